@@ -2,10 +2,12 @@ from .metrics import router as metrics_router
 from .coding_test import router as coding_test_router
 from .resume import router as resume_router
 from .interview import router as interview_router
+from .usage import router as usage_router
 
 __all__ = [
     'metrics_router', 
     'coding_test_router',
     'resume_router',
-    'interview_router'
+    'interview_router',
+    'usage_router'
 ]
\ No newline at end of file
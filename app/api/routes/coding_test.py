@@ -1,15 +1,22 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
-from app.schemas.coding_test import TestCaseInput, TestCaseAnswer, TestCaseRequest
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from app.schemas.coding_test import TestCaseInput, GeneratedTestCase, GeneratedTestCaseAnswer, TestCaseRequest
 from app.services.coding_test.testcase import generate_test_case_answer
-from app.services.coding_test.testcase_zip import create_simple_test_case_zip
+from app.services.coding_test.sandbox import SandboxError, execution_allowed
+from app.services.coding_test.generator import generated_case_files
+from app.services.coding_test.testcase_zip import iter_test_case_zip, aiter_test_case_zip, test_case_arcname
+from app.utils.generator_store import generator_store
+from app.utils.llm_usage import bind_request_usage_scope
 
 router = APIRouter(
     prefix="/api/v1/ai",
-    tags=["coding_test"]
+    tags=["coding_test"],
+    # 경로의 space_id / user_id 로 LLM 토큰/비용 집계
+    dependencies=[Depends(bind_request_usage_scope)]
 )
 
-@router.post("/{space_id}/problems/{testCaseId}/generate-testcases", response_model=TestCaseAnswer)
+@router.post("/{space_id}/problems/{testCaseId}/generate-testcases", response_model=GeneratedTestCaseAnswer)
 async def generate_test_case(question_input: TestCaseInput):
     try:
         # AI 테스트 케이스 생성
@@ -22,23 +29,51 @@ async def generate_test_case(question_input: TestCaseInput):
         print("테스트 케이스 생성 완료!")
         print(f"생성된 테스트 케이스: {test_case}")
         return test_case
+    except SandboxError as se:
+        # 예시 솔루션 컴파일 오류 등 요청 쪽 문제
+        print(f"예시 솔루션 실행 오류: {str(se)}")
+        raise HTTPException(status_code=400, detail=f"예시 솔루션 실행 오류: {str(se)}")
     except Exception as e:
         print(f"테스트 케이스 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"AI 테스트 케이스 생성 오류: {str(e)}")
 
 @router.post("/{space_id}/problems/{test_case_id}/save-testcases")
 async def generate_test_cases_zip(space_id: str, test_case_id: str, request: TestCaseRequest):
+    print(f"테스트 케이스 ZIP 생성 요청: ID={test_case_id}, 테스트케이스 수={len(request.testcases)}")
+    generators = []
+    sample_solution = None
+    if request.generator_set_id:
+        # 생성 스크립트/예시 솔루션은 generate-testcases 에서 검증해 서버에 보관한 것만 실행
+        if not execution_allowed():
+            raise HTTPException(status_code=403, detail="서버에서 코드 실행이 꺼져 있어 생성 스크립트 케이스를 만들 수 없습니다.")
+        generator_set = await asyncio.to_thread(generator_store.get, request.generator_set_id)
+        if generator_set is None:
+            raise HTTPException(status_code=404, detail="생성 스크립트를 찾을 수 없습니다. 테스트 케이스를 다시 생성해주세요.")
+        generators = [GeneratedTestCase.model_validate(generator) for generator in generator_set["generators"]]
+        if request.generator_names is not None:
+            unknown = set(request.generator_names) - {generator.name for generator in generators}
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"알 수 없는 생성 스크립트 케이스입니다: {', '.join(sorted(unknown))}")
+            generators = [generator for generator in generators if generator.name in request.generator_names]
+        sample_solution = generator_set["sample_solution"]
+
+    # 스트리밍이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 파일명은 미리 검사
     try:
-        print(f"테스트 케이스 ZIP 생성 요청: ID={test_case_id}, 테스트케이스 수={len(request.testcases)}")
-        # ZIP 파일 생성
-        zip_path = await create_simple_test_case_zip(test_case_id, request.testcases)
-        print(f"테스트 케이스 zip 생성완료 {zip_path}")
-        # 파일 응답 반환
-        return FileResponse(
-            zip_path,
-            media_type="application/zip",
-            filename=f"testcase_{test_case_id}.zip"
-        )
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"ZIP 파일 생성 중 오류: {str(e)}") 
\ No newline at end of file
+        for test_case in request.testcases:
+            for file_name in test_case:
+                test_case_arcname(file_name)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    headers = {"Content-Disposition": f'attachment; filename="testcase_{test_case_id}.zip"'}
+    if not generators:
+        # 임시 파일 없이 ZIP 을 만들면서 바로 전송 (동기 제너레이터는 스레드 풀에서 실행됨)
+        return StreamingResponse(iter_test_case_zip(request.testcases), media_type="application/zip", headers=headers)
+
+    # 생성 스크립트 케이스는 입력을 만들면서 예시 솔루션에 흘려 보내고 ZIP 에 이어서 씀
+    print(f"생성 스크립트 케이스 {len(generators)}개를 실행해 ZIP 에 추가합니다.")
+    return StreamingResponse(
+        aiter_test_case_zip(request.testcases, generated_case_files(generators, sample_solution)),
+        media_type="application/zip",
+        headers=headers
+    )
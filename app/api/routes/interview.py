@@ -1,24 +1,49 @@
 from fastapi import APIRouter, HTTPException, Depends
-from app.schemas.interview import InterviewQuestionInput, InterviewAnswer
-from app.services.interview.interview import generate_interview_answer
-from app.services.interview.evaluate import evaluate_contest_answers_sequential, evaluate_contest_answers_parallel
+from fastapi.responses import StreamingResponse
+from app.schemas.interview import (
+    InterviewQuestionInput,
+    InterviewAnswer,
+    BulkInterviewAnswerInput,
+    BulkInterviewAnswerResult
+)
+from app.services.interview.interview import (
+    generate_interview_answer,
+    generate_interview_answers_bulk,
+    stream_interview_answer
+)
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.services.interview.evaluate import (
+    EVALUATION_METHODS,
+    iter_contest_evaluations_parallel,
+    evaluation_progress_key,
+    get_contest,
+    EvaluationSession
+)
 from app.db.mysql.session import get_db
+from app.db.mysql.async_session import get_evaluation_db, evaluation_session
+from app.tasks.contest_jobs import submit_contest_evaluation, job_methods
+from app.tasks.answer_jobs import submit_answer_precompute, answer_precompute_progress_key
+from app.tasks.job_store import job_store
+from app.utils.progress_store import progress_store
+from app.utils.llm_usage import bind_request_usage_scope
 from app.db.repositories.mysql.tech_interview_repository import TechInterviewRepository
 from app.db.mysql.models import TechInterview, Contest, Participant, Answer, Problem, Submit
 from sqlalchemy.orm import Session
 from app.metrics import (
     EVALUATION_DURATION,
     EVALUATION_COUNTER,
-    EVALUATION_ERROR_COUNTER,
-    update_system_metrics,
-    CPU_USAGE,
-    MEMORY_USAGE
+    EVALUATION_ERROR_COUNTER
 )
-import time
+import anyio
+import asyncio
+import json
+from typing import Optional
 
 router = APIRouter(
     prefix="/api/v1/ai",
-    tags=["interview"]
+    tags=["interview"],
+    # 경로의 space_id / user_id 로 LLM 토큰/비용 집계
+    dependencies=[Depends(bind_request_usage_scope)]
 )
 
 @router.post("/{space_id}/questions/ai-answer", response_model=InterviewAnswer)
@@ -41,86 +66,244 @@ async def create_ai_interview_answer(space_id: int, question_input: InterviewQue
         print(f"AI answer generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"AI 답변 생성 오류: {str(e)}")
 
-@router.get("/{space_id}/contest/{contest_id}/evaluate")
+@router.post("/{space_id}/questions/ai-answer/stream")
+async def stream_ai_interview_answer(space_id: int, question_input: InterviewQuestionInput):
+    """AI 답변을 생성하면서 필드별 부분 텍스트를 SSE 로 전송
+
+    이벤트: delta({"field", "text"}) ... -> answer(최종 답변, 저장 완료 후) -> done, 오류 시 error
+    클라이언트 연결이 끊겨도 답변은 끝까지 생성되어 저장된다.
+    """
+    print(f"Processing stream request - Question ID: {question_input.id}, Tech Class: {question_input.techClass}")
+
+    async def event_stream():
+        # 생성/저장은 응답보다 오래 살 수 있으므로 별도 세션 사용
+        events = stream_interview_answer(
+            question_input.techClass,
+            question_input.questionText,
+            question_input.id,
+            session_factory=evaluation_session
+        )
+        async for event, data in events:
+            yield format_sse(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/{space_id}/questions/ai-answer/bulk", response_model=BulkInterviewAnswerResult)
+async def create_ai_interview_answers_bulk(
+    space_id: int,
+    bulk_input: BulkInterviewAnswerInput,
+    db: EvaluationSession = Depends(get_evaluation_db)
+):
+    """여러 질문의 AI 답변을 동시에 생성 (일부가 실패해도 200 으로 질문별 결과를 반환)"""
+    question_ids = bulk_input.questionIds
+    if not question_ids:
+        raise HTTPException(status_code=400, detail="질문 ID 목록이 비어 있습니다.")
+    if len(question_ids) > INTERVIEW_CONFIG['BULK_MAX_QUESTIONS']:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {INTERVIEW_CONFIG['BULK_MAX_QUESTIONS']}개의 질문만 요청할 수 있습니다."
+        )
+
+    try:
+        print(f"Processing bulk request - {len(question_ids)} questions, force={bulk_input.force}")
+        return await generate_interview_answers_bulk(question_ids, db, force=bulk_input.force)
+    except Exception as e:
+        print(f"AI answer bulk generation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"AI 답변 대량 생성 오류: {str(e)}")
+
+@router.post("/questions/ai-answer/precompute/jobs", status_code=202)
+async def submit_answer_precompute_job(limit: Optional[int] = None):
+    """모범 답안이 비어 있는 질문의 사전 생성 작업을 큐에 등록 (채점 전 대회에 출제된 질문부터)"""
+    if limit is not None and not 1 <= limit <= INTERVIEW_CONFIG['BULK_MAX_QUESTIONS']:
+        raise HTTPException(status_code=400, detail=f"limit 은 1~{INTERVIEW_CONFIG['BULK_MAX_QUESTIONS']} 사이여야 합니다.")
+
+    try:
+        job = await asyncio.to_thread(submit_answer_precompute, limit)
+    except Exception as e:
+        print(f"모범 답안 사전 생성 작업 등록 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"사전 생성 작업 등록 오류: {str(e)}")
+
+    return {
+        "status": "accepted",
+        "message": "모범 답안 사전 생성 작업이 등록되었습니다.",
+        "data": job
+    }
+
+@router.get("/questions/ai-answer/precompute/jobs/{job_id}")
+async def get_answer_precompute_job(job_id: str):
+    """사전 생성 작업 상태 조회 + 워커의 실시간 진행 상황"""
+    job = await asyncio.to_thread(job_store.get, job_id)
+    if not job or job.get("kind") != "answer_precompute":
+        raise HTTPException(status_code=404, detail="사전 생성 작업을 찾을 수 없습니다.")
+
+    if job.get("status") == "running":
+        job["progress"] = await asyncio.to_thread(progress_store.get, answer_precompute_progress_key(job_id))
+
+    return {
+        "status": "success",
+        "data": job
+    }
+
+@router.get("/{space_id}/contest/{contest_id}/evaluate", status_code=202)
 async def evaluate_contest(
     space_id: int,
     contest_id: int,
-    method: str = "both",  # "sequential", "parallel", "both"
-    db: Session = Depends(get_db)
+    method: str = "both",  # "sequential", "parallel", "batched", "both"
+    force: bool = False,  # True 이면 이미 채점된 답변도 다시 채점
+    priority: int = 0,  # 공용 평가 스케줄러 우선순위 (높을수록 먼저)
+    db: EvaluationSession = Depends(get_evaluation_db)
 ):
+    """채점 작업을 큐에 등록하고 job_id 반환 (POST .../evaluate/jobs 와 같은 워커에서 채점)
+
+    "both" 는 sequential -> parallel 순으로 같은 작업 안에서 채점하며, 방식별 결과는
+    작업 조회(GET .../evaluate/jobs/{job_id})의 result.methods 에 담긴다.
+    """
+    print(f"대회 채점 요청: 대회 ID={contest_id}, 스페이스 ID={space_id}, 방식={method}")
+
+    if any(name not in EVALUATION_METHODS for name in job_methods(method)):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 채점 방식입니다: {method}")
+
+    contest = await get_contest(db, contest_id, space_id)
+    if not contest:
+        raise HTTPException(status_code=404, detail="대회를 찾을 수 없습니다.")
+
     try:
-        print(f"대회 채점 요청: 대회 ID={contest_id}, 스페이스 ID={space_id}, 방식={method}")
-        
-        # 대회 정보 조회
-        contest = db.query(Contest).filter(
-            Contest.id == contest_id,
-            Contest.space_id == space_id
-        ).first()
-        
-        if not contest:
-            raise HTTPException(status_code=404, detail="대회를 찾을 수 없습니다.")
-        
-        results = {}
-        metrics_results = {}
-        
-        if method in ["sequential", "both"]:
-            # Sequential 평가 시작 전 메트릭 측정
-            start_time = time.time()
-            update_system_metrics('sequential')
-            initial_cpu = CPU_USAGE.labels(method='sequential')._value.get()
-            initial_memory = MEMORY_USAGE.labels(method='sequential')._value.get()
-            
-            sequential_evaluations = await evaluate_contest_answers_sequential(db, contest_id)
-            results["sequential"] = sequential_evaluations
-            
-            # Sequential 평가 완료 후 메트릭 측정
-            duration = time.time() - start_time
-            final_cpu = CPU_USAGE.labels(method='sequential')._value.get()
-            final_memory = MEMORY_USAGE.labels(method='sequential')._value.get()
-            
-            metrics_results["sequential"] = {
-                "duration": duration,
-                "cpu_usage": final_cpu - initial_cpu,
-                "memory_usage": final_memory - initial_memory,
-                "evaluation_count": len(sequential_evaluations)
-            }
-            
-        if method in ["parallel", "both"]:
-            # Parallel 평가 시작 전 메트릭 측정
-            start_time = time.time()
-            update_system_metrics('parallel')
-            initial_cpu = CPU_USAGE.labels(method='parallel')._value.get()
-            initial_memory = MEMORY_USAGE.labels(method='parallel')._value.get()
-            
-            parallel_evaluations = await evaluate_contest_answers_parallel(db, contest_id)
-            results["parallel"] = parallel_evaluations
-            
-            # Parallel 평가 완료 후 메트릭 측정
-            duration = time.time() - start_time
-            final_cpu = CPU_USAGE.labels(method='parallel')._value.get()
-            final_memory = MEMORY_USAGE.labels(method='parallel')._value.get()
-            
-            metrics_results["parallel"] = {
-                "duration": duration,
-                "cpu_usage": final_cpu - initial_cpu,
-                "memory_usage": final_memory - initial_memory,
-                "evaluation_count": len(parallel_evaluations)
-            }
-        
-        return {
-            "status": "success",
-            "message": "평가가 완료되었습니다.",
-            "data": {
-                "contest_id": contest_id,
-                "submit": contest.submit_status.name if contest.submit_status else None,
-                "evaluations": results,
-                "metrics": metrics_results
-            }
-        }
-        
+        job = await asyncio.to_thread(submit_contest_evaluation, space_id, contest_id, method, force, priority)
+    except Exception as e:
+        print(f"채점 작업 등록 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"채점 작업 등록 오류: {str(e)}")
+
+    return {
+        "status": "accepted",
+        "message": "채점 작업이 등록되었습니다.",
+        "data": job
+    }
+
+def format_sse(event: str, data) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.get("/{space_id}/contest/{contest_id}/evaluate/stream")
+async def stream_contest_evaluation(
+    space_id: int,
+    contest_id: int,
+    force: bool = False,
+    priority: int = 0,
+    db: EvaluationSession = Depends(get_evaluation_db)
+):
+    """답변별 평가 결과를 끝나는 즉시 SSE 로 전송 (parallel 방식)
+
+    이벤트: start -> evaluation(결과 + 진행 상황) ... -> summary(처리량/성공률), 오류 시 error
+    """
+    contest = await get_contest(db, contest_id, space_id)
+    if not contest:
+        raise HTTPException(status_code=404, detail="대회를 찾을 수 없습니다.")
+
+    async def event_stream():
+        # 스트림은 요청 의존성보다 오래 살아 있으므로 별도 세션 사용
+        async with evaluation_session() as stream_db:
+            events = iter_contest_evaluations_parallel(stream_db, contest_id, force, space_id, priority)
+            try:
+                async for event in events:
+                    yield format_sse(event['event'], event['data'])
+            except Exception as e:
+                print(f"평가 스트리밍 중 오류 발생: {str(e)}")
+                yield format_sse("error", {"detail": str(e)})
+            finally:
+                # 연결이 끊겨 응답이 취소되어도 완료된 평가를 저장한 뒤 세션을 닫도록 정리는 취소에서 보호
+                with anyio.CancelScope(shield=True):
+                    await events.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/{space_id}/contest/{contest_id}/evaluate/jobs", status_code=202)
+async def submit_contest_evaluation_job(
+    space_id: int,
+    contest_id: int,
+    method: str = "parallel",  # "sequential", "parallel", "parallel_1", "batched"
+    force: bool = False,
+    priority: int = 0,
+    db: EvaluationSession = Depends(get_evaluation_db)
+):
+    """채점 작업을 큐에 등록하고 즉시 job_id 반환 (채점은 워커 프로세스에서 실행)"""
+    if method not in EVALUATION_METHODS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 채점 방식입니다: {method}")
+
+    contest = await get_contest(db, contest_id, space_id)
+    if not contest:
+        raise HTTPException(status_code=404, detail="대회를 찾을 수 없습니다.")
+
+    try:
+        job = await asyncio.to_thread(submit_contest_evaluation, space_id, contest_id, method, force, priority)
     except Exception as e:
-        print(f"평가 조회 중 오류 발생: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        print(f"채점 작업 등록 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"채점 작업 등록 오류: {str(e)}")
+
+    return {
+        "status": "accepted",
+        "message": "채점 작업이 등록되었습니다.",
+        "data": job
+    }
+
+@router.get("/{space_id}/contest/{contest_id}/evaluate/jobs/{job_id}")
+async def get_contest_evaluation_job(space_id: int, contest_id: int, job_id: str):
+    """채점 작업 상태 조회 (queued, running, completed, failed) + 워커의 실시간 진행 상황"""
+    job = await asyncio.to_thread(job_store.get, job_id)
+    if not job or job.get("space_id") != space_id or job.get("contest_id") != contest_id:
+        raise HTTPException(status_code=404, detail="채점 작업을 찾을 수 없습니다.")
+
+    if job.get("status") == "running":
+        job["progress"] = await asyncio.to_thread(progress_store.get, evaluation_progress_key(contest_id))
+
+    return {
+        "status": "success",
+        "data": job
+    }
+
+@router.get("/{space_id}/contest/{contest_id}/evaluate/progress")
+async def stream_contest_evaluation_progress(space_id: int, contest_id: int, heartbeat: float = 15.0):
+    """진행 중인 채점(어느 워커/컨테이너에서 실행 중이든)의 진행 상황을 갱신될 때마다 SSE 로 전송
+
+    이벤트: progress(현재 진행 상황) ... -> 모든 답변이 끝나면 종료.
+    갱신이 없으면 heartbeat 초마다 현재 상태를 다시 읽어 보낸다.
+    """
+    key = evaluation_progress_key(contest_id)
+    progress = await asyncio.to_thread(progress_store.get, key)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="진행 중인 채점을 찾을 수 없습니다.")
+
+    def finished(current) -> bool:
+        return current is None or current.get("completed", 0) >= current.get("total", 0)
+
+    async def event_stream():
+        current = progress
+        updates = progress_store.subscribe(key, heartbeat=heartbeat)
+        try:
+            yield format_sse("progress", current)
+            while not finished(current):
+                current = await updates.__anext__()
+                if current is None:
+                    # 구독 전에 지나간 갱신이 있을 수 있으므로 저장소에서 다시 읽음
+                    current = await asyncio.to_thread(progress_store.get, key)
+                    if current is None:
+                        break
+                yield format_sse("progress", current)
+        finally:
+            await updates.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # @router.get("/{space_id}/contest/{contest_id}/evaluate")
 # async def evaluate_contest(
@@ -1,18 +1,21 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
 from app.schemas.resume import PortfolioRequest, ResumeSummaryRequest, ResumeSummary, JobDescriptionRequest, CustomResumeRequest
 from app.services.resume import generate_portfolio, get_portfolio_status, generate_resume_summary
 from app.services.resume.job_description import analyze_job_description
 from app.crawler.main_crawler import crawl_url
-from app.services.resume.custom_resume import generate_custom_resume, get_custom_resume_status, custom_resume_trackers
+from app.services.resume.custom_resume import generate_custom_resume, get_custom_resume_status, custom_resume_progress_key
 from fastapi.responses import JSONResponse
 from app.utils.progress_tracker import ProgressTracker
+from app.utils.llm_usage import bind_request_usage_scope
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/v1/ai",
-    tags=["resume"]
+    tags=["resume"],
+    # 경로의 space_id / user_id 로 LLM 토큰/비용 집계
+    dependencies=[Depends(bind_request_usage_scope)]
 )
 
 @router.post("/{space_id}/resume/{user_id}/create-portfolio")
@@ -96,13 +99,13 @@ async def create_custom_resume(space_id: str, user_id: str, request: CustomResum
         if not request.selectedPortfolios:
             raise HTTPException(status_code=400, detail="포트폴리오 정보가 필요합니다.")
         
-        # ProgressTracker 초기화
-        tracker = ProgressTracker(
+        # ProgressTracker 초기화 (상태 조회가 어느 워커로 가든 바로 찾을 수 있도록 저장소에 먼저 등록)
+        await ProgressTracker.create(
             total=3,
             log_interval=10,
-            log_prefix="Custom Resume Generation"
+            log_prefix="Custom Resume Generation",
+            key=custom_resume_progress_key(user_id)
         )
-        custom_resume_trackers[user_id] = tracker
         
         # 백그라운드 작업으로 커스텀 이력서 생성 시작
         background_tasks.add_task(generate_custom_resume, user_id, request)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException
+from app.utils.llm_usage import usage_store, summarize, DIMENSIONS
+from app.config.redis_config import REDIS_CONFIG
+import asyncio
+
+router = APIRouter(
+    prefix="/api/v1/ai",
+    tags=["usage"]
+)
+
+@router.get("/usage")
+async def get_llm_usage(days: int = 1, group_by: str = "chain,model"):
+    """LLM 토큰/비용 사용량 요약 (최근 days 일, 비용이 큰 순)
+
+    group_by: chain, model, space_id, user_id 중 쉼표로 구분해 지정
+    """
+    dimensions = [name.strip() for name in group_by.split(",") if name.strip()]
+    invalid = [name for name in dimensions if name not in DIMENSIONS]
+    if invalid or not dimensions:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 group_by 입니다: {invalid or group_by}")
+    if not 1 <= days <= REDIS_CONFIG['USAGE_RETENTION_DAYS']:
+        raise HTTPException(status_code=400, detail=f"days 는 1~{REDIS_CONFIG['USAGE_RETENTION_DAYS']} 사이여야 합니다.")
+
+    rows = await asyncio.to_thread(usage_store.rows, days)
+    return {
+        "status": "success",
+        "data": {"days": days, **summarize(rows, dimensions)}
+    }
@@ -1,5 +1,8 @@
 from app.chain.evaluate_chain import chain as evaluate_chain
+from app.chain.batch_evaluate_chain import chain as batch_evaluate_chain
+from app.chain.cascade_evaluate_chain import chain as cascade_evaluate_chain
 from app.chain.testcase_chain import chain as testcase_chain
+from app.chain.testcase_input_chain import chain as testcase_input_chain
 from app.chain.portfolio_chain import chain as portfolio_chain
 from app.chain.portfolio_role_chain import role_chain as portfolio_role_chain
 from app.chain.resume_summary_chain import chain as resume_summary_chain
@@ -7,7 +10,10 @@ from app.chain.job_description import chain as job_description_chain
 
 __all__ = [
   'evaluate_chain',
+  'batch_evaluate_chain',
+  'cascade_evaluate_chain',
   'testcase_chain',
+  'testcase_input_chain',
   'portfolio_chain',
   'portfolio_role_chain',
   'resume_summary_chain',
@@ -0,0 +1,43 @@
+from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import PydanticOutputParser
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import structured_llm
+from app.utils.llm_usage import usage_callbacks
+from app.schemas.interview import BatchEvaluation
+
+# 파서는 포맷 안내문 생성에만 사용하고, 응답은 항목별로 직접 검증한다.
+parser = PydanticOutputParser(pydantic_object=BatchEvaluation)
+
+# 고정 지시문 -> 문제/모범답안 -> 응시자 답변 목록 순으로 두어 같은 문제의 호출이 프롬프트 캐시를 공유
+template = """
+다음에 기술 면접 문제와 그에 대한 모범답안, 그리고 여러 응시자의 답변이 주어집니다.
+각 응시자의 답변은 서로 독립적으로 평가해주세요.
+
+답변들을 각각 아래 평가 기준으로 평가하여 다음 형식으로 응답해주세요.
+evaluations 배열에는 주어진 모든 answer_id 에 대해 정확히 하나씩 결과를 포함해야 합니다:
+{format_instructions}
+
+평가 기준:
+1. 핵심 개념의 이해도 (30점)
+2. 설명의 정확성과 명확성 (30점)
+3. 전문 용어의 적절한 사용 (20점)
+4. 답변의 구조와 논리성 (20점)
+
+문제: {problem}
+
+모범답안: {ai_answer}
+
+응시자 답변 목록:
+{participant_answers}
+"""
+
+prompt = PromptTemplate(
+    template=template,
+    input_variables=["problem", "ai_answer", "participant_answers"],
+    partial_variables={"format_instructions": parser.get_format_instructions()}
+)
+
+llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("batch_evaluate"))
+
+# 토큰 사용량(usage_metadata)을 확인할 수 있도록 파서 없이 AIMessage 를 반환
+chain = prompt | structured_llm(llm, BatchEvaluation)
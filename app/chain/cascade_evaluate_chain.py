@@ -0,0 +1,45 @@
+from langchain_core.prompts import PromptTemplate
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.utils.llm_usage import usage_callbacks
+from app.schemas.interview import CascadeEvaluation
+
+# 2단계 평가의 1차 채점 (작은 모델). 점수와 함께 확신도를 받아 재평가 여부를 정한다.
+parser = RepairingOutputParser(pydantic_object=CascadeEvaluation, chain_name="evaluate_cascade")
+
+# evaluate_chain 과 같은 순서(고정 지시문 -> 문제/모범답안 -> 응시자 답변)로 두어 프롬프트 캐시를 공유
+template = """
+다음에 기술 면접 문제와 그에 대한 모범답안, 그리고 응시자의 답변이 주어집니다.
+응시자의 답변을 아래 평가 기준으로 평가하여 다음 형식으로 응답해주세요:
+{format_instructions}
+
+평가 기준:
+1. 핵심 개념의 이해도 (30점)
+2. 설명의 정확성과 명확성 (30점)
+3. 전문 용어의 적절한 사용 (20점)
+4. 답변의 구조와 논리성 (20점)
+
+확신도(confidence)는 0.0-1.0 사이로 적어주세요.
+답변이 명백히 우수하거나, 비어 있거나, 문제와 무관해서 점수가 분명할 때만 0.8 이상을 주고,
+부분적으로 맞거나 판단이 애매하면 낮게 주세요.
+
+문제: {problem}
+
+모범답안: {ai_answer}
+
+응시자의 답변: {participant_answer}
+"""
+
+prompt = PromptTemplate(
+    template=template,
+    input_variables=["problem", "ai_answer", "participant_answer"],
+    partial_variables={"format_instructions": parser.get_format_instructions()}
+)
+
+llm = RateLimitedChatOpenAI(
+    temperature=0,
+    model_name=EVALUATION_CONFIG['CASCADE_MODEL'],
+    callbacks=usage_callbacks("evaluate_cascade")
+)
+chain = prompt | structured_llm(llm, CascadeEvaluation) | parser
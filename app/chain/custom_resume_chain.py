@@ -3,13 +3,15 @@ from langchain.memory import ConversationBufferMemory
 from langchain.prompts import PromptTemplate
 from app.utils.progress_tracker import ProgressTracker
 from app.utils.progress_tracker import ProgressStatus
+from app.utils.adaptive_limiter import get_limiter
 from app.schemas.resume import CustomResumeRequest, JobAnalysis
 from typing import Dict, Any, List, Optional
-from langchain_openai import ChatOpenAI
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
 from app.chain.portfolio_chain import chain as portfolio_chain
 from app.chain.portfolio_role_chain import role_chain
 from pydantic import BaseModel, Field
-from langchain.output_parsers import PydanticOutputParser
 from datetime import datetime, timedelta
 from langchain.schema.runnable import RunnablePassthrough
 import asyncio
@@ -132,7 +134,7 @@ async def generate_start(processed_data: Dict[str, Any], tracker: ProgressTracke
         # 입력 데이터 검증
         validate_processed_data(processed_data, ["job_description"])
         
-        llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
+        llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("custom_resume_start"))
         memory = memory_manager.get_memory(user_id)
         
         prompt = PromptTemplate(
@@ -151,9 +153,10 @@ async def generate_start(processed_data: Dict[str, Any], tracker: ProgressTracke
             verbose=True
         )
         
-        result = await chain.ainvoke({
-            "job_description": processed_data["job_description"]
-        })
+        async with get_limiter("custom_resume").slot():
+            result = await chain.ainvoke({
+                "job_description": processed_data["job_description"]
+            })
         
         response = result.get("text", "")
         progress = tracker.get_progress()
@@ -180,9 +183,9 @@ async def generate_portfolio(processed_data: Dict[str, Any], tracker: ProgressTr
     try:
         validate_processed_data(processed_data, ["portfolio_info", "job_description"])
         
-        llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
+        llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("custom_resume_portfolio"))
         memory = memory_manager.get_memory(user_id)
-        parser = PydanticOutputParser(pydantic_object=TotalPortfolioAnalysis)
+        parser = RepairingOutputParser(pydantic_object=TotalPortfolioAnalysis, chain_name="custom_resume_portfolio")
 
         # 메모리에서 이전 대화 내용 가져오기
         chat_history = ""
@@ -196,17 +199,12 @@ async def generate_portfolio(processed_data: Dict[str, Any], tracker: ProgressTr
                         history_parts.append(f"{msg_type}: {msg.content}")
                 chat_history = "\n".join(history_parts)
 
-        prompt = PromptTemplate.from_template("""당신은 {job_description}의 채용 담당자입니다.
+        # 고정 지시문/응답 형식을 앞에, 지원자별 내용은 뒤에 두어 provider 프롬프트 캐시가 맞도록 함
+        prompt = PromptTemplate.from_template("""당신은 아래 채용 공고의 채용 담당자입니다.
 지원자의 이력서와 포트폴리오를 검토한 결과를 바탕으로, 포트폴리오를 분석해주세요.                                            
 각 포트폴리오 별로 채용 담당자가 중요하게 생각하는 기술 스택과 한국말로 역량을 정리해주세요. 
 각 포트폴리오 별로 채용 담당자가 중요하게 생각 하는 순으로 내림 차순으로 만들어 주세요.  
 
-포트폴리오 정보:
-{portfolio_info}
-                                              
-이전 대화 내용:
-{history}
-
 {format_instructions}
                                               
 1. 프로젝트명은 그대로 사용합니다.
@@ -241,7 +239,16 @@ async def generate_portfolio(processed_data: Dict[str, Any], tracker: ProgressTr
             "deployLink": "배포 링크 또는 빈 문자열"
         }}
     ]
-}}""")
+}}
+
+채용 공고:
+{job_description}
+
+포트폴리오 정보:
+{portfolio_info}
+
+이전 대화 내용:
+{history}""")
         
         # 체인 구성
         chain = (
@@ -252,7 +259,7 @@ async def generate_portfolio(processed_data: Dict[str, Any], tracker: ProgressTr
                 "format_instructions": lambda x: parser.get_format_instructions()
             }
             | prompt
-            | llm
+            | structured_llm(llm, TotalPortfolioAnalysis)
             | parser
         )
 
@@ -264,7 +271,8 @@ async def generate_portfolio(processed_data: Dict[str, Any], tracker: ProgressTr
         }
         
         # 실행
-        parsed_response = await chain.ainvoke(input_data)
+        async with get_limiter("custom_resume").slot():
+            parsed_response = await chain.ainvoke(input_data)
 
         # 메모리에 대화 저장
         user_message = "포트폴리오들 분석 및 정리해주세요"
@@ -297,9 +305,9 @@ async def generate_career(processed_data: Dict[str, Any], tracker: ProgressTrack
     try:
         validate_processed_data(processed_data, ["career_info", "job_description"])
         
-        llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
+        llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("custom_resume_career"))
         memory = memory_manager.get_memory(user_id)
-        parser = PydanticOutputParser(pydantic_object=TotalCareerAnalysis)
+        parser = RepairingOutputParser(pydantic_object=TotalCareerAnalysis, chain_name="custom_resume_career")
 
         # 메모리에서 이전 대화 내용 가져오기
         chat_history = ""
@@ -313,17 +321,11 @@ async def generate_career(processed_data: Dict[str, Any], tracker: ProgressTrack
                         history_parts.append(f"{msg_type}: {msg.content}")
                 chat_history = "\n".join(history_parts)
 
-        prompt = PromptTemplate.from_template("""당신은 {job_description}의 채용 담당자입니다.
+        prompt = PromptTemplate.from_template("""당신은 아래 채용 공고의 채용 담당자입니다.
 지원자의 이력서와 경력을 검토한 결과를 바탕으로, 경력을 분석해주세요.                                            
 각 경력 별로 채용 담당자가 중요하게 생각하는 직무 내용과 성과를 정리해주세요. 
 각 경력 별로 채용 담당자가 중요하게 생각 하는 순으로 내림 차순으로 만들어 주세요.  
 
-경력 정보:
-{career_info}
-                                              
-이전 대화 내용:
-{history}
-
 {format_instructions}
                                               
 1. 회사명은 그대로 사용합니다.
@@ -347,7 +349,16 @@ async def generate_career(processed_data: Dict[str, Any], tracker: ProgressTrack
             "achievement": "주요 성과"
         }}
     ]
-}}""")
+}}
+
+채용 공고:
+{job_description}
+
+경력 정보:
+{career_info}
+
+이전 대화 내용:
+{history}""")
         
         # 체인 구성
         chain = (
@@ -358,7 +369,7 @@ async def generate_career(processed_data: Dict[str, Any], tracker: ProgressTrack
                 "format_instructions": lambda x: parser.get_format_instructions()
             }
             | prompt
-            | llm
+            | structured_llm(llm, TotalCareerAnalysis)
             | parser
         )
 
@@ -370,7 +381,8 @@ async def generate_career(processed_data: Dict[str, Any], tracker: ProgressTrack
         }
         
         # 실행
-        parsed_response = await chain.ainvoke(input_data)
+        async with get_limiter("custom_resume").slot():
+            parsed_response = await chain.ainvoke(input_data)
 
         # 메모리에 대화 저장
         user_message = "경력사항 분석 및 정리해주세요"
@@ -403,9 +415,9 @@ async def generate_tech_stack(processed_data: Dict[str, Any], tracker: ProgressT
     try:
         validate_processed_data(processed_data, ["job_description"])
         
-        llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
+        llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("custom_resume_tech_stack"))
         memory = memory_manager.get_memory(user_id)
-        parser = PydanticOutputParser(pydantic_object=TechStackAnalysis)
+        parser = RepairingOutputParser(pydantic_object=TechStackAnalysis, chain_name="custom_resume_tech_stack")
         
         # 메모리에서 이전 대화 내용 가져오기
         chat_history = ""
@@ -423,20 +435,11 @@ async def generate_tech_stack(processed_data: Dict[str, Any], tracker: ProgressT
         portfolio_info = processed_data.get("portfolio_info", "")
         career_info = processed_data.get("career_info", "")
         
-        prompt = PromptTemplate.from_template("""당신은 {job_description}의 채용 담당자입니다.
+        prompt = PromptTemplate.from_template("""당신은 아래 채용 공고의 채용 담당자입니다.
 지원자의 포트폴리오와 경력을 검토한 결과를 바탕으로, 
 채용 담당자가 중요하게 생각하는 기술 스택과 한국말로 역량을 정리해주세요. 
 채용 담당자가 중요하게 생각 하는 순으로 내림 차순으로 만들어 주세요.
 
-포트폴리오 정보:
-{portfolio_info}
-
-경력 정보:
-{career_info}
-
-이전 대화 내용:
-{history}
-
 {format_instructions}
 
 1. 기술 스택은 채용담당자가 중요하게 생각하는 순으로 정리합니다.
@@ -447,7 +450,19 @@ async def generate_tech_stack(processed_data: Dict[str, Any], tracker: ProgressT
 {{
     "tech_stack": ["기술1", "기술2", "기술3"],
     "tech_summary": ["역량1", "역량2", "역량3"]
-}}""")
+}}
+
+채용 공고:
+{job_description}
+
+포트폴리오 정보:
+{portfolio_info}
+
+경력 정보:
+{career_info}
+
+이전 대화 내용:
+{history}""")
         
         # 체인 구성
         chain = (
@@ -459,7 +474,7 @@ async def generate_tech_stack(processed_data: Dict[str, Any], tracker: ProgressT
                 "format_instructions": lambda x: parser.get_format_instructions()
             }
             | prompt
-            | llm
+            | structured_llm(llm, TechStackAnalysis)
             | parser
         )
         
@@ -472,7 +487,8 @@ async def generate_tech_stack(processed_data: Dict[str, Any], tracker: ProgressT
         }
         
         # 실행
-        parsed_response = await chain.ainvoke(input_data)
+        async with get_limiter("custom_resume").slot():
+            parsed_response = await chain.ainvoke(input_data)
 
         # 메모리에 대화 저장
         user_message = "기술 스택 분석 및 정리해주세요"
@@ -509,9 +525,9 @@ async def generate_coverletter(processed_data: Dict[str, Any], tracker: Progress
         # 입력 데이터 검증
         validate_processed_data(processed_data, ["job_description", "additional_info"])
         
-        llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
+        llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("custom_resume_cover_letter"))
         memory = memory_manager.get_memory(user_id)
-        parser = PydanticOutputParser(pydantic_object=CoverLetter)
+        parser = RepairingOutputParser(pydantic_object=CoverLetter, chain_name="custom_resume_cover_letter")
         
         # 메모리에서 이전 대화 내용 가져오기
         chat_history = ""
@@ -525,16 +541,10 @@ async def generate_coverletter(processed_data: Dict[str, Any], tracker: Progress
                         history_parts.append(f"{msg_type}: {msg.content}")
                 chat_history = "\n".join(history_parts)
         
-        prompt = PromptTemplate.from_template("""당신은 {job_description}의 채용 담당자입니다.
-이전 대화 내용을 기억하면서, {job_description}의 이력서 요구사항과 지원자의 추가 정보를 종합하여
+        prompt = PromptTemplate.from_template("""당신은 아래 채용 공고의 채용 담당자입니다.
+이전 대화 내용을 기억하면서, 채용 공고의 이력서 요구사항과 지원자의 추가 정보를 종합하여
 자기소개서를 작성해주세요. 이전 대화에서 언급된 지원자의 강점과 경험을 최대한 활용하세요.
 
-추가 정보:
-{additional_info}
-
-이전 대화 내용:
-{history}
-
 {format_instructions}
 
 다음 가이드라인에 따라 자기소개서를 작성해주세요:
@@ -557,7 +567,16 @@ async def generate_coverletter(processed_data: Dict[str, Any], tracker: Progress
         }},
         ...
     ]
-}}""")
+}}
+
+채용 공고:
+{job_description}
+
+추가 정보:
+{additional_info}
+
+이전 대화 내용:
+{history}""")
         
         # 체인 구성 (generate_tech_stack과 동일한 방식)
         chain = (
@@ -568,7 +587,7 @@ async def generate_coverletter(processed_data: Dict[str, Any], tracker: Progress
                 "format_instructions": lambda x: parser.get_format_instructions()
             }
             | prompt
-            | llm
+            | structured_llm(llm, CoverLetter)
             | parser
         )
         
@@ -580,7 +599,8 @@ async def generate_coverletter(processed_data: Dict[str, Any], tracker: Progress
         }
         
         # 실행
-        parsed_response = await chain.ainvoke(input_data)
+        async with get_limiter("custom_resume").slot():
+            parsed_response = await chain.ainvoke(input_data)
         
         # 메모리에 대화 저장
         user_message = "자기소개서를 작성해주세요."
@@ -1,21 +1,17 @@
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
 from app.schemas.interview import Evaluation
 
 # LLM 모델과 파서 초기화
-parser = PydanticOutputParser(pydantic_object=Evaluation)
+parser = RepairingOutputParser(pydantic_object=Evaluation, chain_name="evaluate")
 
+# 프롬프트 캐시가 맞도록 고정 지시문을 앞에, 같은 문제끼리 공유하는 문제/모범답안을 그다음에,
+# 매번 달라지는 응시자 답변을 맨 뒤에 둔다.
 template = """
-다음은 기술 면접 문제와 그에 대한 모범답안, 그리고 응시자의 답변입니다.
-
-문제: {problem}
-
-모범답안: {ai_answer}
-
-응시자의 답변: {participant_answer}
-
-위 답변을 평가하여 다음 형식으로 응답해주세요:
+다음에 기술 면접 문제와 그에 대한 모범답안, 그리고 응시자의 답변이 주어집니다.
+응시자의 답변을 아래 평가 기준으로 평가하여 다음 형식으로 응답해주세요:
 {format_instructions}
 
 평가 기준:
@@ -23,6 +19,12 @@ template = """
 2. 설명의 정확성과 명확성 (30점)
 3. 전문 용어의 적절한 사용 (20점)
 4. 답변의 구조와 논리성 (20점)
+
+문제: {problem}
+
+모범답안: {ai_answer}
+
+응시자의 답변: {participant_answer}
 """
 
 prompt = PromptTemplate(
@@ -31,5 +33,5 @@ prompt = PromptTemplate(
     partial_variables={"format_instructions": parser.get_format_instructions()}
 )
 
-llm = ChatOpenAI(temperature=0.2, model_name="gpt-4.1")
-chain = prompt | llm | parser 
\ No newline at end of file
+llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("evaluate"))
+chain = prompt | structured_llm(llm, Evaluation) | parser 
\ No newline at end of file
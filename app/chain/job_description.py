@@ -1,10 +1,11 @@
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
 from app.schemas.resume import JobAnalysis
 
 # LLM 모델과 파서 초기화
-parser = PydanticOutputParser(pydantic_object=JobAnalysis)
+parser = RepairingOutputParser(pydantic_object=JobAnalysis, chain_name="job_description")
 
 template = """
 다음은 채용공고의 내용입니다. 주어진 텍스트에서 다음 정보를 추출해주세요:
@@ -76,5 +77,9 @@ prompt = PromptTemplate(
     partial_variables={"format_instructions": parser.get_format_instructions()}
 )
 
-llm = ChatOpenAI(temperature=0, model_name="gpt-4-turbo-preview")
-chain = prompt | llm | parser
+llm = RateLimitedChatOpenAI(
+    temperature=0,
+    model_name="gpt-4-turbo-preview",
+    callbacks=usage_callbacks("job_description")
+)
+chain = prompt | structured_llm(llm, JobAnalysis) | parser
@@ -1,10 +1,11 @@
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
 from app.schemas.resume import PortfolioData
 
 # 출력 파서 생성
-parser = PydanticOutputParser(pydantic_object=PortfolioData)
+parser = RepairingOutputParser(pydantic_object=PortfolioData, chain_name="portfolio")
 
 # 프롬프트 템플릿 생성
 template = """
@@ -90,12 +91,13 @@ prompt = PromptTemplate(
 )
 
 # LLM 모델 설정
-llm = ChatOpenAI(
+llm = RateLimitedChatOpenAI(
     temperature=0.3, 
     model_name="gpt-4.1-nano",  # 더 큰 컨텍스트를 지원하는 모델로 변경
     max_tokens=32768,  # 출력 토큰 수 제한
-    request_timeout=300  # 타임아웃 시간 증가
+    request_timeout=300,  # 타임아웃 시간 증가
+    callbacks=usage_callbacks("portfolio")
 )
 
 # 체인 구성
-chain = prompt | llm | parser
+chain = prompt | structured_llm(llm, PortfolioData) | parser
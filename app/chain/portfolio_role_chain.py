@@ -1,10 +1,11 @@
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
 from app.schemas.resume import PortfolioRole
 
 # 출력 파서 생성
-parser = PydanticOutputParser(pydantic_object=PortfolioRole)
+parser = RepairingOutputParser(pydantic_object=PortfolioRole, chain_name="portfolio_role")
 
 # 프롬프트 템플릿 생성
 template = """
@@ -38,12 +39,13 @@ prompt = PromptTemplate(
 )
 
 # LLM 모델 설정
-llm = ChatOpenAI(
+llm = RateLimitedChatOpenAI(
     temperature=0.3,
     model_name="gpt-4.1-nano",
     max_tokens=32768,
-    request_timeout=500
+    request_timeout=500,
+    callbacks=usage_callbacks("portfolio_role")
 )
 
 # 체인 구성
-role_chain = prompt | llm | parser
+role_chain = prompt | structured_llm(llm, PortfolioRole) | parser
@@ -0,0 +1,197 @@
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+import asyncio
+import time
+from langchain_core.messages import BaseMessage, message_chunk_to_message
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+from app.config.llm_config import LLM_RATE_LIMIT_CONFIG
+from app.utils.cassette import get_cassette
+from app.utils.rate_limiter import get_rate_limiter, estimate_tokens
+
+class RateLimitedChatOpenAI(ChatOpenAI):
+    """호출 전에 모델별 RPM/TPM 토큰 버킷에서 몫을 받아오는 ChatOpenAI
+
+    app/chain 의 모든 체인이 이 클래스로 LLM 을 만들어, 여러 컨테이너/워커가
+    같은 provider 쿼터를 나눠 쓰도록 한다.
+    LLM_CASSETTE_MODE=record 이면 호출을 녹화하고, replay 이면 네트워크 없이 녹화된 응답을 돌려준다.
+    스트리밍(astream)도 같은 제한과 녹화를 거치며, 녹화 키는 일반 호출과 같아 서로의 녹화를 재생할 수 있다.
+    """
+    def _reserved_tokens(self, messages: List[BaseMessage]) -> int:
+        prompt_tokens = sum(estimate_tokens(str(message.content)) for message in messages)
+        completion_tokens = LLM_RATE_LIMIT_CONFIG['COMPLETION_TOKENS_ESTIMATE']
+        if self.max_tokens:
+            completion_tokens = min(completion_tokens, self.max_tokens)
+        return prompt_tokens + completion_tokens
+
+    @staticmethod
+    def _used_tokens(result: ChatResult, reserved: int) -> int:
+        usage = getattr(result.generations[0].message, "usage_metadata", None) if result.generations else None
+        return usage.get("total_tokens", reserved) if usage else reserved
+
+    @staticmethod
+    def _chunk_result(chunk: ChatGenerationChunk) -> ChatResult:
+        """스트리밍 조각을 합친 결과를 녹화용 ChatResult 로 변환"""
+        return ChatResult(generations=[
+            ChatGeneration(message=message_chunk_to_message(chunk.message), generation_info=chunk.generation_info)
+        ])
+
+    def _cassette_params(self, stop: Optional[List[str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"temperature": self.temperature, "max_tokens": self.max_tokens, "stop": stop, **kwargs}
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        cassette = get_cassette()
+        if cassette is None:
+            return self._limited_generate(messages, stop, run_manager, **kwargs)
+
+        key = cassette.key(self.model_name, messages, self._cassette_params(stop, kwargs))
+        if cassette.replaying:
+            entry = cassette.lookup(key)
+            if entry is not None:
+                time.sleep(cassette.replay_delay(entry))
+                return cassette.to_result(entry)
+
+        started = time.monotonic()
+        result = self._limited_generate(messages, stop, run_manager, **kwargs)
+        if cassette.recording:
+            cassette.record(key, self.model_name, messages, result, time.monotonic() - started)
+        return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        cassette = get_cassette()
+        if cassette is None:
+            return await self._alimited_generate(messages, stop, run_manager, **kwargs)
+
+        key = cassette.key(self.model_name, messages, self._cassette_params(stop, kwargs))
+        if cassette.replaying:
+            entry = cassette.lookup(key)
+            if entry is not None:
+                await asyncio.sleep(cassette.replay_delay(entry))
+                return cassette.to_result(entry)
+
+        started = time.monotonic()
+        result = await self._alimited_generate(messages, stop, run_manager, **kwargs)
+        if cassette.recording:
+            # 파일 쓰기는 스레드에서 처리해 이벤트 루프를 막지 않음
+            await asyncio.to_thread(cassette.record, key, self.model_name, messages, result, time.monotonic() - started)
+        return result
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        cassette = get_cassette()
+        key = cassette.key(self.model_name, messages, self._cassette_params(stop, kwargs)) if cassette else None
+        if cassette is not None and cassette.replaying:
+            entry = cassette.lookup(key)
+            if entry is not None:
+                time.sleep(cassette.replay_delay(entry))
+                for chunk in cassette.to_chunks(entry):
+                    if run_manager:
+                        run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                    yield chunk
+                return
+
+        started = time.monotonic()
+        merged: Optional[ChatGenerationChunk] = None
+        for chunk in self._limited_stream(messages, stop, run_manager, **kwargs):
+            merged = chunk if merged is None else merged + chunk
+            yield chunk
+        if cassette is not None and cassette.recording and merged is not None:
+            cassette.record(key, self.model_name, messages, self._chunk_result(merged), time.monotonic() - started)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        cassette = get_cassette()
+        key = cassette.key(self.model_name, messages, self._cassette_params(stop, kwargs)) if cassette else None
+        if cassette is not None and cassette.replaying:
+            entry = cassette.lookup(key)
+            if entry is not None:
+                await asyncio.sleep(cassette.replay_delay(entry))
+                for chunk in cassette.to_chunks(entry):
+                    if run_manager:
+                        await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                    yield chunk
+                return
+
+        started = time.monotonic()
+        merged: Optional[ChatGenerationChunk] = None
+        async for chunk in self._alimited_stream(messages, stop, run_manager, **kwargs):
+            merged = chunk if merged is None else merged + chunk
+            yield chunk
+        if cassette is not None and cassette.recording and merged is not None:
+            await asyncio.to_thread(
+                cassette.record, key, self.model_name, messages, self._chunk_result(merged), time.monotonic() - started
+            )
+
+    def _limited_generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                          run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if not LLM_RATE_LIMIT_CONFIG['ENABLED']:
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        rate_limiter = get_rate_limiter()
+        reserved = self._reserved_tokens(messages)
+        rate_limiter.acquire(self.model_name, reserved)
+        used = 0
+        try:
+            result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            used = self._used_tokens(result, reserved)
+            return result
+        finally:
+            # 호출이 실패하면 예약한 토큰을 모두 돌려줌 (used=0)
+            rate_limiter.settle(self.model_name, reserved, used)
+
+    async def _alimited_generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                                 run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if not LLM_RATE_LIMIT_CONFIG['ENABLED']:
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        rate_limiter = get_rate_limiter()
+        reserved = self._reserved_tokens(messages)
+        await rate_limiter.aacquire(self.model_name, reserved)
+        used = 0
+        try:
+            result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            used = self._used_tokens(result, reserved)
+            return result
+        finally:
+            await rate_limiter.asettle(self.model_name, reserved, used)
+
+    def _limited_stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                        run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        if not LLM_RATE_LIMIT_CONFIG['ENABLED']:
+            yield from super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return
+
+        rate_limiter = get_rate_limiter()
+        reserved = self._reserved_tokens(messages)
+        rate_limiter.acquire(self.model_name, reserved)
+        used = reserved
+        try:
+            # 사용량은 마지막 조각(stream_options.include_usage)에 실려 온다
+            for chunk in super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                usage = getattr(chunk.message, "usage_metadata", None)
+                if usage:
+                    used = usage.get("total_tokens", used)
+                yield chunk
+        finally:
+            rate_limiter.settle(self.model_name, reserved, used)
+
+    async def _alimited_stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                               run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        if not LLM_RATE_LIMIT_CONFIG['ENABLED']:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            return
+
+        rate_limiter = get_rate_limiter()
+        reserved = self._reserved_tokens(messages)
+        await rate_limiter.aacquire(self.model_name, reserved)
+        used = reserved
+        try:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                usage = getattr(chunk.message, "usage_metadata", None)
+                if usage:
+                    used = usage.get("total_tokens", used)
+                yield chunk
+        finally:
+            await rate_limiter.asettle(self.model_name, reserved, used)
@@ -0,0 +1,89 @@
+from typing import Any, List, Optional, Type
+import logging
+from pydantic import BaseModel, ValidationError
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import Generation
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_function
+from app.config.llm_config import LLM_STRUCTURED_OUTPUT_CONFIG
+from app.metrics import LLM_OUTPUT_REPAIR_COUNTER, LLM_RETRY_AVOIDED_COUNTER, LLM_OUTPUT_PARSE_FAILURE_COUNTER
+from app.utils.json_repair import JSONRepairError, coerce_to_model, repair_json
+
+logger = logging.getLogger(__name__)
+
+def response_format_for(model_name: str, schema: Type[BaseModel]) -> Optional[dict]:
+    """모델이 지원하는 provider 네이티브 구조화 출력 형식 (prompt 모드면 None)"""
+    mode = LLM_STRUCTURED_OUTPUT_CONFIG['MODE']
+    if mode == "prompt":
+        return None
+    if mode == "json_object" or model_name.startswith(LLM_STRUCTURED_OUTPUT_CONFIG['JSON_OBJECT_ONLY_MODELS']):
+        # JSON 모드는 프롬프트에 "JSON" 이 있어야 하며, 포맷 안내문이 이를 포함한다
+        return {"type": "json_object"}
+
+    strict = LLM_STRUCTURED_OUTPUT_CONFIG['STRICT']
+    function = convert_to_openai_function(schema, strict=strict)
+    json_schema = {"name": function["name"], "schema": function["parameters"], "strict": strict}
+    if function.get("description"):
+        json_schema["description"] = function["description"]
+    return {"type": "json_schema", "json_schema": json_schema}
+
+def structured_llm(llm: BaseChatModel, schema: Type[BaseModel]) -> Runnable:
+    """LLM 이 schema 형식의 JSON 만 내도록 response_format 을 붙임
+
+    응답은 그대로 AIMessage 이므로 뒤에 오는 파서/usage_metadata 처리는 바뀌지 않는다.
+    """
+    response_format = response_format_for(llm.model_name, schema)
+    if response_format is None:
+        return llm
+    return llm.bind(response_format=response_format)
+
+def truncated(result: List[Generation]) -> bool:
+    """생성이 토큰 한도(finish_reason=length)로 끝났는지"""
+    message = getattr(result[0], "message", None) if result else None
+    metadata = getattr(message, "response_metadata", None) or {}
+    return metadata.get("finish_reason") == "length"
+
+def repair_to_model(text: str, schema: Type[BaseModel], chain: str) -> BaseModel:
+    """깨진 응답을 로컬에서 고쳐 schema 로 검증 (성공하면 재호출 1회를 아낀 것으로 집계)
+
+    Raises:
+        JSONRepairError, ValidationError: 고쳐도 schema 에 맞지 않는 경우
+    """
+    data, defects = repair_json(text)
+    coerced = coerce_to_model(data, schema)
+    result = schema.model_validate(coerced)
+    if coerced != data:
+        defects.append("coerced")
+    for defect in defects or ["other"]:
+        LLM_OUTPUT_REPAIR_COUNTER.labels(chain=chain, defect=defect).inc()
+    LLM_RETRY_AVOIDED_COUNTER.labels(chain=chain).inc()
+    logger.info(f"[{chain}] LLM 응답 로컬 복구 성공: {', '.join(defects) or 'other'}")
+    return result
+
+class RepairingOutputParser(PydanticOutputParser):
+    """기본 파싱에 실패하면 재시도 전에 로컬 JSON 복구와 타입 보정을 먼저 시도하는 PydanticOutputParser
+
+    코드 펜스, 앞뒤 설명 문장, 끝 쉼표, 작은따옴표/파이썬 리터럴, 잘린 괄호, 키 표기 차이,
+    "85점" 같은 숫자 문자열을 고친다. 토큰 한도로 잘린 응답은 고치지 않는다.
+    복구도 실패하면 원래 OutputParserException 을 그대로 올려 호출한 쪽의 재시도 정책을 따른다.
+    """
+    chain_name: str = "unknown"
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        if truncated(result) and not partial:
+            # 토큰 한도로 잘린 응답은 괄호를 닫아도(기본 파서도 부분 JSON 을 닫음) 내용이 빠져 있으므로 재요청
+            LLM_OUTPUT_PARSE_FAILURE_COUNTER.labels(chain=self.chain_name).inc()
+            logger.warning(f"[{self.chain_name}] LLM 응답이 토큰 한도로 잘렸습니다")
+            raise OutputParserException("LLM 응답이 토큰 한도(finish_reason=length)로 잘렸습니다", llm_output=result[0].text)
+        try:
+            return super().parse_result(result, partial=partial)
+        except OutputParserException as e:
+            text = result[0].text if result else ""
+            try:
+                return repair_to_model(text, self.pydantic_object, self.chain_name)
+            except (JSONRepairError, ValidationError) as repair_error:
+                LLM_OUTPUT_PARSE_FAILURE_COUNTER.labels(chain=self.chain_name).inc()
+                logger.warning(f"[{self.chain_name}] LLM 응답 로컬 복구 실패: {str(repair_error)}")
+                raise e
@@ -0,0 +1,58 @@
+from langchain_core.prompts import PromptTemplate
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks
+from app.schemas.coding_test import TestCaseInputs
+
+# 예시 솔루션 실행 모드: 입력만 생성하고 출력은 솔루션을 실행해 만든다
+parser = RepairingOutputParser(pydantic_object=TestCaseInputs, chain_name="testcase_inputs")
+
+# testcase_chain 과 같은 순서(고정 지침/출력 형식 -> 문제별 내용)로 두어 프롬프트 캐시가 맞도록 함
+template = """당신은 프로그래밍 문제의 테스트 케이스를 생성하는 전문가입니다.
+아래에 주어지는 프로그래밍 문제에 대한 테스트 케이스 입력 10개를 생성해주세요.
+
+테스트 케이스를 생성할 때 다음 지침을 따라주세요:
+1. 기본 케이스, 경계 케이스, 특수 케이스를 포함시켜 주세요.
+2. 출력은 예시 솔루션을 실행해 만들므로 입력(.in 파일 내용)만 작성해주세요.
+3. 정확히 10개의 입력을 생성해주세요.
+4. 모든 입력은 입력 형식과 문제의 제약 조건을 반드시 지켜야 합니다.
+5. 각 입력은 줄바꿈까지 포함해 파일에 그대로 저장될 텍스트로 작성해주세요.
+6. 반드시 "inputs" 키를 가진 배열 형태로 출력해주세요.
+7. 테스트 케이스 유형에 large 가 있으면 대용량 입력은 inputs 에 직접 쓰지 말고 "generators" 에
+   생성 스크립트 1~3개로 작성해주세요. (inputs 의 10개와 별도)
+   - 표준 라이브러리만 쓰는 Python 3 프로그램으로, random.seed(int(sys.argv[1])) 로 초기화해 항상 같은 입력을 만듭니다.
+   - 입력 전체를 sys.stdout 으로 출력하고, 문제의 최대 제약 조건을 넘지 않아야 합니다.
+   - 큰 출력은 줄 단위로 모아 sys.stdout.write 로 한 번에 쓰는 등 수 초 안에 끝나도록 작성해주세요.
+   - seed 에는 임의의 정수를, description 에는 만들어지는 입력(크기, 값의 분포)을 적어주세요.
+
+### 출력 형식 안내
+{format_instructions}
+
+### 문제 설명
+{problem_description}
+
+### 입력 형식
+{input_description}
+
+### 출력 형식
+{output_description}
+
+### 예시 솔루션 ({solution_language})
+{solution_code}
+### 테스트 케이스 유형
+{test_case_types}
+
+### 특별 요구사항
+{additional_requirements}
+"""
+
+prompt = PromptTemplate(
+    template=template,
+    input_variables=["problem_description", "input_description", "output_description",
+                    "solution_language", "solution_code", "test_case_types", "additional_requirements"],
+    partial_variables={"format_instructions": parser.get_format_instructions()}
+)
+
+llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4.1", callbacks=usage_callbacks("testcase_inputs"))
+
+chain = prompt | structured_llm(llm, TestCaseInputs) | parser
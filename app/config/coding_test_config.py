@@ -0,0 +1,38 @@
+import os
+
+# 코딩 테스트 테스트 케이스 설정
+CODING_TEST_CONFIG = {
+    # 테스트 케이스 ZIP 의 deflate 압축 레벨 (0 이면 압축하지 않고 저장)
+    "ZIP_COMPRESS_LEVEL": int(os.getenv('TESTCASE_ZIP_COMPRESS_LEVEL', 1)),
+    # 응답으로 한 번에 내보내는 ZIP 조각 크기 (바이트)
+    "ZIP_CHUNK_SIZE": int(os.getenv('TESTCASE_ZIP_CHUNK_SIZE', 64 * 1024)),
+    # 기본값: LLM 은 입력만 만들고 .out 은 예시 솔루션을 로컬에서 실행해 만듦 (요청의 run_solution 으로 덮어씀)
+    "RUN_SOLUTION": os.getenv('TESTCASE_RUN_SOLUTION', 'false').lower() == 'true',
+    # 요청으로 받은 예시 솔루션/생성 스크립트는 아래 둘 중 하나가 켜져 있을 때만 실행 (둘 다 꺼져 있으면 LLM 이 출력까지 생성)
+    # 출제자가 모두 신뢰할 수 있는 배포 (rlimit 만으로 실행, 네트워크/파일 시스템 격리 없음)
+    "TRUSTED_SOLUTIONS": os.getenv('TESTCASE_TRUSTED_SOLUTIONS', 'false').lower() == 'true',
+    # "unshare": 네트워크/PID/마운트 네임스페이스 + nobody 사용자 + 읽기 전용 최소 루트에서 실행 (root 권한 필요)
+    "SANDBOX_JAIL": os.getenv('TESTCASE_SANDBOX_JAIL', '').lower(),
+    # 격리 루트에 읽기 전용으로 추가로 연결할 경로 (":" 로 구분, 컴파일러가 /usr 밖에 있는 경우 등)
+    "SANDBOX_JAIL_BINDS": os.getenv('TESTCASE_SANDBOX_JAIL_BINDS', ''),
+    # 격리 실행 사용자(nobody)가 동시에 가질 수 있는 프로세스 수 (fork 폭탄 방지)
+    "SANDBOX_JAIL_PROCESSES": int(os.getenv('TESTCASE_SANDBOX_JAIL_PROCESSES', 64)),
+    # 예시 솔루션을 동시에 실행할 프로세스 수
+    "SANDBOX_WORKERS": int(os.getenv('TESTCASE_SANDBOX_WORKERS', os.cpu_count() or 2)),
+    # 실행 한 번의 CPU 시간(초) / 벽시계 시간(초) / 주소 공간(MB) / 출력 크기(MB) 제한
+    "SANDBOX_CPU_SECONDS": int(os.getenv('TESTCASE_SANDBOX_CPU_SECONDS', 2)),
+    "SANDBOX_WALL_SECONDS": float(os.getenv('TESTCASE_SANDBOX_WALL_SECONDS', 5)),
+    "SANDBOX_MEMORY_MB": int(os.getenv('TESTCASE_SANDBOX_MEMORY_MB', 512)),
+    "SANDBOX_OUTPUT_MB": int(os.getenv('TESTCASE_SANDBOX_OUTPUT_MB', 64)),
+    # C/C++ 컴파일 제한 시간(초)
+    "SANDBOX_COMPILE_SECONDS": float(os.getenv('TESTCASE_SANDBOX_COMPILE_SECONDS', 30)),
+    # large 케이스 입력 생성 스크립트의 CPU 시간(초) / 입력 크기(MB) 제한
+    "GENERATOR_CPU_SECONDS": int(os.getenv('TESTCASE_GENERATOR_CPU_SECONDS', 10)),
+    "GENERATOR_OUTPUT_MB": int(os.getenv('TESTCASE_GENERATOR_OUTPUT_MB', 64)),
+    # 생성 스크립트 + 예시 솔루션 실행 전체의 벽시계 시간(초)
+    "GENERATOR_WALL_SECONDS": float(os.getenv('TESTCASE_GENERATOR_WALL_SECONDS', 60)),
+    # 응답에 담는 생성된 입력 앞부분 길이 (글자)
+    "GENERATOR_PREVIEW_CHARS": int(os.getenv('TESTCASE_GENERATOR_PREVIEW_CHARS', 200)),
+    # 검증한 생성 스크립트/예시 솔루션을 save-testcases 에서 쓸 수 있도록 서버에 보관하는 시간(초)
+    "GENERATOR_TTL_SECONDS": int(os.getenv('TESTCASE_GENERATOR_TTL', 60 * 60 * 24)),
+}
@@ -1,10 +1,24 @@
+import os
 from app.db.mysql.connection import DB_CONFIG
 
 EVALUATION_CONFIG = {
-    "CONCURRENT_LIMIT": DB_CONFIG['CONCURRENT_LIMIT'],
     "BATCH_SIZE": DB_CONFIG['BATCH_SIZE'],
     "MAX_RETRIES": DB_CONFIG['MAX_RETRIES'],
     "LOG_INTERVAL": 10,
     "RETRY_BASE_DELAY": 2,
-    "METRIC_PREFIX": "advanced_parallel"
+    "METRIC_PREFIX": "advanced_parallel",
+    # batched 방식에서 한 번의 LLM 호출로 평가할 답변 수
+    "BATCH_EVAL_SIZE": int(os.getenv('EVAL_BATCH_ANSWERS', 5)),
+    # 문제별 첫 평가를 먼저 보내 프롬프트 캐시를 채운 뒤 나머지를 보냄: auto | on | off
+    # auto 는 시작 회차에 노는 슬롯이 전체 작업의 10% 이하일 때만 사용
+    "PREFIX_WARMUP": os.getenv('EVAL_PREFIX_WARMUP', 'auto').lower(),
+    # 2단계 평가: 작은 모델이 먼저 채점하고 확신도가 낮거나 경계 점수인 답변만 큰 모델로 재평가
+    # (sequential / parallel / parallel_1 방식에 적용)
+    "CASCADE": os.getenv('EVAL_CASCADE', 'false').lower() == 'true',
+    "CASCADE_MODEL": os.getenv('EVAL_CASCADE_MODEL', 'gpt-4.1-nano'),
+    # 이 확신도 미만이면 재평가
+    "CASCADE_MIN_CONFIDENCE": float(os.getenv('EVAL_CASCADE_MIN_CONFIDENCE', 0.8)),
+    # 점수가 이 구간(양 끝 제외) 안이면 경계 답변으로 보고 재평가
+    "CASCADE_BORDERLINE_LOW": int(os.getenv('EVAL_CASCADE_BORDERLINE_LOW', 30)),
+    "CASCADE_BORDERLINE_HIGH": int(os.getenv('EVAL_CASCADE_BORDERLINE_HIGH', 85))
 }
\ No newline at end of file
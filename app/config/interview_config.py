@@ -0,0 +1,30 @@
+import os
+
+# 기술 면접 모범 답변 생성 설정
+INTERVIEW_CONFIG = {
+    # 대량 생성 요청 한 번에 받을 최대 질문 수
+    "BULK_MAX_QUESTIONS": int(os.getenv('INTERVIEW_BULK_MAX_QUESTIONS', 500)),
+    # 생성된 답변을 모아 한 번의 UPDATE 문으로 저장할 개수
+    "BULK_WRITE_SIZE": int(os.getenv('INTERVIEW_BULK_WRITE_SIZE', 20)),
+    # 같은 tech_class 에 이미 답변된 비슷한 질문이 있으면 LLM 호출 없이 그 답변을 재사용 (기본 꺼짐)
+    "ANSWER_CACHE": os.getenv('INTERVIEW_ANSWER_CACHE', 'false').lower() == 'true',
+    # 영문/숫자 토큰이 같고 문자 n-gram TF-IDF 코사인 유사도가 이 값 이상이면 재사용
+    "ANSWER_CACHE_THRESHOLD": float(os.getenv('INTERVIEW_ANSWER_CACHE_THRESHOLD', 0.85)),
+    "ANSWER_CACHE_NGRAM_RANGE": (2, 3),
+    # 다른 워커가 저장한 답변을 반영하기 위해 tech_class 별 색인을 다시 읽는 주기(초)
+    "ANSWER_CACHE_TTL_SECONDS": int(os.getenv('INTERVIEW_ANSWER_CACHE_TTL', 600)),
+    # 비어 있는 모범 답안 사전 생성 (워커 작업). 한 번에 처리할 질문 수
+    "PRECOMPUTE_BATCH_SIZE": int(os.getenv('INTERVIEW_PRECOMPUTE_BATCH_SIZE', 50)),
+    # 사전 생성이 동시에 쓰는 "interview" 리미터 슬롯 수 상한
+    "PRECOMPUTE_CONCURRENCY": int(os.getenv('INTERVIEW_PRECOMPUTE_CONCURRENCY', 2)),
+    # 리미터 대기열 우선순위 (요청 처리의 기본값 0 보다 낮아야 요청이 먼저 슬롯을 받음)
+    "PRECOMPUTE_PRIORITY": int(os.getenv('INTERVIEW_PRECOMPUTE_PRIORITY', -10)),
+    # 사전 생성에 하루(UTC) 동안 쓸 수 있는 LLM 비용 (0 이면 제한 없음)
+    "PRECOMPUTE_DAILY_BUDGET_USD": float(os.getenv('INTERVIEW_PRECOMPUTE_DAILY_BUDGET_USD', 2.0)),
+    # 사전 생성 워커가 이 시간(초)마다 비어 있는 답안을 찾아 채움 (0 이면 요청으로 등록한 작업만 실행)
+    "PRECOMPUTE_INTERVAL_SECONDS": int(os.getenv('INTERVIEW_PRECOMPUTE_INTERVAL', 600)),
+    # 생성이 이 횟수만큼 연속으로 실패한 질문은 사전 생성 대상에서 제외
+    "PRECOMPUTE_MAX_ATTEMPTS": int(os.getenv('INTERVIEW_PRECOMPUTE_MAX_ATTEMPTS', 3)),
+    # 마지막 실패 후 이 시간(초)이 지나면 실패 기록을 지우고 다시 시도 (프롬프트/모델 변경 반영)
+    "PRECOMPUTE_FAILURE_TTL_SECONDS": int(os.getenv('INTERVIEW_PRECOMPUTE_FAILURE_TTL', 60 * 60 * 24 * 7))
+}
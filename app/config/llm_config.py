@@ -0,0 +1,66 @@
+import os
+import json
+from app.db.mysql.connection import DB_CONFIG
+
+# 체인 호출 적응형 동시성 제한 (AIMD) 설정
+LLM_CONCURRENCY_CONFIG = {
+    # 시작 동시 실행 수 (기존 고정 세마포어 값과 동일)
+    "INITIAL_LIMIT": int(os.getenv('LLM_CONCURRENCY_INITIAL', DB_CONFIG['CONCURRENT_LIMIT'])),
+    "MIN_LIMIT": int(os.getenv('LLM_CONCURRENCY_MIN', 1)),
+    "MAX_LIMIT": int(os.getenv('LLM_CONCURRENCY_MAX', 50)),
+    # 429/타임아웃/지연 급증 시 limit 에 곱하는 값
+    "DECREASE_FACTOR": float(os.getenv('LLM_CONCURRENCY_DECREASE', 0.5)),
+    # 평균 지연 대비 이 배수를 넘으면 지연 급증으로 판단
+    "LATENCY_TOLERANCE": float(os.getenv('LLM_LATENCY_TOLERANCE', 2.0)),
+    # 평균 지연을 계산하기 전에 모을 최소 표본 수
+    "MIN_LATENCY_SAMPLES": 5
+}
+
+# 모델별 요청/토큰 속도 제한 (여러 컨테이너/워커가 Redis 토큰 버킷을 공유)
+LLM_RATE_LIMIT_CONFIG = {
+    "ENABLED": os.getenv('LLM_RATE_LIMIT', 'true').lower() == 'true',
+    # REDIS_URL 이 없으면 프로세스 내 버킷만 사용
+    "BACKEND": os.getenv('LLM_RATE_LIMIT_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'local'),
+    "DEFAULT_RPM": int(os.getenv('LLM_DEFAULT_RPM', 500)),
+    "DEFAULT_TPM": int(os.getenv('LLM_DEFAULT_TPM', 30000)),
+    # 모델별 한도: '{"gpt-4.1": {"rpm": 500, "tpm": 30000}}'
+    "MODEL_LIMITS": json.loads(os.getenv('LLM_RATE_LIMITS', '{}')),
+    # 호출 전에는 완성 토큰 수를 알 수 없으므로 이 값(또는 max_tokens)으로 예약 후 실제 사용량으로 정산
+    "COMPLETION_TOKENS_ESTIMATE": int(os.getenv('LLM_COMPLETION_TOKENS_ESTIMATE', 1000)),
+    # Redis 오류 시 로컬 버킷으로 전환해 두는 시간(초)
+    "FALLBACK_SECONDS": 30
+}
+
+# LLM 호출 녹화/재생 (성능 측정과 CI 에서 네트워크/비용 없이 실제 트래픽을 재현)
+LLM_CASSETTE_CONFIG = {
+    # off | record | replay
+    "MODE": os.getenv('LLM_CASSETTE_MODE', 'off').lower(),
+    "PATH": os.getenv('LLM_CASSETTE_PATH', 'cassettes/llm.jsonl.gz'),
+    # 재생 시 녹화된 지연 시간에 곱할 값 (0 이면 지연 없이 바로 응답)
+    "REPLAY_LATENCY_SCALE": float(os.getenv('LLM_CASSETTE_REPLAY_LATENCY', 0)),
+    # 재생 중 녹화에 없는 호출: error(오류) | live(실제 호출)
+    "ON_MISS": os.getenv('LLM_CASSETTE_ON_MISS', 'error').lower()
+}
+
+# 구조화 출력 (provider 네이티브 JSON 스키마 + 로컬 JSON 복구)
+LLM_STRUCTURED_OUTPUT_CONFIG = {
+    # json_schema(스키마 지정) | json_object(JSON 모드만) | prompt(기존처럼 포맷 안내문만 사용)
+    "MODE": os.getenv('LLM_STRUCTURED_OUTPUT', 'json_schema').lower(),
+    # strict 스키마는 모든 필드가 필수여야 하고 Dict 필드를 쓸 수 없어 기본은 끔
+    "STRICT": os.getenv('LLM_STRUCTURED_OUTPUT_STRICT', 'false').lower() == 'true',
+    # json_schema 를 지원하지 않는 모델 (json_object 로 대체)
+    "JSON_OBJECT_ONLY_MODELS": ("gpt-4-turbo", "gpt-4-0125", "gpt-4-1106", "gpt-3.5-turbo")
+}
+
+# 모델별 가격 (USD / 1M 토큰). 스냅샷 이름(gpt-4.1-2025-04-14 등)은 가장 긴 접두사로 매칭
+# LLM_PRICING='{"gpt-4.1": {"input": 2.0, "cached_input": 0.5, "output": 8.0}}' 로 덮어쓸 수 있음
+LLM_PRICING = {
+    "gpt-4.1": {"input": 2.00, "cached_input": 0.50, "output": 8.00},
+    "gpt-4.1-mini": {"input": 0.40, "cached_input": 0.10, "output": 1.60},
+    "gpt-4.1-nano": {"input": 0.10, "cached_input": 0.025, "output": 0.40},
+    "gpt-4o": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+    "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.60},
+    "gpt-4-turbo": {"input": 10.00, "cached_input": 10.00, "output": 30.00},
+    "gpt-4-turbo-preview": {"input": 10.00, "cached_input": 10.00, "output": 30.00},
+    **json.loads(os.getenv('LLM_PRICING', '{}'))
+}
@@ -0,0 +1,22 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+REDIS_CONFIG = {
+    "URL": os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+    # "redis": 별도 워커 프로세스가 Redis 큐를 소비, "stub": 테스트용 인메모리 브로커
+    "BROKER": os.getenv('DRAMATIQ_BROKER', 'redis'),
+    "JOB_TTL_SECONDS": int(os.getenv('EVALUATION_JOB_TTL', 60 * 60 * 24)),
+    # 진행 상황 저장소: "redis"(모든 워커/컨테이너 공유), "memory"(프로세스 내). REDIS_URL 이 없으면 memory
+    "PROGRESS_BACKEND": os.getenv('PROGRESS_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'memory'),
+    "PROGRESS_TTL_SECONDS": int(os.getenv('PROGRESS_TTL', 60 * 60 * 6)),
+    # LLM 토큰/비용 집계 저장소: "redis"(클러스터 전체 합산), "memory"(프로세스 내)
+    "USAGE_BACKEND": os.getenv('LLM_USAGE_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'memory'),
+    # 모범 답안 사전 생성 실패 횟수 저장소: "redis"(모든 워커 공유), "memory"(프로세스 내)
+    "ANSWER_FAILURE_BACKEND": os.getenv('ANSWER_FAILURE_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'memory'),
+    # 테스트 케이스 생성 스크립트 저장소: "redis"(모든 API 컨테이너 공유), "memory"(프로세스 내)
+    "GENERATOR_BACKEND": os.getenv('TESTCASE_GENERATOR_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'memory'),
+    # 일별 집계를 보관하는 기간
+    "USAGE_RETENTION_DAYS": int(os.getenv('LLM_USAGE_RETENTION_DAYS', 35))
+}
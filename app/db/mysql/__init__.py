@@ -1,5 +1,6 @@
 from .connection import MySQLConnection
 from .session import get_db
+from .async_session import get_async_db, get_evaluation_db, evaluation_session, job_session
 from .models import (
     Base,
     Contest,
@@ -15,6 +16,10 @@ from .models import (
 __all__ = [
     'MySQLConnection',
     'get_db',
+    'get_async_db',
+    'get_evaluation_db',
+    'evaluation_session',
+    'job_session',
     'Contest',
     'Problem',
     'Participant',
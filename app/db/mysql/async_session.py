@@ -0,0 +1,80 @@
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
+from app.db.mysql.connection import DB_CONFIG
+from app.db.mysql.session import SessionLocal
+import os
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv(verbose=True)
+
+# 비동기 데이터베이스 URL 생성 (aiomysql 드라이버)
+ASYNC_DATABASE_URL = f"mysql+aiomysql://{os.getenv('MYSQL_USER')}:{os.getenv('MYSQL_PASSWORD')}@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DB_NAME')}"
+
+# 비동기 엔진 생성
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_recycle=1800
+)
+
+# 비동기 세션 팩토리 생성
+# commit 후 속성 접근 시 암묵적 lazy load(IO)가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+async def get_async_db() -> AsyncSession:
+    """비동기 데이터베이스 세션을 가져오는 함수"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+@asynccontextmanager
+async def evaluation_session():
+    """평가용 세션 컨텍스트 (MYSQL_ASYNC=true 이면 AsyncSession, 아니면 기존 Session)
+
+    스트리밍 응답처럼 요청 의존성보다 오래 살아야 하는 곳에서 직접 연다.
+    """
+    if DB_CONFIG['ASYNC_DB']:
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+@asynccontextmanager
+async def job_session():
+    """백그라운드 작업(dramatiq 워커)용 세션 컨텍스트
+
+    작업마다 asyncio.run 으로 새 이벤트 루프를 쓰고 워커 스레드도 여럿이라, 루프에 묶이는
+    aiomysql 커넥션을 공용 async_engine 풀에서 나눠 쓰지 않는다. 작업마다 NullPool 엔진을
+    만들고 끝나면 그 엔진만 정리한다. MYSQL_ASYNC=false 이면 기존 Session 을 쓴다.
+    """
+    if not DB_CONFIG['ASYNC_DB']:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+
+    engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=NullPool)
+    try:
+        async with AsyncSession(bind=engine, autoflush=False, expire_on_commit=False) as db:
+            yield db
+    finally:
+        await engine.dispose()
+
+async def get_evaluation_db():
+    """평가 API용 세션 의존성"""
+    async with evaluation_session() as db:
+        yield db
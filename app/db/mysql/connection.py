@@ -13,7 +13,8 @@ DB_CONFIG = {
     "POOL_SIZE": int(os.getenv('MYSQL_POOL_SIZE', 10)),
     "CONCURRENT_LIMIT": int(os.getenv('CONCURRENT_LIMIT', 10)),
     "BATCH_SIZE": int(os.getenv('BATCH_SIZE', 20)),
-    "MAX_RETRIES": int(os.getenv('MAX_RETRIES', 2))
+    "MAX_RETRIES": int(os.getenv('MAX_RETRIES', 2)),
+    "ASYNC_DB": os.getenv('MYSQL_ASYNC', 'false').lower() == 'true'
 }
 
 class MySQLConnection:
@@ -1,7 +1,18 @@
-from .contest_repository import ContestRepository
+from .contest_repository import ContestRepository, ContestSnapshot, ProblemSnapshot, AnswerSnapshot
 from .tech_interview_repository import TechInterviewRepository
+from .answer_repository import AnswerRepository
+from .async_contest_repository import AsyncContestRepository
+from .async_tech_interview_repository import AsyncTechInterviewRepository
+from .async_answer_repository import AsyncAnswerRepository
 
 __all__ = [
     'ContestRepository',
-    'TechInterviewRepository'
-] 
\ No newline at end of file
+    'ContestSnapshot',
+    'ProblemSnapshot',
+    'AnswerSnapshot',
+    'TechInterviewRepository',
+    'AnswerRepository',
+    'AsyncContestRepository',
+    'AsyncTechInterviewRepository',
+    'AsyncAnswerRepository'
+]
@@ -0,0 +1,60 @@
+from sqlalchemy import update, case
+from sqlalchemy.orm import Session
+from app.db.mysql.models import Answer
+from typing import List, Dict, Any
+
+class AnswerRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def bulk_update_evaluations(self, items: List[Dict[str, Any]]) -> int:
+        """answer_id 기준으로 rank_score/feedback 을 하나의 UPDATE 문으로 반영
+
+        Args:
+            items: answer_id, score, feedback 키를 가진 평가 결과 목록
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        if not items:
+            return 0
+
+        try:
+            result = self.db_session.execute(bulk_update_statement(items))
+            self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
+    def update_evaluation(self, answer_id: int, score: int, feedback: str) -> bool:
+        """단일 답변의 평가 결과 반영 (배치 실패 시 개별 재시도용)"""
+        try:
+            result = self.db_session.execute(update_statement(answer_id, score, feedback))
+            self.db_session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
+def bulk_update_statement(items: List[Dict[str, Any]]):
+    """UPDATE answer SET rank_score = CASE id ..., feedback = CASE id ... WHERE id IN (...)"""
+    scores = {item['answer_id']: item['score'] for item in items}
+    feedbacks = {item['answer_id']: item['feedback'] for item in items}
+    return (
+        update(Answer)
+        .where(Answer.id.in_(list(scores.keys())))
+        .values(
+            rank_score=case(scores, value=Answer.id),
+            feedback=case(feedbacks, value=Answer.id)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+def update_statement(answer_id: int, score: int, feedback: str):
+    return (
+        update(Answer)
+        .where(Answer.id == answer_id)
+        .values(rank_score=score, feedback=feedback)
+        .execution_options(synchronize_session=False)
+    )
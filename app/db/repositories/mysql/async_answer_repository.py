@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.repositories.mysql.answer_repository import bulk_update_statement, update_statement
+from typing import List, Dict, Any
+
+class AsyncAnswerRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def bulk_update_evaluations(self, items: List[Dict[str, Any]]) -> int:
+        """AnswerRepository.bulk_update_evaluations 의 비동기 버전"""
+        if not items:
+            return 0
+
+        try:
+            result = await self.db_session.execute(bulk_update_statement(items))
+            await self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.db_session.rollback()
+            raise e
+
+    async def update_evaluation(self, answer_id: int, score: int, feedback: str) -> bool:
+        try:
+            result = await self.db_session.execute(update_statement(answer_id, score, feedback))
+            await self.db_session.commit()
+            return result.rowcount > 0
+        except Exception as e:
+            await self.db_session.rollback()
+            raise e
@@ -0,0 +1,76 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.mysql.models import Contest
+from app.db.repositories.mysql.contest_repository import (
+    ContestSnapshot,
+    problem_rows_statement,
+    answer_rows_statement,
+    build_contest_snapshot,
+    unevaluated_count_statement,
+    reset_answers_statement,
+    reset_contest_status_statement
+)
+from typing import List, Optional
+from datetime import datetime
+
+class AsyncContestRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, contest: Contest) -> Contest:
+        if not contest.created_at:
+            contest.created_at = datetime.utcnow()
+        self.db_session.add(contest)
+        await self.db_session.commit()
+        await self.db_session.refresh(contest)
+        return contest
+
+    async def get_by_id(self, contest_id: int) -> Optional[Contest]:
+        result = await self.db_session.execute(select(Contest).where(Contest.id == contest_id))
+        return result.scalars().first()
+
+    async def get_all(self) -> List[Contest]:
+        result = await self.db_session.execute(select(Contest))
+        return list(result.scalars().all())
+
+    async def update(self, contest: Contest) -> Contest:
+        await self.db_session.commit()
+        await self.db_session.refresh(contest)
+        return contest
+
+    async def delete(self, contest_id: int) -> bool:
+        contest = await self.get_by_id(contest_id)
+        if contest:
+            await self.db_session.delete(contest)
+            await self.db_session.commit()
+            return True
+        return False
+
+    async def get_by_space_id(self, space_id: int) -> List[Contest]:
+        result = await self.db_session.execute(select(Contest).where(Contest.space_id == space_id))
+        return list(result.scalars().all())
+
+    async def get_active_contests(self) -> List[Contest]:
+        result = await self.db_session.execute(select(Contest).where(Contest.submit == 0))
+        return list(result.scalars().all())
+
+    async def get_snapshot(self, contest_id: int) -> ContestSnapshot:
+        """ContestRepository.get_snapshot 의 비동기 버전"""
+        problem_rows = (await self.db_session.execute(problem_rows_statement(contest_id))).all()
+        answer_rows = (await self.db_session.execute(answer_rows_statement(contest_id))).all()
+        return build_contest_snapshot(contest_id, problem_rows, answer_rows)
+
+    async def count_unevaluated_answers(self, contest_id: int) -> int:
+        result = await self.db_session.execute(unevaluated_count_statement(contest_id))
+        return result.scalar_one()
+
+    async def reset_evaluations(self, contest_id: int) -> int:
+        """ContestRepository.reset_evaluations 의 비동기 버전"""
+        try:
+            result = await self.db_session.execute(reset_answers_statement(contest_id))
+            await self.db_session.execute(reset_contest_status_statement(contest_id))
+            await self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.db_session.rollback()
+            raise e
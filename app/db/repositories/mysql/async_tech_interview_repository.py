@@ -0,0 +1,80 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.mysql.models import TechInterview
+from app.db.repositories.mysql.tech_interview_repository import bulk_update_answers_statement, missing_answers_statement
+from typing import List, Optional, Dict, Any, Iterable
+
+class AsyncTechInterviewRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, tech_interview: TechInterview) -> TechInterview:
+        self.db_session.add(tech_interview)
+        await self.db_session.commit()
+        await self.db_session.refresh(tech_interview)
+        return tech_interview
+
+    async def get_by_id(self, tech_interview_id: int) -> Optional[TechInterview]:
+        result = await self.db_session.execute(select(TechInterview).where(TechInterview.id == tech_interview_id))
+        return result.scalars().first()
+
+    async def get_by_ids(self, tech_interview_ids: Iterable[int]) -> List[TechInterview]:
+        result = await self.db_session.execute(
+            select(TechInterview).where(TechInterview.id.in_(list(tech_interview_ids)))
+        )
+        return list(result.scalars().all())
+
+    async def get_all(self) -> List[TechInterview]:
+        result = await self.db_session.execute(select(TechInterview))
+        return list(result.scalars().all())
+
+    async def update(self, tech_interview: TechInterview) -> TechInterview:
+        try:
+            # 기존 엔티티를 가져와서 업데이트
+            existing = await self.get_by_id(tech_interview.id)
+            if existing:
+                for key, value in tech_interview.__dict__.items():
+                    if not key.startswith('_'):
+                        setattr(existing, key, value)
+                await self.db_session.commit()
+                await self.db_session.refresh(existing)
+                return existing
+            return None
+        except Exception as e:
+            await self.db_session.rollback()
+            raise e
+
+    async def delete(self, tech_interview_id: int) -> bool:
+        tech_interview = await self.get_by_id(tech_interview_id)
+        if tech_interview:
+            await self.db_session.delete(tech_interview)
+            await self.db_session.commit()
+            return True
+        return False
+
+    async def get_by_tech_class(self, tech_class: int) -> List[TechInterview]:
+        result = await self.db_session.execute(select(TechInterview).where(TechInterview.tech_class == tech_class))
+        return list(result.scalars().all())
+
+    async def get_answered_by_tech_class(self, tech_class: int) -> List[TechInterview]:
+        result = await self.db_session.execute(
+            select(TechInterview).where(TechInterview.tech_class == tech_class, TechInterview.ai_answer.isnot(None))
+        )
+        return list(result.scalars().all())
+
+    async def get_missing_answers(self, limit: int, exclude_ids: Iterable[int] = ()) -> List[TechInterview]:
+        result = await self.db_session.execute(missing_answers_statement(limit, exclude_ids))
+        return list(result.scalars().all())
+
+    async def bulk_update_answers(self, items: List[Dict[str, Any]]) -> int:
+        """TechInterviewRepository.bulk_update_answers 의 비동기 버전"""
+        if not items:
+            return 0
+
+        try:
+            result = await self.db_session.execute(bulk_update_answers_statement(items))
+            await self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.db_session.rollback()
+            raise e
@@ -1,8 +1,35 @@
+from sqlalchemy import select, update, func
 from sqlalchemy.orm import Session
-from app.db.mysql.models import Contest
-from typing import List, Optional
+from app.db.mysql.models import Contest, Problem, Answer, Participant, TechInterview, TechClass
+from typing import List, Optional, NamedTuple, Tuple
 from datetime import datetime
 
+class AnswerSnapshot(NamedTuple):
+    """채점에 필요한 답변 컬럼만 담은 불변 스냅샷"""
+    answer_id: int
+    participant_id: int
+    nickname: Optional[str]
+    answer: Optional[str]
+    feedback: Optional[str]
+    rank_score: Optional[int]
+
+class ProblemSnapshot(NamedTuple):
+    """문제 + 기술 면접 질문 + 답변 목록 스냅샷"""
+    id: int
+    question: Optional[str]
+    ai_answer: Optional[str]
+    tech_class: Optional[str]
+    answers: Tuple[AnswerSnapshot, ...]
+
+class ContestSnapshot(NamedTuple):
+    """콘테스트 채점용 스냅샷"""
+    contest_id: int
+    problems: Tuple[ProblemSnapshot, ...]
+
+    @property
+    def total_answers(self) -> int:
+        return sum(len(problem.answers) for problem in self.problems)
+
 class ContestRepository:
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -38,4 +65,111 @@ class ContestRepository:
         return self.db_session.query(Contest).filter(Contest.space_id == space_id).all()
 
     def get_active_contests(self) -> List[Contest]:
-        return self.db_session.query(Contest).filter(Contest.submit == 0).all() 
\ No newline at end of file
+        return self.db_session.query(Contest).filter(Contest.submit == 0).all()
+
+    def get_snapshot(self, contest_id: int) -> ContestSnapshot:
+        """문제/기술 면접/답변/참가자 닉네임을 두 번의 조인 쿼리로 조회
+
+        문제별 lazy load 와 답변별 참가자 조회(N+1)를 피하기 위해 필요한 컬럼만 projection 한다.
+        """
+        problem_rows = self.db_session.execute(problem_rows_statement(contest_id)).all()
+        answer_rows = self.db_session.execute(answer_rows_statement(contest_id)).all()
+
+        return build_contest_snapshot(contest_id, problem_rows, answer_rows)
+
+    def count_unevaluated_answers(self, contest_id: int) -> int:
+        """아직 채점 결과(feedback)가 저장되지 않은 답변 수"""
+        return self.db_session.execute(unevaluated_count_statement(contest_id)).scalar_one()
+
+    def reset_evaluations(self, contest_id: int) -> int:
+        """콘테스트의 채점 결과를 지우고 EVALUATED 상태를 COMPLETED 로 되돌림 (강제 재채점용)
+
+        Returns:
+            int: 초기화된 답변 수
+        """
+        try:
+            result = self.db_session.execute(reset_answers_statement(contest_id))
+            self.db_session.execute(reset_contest_status_statement(contest_id))
+            self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
+def problem_rows_statement(contest_id: int):
+    """문제 + 기술 면접 컬럼 조회 쿼리"""
+    return (
+        select(
+            Problem.id,
+            TechInterview.question,
+            TechInterview.ai_answer,
+            TechInterview.tech_class
+        )
+        .outerjoin(TechInterview, Problem.tech_interview_id == TechInterview.id)
+        .where(Problem.contest_id == contest_id)
+        .order_by(Problem.id)
+    )
+
+def answer_rows_statement(contest_id: int):
+    """콘테스트 전체 답변 + 참가자 닉네임 조회 쿼리"""
+    return (
+        select(
+            Answer.problem_id,
+            Answer.id,
+            Answer.participant_id,
+            Participant.nickname,
+            Answer.answer,
+            Answer.feedback,
+            Answer.rank_score
+        )
+        .join(Problem, Answer.problem_id == Problem.id)
+        .outerjoin(Participant, Answer.participant_id == Participant.id)
+        .where(Problem.contest_id == contest_id)
+        .order_by(Answer.problem_id, Answer.id)
+    )
+
+def build_contest_snapshot(contest_id: int, problem_rows, answer_rows) -> ContestSnapshot:
+    """get_snapshot 쿼리 결과 행을 ContestSnapshot 으로 조립"""
+    answers_by_problem = {}
+    for problem_id, answer_id, participant_id, nickname, answer, feedback, rank_score in answer_rows:
+        answers_by_problem.setdefault(problem_id, []).append(
+            AnswerSnapshot(answer_id, participant_id, nickname, answer, feedback, rank_score)
+        )
+
+    problems = tuple(
+        ProblemSnapshot(
+            id=problem_id,
+            question=question,
+            ai_answer=ai_answer,
+            tech_class=TechClass(tech_class).name if tech_class is not None else None,
+            answers=tuple(answers_by_problem.get(problem_id, ()))
+        )
+        for problem_id, question, ai_answer, tech_class in problem_rows
+    )
+    return ContestSnapshot(contest_id=contest_id, problems=problems)
+
+def unevaluated_count_statement(contest_id: int):
+    """feedback 이 없는 답변 수 조회 쿼리 (feedback 저장 여부로 채점 완료 판단)"""
+    return (
+        select(func.count(Answer.id))
+        .join(Problem, Answer.problem_id == Problem.id)
+        .where(Problem.contest_id == contest_id, Answer.feedback.is_(None))
+    )
+
+def reset_answers_statement(contest_id: int):
+    """UPDATE answer SET feedback = NULL, rank_score = 0 WHERE problem_id IN (콘테스트 문제)"""
+    return (
+        update(Answer)
+        .where(Answer.problem_id.in_(select(Problem.id).where(Problem.contest_id == contest_id)))
+        .values(feedback=None, rank_score=0)
+        .execution_options(synchronize_session=False)
+    )
+
+def reset_contest_status_statement(contest_id: int):
+    """EVALUATED(2) -> COMPLETED(1)"""
+    return (
+        update(Contest)
+        .where(Contest.id == contest_id, Contest.submit == 2)
+        .values(submit=1)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,6 +1,7 @@
+from sqlalchemy import update, case, select, exists, or_
 from sqlalchemy.orm import Session
-from app.db.mysql.models import TechInterview
-from typing import List, Optional
+from app.db.mysql.models import TechInterview, Problem, Contest
+from typing import List, Optional, Dict, Any, Iterable
 
 class TechInterviewRepository:
     def __init__(self, db_session: Session):
@@ -15,6 +16,9 @@ class TechInterviewRepository:
     def get_by_id(self, tech_interview_id: int) -> Optional[TechInterview]:
         return self.db_session.query(TechInterview).filter(TechInterview.id == tech_interview_id).first()
 
+    def get_by_ids(self, tech_interview_ids: Iterable[int]) -> List[TechInterview]:
+        return self.db_session.query(TechInterview).filter(TechInterview.id.in_(list(tech_interview_ids))).all()
+
     def get_all(self) -> List[TechInterview]:
         return self.db_session.query(TechInterview).all()
 
@@ -43,4 +47,64 @@ class TechInterviewRepository:
         return False
 
     def get_by_tech_class(self, tech_class: int) -> List[TechInterview]:
-        return self.db_session.query(TechInterview).filter(TechInterview.tech_class == tech_class).all() 
\ No newline at end of file
+        return self.db_session.query(TechInterview).filter(TechInterview.tech_class == tech_class).all()
+
+    def get_answered_by_tech_class(self, tech_class: int) -> List[TechInterview]:
+        """AI 답변이 저장된 질문만 조회 (유사 질문 답변 재사용 색인용)"""
+        return self.db_session.query(TechInterview).filter(
+            TechInterview.tech_class == tech_class,
+            TechInterview.ai_answer.isnot(None)
+        ).all()
+
+    def get_missing_answers(self, limit: int, exclude_ids: Iterable[int] = ()) -> List[TechInterview]:
+        """ai_answer/key_point 가 비어 있는 질문 조회 (채점 전 대회에 출제된 질문 먼저, exclude_ids 제외)"""
+        return list(self.db_session.execute(missing_answers_statement(limit, exclude_ids)).scalars().all())
+
+    def bulk_update_answers(self, items: List[Dict[str, Any]]) -> int:
+        """id 기준으로 ai_answer/key_point/additional_topics 를 하나의 UPDATE 문으로 반영
+
+        Args:
+            items: id, ai_answer, key_point, additional_topics 키를 가진 생성 결과 목록
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        if not items:
+            return 0
+
+        try:
+            result = self.db_session.execute(bulk_update_answers_statement(items))
+            self.db_session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.db_session.rollback()
+            raise e
+
+def missing_answers_statement(limit: int, exclude_ids: Iterable[int] = ()):
+    """SELECT ... WHERE ai_answer/key_point 가 비어 있음 AND id NOT IN (exclude_ids) ORDER BY 채점 전 대회 출제 여부, id"""
+    in_open_contest = exists().where(
+        Problem.tech_interview_id == TechInterview.id,
+        Problem.contest_id == Contest.id,
+        Contest.submit != 2  # EVALUATED 가 아닌 대회
+    )
+    statement = select(TechInterview).where(
+        or_(TechInterview.ai_answer.is_(None), TechInterview.ai_answer == "", TechInterview.key_point.is_(None))
+    )
+    exclude_ids = list(exclude_ids)
+    if exclude_ids:
+        # 생성이 계속 실패하는 질문은 매번 다시 뽑히지 않도록 제외
+        statement = statement.where(TechInterview.id.notin_(exclude_ids))
+    return statement.order_by(case((in_open_contest, 0), else_=1), TechInterview.id).limit(limit)
+
+def bulk_update_answers_statement(items: List[Dict[str, Any]]):
+    """UPDATE tech_interview SET ai_answer = CASE id ..., ... WHERE id IN (...)"""
+    ids = [item['id'] for item in items]
+    return (
+        update(TechInterview)
+        .where(TechInterview.id.in_(ids))
+        .values(**{
+            column: case({item['id']: item[column] for item in items}, value=TechInterview.id)
+            for column in ('ai_answer', 'key_point', 'additional_topics')
+        })
+        .execution_options(synchronize_session=False)
+    )
@@ -10,7 +10,8 @@ from app.api.routes import (
     metrics_router,
     coding_test_router,
     resume_router,
-    interview_router
+    interview_router,
+    usage_router
 )
 
 @asynccontextmanager
@@ -49,6 +50,7 @@ app.include_router(metrics_router)
 app.include_router(coding_test_router)
 app.include_router(resume_router)
 app.include_router(interview_router)
+app.include_router(usage_router)
 
 # 엔트리 포인트
 if __name__ == "__main__":
@@ -1,7 +1,26 @@
 from .evaluation import (
     EVALUATION_DURATION,
     EVALUATION_COUNTER,
-    EVALUATION_ERROR_COUNTER
+    EVALUATION_ERROR_COUNTER,
+    EVALUATION_TOKEN_COUNTER,
+    EVALUATION_QUEUE_WAIT,
+    EVALUATION_CASCADE_COUNTER
+)
+from .llm import (
+    LLM_CONCURRENCY_LIMIT,
+    LLM_IN_FLIGHT,
+    LLM_QUEUE_DEPTH,
+    LLM_LIMIT_DECREASE_COUNTER,
+    LLM_CALL_COUNTER,
+    LLM_TOKEN_COUNTER,
+    LLM_COST_COUNTER,
+    LLM_CALL_DURATION,
+    LLM_PROMPT_CACHE_RATIO,
+    LLM_OUTPUT_REPAIR_COUNTER,
+    LLM_RETRY_AVOIDED_COUNTER,
+    LLM_OUTPUT_PARSE_FAILURE_COUNTER,
+    LLM_ANSWER_CACHE_COUNTER,
+    LLM_ANSWER_CACHE_SIMILARITY
 )
 from .system import (
     CPU_USAGE,
@@ -18,6 +37,23 @@ __all__ = [
     'EVALUATION_DURATION',
     'EVALUATION_COUNTER',
     'EVALUATION_ERROR_COUNTER',
+    'EVALUATION_TOKEN_COUNTER',
+    'EVALUATION_QUEUE_WAIT',
+    'EVALUATION_CASCADE_COUNTER',
+    'LLM_CONCURRENCY_LIMIT',
+    'LLM_IN_FLIGHT',
+    'LLM_QUEUE_DEPTH',
+    'LLM_LIMIT_DECREASE_COUNTER',
+    'LLM_CALL_COUNTER',
+    'LLM_TOKEN_COUNTER',
+    'LLM_COST_COUNTER',
+    'LLM_CALL_DURATION',
+    'LLM_PROMPT_CACHE_RATIO',
+    'LLM_OUTPUT_REPAIR_COUNTER',
+    'LLM_RETRY_AVOIDED_COUNTER',
+    'LLM_OUTPUT_PARSE_FAILURE_COUNTER',
+    'LLM_ANSWER_CACHE_COUNTER',
+    'LLM_ANSWER_CACHE_SIMILARITY',
     'CPU_USAGE',
     'MEMORY_USAGE',
     'update_system_metrics',
@@ -17,4 +17,22 @@ EVALUATION_ERROR_COUNTER = Counter(
     'evaluation_errors_total',
     'Total number of evaluation errors',
     ['method', 'error_type']
-)
\ No newline at end of file
+)
+
+EVALUATION_TOKEN_COUNTER = Counter(
+    'evaluation_tokens_total',
+    'Total number of LLM tokens used for evaluations',
+    ['method', 'token_type']
+)
+EVALUATION_QUEUE_WAIT = Histogram(
+    'evaluation_queue_wait_seconds',
+    'Time an answer evaluation waits in the shared scheduler before its LLM call starts',
+    ['contest_id'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+
+EVALUATION_CASCADE_COUNTER = Counter(
+    'evaluation_cascade_total',
+    'Cascade evaluation outcomes (accepted by the small model or escalated to the large model)',
+    ['outcome']
+)
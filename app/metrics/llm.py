@@ -0,0 +1,94 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# LLM 체인 호출 동시성 관련 메트릭
+LLM_CONCURRENCY_LIMIT = Gauge(
+    'llm_concurrency_limit',
+    'Current adaptive concurrency limit for LLM calls',
+    ['limiter']
+)
+
+LLM_IN_FLIGHT = Gauge(
+    'llm_in_flight_requests',
+    'Number of LLM calls currently running',
+    ['limiter']
+)
+
+LLM_LIMIT_DECREASE_COUNTER = Counter(
+    'llm_concurrency_decrease_total',
+    'Total number of adaptive concurrency limit decreases',
+    ['limiter', 'reason']
+)
+
+LLM_QUEUE_DEPTH = Gauge(
+    'llm_queue_depth',
+    'Number of LLM calls waiting for a concurrency slot',
+    ['limiter']
+)
+
+
+# 체인별 토큰/비용 메트릭 (space_id/user_id 는 카디널리티 문제로 /api/v1/ai/usage 집계에서만 제공)
+LLM_CALL_COUNTER = Counter(
+    'llm_calls_total',
+    'Total number of LLM calls',
+    ['chain', 'model', 'status']
+)
+
+LLM_TOKEN_COUNTER = Counter(
+    'llm_tokens_total',
+    'Total number of LLM tokens by kind (prompt, completion, cached)',
+    ['chain', 'model', 'kind']
+)
+
+LLM_COST_COUNTER = Counter(
+    'llm_cost_usd_total',
+    'Estimated LLM cost in USD',
+    ['chain', 'model']
+)
+
+LLM_CALL_DURATION = Histogram(
+    'llm_call_duration_seconds',
+    'LLM call latency in seconds',
+    ['chain', 'model'],
+    buckets=[0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300]
+)
+
+LLM_PROMPT_CACHE_RATIO = Histogram(
+    'llm_prompt_cache_hit_ratio',
+    'Share of prompt tokens served from the provider prompt cache per call',
+    ['chain', 'model'],
+    buckets=[0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]
+)
+
+
+# 구조화 출력 로컬 복구 메트릭 (복구에 성공한 만큼 LLM 재호출을 아낀 것)
+LLM_OUTPUT_REPAIR_COUNTER = Counter(
+    'llm_output_repairs_total',
+    'Total number of malformed LLM outputs repaired locally, by defect',
+    ['chain', 'defect']
+)
+
+LLM_RETRY_AVOIDED_COUNTER = Counter(
+    'llm_retries_avoided_total',
+    'Total number of LLM retries avoided by local output repair',
+    ['chain']
+)
+
+LLM_OUTPUT_PARSE_FAILURE_COUNTER = Counter(
+    'llm_output_parse_failures_total',
+    'Total number of LLM outputs that could not be parsed even after repair',
+    ['chain']
+)
+
+# 유사 질문 답변 재사용 (hit 비율 = hit / (hit + miss))
+LLM_ANSWER_CACHE_COUNTER = Counter(
+    'llm_answer_cache_lookups_total',
+    'Total number of semantic answer cache lookups by outcome (hit, miss)',
+    ['chain', 'outcome']
+)
+
+LLM_ANSWER_CACHE_SIMILARITY = Histogram(
+    'llm_answer_cache_similarity',
+    'Best cosine similarity found per semantic answer cache lookup',
+    ['chain'],
+    buckets=[0.1, 0.3, 0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 1.0]
+)
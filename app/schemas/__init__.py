@@ -4,7 +4,8 @@ from .coding_test import (
     ProblemBase, ProblemCreate, ProblemResponse,
     ParticipantBase, ParticipantCreate, ParticipantResponse,
     AnswerBase, AnswerCreate, AnswerResponse,
-    TestCaseInput, TestCase, TestCaseAnswer, TestCaseRequest
+    TestCaseInput, TestCase, TestCaseAnswer, TestCaseInputs, TestCaseRequest,
+    TestCaseGenerator, GeneratedTestCase, GeneratedTestCaseAnswer
 )
 from .resume import (
     ResumeBase, ResumeCreate, ResumeResponse,
@@ -13,7 +14,8 @@ from .resume import (
 )
 from .interview import (
     InterviewQuestionInput, InterviewAnswer,
-    ParticipantAnswer, Evaluation,
+    BulkInterviewAnswerInput, BulkInterviewAnswerItem, BulkInterviewAnswerResult,
+    ParticipantAnswer, Evaluation, BatchEvaluationItem, BatchEvaluation,
     TechInterviewBase, TechInterviewCreate, TechInterviewResponse,
     QuestionBase, QuestionCreate, QuestionResponse,
     ParticipantQnaBase, ParticipantQnaCreate, ParticipantQnaResponse,
@@ -26,12 +28,14 @@ __all__ = [
     'ProblemBase', 'ProblemCreate', 'ProblemResponse',
     'ParticipantBase', 'ParticipantCreate', 'ParticipantResponse',
     'AnswerBase', 'AnswerCreate', 'AnswerResponse',
-    'TestCaseInput', 'TestCase', 'TestCaseAnswer', 'TestCaseRequest',
+    'TestCaseInput', 'TestCase', 'TestCaseAnswer', 'TestCaseInputs', 'TestCaseRequest',
+    'TestCaseGenerator', 'GeneratedTestCase', 'GeneratedTestCaseAnswer',
     'ResumeBase', 'ResumeCreate', 'ResumeResponse',
     'PortfolioRequest', 'FeatureDetail', 'ServiceComponent',
     'SystemArchitecture', 'PortfolioData', 'PortfolioResponse',
     'InterviewQuestionInput', 'InterviewAnswer',
-    'ParticipantAnswer', 'Evaluation',
+    'BulkInterviewAnswerInput', 'BulkInterviewAnswerItem', 'BulkInterviewAnswerResult',
+    'ParticipantAnswer', 'Evaluation', 'BatchEvaluationItem', 'BatchEvaluation',
     'TechInterviewBase', 'TechInterviewCreate', 'TechInterviewResponse',
     'QuestionBase', 'QuestionCreate', 'QuestionResponse',
     'ParticipantQnaBase', 'ParticipantQnaCreate', 'ParticipantQnaResponse',
@@ -79,6 +79,10 @@ class TestCaseInput(BaseModel):
         - large: 성능 테스트를 위한 대용량 데이터 케이스""",
         default=["basic"]
     )
+    run_solution: Optional[bool] = Field(
+        description="LLM 은 입력만 만들고 출력(.out)은 예시 솔루션을 실행해 만들지 여부 (없으면 서버 설정)",
+        default=None
+    )
 
     class Config:
         schema_extra = {
@@ -145,6 +149,39 @@ class TestCaseAnswer(BaseModel):
         # 기본값 반환
         return super().model_validate({"testcases": []})
 
+class TestCaseGenerator(BaseModel):
+    """대용량(large) 테스트 케이스 입력을 만드는 생성 스크립트"""
+    code: str = Field(description="sys.argv[1] 의 시드로 random 을 초기화하고 입력 전체를 표준 출력으로 쓰는 Python 3 프로그램")
+    seed: int = Field(description="생성 스크립트에 넘길 난수 시드")
+    description: str = Field(description="생성되는 입력 설명 (예: N=1000000, 모든 값이 최댓값)", default="")
+
+class TestCaseInputs(BaseModel):
+    """예시 솔루션 실행 모드에서 LLM 이 만드는 테스트 케이스 입력 목록"""
+    inputs: List[str] = Field(description="테스트 케이스 입력(.in 파일 내용) 목록")
+    generators: List[TestCaseGenerator] = Field(
+        description="대용량(large) 케이스의 입력 생성 스크립트 목록 (large 유형을 요청한 경우만)",
+        default_factory=list
+    )
+
+class GeneratedTestCase(TestCaseGenerator):
+    """ZIP 을 만들 때 생성 스크립트와 예시 솔루션을 실행해 채우는 테스트 케이스"""
+    name: str = Field(description="파일 이름 번호 (name.in / name.out)")
+    input_bytes: int = Field(description="검증 실행에서 생성된 입력 크기 (바이트)", default=0)
+    output_bytes: int = Field(description="검증 실행에서 예시 솔루션이 출력한 크기 (바이트)", default=0)
+    input_preview: str = Field(description="생성된 입력의 앞부분", default="")
+
+class GeneratedTestCaseAnswer(TestCaseAnswer):
+    """생성 결과 (입력이 큰 케이스는 내용 대신 생성 스크립트로 전달)"""
+    generators: List[GeneratedTestCase] = Field(description="생성 스크립트로 만드는 테스트 케이스 (확인용)", default_factory=list)
+    generator_set_id: Optional[str] = Field(
+        description="서버에 보관한 생성 스크립트/예시 솔루션 ID (save-testcases 의 generator_set_id 로 전달)",
+        default=None
+    )
+
 class TestCaseRequest(BaseModel):
     test_case_id: str
-    testcases: List[Dict[str, str]] 
\ No newline at end of file
+    testcases: List[Dict[str, str]]
+    # 생성 스크립트 케이스: 실행할 코드는 요청으로 받지 않고 generate-testcases 가 서버에 보관한 것을 ID 로 참조
+    generator_set_id: Optional[str] = None
+    # ZIP 에 넣을 생성 스크립트 케이스 이름 (없으면 전부)
+    generator_names: Optional[List[str]] = None 
\ No newline at end of file
@@ -36,6 +36,38 @@ class InterviewAnswer(BaseModel):
             }
         }
 
+# 면접 답변 대량 생성 입력 스키마
+class BulkInterviewAnswerInput(BaseModel):
+    """여러 질문의 AI 답변을 한 번에 생성하기 위한 입력 스키마"""
+    questionIds: List[int]
+    # False 이면 이미 답변이 있는 질문은 건너뜀
+    force: bool = False
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "questionIds": [4, 5, 6],
+                "force": False
+            }
+        }
+
+class BulkInterviewAnswerItem(BaseModel):
+    """질문별 생성 결과 (status: success | skipped | not_found | failed | deferred)"""
+    id: int
+    status: str
+    answer: Optional[InterviewAnswer] = None
+    error: Optional[str] = None
+    # 비슷한 질문의 기존 답변을 재사용했으면 True
+    cached: bool = False
+
+class BulkInterviewAnswerResult(BaseModel):
+    total: int
+    success: int
+    skipped: int
+    failed: int
+    cached: int = 0
+    results: List[BulkInterviewAnswerItem]
+
 class ParticipantAnswer(BaseModel):
     participant_id: int
     nickname: str
@@ -66,6 +98,20 @@ class Evaluation(BaseModel):
             }
         }
 
+class CascadeEvaluation(Evaluation):
+    """작은 모델의 1차 평가 결과 (확신도가 낮거나 경계 점수면 큰 모델로 재평가)"""
+    confidence: float = Field(description="채점 결과에 대한 확신도 (0.0-1.0)")
+
+class BatchEvaluationItem(BaseModel):
+    """여러 답변을 한 번에 평가할 때의 개별 결과"""
+    answer_id: int = Field(description="평가한 답변의 answer_id")
+    score: int = Field(description="답변의 점수 (0-100)")
+    feedback: str = Field(description="답변에 대한 피드백")
+
+class BatchEvaluation(BaseModel):
+    """한 문제에 대한 여러 답변의 평가 결과"""
+    evaluations: List[BatchEvaluationItem] = Field(description="answer_id 별 평가 결과 목록")
+
 # 기존 면접 관련 스키마들
 class TechInterviewBase(BaseModel):
     additional_topics: Optional[str] = None
@@ -1,7 +1,8 @@
 from .testcase import generate_test_case_answer
-from .testcase_zip import create_simple_test_case_zip
+from .testcase_zip import iter_test_case_zip, create_test_case_zip
 
 __all__ = [
     'generate_test_case_answer',
-    'create_simple_test_case_zip'
+    'iter_test_case_zip',
+    'create_test_case_zip'
 ] 
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""대용량(large) 테스트 케이스 생성 스크립트 실행
+
+LLM 이 큰 입력을 직접 쓰는 대신 시드를 받는 작은 Python 생성 스크립트를 만들고,
+여기서 샌드박스로 실행해 입력을 만든다. 생성 스크립트의 표준 출력은 조각 단위로
+ZIP 과 예시 솔루션의 표준 입력에 동시에 흘려 보내고, 솔루션 출력은 이름 없는 임시 파일에
+받아 두었다가 .out 으로 이어서 쓴다. 수 MB 의 입력/출력을 메모리에 통째로 올리지 않는다.
+"""
+from typing import AsyncIterator, List, Optional, Tuple
+import asyncio
+import os
+import tempfile
+from app.config.coding_test_config import CODING_TEST_CONFIG
+from app.schemas.coding_test import GeneratedTestCase, TestCaseGenerator
+from app.services.coding_test.sandbox import (
+    OK,
+    SandboxError,
+    SolutionSandbox,
+    kill_process,
+    read_limited,
+    run_slots,
+    run_status
+)
+
+READ_SIZE = 64 * 1024
+
+def generator_sandbox(generator: TestCaseGenerator) -> SolutionSandbox:
+    """생성 스크립트용 샌드박스 (솔루션보다 CPU 시간/출력 한도가 큼)"""
+    return SolutionSandbox(
+        "python",
+        generator.code,
+        cpu_seconds=CODING_TEST_CONFIG['GENERATOR_CPU_SECONDS'],
+        wall_seconds=CODING_TEST_CONFIG['GENERATOR_WALL_SECONDS'],
+        output_mb=CODING_TEST_CONFIG['GENERATOR_OUTPUT_MB']
+    )
+
+class GeneratedCaseRun:
+    """
+    생성 스크립트 -> 예시 솔루션 파이프라인 실행 한 번
+
+    input_chunks() 로 생성된 입력을 받아 가는 동안 솔루션도 같은 입력을 읽고,
+    다 읽은 뒤 ok 이면 output_chunks() 로 솔루션 출력을 읽는다.
+
+    사용 예:
+        async with GeneratedCaseRun(generator_box, solution_box, seed) as run:
+            async for chunk in run.input_chunks(): ...
+            if run.ok:
+                async for chunk in run.output_chunks(): ...
+    """
+    def __init__(self, generator: SolutionSandbox, solution: SolutionSandbox, seed: int):
+        self.generator = generator
+        self.solution = solution
+        self.seed = seed
+        self.output = None
+        self.input_bytes = 0
+        self.generator_status: Optional[str] = None
+        self.solution_status: Optional[str] = None
+        self.stderr = ""
+        self._slot: Optional[asyncio.Semaphore] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.generator_status == OK and self.solution_status == OK
+
+    @property
+    def output_bytes(self) -> int:
+        if self.output is None or self.solution_status is None:
+            return 0
+        # 솔루션이 파일 디스크립터로 직접 쓰므로 파일 객체의 위치 대신 파일 크기를 봄
+        return os.fstat(self.output.fileno()).st_size
+
+    @property
+    def error(self) -> str:
+        if self.generator_status != OK:
+            return f"생성 스크립트 {self.generator_status}: {self.stderr}"
+        return f"예시 솔루션 {self.solution_status}: {self.stderr}"
+
+    async def __aenter__(self) -> "GeneratedCaseRun":
+        # 두 프로세스가 번갈아 일하므로 실행 슬롯은 하나만 차지
+        self._slot = run_slots()
+        await self._slot.acquire()
+        self.output = tempfile.TemporaryFile()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.output.close()
+        self._slot.release()
+
+    async def input_chunks(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CODING_TEST_CONFIG['GENERATOR_WALL_SECONDS']
+
+        def remaining() -> float:
+            return max(deadline - loop.time(), 0)
+
+        generator = await self.generator.start(str(self.seed), stdin=asyncio.subprocess.DEVNULL)
+        solution = await self.solution.start(stdout=self.output)
+        stderr_tasks = [
+            asyncio.create_task(read_limited(process.stderr, 64 * 1024))
+            for process in (generator, solution)
+        ]
+        timed_out = too_long = False
+        solution_reading = True
+        try:
+            while True:
+                chunk = await asyncio.wait_for(generator.stdout.read(READ_SIZE), remaining())
+                if not chunk:
+                    break
+                self.input_bytes += len(chunk)
+                if self.input_bytes > self.generator.output_bytes:
+                    too_long = True
+                    kill_process(generator)
+                    break
+                if solution_reading:
+                    try:
+                        solution.stdin.write(chunk)
+                        await asyncio.wait_for(solution.stdin.drain(), remaining())
+                    except (BrokenPipeError, ConnectionResetError):
+                        # 입력을 다 읽지 않고 끝나는 솔루션
+                        solution_reading = False
+                yield chunk
+            solution.stdin.close()
+            await asyncio.wait_for(asyncio.gather(generator.wait(), solution.wait()), remaining())
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            # 다 읽기 전에 취소되거나 시간이 초과돼도 프로세스를 남기지 않음
+            for process in (generator, solution):
+                if process.returncode is None:
+                    kill_process(process)
+            generator_exit, solution_exit = await self.generator.wait(generator), await self.solution.wait(solution)
+            stderrs = [(await task)[0].decode("utf-8", "replace") for task in stderr_tasks]
+
+        self.generator_status = run_status(generator_exit, timed_out, too_long)
+        self.solution_status = run_status(solution_exit, timed_out)
+        self.stderr = (stderrs[0] if self.generator_status != OK else stderrs[1])[-2000:]
+
+    async def output_chunks(self) -> AsyncIterator[bytes]:
+        self.output.seek(0)
+        while True:
+            chunk = await asyncio.to_thread(self.output.read, READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+async def validate_generators(
+    generators: List[TestCaseGenerator],
+    solution: SolutionSandbox,
+    first_number: int
+) -> List[GeneratedTestCase]:
+    """
+    생성 스크립트를 한 번씩 실행해 입력/출력 크기와 미리보기를 채움 (내용은 버림)
+
+    생성 스크립트나 솔루션이 실패한 케이스는 빼고, 남은 케이스에 first_number 부터 번호를 붙인다.
+    """
+    preview_chars = CODING_TEST_CONFIG['GENERATOR_PREVIEW_CHARS']
+
+    async def validate(generator: TestCaseGenerator) -> Optional[GeneratedTestCase]:
+        try:
+            async with generator_sandbox(generator) as box, GeneratedCaseRun(box, solution, generator.seed) as run:
+                head = b""
+                async for chunk in run.input_chunks():
+                    if len(head) < preview_chars * 4:
+                        head += chunk[:preview_chars * 4]
+                if not run.ok:
+                    print(f"생성 스크립트 케이스 제외: {run.error[-200:]}")
+                    return None
+                return GeneratedTestCase(
+                    **generator.model_dump(),
+                    name="",
+                    input_bytes=run.input_bytes,
+                    output_bytes=run.output_bytes,
+                    input_preview=head.decode("utf-8", "ignore")[:preview_chars]
+                )
+        except SandboxError as e:
+            print(f"생성 스크립트 케이스 제외: {str(e)[:200]}")
+            return None
+
+    results = await asyncio.gather(*(validate(generator) for generator in generators))
+    cases = [case for case in results if case is not None]
+    for offset, case in enumerate(cases):
+        case.name = str(first_number + offset)
+    return cases
+
+async def generated_case_files(
+    generators: List[GeneratedTestCase],
+    sample_solution: dict
+) -> AsyncIterator[Tuple[str, AsyncIterator[bytes]]]:
+    """
+    aiter_test_case_zip 의 streamed_files: 케이스마다 (name.in, 생성된 입력) -> (name.out, 솔루션 출력)
+
+    Raises:
+        SandboxError: 솔루션 컴파일 실패, 또는 생성 스크립트/솔루션이 실패한 경우 (ZIP 전송이 중단됨)
+    """
+    async with SolutionSandbox(sample_solution.get("language", ""), sample_solution.get("code", "")) as solution:
+        for generator in generators:
+            async with generator_sandbox(generator) as box, GeneratedCaseRun(box, solution, generator.seed) as run:
+                yield f"{generator.name}.in", run.input_chunks()
+                if not run.ok:
+                    raise SandboxError(f"{generator.name}번 케이스 생성 실패: {run.error[-500:]}")
+                yield f"{generator.name}.out", run.output_chunks()
@@ -0,0 +1,384 @@
+"""예시 솔루션을 로컬에서 실행하는 샌드박스
+
+테스트 케이스의 출력(.out)을 LLM 이 추측하지 않고 예시 솔루션을 실제로 실행해 만든다.
+실행마다 별도 프로세스를 띄우고 setrlimit 으로 CPU 시간/주소 공간/파일 크기를 제한하며,
+빈 임시 디렉토리와 최소한의 환경 변수(API 키 등이 넘어가지 않도록)로 실행한다.
+
+요청으로 받은 코드이므로 execution_allowed() 일 때만 실행한다:
+  - TESTCASE_SANDBOX_JAIL=unshare: 컴파일/실행을 새 네트워크(루프백만, 꺼진 상태)/PID/IPC/마운트
+    네임스페이스에서, /usr 등만 읽기 전용으로 연결한 최소 루트에 chroot 한 뒤 nobody 사용자로
+    모든 capability 를 버리고 실행한다. 쓸 수 있는 곳은 작업 디렉토리와 크기 제한된 /tmp 뿐이다.
+  - TESTCASE_TRUSTED_SOLUTIONS=true: 격리 없이 실행 (출제자를 모두 신뢰할 수 있는 배포에서만)
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import os
+import resource
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from app.config.coding_test_config import CODING_TEST_CONFIG
+
+@dataclass(frozen=True)
+class Language:
+    source: str
+    compile: Optional[List[str]]
+    run: List[str]
+
+LANGUAGES: Dict[str, Language] = {
+    "python": Language("main.py", None, [sys.executable, "-I", "main.py"]),
+    "c": Language("main.c", ["gcc", "-O2", "-std=gnu11", "-o", "main", "main.c", "-lm"], ["./main"]),
+    "c++": Language("main.cpp", ["g++", "-O2", "-std=gnu++17", "-o", "main", "main.cpp"], ["./main"]),
+}
+
+_ALIASES = {
+    "python3": "python", "py": "python", "pypy": "python", "pypy3": "python",
+    "cpp": "c++", "c++17": "c++", "c++14": "c++", "c++11": "c++", "g++": "c++",
+    "gcc": "c",
+}
+
+# 실행 결과 상태
+OK = "ok"
+RUNTIME_ERROR = "runtime_error"
+TIME_LIMIT = "time_limit"
+OUTPUT_LIMIT = "output_limit"
+
+class SandboxError(Exception):
+    """지원하지 않는 언어, 컴파일 오류, 코드 실행이 꺼져 있는 경우 등 솔루션을 실행할 수 없는 경우"""
+
+# 격리 실행 사용자/그룹 (nobody/nogroup)
+JAIL_UID = 65534
+
+# unshare 로 만든 네임스페이스 안에서 root 로 최소 루트를 만들고 nobody 로 명령 실행
+#   $1: 새 루트 마운트 지점, $2: 작업 디렉토리, $3: 읽기 전용으로 연결할 경로(":" 구분), 나머지: 실행할 명령
+# 명령은 PID 1(이 셸)의 자식으로 실행해, 커널이 보내는 SIGXCPU 등이 PID 1 예외로 무시되지 않게 한다.
+# 종료 상태는 셸 규칙(시그널이면 128+번호)으로 돌려주고 jail_exit_code 가 되돌린다.
+_JAIL_SCRIPT = r"""
+set -e
+root=$1; work=$2; binds=$3; shift 3
+mount -t tmpfs -o mode=755,size=16m jail "$root"
+IFS=:
+for path in $binds; do
+    [ -e "$path" ] || [ -L "$path" ] || continue
+    mkdir -p "$root$(dirname "$path")"
+    if [ -L "$path" ]; then
+        ln -s "$(readlink "$path")" "$root$path"
+        continue
+    fi
+    if [ -d "$path" ]; then mkdir -p "$root$path"; else touch "$root$path"; fi
+    mount --bind "$path" "$root$path"
+    mount -o remount,bind,ro,nosuid,nodev "$root$path"
+done
+unset IFS
+mkdir -p "$root/work" "$root/tmp" "$root/dev"
+mount --bind "$work" "$root/work"
+mount -o remount,bind,nosuid,nodev "$root/work"
+mount -t tmpfs -o mode=1777,size=64m,nosuid,nodev tmp "$root/tmp"
+for dev in null zero urandom; do
+    touch "$root/dev/$dev"
+    mount --bind "/dev/$dev" "$root/dev/$dev"
+done
+mount -o remount,ro "$root"
+set +e
+chroot "$root" setpriv --reuid=65534 --regid=65534 --clear-groups --no-new-privs \
+    --inh-caps=-all --bounding-set=-all sh -c 'cd /work && exec "$@"' sh "$@"
+status=$?
+exit $status
+"""
+
+def jail_enabled() -> bool:
+    return CODING_TEST_CONFIG['SANDBOX_JAIL'] == "unshare"
+
+def execution_allowed() -> bool:
+    """요청으로 받은 코드를 실행해도 되는지 (격리 실행을 켰거나 신뢰할 수 있는 출제자만 쓰는 배포)"""
+    return jail_enabled() or CODING_TEST_CONFIG['TRUSTED_SOLUTIONS']
+
+def _jail_binds() -> List[str]:
+    """격리 루트에 읽기 전용으로 연결할 경로 (컴파일러/라이브러리, 이 프로세스의 Python)"""
+    paths = ["/usr", "/bin", "/lib", "/lib64", "/sbin", "/etc/alternatives", "/etc/ld.so.cache",
+             sys.base_prefix, sys.prefix]
+    paths += [path for path in CODING_TEST_CONFIG['SANDBOX_JAIL_BINDS'].split(":") if path]
+    return list(dict.fromkeys(os.path.normpath(path) for path in paths))
+
+def jail_command(basedir: str, command: List[str]) -> List[str]:
+    """basedir/root 를 새 루트로, basedir/work 를 /work 로 두고 command 를 격리 실행하는 명령"""
+    return [
+        "unshare", "--net", "--pid", "--ipc", "--uts", "--mount", "--propagation", "private",
+        "--fork", "--kill-child",
+        "--", "sh", "-c", _JAIL_SCRIPT, "jail",
+        os.path.join(basedir, "root"), os.path.join(basedir, "work"), ":".join(_jail_binds()),
+        *command
+    ]
+
+def jail_exit_code(exit_code: Optional[int]) -> Optional[int]:
+    """격리 실행의 셸 종료 상태(128+시그널)를 subprocess 규칙(-시그널)으로 변환"""
+    if exit_code is not None and exit_code > 128:
+        return 128 - exit_code
+    return exit_code
+
+_jail_checked = False
+
+async def check_jail():
+    """격리 실행이 가능한지 한 번 확인 (unshare/mount 권한이 없으면 SandboxError)"""
+    global _jail_checked
+    if _jail_checked:
+        return
+    with tempfile.TemporaryDirectory(prefix="jail_check_") as basedir:
+        for name in ("root", "work"):
+            os.mkdir(os.path.join(basedir, name))
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *jail_command(basedir, ["true"]),
+                env=_sandbox_env(),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+            _, stderr = await asyncio.wait_for(process.communicate(), CODING_TEST_CONFIG['SANDBOX_COMPILE_SECONDS'])
+        except (OSError, asyncio.TimeoutError) as e:
+            raise SandboxError(f"격리 실행 환경을 사용할 수 없습니다: {str(e)}")
+    if process.returncode != 0:
+        raise SandboxError(f"격리 실행 환경을 사용할 수 없습니다: {stderr.decode('utf-8', 'replace')[-500:]}")
+    _jail_checked = True
+
+@dataclass
+class RunResult:
+    status: str
+    stdout: str
+    stderr: str
+    exit_code: Optional[int]
+    duration: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+def normalize_language(language: str) -> Optional[str]:
+    """요청의 언어 이름을 LANGUAGES 키로 변환 (지원하지 않으면 None)"""
+    name = (language or "").strip().lower()
+    name = _ALIASES.get(name, name)
+    if name not in LANGUAGES:
+        return None
+    compiler = LANGUAGES[name].compile
+    if compiler and shutil.which(compiler[0]) is None:
+        return None
+    return name
+
+_slots: Optional[asyncio.Semaphore] = None
+_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def run_slots() -> asyncio.Semaphore:
+    """모든 요청이 나눠 쓰는 실행 슬롯 (SANDBOX_WORKERS 개의 프로세스만 동시에 실행)"""
+    global _slots, _slots_loop
+    loop = asyncio.get_running_loop()
+    if _slots is None or _slots_loop is not loop:
+        _slots = asyncio.Semaphore(CODING_TEST_CONFIG['SANDBOX_WORKERS'])
+        _slots_loop = loop
+    return _slots
+
+def _limit_resources(cpu_seconds: int, memory_bytes: int, output_bytes: int, processes: Optional[int] = None):
+    def apply():
+        # 소프트 한도를 넘으면 SIGXCPU, 1초 뒤 하드 한도에서 SIGKILL
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        resource.setrlimit(resource.RLIMIT_FSIZE, (output_bytes, output_bytes))
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+        resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
+        if processes is not None:
+            # 실제 사용자(nobody)로 바뀐 뒤부터 적용됨 (root 는 제한받지 않음)
+            resource.setrlimit(resource.RLIMIT_NPROC, (processes, processes))
+    return apply
+
+def _sandbox_env() -> Dict[str, str]:
+    return {
+        "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
+        "LANG": "C.UTF-8",
+        "PYTHONIOENCODING": "utf-8",
+        "PYTHONDONTWRITEBYTECODE": "1",
+        # set 순회 순서 등이 실행마다 같도록 (생성 스크립트의 재현성)
+        "PYTHONHASHSEED": "0",
+    }
+
+def kill_process(process: asyncio.subprocess.Process):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+async def read_limited(
+    stream: asyncio.StreamReader,
+    limit: int,
+    on_overflow: Optional[Callable[[], None]] = None
+) -> Tuple[bytes, bool]:
+    """limit 바이트까지 읽음 (넘으면 on_overflow 호출 후 (읽은 부분, True))"""
+    chunks = []
+    size = 0
+    while True:
+        chunk = await stream.read(64 * 1024)
+        if not chunk:
+            return b"".join(chunks), False
+        size += len(chunk)
+        if size > limit:
+            if on_overflow:
+                on_overflow()
+            return b"".join(chunks), True
+        chunks.append(chunk)
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes):
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # 입력을 다 읽지 않고 끝나는 프로그램
+        pass
+    finally:
+        stream.close()
+
+def run_status(exit_code: Optional[int], timed_out: bool = False, too_long: bool = False) -> str:
+    """종료 코드와 제한 초과 여부로 실행 결과 상태를 정함"""
+    if too_long or exit_code == -signal.SIGXFSZ:
+        return OUTPUT_LIMIT
+    if timed_out or exit_code in (-signal.SIGXCPU, -signal.SIGKILL):
+        return TIME_LIMIT
+    if exit_code != 0:
+        return RUNTIME_ERROR
+    return OK
+
+class SolutionSandbox:
+    """
+    예시 솔루션 하나를 임시 디렉토리에 두고(C/C++ 은 한 번만 컴파일) 입력마다 실행
+
+    사용 예:
+        async with SolutionSandbox("C++", code) as sandbox:
+            result = await sandbox.run("3\\n1 2 3\\n")
+
+    Raises:
+        SandboxError: 코드 실행이 꺼져 있거나(execution_allowed) 실행할 수 없는 언어인 경우
+    """
+    def __init__(
+        self,
+        language: str,
+        code: str,
+        cpu_seconds: int = CODING_TEST_CONFIG['SANDBOX_CPU_SECONDS'],
+        wall_seconds: float = CODING_TEST_CONFIG['SANDBOX_WALL_SECONDS'],
+        memory_mb: int = CODING_TEST_CONFIG['SANDBOX_MEMORY_MB'],
+        output_mb: int = CODING_TEST_CONFIG['SANDBOX_OUTPUT_MB']
+    ):
+        if not execution_allowed():
+            raise SandboxError("코드 실행이 꺼져 있습니다 (TESTCASE_SANDBOX_JAIL 또는 TESTCASE_TRUSTED_SOLUTIONS 설정 필요)")
+        name = normalize_language(language)
+        if name is None:
+            raise SandboxError(f"실행할 수 없는 언어입니다: {language}")
+        self.language = LANGUAGES[name]
+        self.code = code
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_bytes = memory_mb * 1024 * 1024
+        self.output_bytes = output_mb * 1024 * 1024
+        self.jailed = jail_enabled()
+        self.workdir: Optional[tempfile.TemporaryDirectory] = None
+        self.cwd: Optional[str] = None
+
+    async def __aenter__(self) -> "SolutionSandbox":
+        self.workdir = tempfile.TemporaryDirectory(prefix="solution_")
+        self.cwd = self.workdir.name
+        try:
+            if self.jailed:
+                await check_jail()
+                # basedir/root: 새 루트 마운트 지점, basedir/work: 격리 안의 /work (nobody 만 쓸 수 있음)
+                self.cwd = os.path.join(self.workdir.name, "work")
+                os.mkdir(os.path.join(self.workdir.name, "root"))
+                os.mkdir(self.cwd)
+                os.chown(self.cwd, JAIL_UID, JAIL_UID)
+            with open(os.path.join(self.cwd, self.language.source), "w", encoding="utf-8") as f:
+                f.write(self.code)
+            if self.language.compile:
+                await self._compile()
+        except BaseException:
+            self.workdir.cleanup()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self.workdir.cleanup()
+
+    def _command(self, command: List[str]) -> List[str]:
+        return jail_command(self.workdir.name, command) if self.jailed else command
+
+    async def wait(self, process: asyncio.subprocess.Process) -> Optional[int]:
+        """프로세스 종료를 기다려 종료 코드 반환 (격리 실행이면 시그널 종료를 -시그널로 변환)"""
+        exit_code = await process.wait()
+        return jail_exit_code(exit_code) if self.jailed else exit_code
+
+    async def _compile(self):
+        process = await asyncio.create_subprocess_exec(
+            *self._command(self.language.compile),
+            cwd=self.cwd,
+            env=_sandbox_env(),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), CODING_TEST_CONFIG['SANDBOX_COMPILE_SECONDS'])
+        except asyncio.TimeoutError:
+            kill_process(process)
+            await process.wait()
+            raise SandboxError("컴파일 시간 초과")
+        if process.returncode != 0:
+            raise SandboxError(f"컴파일 오류: {stderr.decode('utf-8', 'replace')[-2000:]}")
+
+    async def start(self, *args: str, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE) -> asyncio.subprocess.Process:
+        """제한을 건 프로세스 하나를 띄움 (stderr 는 PIPE, 호출한 쪽이 kill_process/self.wait 책임)"""
+        processes = CODING_TEST_CONFIG['SANDBOX_JAIL_PROCESSES'] if self.jailed else None
+        return await asyncio.create_subprocess_exec(
+            *self._command([*self.language.run, *args]),
+            cwd=self.cwd,
+            env=_sandbox_env(),
+            stdin=stdin,
+            stdout=stdout,
+            stderr=asyncio.subprocess.PIPE,
+            preexec_fn=_limit_resources(self.cpu_seconds, self.memory_bytes, self.output_bytes, processes),
+            start_new_session=True
+        )
+
+    async def run(self, input_data: Union[str, bytes]) -> RunResult:
+        """입력 하나로 솔루션을 실행 (SANDBOX_WORKERS 개까지 동시 실행)"""
+        data = input_data.encode("utf-8") if isinstance(input_data, str) else input_data
+        async with run_slots():
+            start_time = time.perf_counter()
+            process = await self.start()
+            feeder = asyncio.create_task(_feed(process.stdin, data))
+            timed_out = False
+            try:
+                (stdout, too_long), (stderr, _) = await asyncio.wait_for(
+                    asyncio.gather(
+                        read_limited(process.stdout, self.output_bytes, lambda: kill_process(process)),
+                        read_limited(process.stderr, 64 * 1024)
+                    ),
+                    self.wall_seconds
+                )
+            except asyncio.TimeoutError:
+                timed_out = True
+                stdout, stderr, too_long = b"", b"", False
+                kill_process(process)
+            finally:
+                # 요청이 취소돼도 프로세스를 남기지 않음
+                if process.returncode is None:
+                    kill_process(process)
+                feeder.cancel()
+            exit_code = await self.wait(process)
+            duration = time.perf_counter() - start_time
+
+        return RunResult(
+            status=run_status(exit_code, timed_out, too_long),
+            stdout=stdout.decode("utf-8", "replace"),
+            stderr=stderr.decode("utf-8", "replace")[-2000:],
+            exit_code=exit_code,
+            duration=duration
+        )
@@ -1,8 +1,49 @@
 # app/service/testcase.py
 import time
 import json
-from app.schemas.coding_test import TestCaseAnswer, TestCaseInput
-from app.chain import testcase_chain
+import uuid
+import asyncio
+from typing import Dict, Any
+from app.schemas.coding_test import TestCaseAnswer, TestCaseInput, TestCaseInputs, GeneratedTestCaseAnswer
+from app.chain import testcase_chain, testcase_input_chain
+from app.config.coding_test_config import CODING_TEST_CONFIG
+from app.services.coding_test.sandbox import SolutionSandbox, execution_allowed, normalize_language
+from app.services.coding_test.generator import validate_generators
+from app.utils.adaptive_limiter import get_limiter
+from app.utils.generator_store import generator_store
+
+def testcase_chain_inputs(test_input: TestCaseInput) -> Dict[str, Any]:
+    """테스트 케이스 체인의 프롬프트 변수"""
+    # 추가 요구사항 생성
+    additional_requirements = "특별 판정 필요: " + ("예" if test_input.spj else "아니오")
+
+    return {
+        "problem_description": test_input.problem_description,
+        "input_description": test_input.input_description,
+        "output_description": test_input.output_description,
+        # 솔루션 언어와 코드 추출
+        "solution_language": test_input.sample_solution.get("language", ""),
+        "solution_code": test_input.sample_solution.get("code", ""),
+        # 테스트 케이스 유형 문자열로 변환
+        "test_case_types": ", ".join(test_input.test_case_types),
+        "additional_requirements": additional_requirements
+    }
+
+def should_run_solution(test_input: TestCaseInput) -> bool:
+    """예시 솔루션을 실행해 출력을 만들지 여부 (요청 값이 없으면 서버 설정)"""
+    run_solution = test_input.run_solution
+    if run_solution is None:
+        run_solution = CODING_TEST_CONFIG['RUN_SOLUTION']
+    if not run_solution:
+        return False
+    if not execution_allowed():
+        print("코드 실행이 꺼져 있어(TESTCASE_SANDBOX_JAIL/TESTCASE_TRUSTED_SOLUTIONS) LLM 이 출력까지 생성합니다")
+        return False
+    language = test_input.sample_solution.get("language", "")
+    if normalize_language(language) is None:
+        print(f"예시 솔루션을 실행할 수 없는 언어라 LLM 이 출력까지 생성합니다: {language}")
+        return False
+    return True
 
 # 테스트 케이스 생성 함수
 async def generate_test_case_answer(test_input: TestCaseInput) -> TestCaseAnswer:
@@ -15,29 +56,15 @@ async def generate_test_case_answer(test_input: TestCaseInput) -> TestCaseAnswer
     Returns:
         TestCaseAnswer: 생성된 테스트 케이스 목록
     """
+    if should_run_solution(test_input):
+        return await generate_test_cases_with_solution(test_input)
+
     start_time = time.time()
 
     try:
-        # 추가 요구사항 생성
-        additional_requirements = "특별 판정 필요: " + ("예" if test_input.spj else "아니오")
-        
-        # 솔루션 언어와 코드 추출
-        solution_language = test_input.sample_solution.get("language", "")
-        solution_code = test_input.sample_solution.get("code", "")
-        
-        # 테스트 케이스 유형 문자열로 변환
-        test_case_types_str = ", ".join(test_input.test_case_types)
-        
-        # LangChain 체인 실행
-        response = testcase_chain.invoke({
-            "problem_description": test_input.problem_description,
-            "input_description": test_input.input_description,
-            "output_description": test_input.output_description,
-            "solution_language": solution_language,
-            "solution_code": solution_code,
-            "test_case_types": test_case_types_str,
-            "additional_requirements": additional_requirements
-        })
+        # LangChain 체인 실행 (이벤트 루프를 막지 않도록 비동기 호출)
+        async with get_limiter("testcase").slot():
+            response = await testcase_chain.ainvoke(testcase_chain_inputs(test_input))
         
         # 응답에서 content 추출 (LangChain AIMessage 객체에서)
         if hasattr(response, 'content'):
@@ -66,4 +93,63 @@ async def generate_test_case_answer(test_input: TestCaseInput) -> TestCaseAnswer
     except Exception as e:
         # 오류 발생 시 로깅 및 예외 전파
         print(f"Error generating test cases: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+async def generate_test_case_inputs(test_input: TestCaseInput) -> TestCaseInputs:
+    """LLM 으로 테스트 케이스 입력만 생성"""
+    async with get_limiter("testcase").slot():
+        return await testcase_input_chain.ainvoke(testcase_chain_inputs(test_input))
+
+async def generate_test_cases_with_solution(test_input: TestCaseInput) -> GeneratedTestCaseAnswer:
+    """
+    LLM 은 입력만 생성하고, 출력(.out)은 예시 솔루션을 로컬 샌드박스에서 실행해 만듦
+
+    솔루션이 실패(런타임 오류, 시간/출력 초과)한 입력은 제약 조건을 어긴 입력으로 보고 버린다.
+    large 유형은 LLM 이 만든 생성 스크립트를 한 번 실행해 검증만 하고 generators 로 돌려주며,
+    실제 입력/출력은 ZIP 을 만들 때 다시 실행해 채운다. 이때 실행할 코드는 요청으로 다시 받지 않도록
+    검증한 생성 스크립트와 예시 솔루션을 서버에 보관하고 generator_set_id 로 참조하게 한다.
+
+    Raises:
+        SandboxError: 예시 솔루션을 컴파일할 수 없는 경우
+        ValueError: 솔루션이 모든 입력에서 실패한 경우
+    """
+    start_time = time.time()
+    language = test_input.sample_solution.get("language", "")
+    code = test_input.sample_solution.get("code", "")
+
+    # C/C++ 컴파일은 LLM 이 입력을 만드는 동안 진행
+    inputs_task = asyncio.create_task(generate_test_case_inputs(test_input))
+    try:
+        async with SolutionSandbox(language, code) as sandbox:
+            generated = await inputs_task
+            inputs = [text if text.endswith("\n") else text + "\n" for text in generated.inputs if text.strip()]
+            results = await asyncio.gather(*(sandbox.run(text) for text in inputs))
+
+            testcases = []
+            for text, result in zip(inputs, results):
+                if not result.ok:
+                    print(f"예시 솔루션 실행 실패로 입력 제외: {result.status} {result.stderr[-200:]}")
+                    continue
+                number = len(testcases) + 1
+                testcases.append({f"{number}.in": text, f"{number}.out": result.stdout})
+
+            generators = []
+            if "large" in test_input.test_case_types and generated.generators:
+                generators = await validate_generators(generated.generators, sandbox, len(testcases) + 1)
+    finally:
+        inputs_task.cancel()
+
+    if not testcases and not generators:
+        raise ValueError("예시 솔루션이 생성된 모든 입력에서 실패했습니다.")
+
+    generator_set_id = None
+    if generators:
+        generator_set_id = uuid.uuid4().hex
+        await asyncio.to_thread(generator_store.save, generator_set_id, {
+            "sample_solution": {"language": language, "code": code},
+            "generators": [generator.model_dump() for generator in generators]
+        })
+
+    print(f"테스트 케이스 생성 시간(솔루션 실행): {time.time() - start_time:.2f}초, "
+          f"{len(testcases)}/{len(inputs)}개 사용, 생성 스크립트 {len(generators)}/{len(generated.generators)}개")
+    return GeneratedTestCaseAnswer(testcases=testcases, generators=generators, generator_set_id=generator_set_id)
@@ -1,32 +1,140 @@
-import os
+import asyncio
 import zipfile
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from app.config.coding_test_config import CODING_TEST_CONFIG
 
-async def create_simple_test_case_zip(test_case_id: str, testcases: list) -> str:
-    # 현재 디렉토리에 파일 생성
-    current_dir = os.getcwd()
-    zip_path = os.path.join(current_dir, f"{test_case_id}.zip")
-    
-    # 임시 파일 경로 생성 (현재 디렉토리 내)
-    temp_dir = os.path.join(current_dir, f"{test_case_id}")
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # 테스트 케이스 파일 생성
+class _ZipStream:
+    """ZipFile 이 쓴 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 버퍼
+
+    tell/seek 이 없으므로 ZipFile 은 크기/CRC 를 각 파일 뒤의 data descriptor 에 기록한다.
+    """
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        self.size = 0
+        return data
+
+def test_case_arcname(file_name: str) -> str:
+    """ZIP 안의 파일명 ("../x.in" 처럼 경로가 들어간 이름은 압축 해제 위치를 벗어날 수 있으므로 거부)"""
+    if not file_name or file_name in (".", "..") or any(char in file_name for char in "/\\\0"):
+        raise ValueError(f"잘못된 테스트 케이스 파일명입니다: {file_name!r}")
+    return file_name
+
+class TestCaseZipWriter:
+    """테스트 케이스 파일을 ZIP 에 쓰면서 chunk_size 가 찰 때마다 조각을 꺼내 주는 작성기"""
+    def __init__(
+        self,
+        chunk_size: int = CODING_TEST_CONFIG['ZIP_CHUNK_SIZE'],
+        compress_level: int = CODING_TEST_CONFIG['ZIP_COMPRESS_LEVEL']
+    ):
+        self.chunk_size = chunk_size
+        self.stream = _ZipStream()
+        compression = zipfile.ZIP_DEFLATED if compress_level > 0 else zipfile.ZIP_STORED
+        self.zip_file = zipfile.ZipFile(
+            self.stream, "w", compression=compression, compresslevel=compress_level or None
+        )
+
+    def open(self, file_name: str):
+        """파일 하나를 쓰기 위해 염 (닫기 전까지 다른 파일은 열 수 없음)"""
+        return self.zip_file.open(test_case_arcname(file_name), "w")
+
+    def ready(self) -> Optional[bytes]:
+        """chunk_size 이상 모였으면 꺼내 반환"""
+        return self.stream.drain() if self.stream.size >= self.chunk_size else None
+
+    def add(self, file_name: str, content: Union[str, bytes]) -> Iterator[bytes]:
+        """내용 전체가 메모리에 있는 파일을 chunk_size 만큼씩 인코딩/압축해 씀"""
+        with self.open(file_name) as entry:
+            for start in range(0, len(content), self.chunk_size):
+                piece = content[start:start + self.chunk_size]
+                entry.write(piece.encode("utf-8") if isinstance(piece, str) else piece)
+                chunk = self.ready()
+                if chunk:
+                    yield chunk
+        chunk = self.ready()
+        if chunk:
+            yield chunk
+
+    def close(self) -> bytes:
+        """중앙 디렉토리를 쓰고 남은 바이트를 반환"""
+        self.zip_file.close()
+        return self.stream.drain()
+
+def iter_test_case_zip(
+    testcases: List[Dict[str, Union[str, bytes]]],
+    chunk_size: int = CODING_TEST_CONFIG['ZIP_CHUNK_SIZE'],
+    compress_level: int = CODING_TEST_CONFIG['ZIP_COMPRESS_LEVEL']
+) -> Iterator[bytes]:
+    """
+    테스트 케이스 파일(1.in, 1.out ...)을 ZIP 으로 묶으면서 chunk_size 정도의 조각으로 내보냄
+
+    임시 파일 없이 메모리에서 만들고, 큰 입력도 chunk_size 만큼씩 인코딩/압축하므로
+    payload 외에 아카이브 전체나 인코딩된 사본을 따로 들고 있지 않는다.
+
+    Args:
+        testcases: {파일명: 내용} 딕셔너리 목록
+        chunk_size: 내보내는 조각 크기 (바이트)
+        compress_level: deflate 압축 레벨 (0 이면 압축하지 않음)
+    """
+    writer = TestCaseZipWriter(chunk_size, compress_level)
+    for test_case in testcases:
+        for file_name, content in test_case.items():
+            yield from writer.add(file_name, content)
+    tail = writer.close()
+    if tail:
+        yield tail
+
+async def aiter_test_case_zip(
+    testcases: List[Dict[str, Union[str, bytes]]],
+    streamed_files: Optional[AsyncIterator[Tuple[str, AsyncIterator[bytes]]]] = None,
+    chunk_size: int = CODING_TEST_CONFIG['ZIP_CHUNK_SIZE'],
+    compress_level: int = CODING_TEST_CONFIG['ZIP_COMPRESS_LEVEL']
+) -> AsyncIterator[bytes]:
+    """
+    iter_test_case_zip 에 더해, 내용이 만들어지는 대로 들어오는 파일(streamed_files)을 이어서 씀
+
+    streamed_files 는 (파일명, 내용 조각 async 이터레이터) 를 순서대로 내보내며, 다음 파일은
+    앞 파일의 조각을 다 읽은 뒤에 요청한다. 압축은 이벤트 루프를 막지 않도록 스레드에서 한다.
+    """
+    writer = TestCaseZipWriter(chunk_size, compress_level)
     for test_case in testcases:
         for file_name, content in test_case.items():
-            file_path = os.path.join(temp_dir, file_name)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-    
-    # zip 파일 생성
-    with zipfile.ZipFile(zip_path, "w") as zip_file:
-        for test_case in testcases:
-            for file_name in test_case.keys():
-                file_path = os.path.join(temp_dir, file_name)
-                # ZIP 파일 내 경로는 파일명만 사용 (디렉토리 경로 없이)
-                zip_file.write(file_path, arcname=file_name)
-    
-    # 임시 파일 정리 (선택 사항)
-    # import shutil
-    # shutil.rmtree(temp_dir)
-    
-    return zip_path
\ No newline at end of file
+            for chunk in await asyncio.to_thread(list, writer.add(file_name, content)):
+                yield chunk
+
+    if streamed_files is not None:
+        async for file_name, pieces in streamed_files:
+            entry = writer.open(file_name)
+            try:
+                async for piece in pieces:
+                    await asyncio.to_thread(entry.write, piece)
+                    chunk = writer.ready()
+                    if chunk:
+                        yield chunk
+            finally:
+                entry.close()
+                # 중간에 실패해도 조각을 만들던 쪽(프로세스 등)을 바로 정리
+                await pieces.aclose()
+            chunk = writer.ready()
+            if chunk:
+                yield chunk
+
+    tail = writer.close()
+    if tail:
+        yield tail
+
+def create_test_case_zip(testcases: List[Dict[str, Union[str, bytes]]]) -> bytes:
+    """테스트 케이스 ZIP 을 메모리에서 한 번에 만들어 반환"""
+    return b"".join(iter_test_case_zip(testcases))
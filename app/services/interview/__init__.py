@@ -1,8 +1,9 @@
 from .interview import generate_interview_answer
-from .evaluate import evaluate_contest_answers_sequential, evaluate_contest_answers_parallel
+from .evaluate import evaluate_contest_answers_sequential, evaluate_contest_answers_parallel, evaluate_contest_answers_batched
 
 __all__ = [
     'generate_interview_answer',
     'evaluate_contest_answers_sequential',
-    'evaluate_contest_answers_parallel'
+    'evaluate_contest_answers_parallel',
+    'evaluate_contest_answers_batched'
 ] 
\ No newline at end of file
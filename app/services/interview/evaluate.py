@@ -1,23 +1,32 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union, Tuple, AsyncIterator
 from app.schemas.interview import Evaluation
 import asyncio
+import math
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.mysql.models import Problem, TechInterview, Answer, Participant, Contest, Submit
 import time
 from app.metrics import (
     EVALUATION_DURATION,
     EVALUATION_COUNTER,
     EVALUATION_ERROR_COUNTER,
+    EVALUATION_TOKEN_COUNTER,
     update_system_metrics
 )
 import logging
 from app.chain.evaluate_chain import chain
 from app.db.mysql.connection import DB_CONFIG
+from app.db.repositories.mysql.contest_repository import ContestRepository, ContestSnapshot
+from app.db.repositories.mysql.answer_repository import AnswerRepository
+from app.db.repositories.mysql.async_contest_repository import AsyncContestRepository
+from app.db.repositories.mysql.async_answer_repository import AsyncAnswerRepository
 from app.config.evaluation_config import EVALUATION_CONFIG
 from app.utils.evaluate_batch import BatchProcessor
 from app.utils.progress_tracker import ProgressTracker
+from app.tasks.evaluation_scheduler import contest_slots, problem_warmup
 from app.tasks.evaluation_task import EvaluationTask
+from app.tasks.batch_evaluation_task import BatchEvaluationTask
 from app.services.interview.evaluation_core import evaluate_answer
 
 # 로깅 설정
@@ -26,65 +35,137 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-async def get_problems_data(db: Session, contest_id: int) -> List[Dict[str, Any]]:
+# 평가 함수들은 동기 Session 과 AsyncSession(MYSQL_ASYNC=true)을 모두 받는다.
+# 동기 세션 작업은 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+EvaluationSession = Union[Session, AsyncSession]
+
+def evaluation_progress_key(contest_id: int) -> str:
+    """콘테스트 채점 진행 상황의 저장소 키 (API/워커 프로세스가 공유)"""
+    return f"evaluation:{contest_id}"
+
+async def get_contest(db: EvaluationSession, contest_id: int, space_id: int) -> Optional[Contest]:
+    """스페이스에 속한 콘테스트 조회"""
+    if isinstance(db, AsyncSession):
+        contest = await AsyncContestRepository(db).get_by_id(contest_id)
+    else:
+        contest = await asyncio.to_thread(ContestRepository(db).get_by_id, contest_id)
+    if contest and contest.space_id == space_id:
+        return contest
+    return None
+
+async def get_problems_data(db: EvaluationSession, contest_id: int) -> List[Dict[str, Any]]:
     """문제와 답변 데이터 조회"""
+    if isinstance(db, AsyncSession):
+        try:
+            snapshot = await AsyncContestRepository(db).get_snapshot(contest_id)
+        except Exception as e:
+            print(f"문제 데이터 조회 중 오류 발생: {str(e)}")
+            raise Exception(f"문제 조회 실패: {str(e)}")
+        return _to_problems_data(snapshot)
+    return await asyncio.to_thread(_load_problems_data, db, contest_id)
+
+def _load_problems_data(db: Session, contest_id: int) -> List[Dict[str, Any]]:
     try:
-        # 문제와 답변 정보 조회
-        problems = db.query(Problem).filter(Problem.contest_id == contest_id).all()
-        
-        problems_data = []
-        for problem in problems:
-            tech_interview = problem.tech_interview
-            answers = db.query(Answer).filter(
-                Answer.problem_id == problem.id
-            ).all()
-            
-            problem_data = {
-                'id': problem.id,
-                'question': tech_interview.question,
-                'ai_answer': tech_interview.ai_answer,
-                'tech_class': tech_interview.tech_class_enum.name if tech_interview.tech_class_enum else None,
-                'answers': []
-            }
-            
-            for answer in answers:
-                participant = answer.participant
-                problem_data['answers'].append({
-                    'answer_id': answer.id,
-                    'participant_id': participant.id,
-                    'nickname': participant.nickname,
-                    'answer': answer.answer,
-                    'feedback': answer.feedback,
-                    'rank_score': answer.rank_score
-                })
-            
-            problems_data.append(problem_data)
-        
-        return problems_data
+        # 문제/답변/참가자 정보를 조인 쿼리 두 번으로 조회
+        snapshot = ContestRepository(db).get_snapshot(contest_id)
+        return _to_problems_data(snapshot)
         
     except Exception as e:
         print(f"문제 데이터 조회 중 오류 발생: {str(e)}")
         raise Exception(f"문제 조회 실패: {str(e)}")
 
-async def update_evaluation(db: Session, problem_id: int, participant_id: int, score: int, feedback: str):
-    """평가 결과를 DB에 업데이트"""
+def _to_problems_data(snapshot: ContestSnapshot) -> List[Dict[str, Any]]:
+    return [
+        {
+            'id': problem.id,
+            'question': problem.question,
+            'ai_answer': problem.ai_answer,
+            'tech_class': problem.tech_class,
+            'answers': [answer._asdict() for answer in problem.answers]
+        }
+        for problem in snapshot.problems
+    ]
+
+async def update_evaluation(db: EvaluationSession, answer_id: int, score: int, feedback: str):
+    """평가 결과를 DB에 업데이트 (answer_id 기준, 재조회 없이 바로 UPDATE)"""
     try:
-        answer = db.query(Answer).filter(
-            Answer.problem_id == problem_id,
-            Answer.participant_id == participant_id
-        ).first()
-        
-        if answer:
-            answer.rank_score = score
-            answer.feedback = feedback
-            db.commit()
+        if isinstance(db, AsyncSession):
+            await AsyncAnswerRepository(db).update_evaluation(answer_id, score, feedback)
+        else:
+            await asyncio.to_thread(AnswerRepository(db).update_evaluation, answer_id, score, feedback)
     except Exception as e:
-        db.rollback()
         print(f"평가 결과 업데이트 실패: {str(e)}")
         raise e
 
-async def update_contest_status(db: Session, contest_id: int):
-    """콘테스트 상태를 EVALUATED로 업데이트"""
+async def bulk_update_evaluations(db: EvaluationSession, items: List[Dict[str, Any]]) -> int:
+    """평가 결과 배치를 answer_id 기준 단일 UPDATE 문으로 반영"""
+    if isinstance(db, AsyncSession):
+        return await AsyncAnswerRepository(db).bulk_update_evaluations(items)
+    return await asyncio.to_thread(AnswerRepository(db).bulk_update_evaluations, items)
+
+def is_evaluated(answer: Dict[str, Any]) -> bool:
+    """feedback 이 저장된 답변은 채점 완료로 간주 (재실행 시 건너뜀)"""
+    return answer.get('feedback') is not None
+
+async def reset_evaluations(db: EvaluationSession, contest_id: int) -> int:
+    """기존 채점 결과 초기화 (force 재채점)"""
+    if isinstance(db, AsyncSession):
+        return await AsyncContestRepository(db).reset_evaluations(contest_id)
+    return await asyncio.to_thread(ContestRepository(db).reset_evaluations, contest_id)
+
+async def get_pending_problems_data(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False
+) -> Tuple[List[Dict[str, Any]], int]:
+    """채점이 남은 답변만 담은 문제 데이터와 건너뛴 답변 수 조회
+
+    중단된 평가를 다시 실행하면 이미 저장된 답변은 LLM 을 다시 호출하지 않는다.
+    force=True 이면 기존 결과를 지우고 전체 답변을 다시 채점한다.
+    """
+    if force:
+        reset = await reset_evaluations(db, contest_id)
+        logger.info(f"강제 재채점 - 대회 ID: {contest_id}, 초기화된 답변 {reset}개")
+
+    problems = await get_problems_data(db, contest_id)
+    skipped = 0
+    for problem in problems:
+        pending = [answer for answer in problem['answers'] if not is_evaluated(answer)]
+        skipped += len(problem['answers']) - len(pending)
+        problem['answers'] = pending
+    return problems, skipped
+
+async def count_unevaluated_answers(db: EvaluationSession, contest_id: int) -> int:
+    if isinstance(db, AsyncSession):
+        return await AsyncContestRepository(db).count_unevaluated_answers(contest_id)
+    return await asyncio.to_thread(ContestRepository(db).count_unevaluated_answers, contest_id)
+
+async def update_contest_status(db: EvaluationSession, contest_id: int) -> int:
+    """모든 답변의 채점 결과가 저장된 경우에만 콘테스트 상태를 EVALUATED로 업데이트
+
+    Returns:
+        int: 아직 채점되지 않은 답변 수 (0 이면 EVALUATED)
+    """
+    remaining = await count_unevaluated_answers(db, contest_id)
+    if remaining > 0:
+        logger.warning(f"채점되지 않은 답변 {remaining}개 - 대회 ID: {contest_id}, 상태를 유지합니다 (재실행 시 이어서 채점)")
+        return remaining
+
+    if isinstance(db, AsyncSession):
+        try:
+            contest = await AsyncContestRepository(db).get_by_id(contest_id)
+            if contest:
+                contest.submit = 2  # EVALUATED = 2
+                await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"콘테스트 상태 업데이트 실패: {str(e)}")
+            raise e
+        return 0
+    await asyncio.to_thread(_update_contest_status, db, contest_id)
+    return 0
+
+def _update_contest_status(db: Session, contest_id: int):
     try:
         contest = db.query(Contest).filter(Contest.id == contest_id).first()
         if contest:
@@ -95,15 +176,23 @@ async def update_contest_status(db: Session, contest_id: int):
         print(f"콘테스트 상태 업데이트 실패: {str(e)}")
         raise e
 
-async def evaluate_contest_answers_sequential(db: Session, contest_id: int) -> List[Dict[str, Any]]:
+async def evaluate_contest_answers_sequential(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> List[Dict[str, Any]]:
     """콘테스트의 모든 답변 평가"""
     try:
         # 문제와 답변 데이터 조회
         start_time = time.time()
-        problems = await get_problems_data(db, contest_id)
+        problems, skipped = await get_pending_problems_data(db, contest_id, force)
         evaluations = []
         
-        logger.info(f"[Sequential] 평가 시작 - 총 {len(problems)}개 문제, {sum(len(p['answers']) for p in problems)}개 답변")
+        logger.info(f"[Sequential] 평가 시작 - 총 {len(problems)}개 문제, {sum(len(p['answers']) for p in problems)}개 답변, 채점 완료 {skipped}개 건너뜀")
+        
+        slots = contest_slots("evaluation", contest_id, space_id, priority)
         
         # 각 문제의 답변 평가
         for problem in problems:
@@ -111,17 +200,17 @@ async def evaluate_contest_answers_sequential(db: Session, contest_id: int) -> L
                 try:
                     update_system_metrics('sequential')
 
-                    evaluation = await evaluate_answer(
-                        problem=problem['question'],
-                        ai_answer=problem['ai_answer'],
-                        participant_answer=answer['answer']
-                    )
+                    async with slots.slot():
+                        evaluation = await evaluate_answer(
+                            problem=problem['question'],
+                            ai_answer=problem['ai_answer'],
+                            participant_answer=answer['answer']
+                        )
                     
                     # 평가 결과 저장
                     await update_evaluation(
                         db=db,
-                        problem_id=problem['id'],
-                        participant_id=answer['participant_id'],
+                        answer_id=answer['answer_id'],
                         score=evaluation.score,
                         feedback=evaluation.feedback
                     )
@@ -147,7 +236,7 @@ async def evaluate_contest_answers_sequential(db: Session, contest_id: int) -> L
         
         logger.info(f"[Sequential] 평가 완료 - 소요시간: {duration:.2f}초, 성공: {len(evaluations)}개")
         
-        # 모든 평가가 완료되면 콘테스트 상태 업데이트
+        # 모든 답변이 채점된 경우에만 콘테스트 상태 업데이트
         await update_contest_status(db, contest_id)
         
         return evaluations
@@ -160,28 +249,62 @@ async def evaluate_contest_answers_sequential(db: Session, contest_id: int) -> L
         logger.error(f"[Sequential] 콘테스트 평가 중 오류 발생: {str(e)}")
         raise e
 
-async def evaluate_contest_answers_parallel(db: Session, contest_id: int) -> List[Dict[str, Any]]:
+async def evaluate_contest_answers_parallel(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> List[Dict[str, Any]]:
+    results = []
+    async for event in iter_contest_evaluations_parallel(db, contest_id, force, space_id, priority):
+        if event['event'] == 'evaluation':
+            results.append(event['data']['result'])
+    return [r for r in results if r['status'] == 'success']
+
+async def iter_contest_evaluations_parallel(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> AsyncIterator[Dict[str, Any]]:
+    """parallel 방식 평가를 답변이 끝나는 순서대로 이벤트로 내보냄 (SSE 스트리밍용)
+
+    이벤트: start(대상 답변 수) -> evaluation(답변별 결과 + 진행 상황) x N -> summary(처리량/성공률)
+    소비자가 중간에 끊으면 남은 평가를 취소하고 완료된 결과까지만 저장한다 (재실행 시 이어서 채점).
+    """
+    tasks = []
+    batch_processor = None
     try:
         start_time = time.time()
-        problems = await get_problems_data(db, contest_id)
+        problems, skipped = await get_pending_problems_data(db, contest_id, force)
         total_answers = sum(len(p['answers']) for p in problems)
         
-        logger.info(f"[Parallel] 평가 시작 - 총 {len(problems)}개 문제, {total_answers}개 답변")
+        logger.info(f"[Parallel] 평가 시작 - 총 {len(problems)}개 문제, {total_answers}개 답변, 채점 완료 {skipped}개 건너뜀")
+        yield {
+            'event': 'start',
+            'data': {'contest_id': contest_id, 'total': total_answers, 'skipped': skipped}
+        }
         
         # 컴포넌트 초기화
-        sem = asyncio.Semaphore(EVALUATION_CONFIG['CONCURRENT_LIMIT'])
+        # 모든 콘테스트가 공용 스케줄러(AIMD 전역 동시성 예산)를 공정하게 나눠 씀
+        slots = contest_slots("evaluation", contest_id, space_id, priority)
         batch_processor = BatchProcessor(db, EVALUATION_CONFIG['BATCH_SIZE'])
-        progress_tracker = ProgressTracker(
+        progress_tracker = await ProgressTracker.create(
             total=total_answers,
-            log_interval=EVALUATION_CONFIG['LOG_INTERVAL']
+            log_interval=EVALUATION_CONFIG['LOG_INTERVAL'],
+            key=evaluation_progress_key(contest_id)
         )
-        evaluation_task = EvaluationTask(sem, batch_processor, progress_tracker)
+        # 같은 문제의 평가는 프롬프트 접두사가 같으므로 문제 순서대로 몰아서 보냄
+        warmup = problem_warmup(slots, len(problems), total_answers)
+        evaluation_task = EvaluationTask(slots, batch_processor, progress_tracker, warmup)
         
         # 작업 생성 및 실행
-        tasks = []
         for problem in problems:
             for answer in problem['answers']:
                 task_data = {
+                    'answer_id': answer['answer_id'],
                     'problem_id': problem['id'],
                     'participant_id': answer['participant_id'],
                     'nickname': answer['nickname'],
@@ -189,10 +312,17 @@ async def evaluate_contest_answers_parallel(db: Session, contest_id: int) -> Lis
                     'ai_answer': problem['ai_answer'],
                     'participant_answer': answer['answer']
                 }
-                tasks.append(evaluation_task.execute(task_data))
-        
-        # 결과 수집 및 처리
-        results = await asyncio.gather(*tasks)
+                tasks.append(asyncio.create_task(evaluation_task.execute(task_data)))
+        
+        # 끝나는 순서대로 결과 전달
+        results = []
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            results.append(result)
+            yield {
+                'event': 'evaluation',
+                'data': {'result': result, 'progress': progress_tracker.get_progress()}
+            }
         await batch_processor.process_batch()  # 남은 배치 처리
         
         successful_evaluations = [r for r in results if r['status'] == 'success']
@@ -216,8 +346,21 @@ async def evaluate_contest_answers_parallel(db: Session, contest_id: int) -> Lis
             f"처리량: {throughput:.1f}개/초"
         )
         
-        await update_contest_status(db, contest_id)
-        return successful_evaluations
+        remaining = await update_contest_status(db, contest_id)
+        yield {
+            'event': 'summary',
+            'data': {
+                'contest_id': contest_id,
+                'total': total_answers,
+                'skipped': skipped,
+                'success': len(successful_evaluations),
+                'failed': failed_evaluations,
+                'success_rate': success_rate,
+                'duration': duration,
+                'throughput': throughput,
+                'remaining': remaining
+            }
+        }
         
     except Exception as e:
         EVALUATION_ERROR_COUNTER.labels(
@@ -226,8 +369,24 @@ async def evaluate_contest_answers_parallel(db: Session, contest_id: int) -> Lis
         ).inc()
         logger.error(f"[Parallel] 콘테스트 평가 중 오류 발생: {str(e)}", exc_info=True)
         raise e
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            # 소비자가 스트림을 끊은 경우: 남은 평가는 취소하고 완료된 결과만 저장
+            # (배치 추가/반영은 BatchProcessor 가 취소와 무관하게 끝내며, process_batch 가 그것을 기다림)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await batch_processor.process_batch()
+            logger.warning(f"[Parallel] 평가 중단 - 대회 ID: {contest_id}, 취소된 답변 {len(pending)}개")
 
-async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> List[Dict[str, Any]]:
+async def evaluate_contest_answers_parallel_1(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> List[Dict[str, Any]]:
     """고급 병렬 처리 기능을 갖춘 평가 함수
     - 진행상황 추적
     - 배치 처리
@@ -236,15 +395,15 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
     """
     try:
         start_time = time.time()
-        problems = await get_problems_data(db, contest_id)
+        problems, skipped = await get_pending_problems_data(db, contest_id, force)
         
         # 설정 매개변수
-        CONCURRENT_LIMIT = DB_CONFIG['CONCURRENT_LIMIT']
         BATCH_SIZE = DB_CONFIG['BATCH_SIZE']
         MAX_RETRIES = DB_CONFIG['MAX_RETRIES']
         
-        # 세마포어 및 공유 상태
-        sem = asyncio.Semaphore(CONCURRENT_LIMIT)
+        # 공용 평가 스케줄러 및 공유 상태
+        slots = contest_slots("evaluation", contest_id, space_id, priority)
+        warmup = problem_warmup(slots, len(problems), sum(len(p['answers']) for p in problems))
         progress = {"total": 0, "completed": 0, "success": 0, "failed": 0}
         
         # 진행 상황 추적용 잠금
@@ -255,7 +414,7 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
         total_answers = sum(len(p['answers']) for p in problems)
         progress["total"] = total_answers
         
-        logger.info(f"[Advanced] 평가 시작 - 총 {len(problems)}개 문제, {total_answers}개 답변")
+        logger.info(f"[Advanced] 평가 시작 - 총 {len(problems)}개 문제, {total_answers}개 답변, 채점 완료 {skipped}개 건너뜀")
         update_system_metrics('advanced_parallel')
         
         # 배치 DB 업데이트 함수
@@ -269,21 +428,10 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
             db_batch = []
             
             try:
-                # 트랜잭션으로 한 번에 처리
-                for item in batch_to_process:
-                    answer = db.query(Answer).filter(
-                        Answer.problem_id == item['problem_id'],
-                        Answer.participant_id == item['participant_id']
-                    ).first()
-                    
-                    if answer:
-                        answer.rank_score = item['score']
-                        answer.feedback = item['feedback']
-                
-                db.commit()
-                logger.info(f"[Advanced] 배치 업데이트 성공 - {len(batch_to_process)}개 항목")
+                # answer_id 기준 단일 UPDATE 문으로 반영
+                updated = await bulk_update_evaluations(db, batch_to_process)
+                logger.info(f"[Advanced] 배치 업데이트 성공 - {updated}/{len(batch_to_process)}개 항목")
             except Exception as e:
-                db.rollback()
                 logger.error(f"[Advanced] 배치 업데이트 실패: {str(e)}")
                 
                 # 실패한 배치는 개별적으로 다시 시도
@@ -291,13 +439,12 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
                     try:
                         await update_evaluation(
                             db=db,
-                            problem_id=item['problem_id'],
-                            participant_id=item['participant_id'],
+                            answer_id=item['answer_id'],
                             score=item['score'],
                             feedback=item['feedback']
                         )
                     except Exception as inner_e:
-                        logger.error(f"[Advanced] 개별 업데이트 실패: 문제 ID {item['problem_id']}, 참가자 ID {item['participant_id']}, 오류: {str(inner_e)}")
+                        logger.error(f"[Advanced] 개별 업데이트 실패: 답변 ID {item['answer_id']}, 문제 ID {item['problem_id']}, 참가자 ID {item['participant_id']}, 오류: {str(inner_e)}")
         
         # 진행 상황 업데이트 함수
         async def update_progress(status):
@@ -318,7 +465,7 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
             retries = 0
             while retries <= MAX_RETRIES:
                 try:
-                    async with sem:
+                    async with warmup.turn(task_data['problem_id']), slots.slot():
                         # 평가 작업 수행
                         evaluation = await evaluate_answer(
                             problem=task_data['question'],
@@ -326,28 +473,29 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
                             participant_answer=task_data['participant_answer']
                         )
                         
-                        # 결과를 배치에 추가
-                        async with lock:
-                            db_batch.append({
-                                'problem_id': task_data['problem_id'],
-                                'participant_id': task_data['participant_id'],
-                                'score': evaluation.score,
-                                'feedback': evaluation.feedback
-                            })
-                            
-                            # 배치 크기에 도달하면 DB 업데이트
-                            if len(db_batch) >= BATCH_SIZE:
-                                await process_batch()
-                        
-                        await update_progress("success")
-                        
-                        return {
-                            'status': 'success',
+                    # 결과를 배치에 추가 (LLM 동시 실행 슬롯은 반납한 뒤 처리)
+                    async with lock:
+                        db_batch.append({
+                            'answer_id': task_data['answer_id'],
                             'problem_id': task_data['problem_id'],
                             'participant_id': task_data['participant_id'],
-                            'nickname': task_data.get('nickname', ''),
-                            'evaluation': evaluation.dict()
-                        }
+                            'score': evaluation.score,
+                            'feedback': evaluation.feedback
+                        })
+                        
+                        # 배치 크기에 도달하면 DB 업데이트
+                        if len(db_batch) >= BATCH_SIZE:
+                            await process_batch()
+                    
+                    await update_progress("success")
+                    
+                    return {
+                        'status': 'success',
+                        'problem_id': task_data['problem_id'],
+                        'participant_id': task_data['participant_id'],
+                        'nickname': task_data.get('nickname', ''),
+                        'evaluation': evaluation.dict()
+                    }
                 except Exception as e:
                     retries += 1
                     if retries <= MAX_RETRIES:
@@ -375,6 +523,7 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
         for problem in problems:
             for answer in problem['answers']:
                 task_data = {
+                    'answer_id': answer['answer_id'],
                     'problem_id': problem['id'],
                     'participant_id': answer['participant_id'],
                     'nickname': answer['nickname'],
@@ -405,7 +554,7 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
         success_rate = (len(successful_evaluations) / len(results)) * 100 if results else 0
         logger.info(f"[Advanced] 평가 완료 - 소요시간: {duration:.2f}초, 성공: {len(successful_evaluations)}/{len(results)} ({success_rate:.1f}%), 처리량: {total_answers/duration:.1f}개/초")
         
-        # 대회 상태 업데이트
+        # 대회 상태 업데이트 (남은 답변이 없을 때만)
         await update_contest_status(db, contest_id)
         
         return successful_evaluations
@@ -416,4 +565,92 @@ async def evaluate_contest_answers_parallel_1(db: Session, contest_id: int) -> L
             error_type=type(e).__name__
         ).inc()
         logger.error(f"[Advanced] 콘테스트 평가 중 오류 발생: {str(e)}", exc_info=True)
-        raise e
\ No newline at end of file
+        raise e
+
+async def evaluate_contest_answers_batched(
+    db: EvaluationSession,
+    contest_id: int,
+    force: bool = False,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> List[Dict[str, Any]]:
+    """문제별로 답변 K개를 묶어 한 번의 LLM 호출로 평가
+    - 문제/모범답안/포맷 안내문을 답변마다 반복해서 보내지 않음
+    - 항목 단위 검증 후 실패한 항목만 재요청
+    """
+    try:
+        start_time = time.time()
+        problems, skipped = await get_pending_problems_data(db, contest_id, force)
+        total_answers = sum(len(p['answers']) for p in problems)
+        batch_eval_size = max(1, EVALUATION_CONFIG['BATCH_EVAL_SIZE'])
+        
+        logger.info(f"[Batched] 평가 시작 - 총 {len(problems)}개 문제, {total_answers}개 답변, 채점 완료 {skipped}개 건너뜀, 호출당 {batch_eval_size}개")
+        
+        # 컴포넌트 초기화
+        # 배치 호출은 지연 분포가 달라 개별 평가와 별도 제한기 사용
+        slots = contest_slots("evaluation_batch", contest_id, space_id, priority)
+        batch_processor = BatchProcessor(db, EVALUATION_CONFIG['BATCH_SIZE'])
+        progress_tracker = await ProgressTracker.create(
+            total=total_answers,
+            log_interval=EVALUATION_CONFIG['LOG_INTERVAL'],
+            log_prefix="[Batched] Progress",
+            key=evaluation_progress_key(contest_id)
+        )
+        chunk_count = sum(math.ceil(len(p['answers']) / batch_eval_size) for p in problems)
+        warmup = problem_warmup(slots, len(problems), chunk_count)
+        batch_task = BatchEvaluationTask(slots, batch_processor, progress_tracker, warmup)
+        
+        # 문제별로 답변을 K개씩 묶어 작업 생성
+        tasks = []
+        for problem in problems:
+            answers = problem['answers']
+            for offset in range(0, len(answers), batch_eval_size):
+                tasks.append(batch_task.execute(problem, answers[offset:offset + batch_eval_size]))
+        
+        results = [result for chunk in await asyncio.gather(*tasks) for result in chunk]
+        await batch_processor.process_batch()  # 남은 배치 처리
+        
+        successful_evaluations = [r for r in results if r['status'] == 'success']
+        failed_evaluations = len(results) - len(successful_evaluations)
+        
+        # 메트릭 업데이트
+        duration = time.time() - start_time
+        EVALUATION_DURATION.labels(method="batched").observe(duration)
+        EVALUATION_COUNTER.labels(method="batched", status="success").inc(len(successful_evaluations))
+        EVALUATION_COUNTER.labels(method="batched", status="error").inc(failed_evaluations)
+        EVALUATION_TOKEN_COUNTER.labels(method="batched", token_type="input").inc(batch_task.token_usage["input"])
+        EVALUATION_TOKEN_COUNTER.labels(method="batched", token_type="output").inc(batch_task.token_usage["output"])
+        
+        total_tokens = batch_task.token_usage["input"] + batch_task.token_usage["output"]
+        tokens_per_answer = total_tokens / len(successful_evaluations) if successful_evaluations else 0
+        throughput = len(successful_evaluations) / duration if duration > 0 else 0
+        
+        logger.info(
+            f"[Batched] 평가 완료 - "
+            f"소요시간: {duration:.2f}초, "
+            f"성공: {len(successful_evaluations)}/{total_answers}, "
+            f"실패: {failed_evaluations}, "
+            f"LLM 호출: {batch_task.llm_calls}회 (재요청 항목 {batch_task.requeued}개), "
+            f"답변당 토큰: {tokens_per_answer:.0f}, "
+            f"처리량: {throughput:.1f}개/초"
+        )
+        
+        await update_contest_status(db, contest_id)
+        return successful_evaluations
+        
+    except Exception as e:
+        EVALUATION_ERROR_COUNTER.labels(
+            method="batched",
+            error_type=type(e).__name__
+        ).inc()
+        logger.error(f"[Batched] 콘테스트 평가 중 오류 발생: {str(e)}", exc_info=True)
+        raise e
+
+
+# 채점 방식별 평가 함수 (API 라우트와 백그라운드 작업에서 공용)
+EVALUATION_METHODS = {
+    "sequential": evaluate_contest_answers_sequential,
+    "parallel": evaluate_contest_answers_parallel,
+    "parallel_1": evaluate_contest_answers_parallel_1,
+    "batched": evaluate_contest_answers_batched
+}
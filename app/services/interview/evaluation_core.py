@@ -1,18 +1,138 @@
-from app.schemas.interview import Evaluation
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import ValidationError
+from langchain_core.utils.json import parse_json_markdown
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.schemas.interview import Evaluation, BatchEvaluationItem, CascadeEvaluation
 from app.chain.evaluate_chain import chain
+from app.chain.cascade_evaluate_chain import chain as cascade_chain
+from app.chain.batch_evaluate_chain import chain as batch_chain
+from app.metrics import EVALUATION_CASCADE_COUNTER, LLM_OUTPUT_REPAIR_COUNTER, LLM_RETRY_AVOIDED_COUNTER, LLM_OUTPUT_PARSE_FAILURE_COUNTER
+from app.utils.json_repair import JSONRepairError, coerce_to_model, repair_json
 import logging
 
 logger = logging.getLogger(__name__)
 
 async def evaluate_answer(problem: str, ai_answer: str, participant_answer: str) -> Evaluation:
-    """개별 답변 평가"""
+    """개별 답변 평가 (이벤트 루프를 막지 않도록 비동기 체인 호출)
+
+    CASCADE 설정이 켜져 있으면 작은 모델의 1차 평가를 먼저 보고, 필요한 답변만 큰 모델로 재평가한다.
+    """
+    inputs = {
+        "problem": problem,
+        "ai_answer": ai_answer,
+        "participant_answer": participant_answer
+    }
+    if EVALUATION_CONFIG['CASCADE']:
+        evaluation = await evaluate_answer_cascade(inputs)
+        if evaluation is not None:
+            return evaluation
+    try:
+        response = await chain.ainvoke(inputs)
+        return response
+    except Exception as e:
+        logger.error(f"답변 평가 중 오류 발생: {str(e)}")
+        raise e 
+
+def cascade_outcome(evaluation: CascadeEvaluation) -> str:
+    """1차 평가를 그대로 쓸지(accepted), 어떤 이유로 재평가할지 판단"""
+    if evaluation.confidence < EVALUATION_CONFIG['CASCADE_MIN_CONFIDENCE']:
+        return "escalated_low_confidence"
+    if EVALUATION_CONFIG['CASCADE_BORDERLINE_LOW'] < evaluation.score < EVALUATION_CONFIG['CASCADE_BORDERLINE_HIGH']:
+        return "escalated_borderline"
+    return "accepted"
+
+async def evaluate_answer_cascade(inputs: Dict[str, Any]) -> Optional[Evaluation]:
+    """작은 모델로 1차 평가 (재평가가 필요하면 None)
+
+    1차 호출이 실패하면 재시도 대신 바로 큰 모델로 넘긴다.
+    """
+    try:
+        response = await cascade_chain.ainvoke(inputs)
+    except Exception as e:
+        logger.warning(f"1차(작은 모델) 평가 실패, 큰 모델로 재평가: {str(e)}")
+        EVALUATION_CASCADE_COUNTER.labels(outcome="escalated_error").inc()
+        return None
+
+    outcome = cascade_outcome(response)
+    EVALUATION_CASCADE_COUNTER.labels(outcome=outcome).inc()
+    if outcome != "accepted":
+        return None
+    return Evaluation(score=response.score, feedback=response.feedback)
+
+async def evaluate_answers_batch(
+    problem: str,
+    ai_answer: str,
+    answers: List[Dict[str, Any]]
+) -> Tuple[Dict[int, Evaluation], Dict[str, int]]:
+    """같은 문제의 여러 답변을 한 번의 LLM 호출로 평가
+
+    Args:
+        problem: 문제 내용
+        ai_answer: 모범 답안
+        answers: answer_id, answer 키를 가진 응시자 답변 목록
+
+    Returns:
+        (answer_id 별 평가 결과, 토큰 사용량). 파싱/검증에 실패한 답변은 결과에서 빠진다.
+    """
+    participant_answers = "\n\n".join(
+        f"[answer_id={answer['answer_id']}]\n{answer['answer']}" for answer in answers
+    )
     try:
-        response = chain.invoke({
+        response = await batch_chain.ainvoke({
             "problem": problem,
             "ai_answer": ai_answer,
-            "participant_answer": participant_answer
+            "participant_answers": participant_answers
         })
-        return response
     except Exception as e:
-        logger.error(f"답변 평가 중 오류 발생: {str(e)}")
-        raise e 
\ No newline at end of file
+        logger.error(f"배치 답변 평가 중 오류 발생: {str(e)}")
+        raise e
+
+    usage = getattr(response, "usage_metadata", None) or {}
+    token_usage = {
+        "input": usage.get("input_tokens", 0),
+        "output": usage.get("output_tokens", 0)
+    }
+    answer_ids = {answer['answer_id'] for answer in answers}
+    return parse_batch_evaluations(response.content, answer_ids), token_usage
+
+def parse_batch_evaluations(content: str, answer_ids: set) -> Dict[int, Evaluation]:
+    """배치 평가 응답을 항목별로 검증
+
+    응답 전체가 아닌 항목 단위로 검증하므로, 일부 항목만 깨졌을 때 나머지 결과는 살린다.
+    깨진 JSON 과 타입이 어긋난 항목은 재요청 전에 로컬에서 먼저 복구한다.
+    """
+    defects = []
+    try:
+        data = parse_json_markdown(content)
+    except Exception as e:
+        try:
+            data, defects = repair_json(content)
+        except JSONRepairError:
+            LLM_OUTPUT_PARSE_FAILURE_COUNTER.labels(chain="batch_evaluate").inc()
+            logger.warning(f"배치 평가 응답 JSON 파싱 실패: {str(e)}")
+            return {}
+
+    items = data.get("evaluations", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+
+    results = {}
+    for item in items:
+        try:
+            parsed = BatchEvaluationItem.model_validate(item)
+        except ValidationError as e:
+            try:
+                parsed = BatchEvaluationItem.model_validate(coerce_to_model(item, BatchEvaluationItem))
+                defects.append("coerced")
+            except ValidationError:
+                logger.warning(f"배치 평가 항목 검증 실패: {item} - {str(e)}")
+                continue
+        if parsed.answer_id in answer_ids and parsed.answer_id not in results:
+            results[parsed.answer_id] = Evaluation(score=parsed.score, feedback=parsed.feedback)
+
+    if defects:
+        # 복구한 항목들은 다시 묶어 재요청했을 것이므로 재호출 1회를 아낀 것으로 집계
+        for defect in dict.fromkeys(defects):
+            LLM_OUTPUT_REPAIR_COUNTER.labels(chain="batch_evaluate", defect=defect).inc()
+        LLM_RETRY_AVOIDED_COUNTER.labels(chain="batch_evaluate").inc()
+    return results
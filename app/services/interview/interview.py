@@ -1,18 +1,34 @@
 # app/services.py
 import time
-from app.schemas.interview import InterviewAnswer
+import asyncio
+import contextlib
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from app.schemas.interview import InterviewAnswer, BulkInterviewAnswerItem, BulkInterviewAnswerResult
 from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
+from langchain_core.utils.json import parse_partial_json
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.chain.structured_output import RepairingOutputParser, structured_llm
+from app.utils.llm_usage import usage_callbacks, usage_store
+from app.utils.progress_tracker import ProgressTracker, ProgressStatus
 from dotenv import load_dotenv
 from app.db.repositories.mysql.tech_interview_repository import TechInterviewRepository
+from app.db.repositories.mysql.async_tech_interview_repository import AsyncTechInterviewRepository
+from app.db.mysql.models import TechInterview, TechClass
+from app.config.interview_config import INTERVIEW_CONFIG
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
+from app.utils.adaptive_limiter import get_limiter
+from app.utils.answer_cache import CachedAnswer, answer_index
+from app.utils.answer_failures import answer_failure_store
+from app.metrics import LLM_ANSWER_CACHE_COUNTER, LLM_ANSWER_CACHE_SIMILARITY
 
 # 환경변수 로드
 load_dotenv()
 
 # 출력 파서 생성
-parser = PydanticOutputParser(pydantic_object=InterviewAnswer)
+parser = RepairingOutputParser(pydantic_object=InterviewAnswer, chain_name="interview_answer")
 
 # 프롬프트 템플릿 생성
 template = """당신은 IT 기술 면접 전문가입니다. 주어진 기술 면접 질문에 대해 모범 답변을 작성해 주세요.
@@ -37,10 +53,10 @@ prompt = PromptTemplate(
 )
 
 # LLM 모델 설정
-llm = ChatOpenAI(temperature=0.2, model_name="gpt-4o")
+llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4o", callbacks=usage_callbacks("interview_answer"))
 
 # 체인 구성
-chain = prompt | llm | parser
+chain = prompt | structured_llm(llm, InterviewAnswer) | parser
 
 # 기술 면접 답변 생성 함수
 async def generate_interview_answer(topic: str, question: str, question_id: int, db: Session) -> InterviewAnswer:
@@ -59,31 +75,464 @@ async def generate_interview_answer(topic: str, question: str, question_id: int,
     start_time = time.time()
 
     try:
-        # LangChain 체인 실행
-        response = chain.invoke({"topic": topic, "question": question})
+        # 같은 주제에 비슷한 질문의 답변이 있으면 재사용, 없으면 LangChain 체인 실행
+        tech_class = tech_class_code(topic)
+        await refresh_answer_index(db, [tech_class])
+        response = lookup_cached_answer(tech_class, question, exclude_id=question_id)
+        if response is None:
+            async with get_limiter("interview").slot():
+                response = await chain.ainvoke({"topic": topic, "question": question})
         processing_time = time.time() - start_time
 
         print(f"AI 답변 생성 시간: {processing_time:.2f}초")
         print(f"AI 답변: {response}")
 
-        # 데이터베이스에 답변 저장
-        tech_interview_repo = TechInterviewRepository(db)
-        
-        # 기존 질문 조회
-        existing_interview = tech_interview_repo.get_by_id(question_id)
-        if not existing_interview:
+        # 데이터베이스에 답변 저장 (재조회 없이 id 기준 UPDATE)
+        updated = await asyncio.to_thread(
+            TechInterviewRepository(db).bulk_update_answers, [answer_row(question_id, response)]
+        )
+        if not updated:
             raise ValueError(f"Question with id {question_id} not found")
-        
-        # 기존 질문 업데이트
-        existing_interview.ai_answer = response.model_dump_json()
-        existing_interview.key_point = response.tips
-        existing_interview.additional_topics = response.related_topics
-        
-        # 업데이트 저장
-        updated_interview = tech_interview_repo.update(existing_interview)
-        print(f"Successfully updated interview: {updated_interview.id}")
+        remember_answer(tech_class, question_id, question, response)
+        print(f"Successfully updated interview: {question_id}")
 
         return response
     except Exception as e:
         print(f"Error generating interview answer: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+# 스트리밍용 체인: 파서 없이 토큰을 받고, 끝난 뒤 전체 텍스트를 한 번에 파싱
+stream_chain = prompt | structured_llm(llm, InterviewAnswer)
+
+# 클라이언트 연결이 끊겨도 끝까지 생성/저장하도록 참조를 들고 있는 생성 태스크
+_stream_tasks: Set[asyncio.Task] = set()
+
+def answer_field_deltas(text: str, fields: Dict[str, str]) -> List[Dict[str, Any]]:
+    """지금까지 받은 JSON 조각에서 필드별로 새로 늘어난 글자를 뽑고 fields 를 갱신
+
+    Returns:
+        [{"field": "answer", "text": "새 글자"}, ...] (값이 앞부분부터 바뀌었으면 replace=True 와 전체 값)
+    """
+    try:
+        partial = parse_partial_json(text)
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(partial, dict):
+        return []
+
+    deltas = []
+    for name in InterviewAnswer.model_fields:
+        value = partial.get(name)
+        if not isinstance(value, str):
+            continue
+        previous = fields.get(name, "")
+        if value == previous:
+            continue
+        if value.startswith(previous):
+            deltas.append({"field": name, "text": value[len(previous):]})
+        else:
+            deltas.append({"field": name, "text": value, "replace": True})
+        fields[name] = value
+    return deltas
+
+async def stream_interview_answer(
+    topic: str,
+    question: str,
+    question_id: int,
+    session_factory: Callable[[], contextlib.AbstractAsyncContextManager]
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    기술 면접 질문의 AI 답변을 생성하면서 필드별 부분 텍스트를 (이벤트, 데이터) 로 내보냄
+
+    이벤트: delta({"field", "text"}) ... -> answer(최종 InterviewAnswer, 저장 완료 후) -> done
+    실패하면 error 이벤트로 끝난다. 생성과 저장은 별도 태스크에서 실행하므로
+    클라이언트 연결이 끊겨도 끝까지 생성해 TechInterview 에 저장한다.
+
+    Args:
+        topic: 면접 주제
+        question: 면접 질문 내용
+        question_id: 질문 ID
+        session_factory: 응답보다 오래 사는 세션을 여는 컨텍스트 매니저 (예: evaluation_session)
+    """
+    events: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_produce_interview_answer(topic, question, question_id, session_factory, events))
+    _stream_tasks.add(task)
+    task.add_done_callback(_stream_tasks.discard)
+
+    while True:
+        event, data = await events.get()
+        yield event, data
+        if event in ("done", "error"):
+            return
+
+async def _produce_interview_answer(
+    topic: str,
+    question: str,
+    question_id: int,
+    session_factory: Callable[[], contextlib.AbstractAsyncContextManager],
+    events: asyncio.Queue
+):
+    start_time = time.time()
+    try:
+        async with session_factory() as db:
+            tech_class = tech_class_code(topic)
+            await refresh_answer_index(db, [tech_class])
+            response = lookup_cached_answer(tech_class, question, exclude_id=question_id)
+            cached = response is not None
+
+            if response is None:
+                text = ""
+                fields: Dict[str, str] = {}
+                first_token_time = None
+                async with get_limiter("interview").slot():
+                    async for chunk in stream_chain.astream({"topic": topic, "question": question}):
+                        if not isinstance(chunk.content, str) or not chunk.content:
+                            continue
+                        if first_token_time is None:
+                            first_token_time = time.time() - start_time
+                        text += chunk.content
+                        for delta in answer_field_deltas(text, fields):
+                            events.put_nowait(("delta", delta))
+                response = parser.parse(text)
+                print(f"AI 답변 스트리밍 첫 토큰: {first_token_time or 0:.2f}초, 전체: {time.time() - start_time:.2f}초")
+
+            # 데이터베이스에 답변 저장 (재조회 없이 id 기준 UPDATE)
+            updated = await bulk_update_answers(db, [answer_row(question_id, response)])
+            if not updated:
+                raise ValueError(f"Question with id {question_id} not found")
+            remember_answer(tech_class, question_id, question, response)
+            print(f"Successfully updated interview: {question_id}")
+
+        events.put_nowait(("answer", {**response.model_dump(), "cached": cached}))
+        events.put_nowait(("done", {"question_id": question_id, "duration": round(time.time() - start_time, 3)}))
+    except Exception as e:
+        print(f"Error streaming interview answer: {str(e)}")
+        events.put_nowait(("error", {
+            "detail": str(e),
+            "not_found": isinstance(e, ValueError)
+        }))
+
+def answer_row(question_id: int, response: InterviewAnswer) -> Dict[str, Any]:
+    """생성된 답변을 tech_interview 컬럼 값으로 변환"""
+    return {
+        'id': question_id,
+        'ai_answer': response.model_dump_json(),
+        'key_point': response.tips,
+        'additional_topics': response.related_topics
+    }
+
+def interview_topic(interview: TechInterview) -> str:
+    """tech_class 코드를 면접 주제 이름으로 변환 (단건 API 의 techClass 와 같은 표기)"""
+    try:
+        return TechClass(interview.tech_class).name
+    except ValueError:
+        return ""
+
+def tech_class_code(topic: str) -> Optional[int]:
+    """techClass 이름("JAVASCRIPT")을 tech_class 코드로 변환 (알 수 없으면 None)"""
+    try:
+        return TechClass[topic.strip().upper()].value
+    except (KeyError, AttributeError):
+        return None
+
+async def refresh_answer_index(db: Union[Session, AsyncSession], tech_classes: Iterable[Optional[int]]):
+    """재사용 색인이 없거나 오래된 tech_class 의 답변된 질문을 DB 에서 다시 읽음"""
+    if not INTERVIEW_CONFIG['ANSWER_CACHE']:
+        return
+    for tech_class in dict.fromkeys(tech_classes):
+        if tech_class is None or not answer_index.is_stale(tech_class):
+            continue
+        if isinstance(db, AsyncSession):
+            rows = await AsyncTechInterviewRepository(db).get_answered_by_tech_class(tech_class)
+        else:
+            rows = await asyncio.to_thread(TechInterviewRepository(db).get_answered_by_tech_class, tech_class)
+        answer_index.load(tech_class, [
+            CachedAnswer(row.id, row.question or "", row.ai_answer, row.key_point, row.additional_topics)
+            for row in rows
+        ])
+
+def lookup_cached_answer(tech_class: Optional[int], question: str, exclude_id: Optional[int] = None) -> Optional[InterviewAnswer]:
+    """유사도가 임계값 이상인 기존 답변을 새 질문 문구로 바꿔 반환 (없으면 None)"""
+    if not INTERVIEW_CONFIG['ANSWER_CACHE'] or tech_class is None:
+        return None
+    entry, similarity = answer_index.search(tech_class, question, exclude_id=exclude_id)
+    LLM_ANSWER_CACHE_SIMILARITY.labels(chain="interview_answer").observe(similarity)
+    stored = None
+    if entry is not None and similarity >= INTERVIEW_CONFIG['ANSWER_CACHE_THRESHOLD']:
+        try:
+            stored = InterviewAnswer.model_validate_json(entry.ai_answer)
+        except ValidationError:
+            # 구조화 이전 형식으로 저장된 답변은 재사용하지 않음
+            stored = None
+    if stored is None:
+        LLM_ANSWER_CACHE_COUNTER.labels(chain="interview_answer", outcome="miss").inc()
+        return None
+
+    LLM_ANSWER_CACHE_COUNTER.labels(chain="interview_answer", outcome="hit").inc()
+    print(f"유사 질문 답변 재사용 (유사도 {similarity:.2f}): '{question}' <- {entry.id} '{entry.question}'")
+    # 팁/관련 주제는 수정되었을 수 있는 컬럼 값을 우선
+    return stored.model_copy(update={
+        "question": question,
+        "tips": entry.key_point or stored.tips,
+        "related_topics": entry.additional_topics or stored.related_topics
+    })
+
+def remember_answer(tech_class: Optional[int], question_id: int, question: str, response: InterviewAnswer):
+    """저장한 답변을 재사용 색인에 반영 (재사용한 답변도 새 문구로 찾을 수 있도록 추가)"""
+    if INTERVIEW_CONFIG['ANSWER_CACHE'] and tech_class is not None:
+        row = answer_row(question_id, response)
+        answer_index.add(tech_class, CachedAnswer(
+            question_id, question, row['ai_answer'], row['key_point'], row['additional_topics']
+        ))
+
+async def get_tech_interviews(db: Union[Session, AsyncSession], question_ids: List[int]) -> List[TechInterview]:
+    if isinstance(db, AsyncSession):
+        return await AsyncTechInterviewRepository(db).get_by_ids(question_ids)
+    return await asyncio.to_thread(TechInterviewRepository(db).get_by_ids, question_ids)
+
+async def bulk_update_answers(db: Union[Session, AsyncSession], items: List[Dict[str, Any]]) -> int:
+    """생성된 답변 묶음을 id 기준 단일 UPDATE 문으로 반영"""
+    if isinstance(db, AsyncSession):
+        return await AsyncTechInterviewRepository(db).bulk_update_answers(items)
+    return await asyncio.to_thread(TechInterviewRepository(db).bulk_update_answers, items)
+
+def is_answered(interview: TechInterview) -> bool:
+    """모범 답안과 핵심 포인트가 모두 저장된 질문"""
+    return bool(interview.ai_answer) and interview.key_point is not None
+
+async def get_missing_answers(
+    db: Union[Session, AsyncSession],
+    limit: int,
+    exclude_ids: Iterable[int] = ()
+) -> List[TechInterview]:
+    if isinstance(db, AsyncSession):
+        return await AsyncTechInterviewRepository(db).get_missing_answers(limit, exclude_ids)
+    return await asyncio.to_thread(TechInterviewRepository(db).get_missing_answers, limit, exclude_ids)
+
+async def generate_answers(
+    targets: List[TechInterview],
+    db: Union[Session, AsyncSession],
+    answer_chain=None,
+    priority: int = 0,
+    flow: Any = None,
+    max_concurrency: Optional[int] = None,
+    budget_exhausted: Optional[Callable[[], Awaitable[bool]]] = None,
+    on_result: Optional[Callable[[BulkInterviewAnswerItem], Awaitable[None]]] = None
+) -> Dict[int, BulkInterviewAnswerItem]:
+    """
+    질문들의 AI 답변을 동시에 생성해 묶음 단위로 저장
+
+    비슷한 질문의 답변이 있으면 재사용하고, 나머지 생성은 공용 "interview" 리미터 안에서 동시에 실행한다.
+    끝난 순서대로 BULK_WRITE_SIZE 개씩 모아 한 번의 UPDATE 로 저장하며,
+    일부 질문이 실패해도 나머지는 저장하고 질문별 결과로 알려준다.
+
+    Args:
+        targets: 답변을 만들 질문
+        db: 데이터베이스 세션 (Session 또는 AsyncSession)
+        answer_chain: 사용할 체인 (기본 chain). 사용량을 따로 집계할 때 바꿔 넣는다
+        priority, flow: 리미터 대기열의 우선순위와 공정 분배 단위
+        max_concurrency: 이 호출이 동시에 차지할 리미터 슬롯 수 상한
+        budget_exhausted: 생성 직전마다 확인해 True 면 생성하지 않고 deferred 로 남김
+        on_result: 질문별 최종 결과가 정해질 때마다 호출
+
+    Returns:
+        Dict[int, BulkInterviewAnswerItem]: 질문 ID 별 결과
+    """
+    answer_chain = answer_chain or chain
+    concurrency = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    results: Dict[int, BulkInterviewAnswerItem] = {}
+
+    await refresh_answer_index(db, [interview.tech_class for interview in targets])
+
+    async def generate(interview: TechInterview):
+        try:
+            response = lookup_cached_answer(interview.tech_class, interview.question or "", exclude_id=interview.id)
+            if response is not None:
+                return interview, response, True, None
+            async with concurrency or contextlib.nullcontext():
+                if budget_exhausted is not None and await budget_exhausted():
+                    return interview, None, False, None
+                async with get_limiter("interview").slot(flow, priority):
+                    response = await answer_chain.ainvoke({"topic": interview_topic(interview), "question": interview.question})
+            return interview, response, False, None
+        except Exception as e:
+            return interview, None, False, e
+
+    async def finish(item: BulkInterviewAnswerItem):
+        results[item.id] = item
+        if on_result is not None:
+            await on_result(item)
+
+    pending: List[tuple] = []
+
+    async def flush():
+        if not pending:
+            return
+        written = list(pending)
+        pending.clear()
+        try:
+            await bulk_update_answers(db, [answer_row(interview.id, response) for interview, response, _ in written])
+        except Exception as e:
+            print(f"Error saving interview answers: {str(e)}")
+            for interview, _, _ in written:
+                await finish(BulkInterviewAnswerItem(id=interview.id, status="failed", error=f"답변 저장 실패: {str(e)}"))
+            return
+        for interview, response, cached in written:
+            remember_answer(interview.tech_class, interview.id, interview.question or "", response)
+            await finish(BulkInterviewAnswerItem(id=interview.id, status="success", answer=response, cached=cached))
+
+    for next_result in asyncio.as_completed([generate(interview) for interview in targets]):
+        interview, response, cached, error = await next_result
+        if error is not None:
+            print(f"Error generating interview answer {interview.id}: {str(error)}")
+            await finish(BulkInterviewAnswerItem(id=interview.id, status="failed", error=str(error)))
+            continue
+        if response is None:
+            await finish(BulkInterviewAnswerItem(id=interview.id, status="deferred", error="LLM 예산 소진"))
+            continue
+        pending.append((interview, response, cached))
+        if len(pending) >= INTERVIEW_CONFIG['BULK_WRITE_SIZE']:
+            await flush()
+    await flush()
+    return results
+
+def summarize_results(ordered: List[BulkInterviewAnswerItem]) -> BulkInterviewAnswerResult:
+    return BulkInterviewAnswerResult(
+        total=len(ordered),
+        success=sum(1 for item in ordered if item.status == "success"),
+        skipped=sum(1 for item in ordered if item.status in ("skipped", "deferred")),
+        failed=sum(1 for item in ordered if item.status in ("failed", "not_found")),
+        cached=sum(1 for item in ordered if item.cached),
+        results=ordered
+    )
+
+async def generate_interview_answers_bulk(
+    question_ids: Iterable[int],
+    db: Union[Session, AsyncSession],
+    force: bool = False
+) -> BulkInterviewAnswerResult:
+    """
+    여러 기술 면접 질문의 AI 답변을 동시에 생성해 묶음 단위로 저장
+
+    질문은 한 번의 쿼리로 조회하고 generate_answers 로 생성/저장한다.
+
+    Args:
+        question_ids: 질문 ID 목록 (중복은 한 번만 처리)
+        db: 데이터베이스 세션 (Session 또는 AsyncSession)
+        force: True 이면 이미 답변이 있는 질문도 다시 생성
+
+    Returns:
+        BulkInterviewAnswerResult: 요청 순서대로 정렬된 질문별 결과와 집계
+    """
+    start_time = time.time()
+    ids = list(dict.fromkeys(question_ids))
+    interviews = {interview.id: interview for interview in await get_tech_interviews(db, ids)}
+
+    results: Dict[int, BulkInterviewAnswerItem] = {}
+    targets = []
+    for question_id in ids:
+        interview = interviews.get(question_id)
+        if interview is None:
+            results[question_id] = BulkInterviewAnswerItem(
+                id=question_id, status="not_found", error=f"Question with id {question_id} not found"
+            )
+        elif is_answered(interview) and not force:
+            results[question_id] = BulkInterviewAnswerItem(id=question_id, status="skipped")
+        else:
+            targets.append(interview)
+
+    results.update(await generate_answers(targets, db))
+
+    summary = summarize_results([results[question_id] for question_id in ids])
+    print(
+        f"AI 답변 대량 생성 완료: {summary.success}/{summary.total} 성공 "
+        f"(재사용 {summary.cached}), {summary.skipped} 건너뜀, {summary.failed} 실패 ({time.time() - start_time:.2f}초)"
+    )
+    return summary
+
+# 사전 생성 전용 체인: 사용량을 "interview_precompute" 로 따로 집계해 일일 예산을 확인
+precompute_llm = RateLimitedChatOpenAI(temperature=0.2, model_name="gpt-4o", callbacks=usage_callbacks("interview_precompute"))
+precompute_chain = prompt | structured_llm(precompute_llm, InterviewAnswer) | parser
+
+async def precompute_budget_exhausted() -> bool:
+    """오늘(UTC) 사전 생성에 쓴 LLM 비용이 PRECOMPUTE_DAILY_BUDGET_USD 이상인지"""
+    budget = INTERVIEW_CONFIG['PRECOMPUTE_DAILY_BUDGET_USD']
+    if budget <= 0:
+        return False
+    rows = await asyncio.to_thread(usage_store.rows, 1)
+    spent = sum(values.get("cost_usd", 0.0) for dims, values in rows.items() if dims[0] == "interview_precompute")
+    return spent >= budget
+
+async def precompute_missing_answers(
+    db: Union[Session, AsyncSession],
+    limit: int = INTERVIEW_CONFIG['PRECOMPUTE_BATCH_SIZE'],
+    progress_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    ai_answer/key_point 가 비어 있는 질문의 모범 답안을 낮은 우선순위로 미리 생성
+
+    채점 전 대회에 출제된 질문부터 처리하므로, 채점 시점에는 모범 답안이 이미 저장되어 있다.
+    요청 처리보다 낮은 우선순위로 "interview" 리미터 슬롯을 최대 PRECOMPUTE_CONCURRENCY 개만 쓰고,
+    일일 예산을 넘으면 남은 질문은 다음 실행으로 미룬다 (deferred).
+    PRECOMPUTE_MAX_ATTEMPTS 번 연속 실패한 질문은 실패 기록이 만료될 때까지 대상에서 뺀다.
+
+    Returns:
+        Dict: 처리 결과 집계와 이번 실행 후에도 남아 있을 수 있는지(has_more) 여부
+    """
+    start_time = time.time()
+    if await precompute_budget_exhausted():
+        print("모범 답안 사전 생성 건너뜀: 오늘 LLM 예산 소진")
+        return {"total": 0, "success": 0, "failed": 0, "deferred": 0, "cached": 0, "excluded": 0,
+                "has_more": True, "budget_exhausted": True}
+
+    excluded = await asyncio.to_thread(answer_failure_store.exhausted_ids, INTERVIEW_CONFIG['PRECOMPUTE_MAX_ATTEMPTS'])
+    targets = await get_missing_answers(db, limit, excluded)
+    tracker = await ProgressTracker.create(
+        total=len(targets),
+        log_prefix="모범 답안 사전 생성",
+        key=progress_key,
+        metadata={"stage": "precompute"}
+    )
+
+    async def on_result(item: BulkInterviewAnswerItem):
+        status = {
+            "success": ProgressStatus.SUCCESS,
+            "deferred": ProgressStatus.SKIPPED
+        }.get(item.status, ProgressStatus.FAILED)
+        await tracker.update(status, {"last_question_id": item.id})
+
+    results = await generate_answers(
+        targets,
+        db,
+        answer_chain=precompute_chain,
+        priority=INTERVIEW_CONFIG['PRECOMPUTE_PRIORITY'],
+        flow="precompute",
+        max_concurrency=INTERVIEW_CONFIG['PRECOMPUTE_CONCURRENCY'],
+        budget_exhausted=precompute_budget_exhausted,
+        on_result=on_result
+    )
+
+    await asyncio.to_thread(
+        answer_failure_store.record,
+        [item.id for item in results.values() if item.status == "failed"],
+        [item.id for item in results.values() if item.status == "success"]
+    )
+
+    summary = summarize_results(list(results.values()))
+    deferred = sum(1 for item in results.values() if item.status == "deferred")
+    print(
+        f"모범 답안 사전 생성 완료: {summary.success}/{summary.total} 성공 "
+        f"(재사용 {summary.cached}), {deferred} 미룸, {summary.failed} 실패, "
+        f"반복 실패로 제외 {len(excluded)}개 ({time.time() - start_time:.2f}초)"
+    )
+    return {
+        "total": summary.total,
+        "success": summary.success,
+        "failed": summary.failed,
+        "deferred": deferred,
+        "cached": summary.cached,
+        "excluded": len(excluded),
+        # 한 번에 가져온 만큼 꽉 찼거나 미룬 질문이 있으면 아직 남아 있을 수 있음
+        "has_more": len(targets) >= limit or deferred > 0,
+        "budget_exhausted": deferred > 0
+    }
@@ -3,6 +3,7 @@ from app.schemas.resume import CustomResumeRequest, CustomResumeResponse, JobAna
 from dotenv import load_dotenv
 from typing import Dict, Any, Union, Optional
 from app.utils.progress_tracker import ProgressTracker, ProgressStatus
+from app.utils.progress_store import progress_store
 from app.chain.custom_resume_chain import (
     generate_start,
     generate_tech_stack,
@@ -12,12 +13,15 @@ from app.chain.custom_resume_chain import (
     generate_career
 )
 from langchain.memory import ConversationBufferMemory
+import asyncio
 import logging
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-custom_resume_trackers: Dict[str, ProgressTracker] = {}
+def custom_resume_progress_key(user_id: str) -> str:
+    """커스텀 이력서 생성 상태의 진행 상황 저장소 키 (모든 워커가 공유)"""
+    return f"custom_resume:{user_id}"
 
 def preprocess_request_data(request: CustomResumeRequest) -> Dict[str, Any]:
     """
@@ -145,14 +149,12 @@ def preprocess_request_data(request: CustomResumeRequest) -> Dict[str, Any]:
 async def get_custom_resume_status(user_id: str) -> Dict[str, Any]:
     """커스텀 이력서 생성 상태 조회"""
     logger.info(f"Checking custom resume status for user: {user_id}")
-    logger.info(f"Available trackers: {list(custom_resume_trackers.keys())}")
     
-    if user_id not in custom_resume_trackers:
+    progress = await asyncio.to_thread(progress_store.get, custom_resume_progress_key(user_id))
+    if progress is None:
         logger.error(f"Tracker not found for user: {user_id}")
         return {"error": "커스텀 이력서 생성 요청을 찾을 수 없습니다."}
     
-    tracker = custom_resume_trackers[user_id]
-    progress = tracker.get_progress()
     logger.info(f"Progress for user {user_id}: {progress}")
 
     # 모든 단계가 완료되었는지 확인
@@ -201,14 +203,14 @@ async def generate_custom_resume(user_id: str, request: CustomResumeRequest) ->
         clear_user_memory(user_id)
         
         # ProgressTracker 초기화
-        tracker = ProgressTracker(
+        tracker = await ProgressTracker.create(
             total=5,  # Updated to include all steps: start, portfolio, career, tech_stack, cover_letter
             log_interval=10,
-            log_prefix="Custom Resume Generation"
+            log_prefix="Custom Resume Generation",
+            key=custom_resume_progress_key(user_id),
+            metadata={"start_time": start_time}
         )
-        custom_resume_trackers[user_id] = tracker
         logger.info(f"Initialized tracker for user: {user_id}")
-        logger.info(f"Current trackers: {list(custom_resume_trackers.keys())}")
 
         try:
             # 데이터 전처리
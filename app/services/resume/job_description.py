@@ -2,6 +2,7 @@ from typing import List
 from pydantic import BaseModel, ValidationError
 from app.schemas.resume import JobAnalysis, AiAnalysisResponse
 from app.chain.job_description import chain
+from app.utils.adaptive_limiter import get_limiter
 
 class JobAnalysis(BaseModel):
     company: str
@@ -19,7 +20,8 @@ async def analyze_job_description(raw_data: str) -> AiAnalysisResponse:
     """채용공고 분석"""
     try:
         # LangChain을 사용하여 분석 수행
-        result = await chain.ainvoke({"text": raw_data})
+        async with get_limiter("job_description").slot():
+            result = await chain.ainvoke({"text": raw_data})
         
         print("\n=== AI 분석 원본 결과 ===")
         print(result)
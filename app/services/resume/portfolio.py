@@ -2,27 +2,29 @@ import os
 import time
 import glob
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, Optional
+import asyncio
 from app.schemas.resume import PortfolioData, SystemArchitecture
 from dotenv import load_dotenv
 from app.utils.progress_tracker import ProgressTracker, ProgressStatus
+from app.utils.progress_store import progress_store
 from app.chain import portfolio_chain
 from app.chain import portfolio_role_chain
+from app.utils.adaptive_limiter import get_limiter
 
 # 환경변수 로드
 load_dotenv()
 
-# 포트폴리오 생성 상태를 저장할 딕셔너리
-portfolio_trackers: Dict[str, ProgressTracker] = {}
+def portfolio_progress_key(user_id: str) -> str:
+    """포트폴리오 생성 상태의 진행 상황 저장소 키 (모든 워커가 공유)"""
+    return f"portfolio:{user_id}"
 
 async def get_portfolio_status(user_id: str) -> Dict[str, Any]:
     """포트폴리오 생성 상태를 조회합니다."""
-    if user_id not in portfolio_trackers:
+    progress = await asyncio.to_thread(progress_store.get, portfolio_progress_key(user_id))
+    if progress is None:
         return {"error": "포트폴리오 생성 요청을 찾을 수 없습니다."}
     
-    tracker = portfolio_trackers[user_id]
-    progress = tracker.get_progress()
-    
     # 완료 조건 수정: success가 1 이상이거나 result가 있으면 완료로 처리
     if progress.get("success", 0) > 0 or progress.get("result"):
         if progress["failed"] > 0:
@@ -43,15 +45,16 @@ async def get_portfolio_status(user_id: str) -> Dict[str, Any]:
     
 async def generate_portfolio(user_id: str, repositories: list, commit_files: list) -> Union[PortfolioData, Dict[str, Any]]:
     start_time = time.time()
+    tracker: Optional[ProgressTracker] = None
     
     try:
         # ProgressTracker 초기화
-        tracker = ProgressTracker(
+        tracker = await ProgressTracker.create(
             total=len(repositories),
-            log_prefix=f"포트폴리오 생성 (사용자: {user_id})"
+            log_prefix=f"포트폴리오 생성 (사용자: {user_id})",
+            key=portfolio_progress_key(user_id),
+            metadata={"start_time": start_time}
         )
-        tracker.progress["start_time"] = start_time
-        portfolio_trackers[user_id] = tracker
         
         if not repositories:
             await tracker.update(ProgressStatus.FAILED, {"error": "분석할 저장소가 없습니다."})
@@ -106,7 +109,8 @@ async def generate_portfolio(user_id: str, repositories: list, commit_files: lis
                 "message": "포트폴리오 생성 중입니다."
             })
             
-            response = portfolio_chain.invoke({"source_code": source_code_text})
+            async with get_limiter("portfolio").slot():
+                response = await portfolio_chain.ainvoke({"source_code": source_code_text})
             processing_time = time.time() - start_time
             print(f"포트폴리오 생성 시간: {processing_time:.2f}초")
             
@@ -155,8 +159,7 @@ async def generate_portfolio(user_id: str, repositories: list, commit_files: lis
             print(error_msg)
             
             # 실패 상태 업데이트
-            if user_id in portfolio_trackers:
-                await portfolio_trackers[user_id].update(ProgressStatus.FAILED, {"error": error_msg})
+            await tracker.update(ProgressStatus.FAILED, {"error": error_msg})
             
             return {
                 "error": error_msg,
@@ -167,8 +170,8 @@ async def generate_portfolio(user_id: str, repositories: list, commit_files: lis
         print(error_msg)
         
         # 실패 상태 업데이트
-        if user_id in portfolio_trackers:
-            await portfolio_trackers[user_id].update(ProgressStatus.FAILED, {"error": error_msg})
+        if tracker is not None:
+            await tracker.update(ProgressStatus.FAILED, {"error": error_msg})
         
         return {
             "error": error_msg,
@@ -178,10 +181,11 @@ async def generate_portfolio(user_id: str, repositories: list, commit_files: lis
 async def generate_portfolio_roles(source_code_text: str, commit_files: list) -> Dict[str, Any]:
     try:
         # LangChain을 사용하여 코드 분석 및 역할 생성
-        roles = portfolio_role_chain.invoke({
-            "source_code": source_code_text,
-            "commit_files": commit_files
-        })
+        async with get_limiter("portfolio").slot():
+            roles = await portfolio_role_chain.ainvoke({
+                "source_code": source_code_text,
+                "commit_files": commit_files
+            })
         
         return roles
     except Exception as e:
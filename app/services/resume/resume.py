@@ -1,5 +1,6 @@
 from app.chain.resume_summary_chain import chain
 from app.schemas.resume import ResumeSummaryRequest, ResumeSummary
+from app.utils.adaptive_limiter import get_limiter
 
 async def generate_resume_summary(request: ResumeSummaryRequest) -> ResumeSummary:
     """
@@ -13,11 +14,12 @@ async def generate_resume_summary(request: ResumeSummaryRequest) -> ResumeSummar
     """
     try:
         # 체인 실행
-        result = await chain.ainvoke({
-            "position": request.position,
-            "projects": request.projects,
-            "careers": request.careers
-        })
+        async with get_limiter("resume_summary").slot():
+            result = await chain.ainvoke({
+                "position": request.position,
+                "projects": request.projects,
+                "careers": request.careers
+            })
         
         return result
     except Exception as e:
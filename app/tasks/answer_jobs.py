@@ -0,0 +1,127 @@
+"""비어 있는 기술 면접 모범 답안 사전 생성 백그라운드 작업
+
+채점은 TechInterview.ai_answer 를 모범 답안으로 쓰므로, 답안 없이 출제된 질문은
+채점 전에 워커가 한가한 시간에 미리 채워 둔다:
+
+    dramatiq app.tasks.answer_jobs --queues answer_precompute --processes 1 --threads 1
+
+워커가 뜨면 바로 한 번 실행하고, 그 뒤로 PRECOMPUTE_INTERVAL_SECONDS 마다 다시 실행해
+나중에 추가된 질문도 채운다. 워커가 여럿이어도 반복 실행은 하나만 돈다.
+"""
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+import time
+import uuid
+import dramatiq
+from app.tasks.broker import broker  # 액터 선언 전에 브로커 설정
+from app.tasks.job_store import job_store
+from app.tasks.contest_jobs import JobStatus
+from app.config.interview_config import INTERVIEW_CONFIG
+
+logger = logging.getLogger(__name__)
+
+PRECOMPUTE_QUEUE = "answer_precompute"
+PRECOMPUTE_JOB_TIME_LIMIT = 60 * 60 * 1000
+# 반복 실행 체인의 선점 이름 (job_store.claim)
+PRECOMPUTE_SCHEDULE = "answer_precompute:schedule"
+
+def answer_precompute_progress_key(job_id: str) -> str:
+    """사전 생성 작업 진행 상황의 저장소 키"""
+    return f"answer_precompute:{job_id}"
+
+def precompute_schedule_ttl(interval: int) -> int:
+    """반복 실행 선점 유지 시간: 다음 실행까지 기다림 + 실행 시간 한도 + 여유
+
+    워커가 강제 종료되어 체인이 끊기면 이 시간이 지난 뒤 다른 작업/워커가 다시 시작한다.
+    """
+    return interval + PRECOMPUTE_JOB_TIME_LIMIT // 1000 + 60
+
+def submit_answer_precompute(
+    limit: Optional[int] = None,
+    delay_seconds: int = 0,
+    scheduled: bool = False
+) -> Dict[str, Any]:
+    """사전 생성 작업 등록 후 작업 정보 반환 (scheduled 면 끝난 뒤 다음 실행을 예약하는 반복 작업)"""
+    job_id = uuid.uuid4().hex
+    limit = limit or INTERVIEW_CONFIG['PRECOMPUTE_BATCH_SIZE']
+    job = job_store.create(job_id, {
+        "status": JobStatus.QUEUED,
+        "kind": "answer_precompute",
+        "limit": limit,
+        "scheduled": scheduled
+    })
+    precompute_answers_job.send_with_options(args=(job_id, limit, scheduled), delay=delay_seconds * 1000 or None)
+    return job
+
+def ensure_precompute_schedule() -> Optional[Dict[str, Any]]:
+    """반복 실행이 돌고 있지 않으면 바로 실행되는 반복 작업을 등록 (여러 워커가 동시에 불러도 하나만 등록)"""
+    interval = INTERVIEW_CONFIG['PRECOMPUTE_INTERVAL_SECONDS']
+    if interval <= 0 or not job_store.claim(PRECOMPUTE_SCHEDULE, precompute_schedule_ttl(interval)):
+        return None
+    job = submit_answer_precompute(scheduled=True)
+    logger.info(f"모범 답안 사전 생성 반복 실행 시작 - 작업 ID: {job['job_id']}, 주기 {interval}초")
+    return job
+
+def _schedule_next(job_id: str, limit: int, scheduled: bool):
+    interval = INTERVIEW_CONFIG['PRECOMPUTE_INTERVAL_SECONDS']
+    if interval <= 0:
+        return
+    try:
+        if scheduled:
+            # 남은 질문이 없거나 실행이 실패해도 다음 실행을 예약 (나중에 추가되는 질문도 채움)
+            job_store.claim(PRECOMPUTE_SCHEDULE, precompute_schedule_ttl(interval), force=True)
+            next_job = submit_answer_precompute(limit, delay_seconds=interval, scheduled=True)
+            job_store.update(job_id, next_job_id=next_job["job_id"])
+        else:
+            # 요청으로 등록된 작업은 한 번만 실행하고, 끊긴 반복 실행이 있으면 다시 시작
+            ensure_precompute_schedule()
+    except Exception as e:
+        logger.error(f"모범 답안 사전 생성 다음 실행 예약 실패 - 작업 ID: {job_id}, 오류: {str(e)}")
+
+class PrecomputeScheduler(dramatiq.Middleware):
+    """answer_precompute 큐를 소비하는 워커가 뜨면 반복 실행을 시작"""
+    def after_worker_boot(self, broker, worker):
+        if worker.consumer_whitelist and PRECOMPUTE_QUEUE not in worker.consumer_whitelist:
+            return
+        try:
+            ensure_precompute_schedule()
+        except Exception as e:
+            logger.error(f"모범 답안 사전 생성 반복 실행 등록 실패: {str(e)}")
+
+broker.add_middleware(PrecomputeScheduler())
+
+@dramatiq.actor(queue_name=PRECOMPUTE_QUEUE, max_retries=0, time_limit=PRECOMPUTE_JOB_TIME_LIMIT)
+def precompute_answers_job(job_id: str, limit: int, scheduled: bool = False):
+    """워커 프로세스에서 실행되는 모범 답안 사전 생성 작업
+
+    답안은 묶음마다 저장되므로 중단돼도 다음 실행이 남은 질문만 이어서 채운다.
+    PRECOMPUTE_INTERVAL_SECONDS 가 0 보다 크면 반복 작업(scheduled)은 결과와 관계없이 그 뒤에 다시 등록된다.
+    """
+    start_time = time.time()
+    job_store.update(job_id, status=JobStatus.RUNNING, started_at=start_time)
+    logger.info(f"모범 답안 사전 생성 시작 - 작업 ID: {job_id}, 최대 {limit}개")
+
+    try:
+        result = asyncio.run(_run_precompute(job_id, limit))
+        job_store.update(
+            job_id,
+            status=JobStatus.COMPLETED,
+            finished_at=time.time(),
+            result={**result, "duration": time.time() - start_time}
+        )
+        logger.info(f"모범 답안 사전 생성 완료 - 작업 ID: {job_id}, 결과: {result}")
+    except Exception as e:
+        logger.error(f"모범 답안 사전 생성 실패 - 작업 ID: {job_id}, 오류: {str(e)}", exc_info=True)
+        job_store.update(job_id, status=JobStatus.FAILED, finished_at=time.time(), error=str(e))
+        raise
+    finally:
+        _schedule_next(job_id, limit, scheduled)
+
+async def _run_precompute(job_id: str, limit: int) -> Dict[str, Any]:
+    # 워커 프로세스에서만 체인/색인 모듈을 import
+    from app.services.interview.interview import precompute_missing_answers
+    from app.db.mysql.async_session import job_session
+
+    async with job_session() as db:
+        return await precompute_missing_answers(db, limit, progress_key=answer_precompute_progress_key(job_id))
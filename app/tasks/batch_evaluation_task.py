@@ -0,0 +1,98 @@
+from typing import Dict, Any, List
+import asyncio
+import logging
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.utils.progress_tracker import ProgressStatus
+from app.tasks.evaluation_scheduler import ContestSlots, NoWarmup
+from app.services.interview.evaluation_core import evaluate_answers_batch
+
+logger = logging.getLogger(__name__)
+
+class BatchEvaluationTask:
+    """한 문제의 답변 K개를 한 번의 LLM 호출로 평가하는 작업
+
+    파싱/검증에 실패한 항목만 다시 큐에 넣어 재평가한다.
+    """
+    def __init__(self, slots: ContestSlots, batch_processor, progress_tracker, warmup=None):
+        self.slots = slots
+        self.warmup = warmup or NoWarmup()
+        self.batch_processor = batch_processor
+        self.progress_tracker = progress_tracker
+        self.max_retries = EVALUATION_CONFIG['MAX_RETRIES']
+        self.retry_base_delay = EVALUATION_CONFIG['RETRY_BASE_DELAY']
+        self.token_usage = {"input": 0, "output": 0}
+        self.llm_calls = 0
+        self.requeued = 0
+
+    async def execute(self, problem: Dict[str, Any], answers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        pending = list(answers)
+        results = []
+        retries = 0
+        last_error = "평가 결과 파싱 실패"
+
+        while pending and retries <= self.max_retries:
+            try:
+                async with self.warmup.turn(problem['id']), self.slots.slot():
+                    evaluations, usage = await evaluate_answers_batch(
+                        problem=problem['question'],
+                        ai_answer=problem['ai_answer'],
+                        answers=pending
+                    )
+            except Exception as e:
+                retries += 1
+                last_error = str(e)
+                if retries <= self.max_retries:
+                    wait_time = self.retry_base_delay ** retries
+                    logger.warning(
+                        f"배치 평가 재시도 ({retries}/{self.max_retries}) - "
+                        f"문제 ID: {problem['id']}, 답변 {len(pending)}개, {wait_time}초 후 재시도"
+                    )
+                    await asyncio.sleep(wait_time)
+                continue
+
+            self.llm_calls += 1
+            self.token_usage["input"] += usage["input"]
+            self.token_usage["output"] += usage["output"]
+
+            missing = []
+            for answer in pending:
+                evaluation = evaluations.get(answer['answer_id'])
+                if evaluation is None:
+                    missing.append(answer)
+                    continue
+
+                await self.batch_processor.add_to_batch({
+                    'answer_id': answer['answer_id'],
+                    'problem_id': problem['id'],
+                    'participant_id': answer['participant_id'],
+                    'score': evaluation.score,
+                    'feedback': evaluation.feedback
+                })
+                await self.progress_tracker.update(ProgressStatus.SUCCESS)
+                results.append({
+                    'status': 'success',
+                    'problem_id': problem['id'],
+                    'participant_id': answer['participant_id'],
+                    'nickname': answer.get('nickname', ''),
+                    'evaluation': evaluation.dict()
+                })
+
+            if missing:
+                # 파싱에 실패한 항목만 다시 평가
+                retries += 1
+                self.requeued += len(missing)
+                logger.warning(
+                    f"배치 평가 항목 재요청 ({retries}/{self.max_retries}) - "
+                    f"문제 ID: {problem['id']}, 답변 ID: {[a['answer_id'] for a in missing]}"
+                )
+            pending = missing
+
+        for answer in pending:
+            await self.progress_tracker.update(ProgressStatus.FAILED)
+            results.append({
+                'status': 'error',
+                'problem_id': problem['id'],
+                'participant_id': answer['participant_id'],
+                'error': last_error
+            })
+        return results
@@ -0,0 +1,15 @@
+import dramatiq
+from dramatiq.brokers.redis import RedisBroker
+from dramatiq.brokers.stub import StubBroker
+from app.config.redis_config import REDIS_CONFIG
+
+def create_broker():
+    """DRAMATIQ_BROKER 설정에 따라 브로커 생성 (stub 은 테스트/로컬 개발용)"""
+    if REDIS_CONFIG['BROKER'] == 'stub':
+        broker = StubBroker()
+        broker.emit_after("process_boot")
+        return broker
+    return RedisBroker(url=REDIS_CONFIG['URL'])
+
+broker = create_broker()
+dramatiq.set_broker(broker)
@@ -0,0 +1,124 @@
+"""대회 채점 백그라운드 작업
+
+API 프로세스는 작업을 큐에 넣고 202 와 job_id 만 돌려준다.
+실제 채점은 별도 워커 프로세스에서 실행된다:
+
+    dramatiq app.tasks.contest_jobs --processes 1 --threads 2
+"""
+from typing import Dict, Any, List
+import asyncio
+import logging
+import time
+import uuid
+import dramatiq
+from app.tasks.broker import broker  # noqa: F401  (액터 선언 전에 브로커 설정)
+from app.tasks.job_store import job_store
+from app.utils.llm_usage import usage_scope
+
+logger = logging.getLogger(__name__)
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+# 채점이 오래 걸리는 대회도 있으므로 작업 시간 제한은 넉넉히 (밀리초)
+EVALUATION_JOB_TIME_LIMIT = 60 * 60 * 1000
+
+# method="both": 방식 비교용으로 한 작업 안에서 차례로 채점 (두 번째 방식부터는 결과를 지우고 다시 채점)
+COMPARISON_METHODS = ["sequential", "parallel"]
+
+def job_methods(method: str) -> List[str]:
+    """작업에서 차례로 실행할 채점 방식 목록"""
+    return COMPARISON_METHODS if method == "both" else [method]
+
+def submit_contest_evaluation(
+    space_id: int,
+    contest_id: int,
+    method: str,
+    force: bool = False,
+    priority: int = 0
+) -> Dict[str, Any]:
+    """채점 작업 등록 후 작업 정보 반환"""
+    job_id = uuid.uuid4().hex
+    job = job_store.create(job_id, {
+        "status": JobStatus.QUEUED,
+        "space_id": space_id,
+        "contest_id": contest_id,
+        "method": method,
+        "force": force,
+        "priority": priority
+    })
+    evaluate_contest_job.send(job_id, space_id, contest_id, method, force, priority)
+    return job
+
+@dramatiq.actor(queue_name="contest_evaluation", max_retries=0, time_limit=EVALUATION_JOB_TIME_LIMIT)
+def evaluate_contest_job(
+    job_id: str,
+    space_id: int,
+    contest_id: int,
+    method: str,
+    force: bool = False,
+    priority: int = 0
+):
+    """워커 프로세스에서 실행되는 대회 채점 작업
+
+    채점 결과는 답변 단위로 저장되므로 워커가 중단돼도 같은 작업을 다시 보내면
+    남은 답변만 이어서 채점한다.
+    """
+    start_time = time.time()
+    job_store.update(job_id, status=JobStatus.RUNNING, started_at=start_time)
+    logger.info(f"채점 작업 시작 - 작업 ID: {job_id}, 대회 ID: {contest_id}, 방식: {method}")
+
+    try:
+        with usage_scope(space_id=space_id):
+            runs = asyncio.run(_run_evaluation(space_id, contest_id, method, force, priority))
+        # 대회의 최종 상태는 마지막으로 실행한 방식이 결정
+        last = runs[job_methods(method)[-1]]
+        result = {
+            "evaluation_count": last["evaluation_count"],
+            "failed_count": last["failed_count"],
+            "duration": time.time() - start_time
+        }
+        if len(runs) > 1:
+            result["methods"] = runs
+        job_store.update(job_id, status=JobStatus.COMPLETED, finished_at=time.time(), result=result)
+        logger.info(f"채점 작업 완료 - 작업 ID: {job_id}, 평가 {last['evaluation_count']}개, 실패 {last['failed_count']}개")
+    except Exception as e:
+        logger.error(f"채점 작업 실패 - 작업 ID: {job_id}, 오류: {str(e)}", exc_info=True)
+        job_store.update(job_id, status=JobStatus.FAILED, finished_at=time.time(), error=str(e))
+        raise
+
+async def _run_evaluation(
+    space_id: int,
+    contest_id: int,
+    method: str,
+    force: bool,
+    priority: int
+) -> Dict[str, Dict[str, Any]]:
+    """방식별 채점 실행 후 {방식: 대상/성공/실패 답변 수, 소요 시간} 반환"""
+    # 라우트와 같은 평가 함수를 사용 (워커 프로세스에서만 import)
+    from app.db.mysql.async_session import job_session
+    from app.services.interview.evaluate import EVALUATION_METHODS, count_unevaluated_answers, reset_evaluations
+
+    runs = {}
+    async with job_session() as db:
+        for index, name in enumerate(job_methods(method)):
+            start_time = time.time()
+            if force or index > 0:
+                # 대상 답변 수를 세야 하므로 초기화는 여기서 먼저 하고 평가 함수에는 force=False
+                reset = await reset_evaluations(db, contest_id)
+                logger.info(f"강제 재채점 - 대회 ID: {contest_id}, 초기화된 답변 {reset}개")
+            pending = await count_unevaluated_answers(db, contest_id)
+            evaluations = await EVALUATION_METHODS[name](
+                db, contest_id, force=False, space_id=space_id, priority=priority
+            )
+            runs[name] = {
+                "pending_count": pending,
+                "evaluation_count": len(evaluations),
+                # 평가 함수는 성공한 결과만 돌려주므로 나머지는 실패 (다시 보내면 이어서 채점)
+                "failed_count": max(pending - len(evaluations), 0),
+                "duration": time.time() - start_time
+            }
+    return runs
@@ -0,0 +1,78 @@
+from typing import Dict, Hashable, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import time
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.metrics import EVALUATION_QUEUE_WAIT
+from app.utils.adaptive_limiter import AdaptiveLimiter, get_limiter
+
+class ContestSlots:
+    """프로세스 공용 평가 스케줄러에서 한 콘테스트가 LLM 슬롯을 받는 창구
+
+    모든 콘테스트가 같은 제한기(전역 동시성 예산)를 나눠 쓰며, 대기 중인 평가는
+    우선순위 -> 스페이스 -> 콘테스트 순으로 번갈아 슬롯을 받는다.
+    답변 2,000개짜리 콘테스트가 먼저 줄을 서도 뒤에 온 20개짜리 콘테스트가 바로 끼어들 수 있다.
+    """
+    def __init__(self, limiter: AdaptiveLimiter, contest_id: int, space_id: Optional[int] = None, priority: int = 0):
+        self.limiter = limiter
+        self.contest_id = contest_id
+        self.space_id = space_id
+        self.priority = priority
+
+    @asynccontextmanager
+    async def slot(self):
+        enqueued_at = time.monotonic()
+        async with self.limiter.slot(flow=(self.space_id, self.contest_id), priority=self.priority):
+            EVALUATION_QUEUE_WAIT.labels(contest_id=str(self.contest_id)).observe(time.monotonic() - enqueued_at)
+            yield
+
+def contest_slots(
+    limiter_name: str,
+    contest_id: int,
+    space_id: Optional[int] = None,
+    priority: int = 0
+) -> ContestSlots:
+    """evaluation / evaluation_batch 제한기 위의 콘테스트별 창구 생성"""
+    return ContestSlots(get_limiter(limiter_name), contest_id, space_id, priority)
+
+class ProblemWarmup:
+    """문제별 첫 평가가 끝날 때까지 같은 문제의 나머지 평가를 잡아 두는 창구
+
+    프롬프트가 "고정 지시문 -> 문제/모범답안 -> 응시자 답변" 순이라 같은 문제의 평가는 긴 접두사를 공유한다.
+    provider 의 프롬프트 캐시는 첫 요청이 처리된 뒤에야 채워지므로, 첫 평가(리더)를 먼저 보내고
+    나머지는 리더가 끝난 뒤 연달아 보내 캐시를 맞춘다. 리더가 실패해도 대기는 풀린다.
+    """
+    def __init__(self):
+        self.leaders: Dict[Hashable, asyncio.Event] = {}
+
+    @asynccontextmanager
+    async def turn(self, problem_id: Hashable):
+        done = self.leaders.get(problem_id)
+        if done is None:
+            done = self.leaders[problem_id] = asyncio.Event()
+            try:
+                yield
+            finally:
+                done.set()
+            return
+        await done.wait()
+        yield
+
+class NoWarmup:
+    """워밍업을 쓰지 않을 때의 창구 (바로 통과)"""
+    @asynccontextmanager
+    async def turn(self, problem_id: Hashable):
+        yield
+
+def problem_warmup(slots: ContestSlots, problem_count: int, task_count: int):
+    """PREFIX_WARMUP 설정에 따라 문제별 워밍업 창구 생성
+
+    워밍업 없이 보내면 문제마다 처음 동시에 나간 한 회차(최대 limit 개)가 모두 캐시를 놓친다.
+    대신 워밍업은 시작 한 회차 동안 (limit - 문제 수) 개의 슬롯을 놀리므로,
+    auto 는 그 손실이 전체 작업의 10% 이하일 때만 켠다.
+    """
+    mode = EVALUATION_CONFIG['PREFIX_WARMUP']
+    idle_slots = max(0, slots.limiter.limit - problem_count)
+    if mode == "on" or (mode == "auto" and idle_slots * 10 <= task_count):
+        return ProblemWarmup()
+    return NoWarmup()
@@ -1,15 +1,18 @@
 from typing import Dict, Any
 import asyncio
 import logging
+from langchain_core.exceptions import OutputParserException
 from app.config.evaluation_config import EVALUATION_CONFIG
 from app.utils.progress_tracker import ProgressStatus
+from app.tasks.evaluation_scheduler import ContestSlots, NoWarmup
 from app.services.interview.evaluation_core import evaluate_answer
 
 logger = logging.getLogger(__name__)
 
 class EvaluationTask:
-    def __init__(self, semaphore: asyncio.Semaphore, batch_processor, progress_tracker):
-        self.semaphore = semaphore
+    def __init__(self, slots: ContestSlots, batch_processor, progress_tracker, warmup=None):
+        self.slots = slots
+        self.warmup = warmup or NoWarmup()
         self.batch_processor = batch_processor
         self.progress_tracker = progress_tracker
         self.max_retries = EVALUATION_CONFIG['MAX_RETRIES']
@@ -19,33 +22,37 @@ class EvaluationTask:
         retries = 0
         while retries <= self.max_retries:
             try:
-                async with self.semaphore:
+                async with self.warmup.turn(task_data['problem_id']), self.slots.slot():
                     evaluation = await evaluate_answer(
                         problem=task_data['question'],
                         ai_answer=task_data['ai_answer'],
                         participant_answer=task_data['participant_answer']
                     )
-                    
-                    await self.batch_processor.add_to_batch({
-                        'problem_id': task_data['problem_id'],
-                        'participant_id': task_data['participant_id'],
-                        'score': evaluation.score,
-                        'feedback': evaluation.feedback
-                    })
-                    
-                    await self.progress_tracker.update(ProgressStatus.SUCCESS)
-                    
-                    return {
-                        'status': 'success',
-                        'problem_id': task_data['problem_id'],
-                        'participant_id': task_data['participant_id'],
-                        'nickname': task_data.get('nickname', ''),
-                        'evaluation': evaluation.dict()
-                    }
+                
+                # DB 반영은 슬롯 밖에서 처리해 LLM 동시 실행 슬롯을 바로 반납
+                await self.batch_processor.add_to_batch({
+                    'answer_id': task_data['answer_id'],
+                    'problem_id': task_data['problem_id'],
+                    'participant_id': task_data['participant_id'],
+                    'score': evaluation.score,
+                    'feedback': evaluation.feedback
+                })
+                
+                await self.progress_tracker.update(ProgressStatus.SUCCESS)
+                
+                return {
+                    'status': 'success',
+                    'answer_id': task_data['answer_id'],
+                    'problem_id': task_data['problem_id'],
+                    'participant_id': task_data['participant_id'],
+                    'nickname': task_data.get('nickname', ''),
+                    'evaluation': evaluation.dict()
+                }
             except Exception as e:
                 retries += 1
                 if retries <= self.max_retries:
-                    wait_time = self.retry_base_delay ** retries
+                    # 로컬 복구로도 못 고친 응답은 provider 과부하가 아니므로 백오프 없이 바로 재요청
+                    wait_time = 0 if isinstance(e, OutputParserException) else self.retry_base_delay ** retries
                     logger.warning(
                         f"평가 재시도 ({retries}/{self.max_retries}) - "
                         f"문제 ID: {task_data['problem_id']}, "
@@ -57,6 +64,7 @@ class EvaluationTask:
                     await self.progress_tracker.update(ProgressStatus.FAILED)
                     return {
                         'status': 'error',
+                        'answer_id': task_data['answer_id'],
                         'problem_id': task_data['problem_id'],
                         'participant_id': task_data['participant_id'],
                         'error': str(e)
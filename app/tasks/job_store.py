@@ -0,0 +1,81 @@
+from typing import Dict, Any, Optional
+import json
+import threading
+import time
+import redis
+from app.config.redis_config import REDIS_CONFIG
+
+class InMemoryJobStore:
+    """단일 프로세스용 작업 상태 저장소 (stub 브로커와 함께 사용)"""
+    def __init__(self):
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.leases: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def create(self, job_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        job = {"job_id": job_id, "created_at": time.time(), **data}
+        with self.lock:
+            self.jobs[job_id] = job
+        return dict(job)
+
+    def update(self, job_id: str, **fields) -> None:
+        with self.lock:
+            self.jobs.setdefault(job_id, {"job_id": job_id}).update(fields)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def claim(self, name: str, ttl: int, force: bool = False) -> bool:
+        """name 을 ttl 초 동안 선점 (이미 선점되어 있으면 False, force 면 덮어써 연장)"""
+        now = time.monotonic()
+        with self.lock:
+            if not force and self.leases.get(name, 0) > now:
+                return False
+            self.leases[name] = now + ttl
+            return True
+
+class RedisJobStore:
+    """API 프로세스와 워커 프로세스가 공유하는 작업 상태 저장소"""
+    def __init__(self, client: redis.Redis, ttl: int = REDIS_CONFIG['JOB_TTL_SECONDS']):
+        self.client = client
+        self.ttl = ttl
+
+    def _key(self, job_id: str) -> str:
+        return f"evaluation_job:{job_id}"
+
+    def create(self, job_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        job = {"job_id": job_id, "created_at": time.time(), **data}
+        self._write(job_id, job)
+        return job
+
+    def update(self, job_id: str, **fields) -> None:
+        self._write(job_id, fields)
+
+    def _write(self, job_id: str, fields: Dict[str, Any]) -> None:
+        key = self._key(job_id)
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping={name: json.dumps(value, ensure_ascii=False) for name, value in fields.items()})
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return {
+            (name.decode() if isinstance(name, bytes) else name): json.loads(value)
+            for name, value in raw.items()
+        }
+
+    def claim(self, name: str, ttl: int, force: bool = False) -> bool:
+        """name 을 ttl 초 동안 선점 (여러 워커 중 하나만 성공, force 면 덮어써 연장)"""
+        return bool(self.client.set(f"job_lease:{name}", 1, nx=not force, ex=ttl))
+
+def create_job_store():
+    if REDIS_CONFIG['BROKER'] == 'stub':
+        return InMemoryJobStore()
+    return RedisJobStore(redis.Redis.from_url(REDIS_CONFIG['URL']))
+
+job_store = create_job_store()
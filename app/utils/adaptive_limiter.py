@@ -0,0 +1,259 @@
+from typing import Dict, Optional, Tuple, Hashable, Any
+from collections import deque, OrderedDict
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import threading
+import time
+import openai
+from app.config.llm_config import LLM_CONCURRENCY_CONFIG
+from app.metrics import LLM_CONCURRENCY_LIMIT, LLM_IN_FLIGHT, LLM_QUEUE_DEPTH, LLM_LIMIT_DECREASE_COUNTER
+
+logger = logging.getLogger(__name__)
+
+def is_overload_error(error: BaseException) -> bool:
+    """동시성을 줄여야 하는 오류인지 판단 (429, 503, 타임아웃)"""
+    if isinstance(error, (openai.RateLimitError, openai.APITimeoutError, asyncio.TimeoutError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if status_code in (429, 503):
+        return True
+    return "rate limit" in str(error).lower()
+
+class FairQueue:
+    """우선순위가 높은 대기자부터, 같은 우선순위 안에서는 흐름(flow)별로 라운드로빈하는 대기열
+
+    flow 가 (space_id, contest_id) 같은 튜플이면 앞 요소부터 계층적으로 번갈아 꺼낸다.
+    즉 스페이스끼리 먼저 번갈아 가고, 같은 스페이스 안에서는 콘테스트끼리 번갈아 간다.
+    대기자가 많은 흐름이 적은 흐름을 굶기지 않는다.
+    """
+    def __init__(self):
+        self.levels: Dict[int, OrderedDict] = {}
+        self.positions: Dict[Any, Tuple[int, Tuple[Hashable, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __bool__(self) -> bool:
+        return bool(self.positions)
+
+    def __contains__(self, item) -> bool:
+        return item in self.positions
+
+    @staticmethod
+    def _path(flow) -> Tuple[Hashable, ...]:
+        if flow is None:
+            return (None,)
+        return tuple(flow) if isinstance(flow, tuple) else (flow,)
+
+    def append(self, item, flow=None, priority: int = 0):
+        path = self._path(flow)
+        node = self.levels.setdefault(priority, OrderedDict())
+        for key in path[:-1]:
+            node = node.setdefault(key, OrderedDict())
+        node.setdefault(path[-1], deque()).append(item)
+        self.positions[item] = (priority, path)
+
+    def popleft(self):
+        priority = max(self.levels)
+        nodes = [self.levels[priority]]
+        keys = []
+        while not isinstance(nodes[-1], deque):
+            keys.append(next(iter(nodes[-1])))
+            nodes.append(nodes[-1][keys[-1]])
+        item = nodes[-1].popleft()
+        del self.positions[item]
+        # 꺼낸 경로의 각 단계는 맨 뒤로 보내 다음 차례를 넘기고, 빈 노드는 정리
+        self._rotate(priority, nodes, keys, move_to_end=True)
+        return item
+
+    def remove(self, item):
+        priority, path = self.positions.pop(item)
+        nodes = [self.levels[priority]]
+        for key in path:
+            nodes.append(nodes[-1][key])
+        nodes[-1].remove(item)
+        self._rotate(priority, nodes, list(path), move_to_end=False)
+
+    def _rotate(self, priority: int, nodes, keys, move_to_end: bool):
+        for parent, key in reversed(list(zip(nodes, keys))):
+            if not parent[key]:
+                del parent[key]
+            elif move_to_end:
+                parent.move_to_end(key)
+        if not self.levels[priority]:
+            del self.levels[priority]
+
+class AdaptiveLimiter:
+    """AIMD 방식 동시성 제한기
+
+    - 정상 응답이 이어지면 limit 를 한 윈도우(limit 개 호출)마다 1씩 늘린다 (additive increase)
+    - 429/타임아웃 또는 평균 대비 지연 급증 시 limit 를 DECREASE_FACTOR 배로 줄인다 (multiplicative decrease)
+    - 감소 이전에 시작된 호출의 오류는 다시 반영하지 않아, 한 번의 429 폭주로 limit 가 바닥까지 떨어지지 않는다
+    - 슬롯을 기다리는 호출은 FairQueue 로 흐름별 공정하게 깨운다
+
+    상태는 스레드 락으로 보호하므로 여러 이벤트 루프(워커 스레드별 asyncio.run)에서 공유해도 안전하다.
+    """
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        min_latency_samples: int = 5,
+        latency_alpha: float = 0.2
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.min_latency_samples = min_latency_samples
+        self.latency_alpha = latency_alpha
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.in_flight = 0
+        self.latency_avg: Optional[float] = None
+        self.latency_samples = 0
+        self.last_decrease = 0.0
+
+        self._lock = threading.Lock()
+        self._waiters = FairQueue()
+        self._export_metrics()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    async def acquire(self, flow: Hashable = None, priority: int = 0):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self.in_flight < self.limit:
+                self.in_flight += 1
+                self._export_metrics()
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter, flow, priority)
+            self._export_metrics()
+
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if not waiter[1].cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨
+                self.release(time.monotonic(), record=False)
+            raise
+
+    def release(self, started: float, error: Optional[BaseException] = None, record: bool = True):
+        """슬롯 반납 후 호출 결과(지연/오류)를 limit 에 반영"""
+        latency = time.monotonic() - started
+        with self._lock:
+            self.in_flight -= 1
+            if record:
+                self._on_result(started, latency, error)
+            self._wake_waiters()
+            self._export_metrics()
+
+    @asynccontextmanager
+    async def slot(self, flow: Hashable = None, priority: int = 0):
+        """체인 호출 한 번을 감싸는 컨텍스트 매니저
+
+        Args:
+            flow: 공정 분배 단위 (예: (space_id, contest_id)). 대기 중일 때 흐름별로 번갈아 슬롯을 받는다.
+            priority: 높을수록 먼저 슬롯을 받음
+        """
+        await self.acquire(flow, priority)
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self.release(started, error=e)
+            raise
+        except BaseException:
+            # 취소된 호출은 지연/오류 판단에서 제외
+            self.release(started, record=False)
+            raise
+        else:
+            self.release(started)
+
+    def _on_result(self, started: float, latency: float, error: Optional[BaseException]):
+        if error is not None:
+            if is_overload_error(error):
+                self._decrease(started, "rate_limit")
+            return
+
+        spike = (
+            self.latency_avg is not None
+            and self.latency_samples >= self.min_latency_samples
+            and latency > self.latency_avg * self.latency_tolerance
+        )
+        self.latency_samples += 1
+        if self.latency_avg is None:
+            self.latency_avg = latency
+        else:
+            self.latency_avg += self.latency_alpha * (latency - self.latency_avg)
+
+        if spike:
+            self._decrease(started, "latency")
+        elif self.in_flight + 1 >= self.limit:
+            # 제한까지 꽉 차서 돌고 있을 때만 증가 (한가할 때 limit 가 근거 없이 커지지 않도록)
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _decrease(self, started: float, reason: str):
+        if started < self.last_decrease:
+            return
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.last_decrease = time.monotonic()
+        LLM_LIMIT_DECREASE_COUNTER.labels(limiter=self.name, reason=reason).inc()
+        logger.warning(f"[{self.name}] 동시성 제한 감소 ({reason}): {previous} -> {self.limit}")
+
+    def _wake_waiters(self):
+        while self._waiters and self.in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            try:
+                loop.call_soon_threadsafe(self._grant, future)
+            except RuntimeError:
+                # 대기 중이던 이벤트 루프가 이미 종료됨
+                self.in_flight -= 1
+
+    def _grant(self, future: asyncio.Future):
+        if future.done():
+            # 슬롯을 넘겨받기 직전에 취소된 대기자
+            self.release(time.monotonic(), record=False)
+            return
+        future.set_result(None)
+
+    def _export_metrics(self):
+        LLM_CONCURRENCY_LIMIT.labels(limiter=self.name).set(self.limit)
+        LLM_IN_FLIGHT.labels(limiter=self.name).set(self.in_flight)
+        LLM_QUEUE_DEPTH.labels(limiter=self.name).set(len(self._waiters))
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(name: str) -> AdaptiveLimiter:
+    """체인 호출처별 공유 제한기 (evaluation, testcase, portfolio, custom_resume 등)"""
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = AdaptiveLimiter(
+                name=name,
+                initial_limit=LLM_CONCURRENCY_CONFIG['INITIAL_LIMIT'],
+                min_limit=LLM_CONCURRENCY_CONFIG['MIN_LIMIT'],
+                max_limit=LLM_CONCURRENCY_CONFIG['MAX_LIMIT'],
+                decrease_factor=LLM_CONCURRENCY_CONFIG['DECREASE_FACTOR'],
+                latency_tolerance=LLM_CONCURRENCY_CONFIG['LATENCY_TOLERANCE'],
+                min_latency_samples=LLM_CONCURRENCY_CONFIG['MIN_LATENCY_SAMPLES']
+            )
+        return _limiters[name]
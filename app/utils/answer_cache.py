@@ -0,0 +1,197 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+import math
+import re
+import time
+import numpy as np
+from app.config.interview_config import INTERVIEW_CONFIG
+
+# 공백/기호는 유사도에 영향이 없도록 지움 (한글 음절, 영문, 숫자만 남김)
+_NON_WORD_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+# 거의 모든 질문에 붙는 말투는 색인이 작을 때 IDF 로도 충분히 눌리지 않으므로 미리 지움
+_BOILERPLATE_PATTERN = re.compile(
+    r"(에\s*대해서?|에\s*대하여|설명해\s*(주세요|주십시오|보세요)|설명하시오|설명|무엇인가요|무엇입니까|무엇인지|무엇|어떻게|있나요|인가요|입니까)"
+)
+# 단어 끝 조사 ("트랜잭션의" -> "트랜잭션"). "차이" 처럼 이/가 로 끝나는 명사가 많아 이/가 는 제외
+_PARTICLES = "이란|란|의|은|는|을|를|와|과|로|으로|에서"
+_PARTICLE_PATTERN = re.compile(rf"(?<=\w)({_PARTICLES})$")
+_PARTICLE_WORD_PATTERN = re.compile(_PARTICLES)
+# 영문 단어와 숫자 ("3-way" -> 3, way / "HTTP/2" -> http, 2)
+_KEY_TERM_PATTERN = re.compile(r"[0-9]+|[a-z]+")
+
+def normalize_question(text: str) -> List[str]:
+    """비교에 쓸 단어 목록 (소문자, 기호/말투/조사 제거)"""
+    text = _BOILERPLATE_PATTERN.sub(" ", _NON_WORD_PATTERN.sub(" ", text.lower()))
+    words = []
+    for word in text.split():
+        if _PARTICLE_WORD_PATTERN.fullmatch(word):
+            # 띄어 쓴 조사 ("TCP 와 UDP")
+            continue
+        stripped = _PARTICLE_PATTERN.sub("", word) if len(word) > 2 else word
+        words.append(stripped or word)
+    return words
+
+def key_terms(text: str) -> frozenset:
+    """질문의 영문/숫자 토큰 집합
+
+    "TCP 3-way" 와 "TCP 4-way", "HTTP/2" 와 "HTTP/3" 처럼 문자 n-gram 으로는 거의 같지만 뜻이 다른 질문을
+    가려내기 위한 것으로, 이 집합이 다르면 유사도와 관계없이 재사용하지 않는다.
+    """
+    return frozenset(_KEY_TERM_PATTERN.findall(text.lower()))
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int]) -> Counter:
+    """단어 안의 문자 n-gram 빈도 (띄어쓰기 차이에 덜 민감하도록 단어 양끝에 공백을 붙임)"""
+    low, high = ngram_range
+    grams: Counter = Counter()
+    for word in normalize_question(text):
+        padded = f" {word} "
+        for n in range(low, high + 1):
+            grams.update(padded[start:start + n] for start in range(len(padded) - n + 1))
+    return grams
+
+@dataclass
+class CachedAnswer:
+    id: int
+    question: str
+    ai_answer: str
+    key_point: Optional[str] = None
+    additional_topics: Optional[str] = None
+
+@dataclass
+class _ClassIndex:
+    """tech_class 하나의 TF-IDF 역색인
+
+    postings[n-gram] = (행 번호 배열, L2 정규화된 가중치 배열). 질문 수 x 어휘 수의 밀집 행렬 대신
+    n-gram 별 배열만 두어, 질문에 있는 n-gram 의 배열만 더하면 코사인 유사도가 된다.
+    """
+    entries: List[CachedAnswer] = field(default_factory=list)
+    loaded_at: float = 0.0
+    postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+    idf: Dict[str, float] = field(default_factory=dict)
+    # entries 와 같은 순서의 key_terms
+    terms: List[frozenset] = field(default_factory=list)
+    # 새 답변이 추가되어 다음 검색 전에 색인을 다시 만들어야 함
+    dirty: bool = True
+
+class AnswerIndex:
+    """이미 답변된 기술 면접 질문의 문자 n-gram TF-IDF 색인 (tech_class 별)
+
+    표현이 조금 다른 같은 질문("MongoDB 인덱싱", "MongoDB 인덱스 설명")을 찾아
+    LLM 생성 없이 저장된 답변을 재사용하기 위한 것이다. 색인은 프로세스 메모리에 두고
+    ttl 초가 지나면 DB 에서 다시 읽는다.
+    """
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = INTERVIEW_CONFIG['ANSWER_CACHE_NGRAM_RANGE'],
+        ttl: float = INTERVIEW_CONFIG['ANSWER_CACHE_TTL_SECONDS']
+    ):
+        self.ngram_range = ngram_range
+        self.ttl = ttl
+        self.classes: Dict[int, _ClassIndex] = {}
+
+    def is_stale(self, tech_class: int) -> bool:
+        index = self.classes.get(tech_class)
+        return index is None or time.monotonic() - index.loaded_at > self.ttl
+
+    def load(self, tech_class: int, entries: Iterable[CachedAnswer]):
+        """DB 에서 읽은 답변으로 tech_class 색인을 교체"""
+        self.classes[tech_class] = _ClassIndex(
+            entries=[entry for entry in entries if entry.ai_answer],
+            loaded_at=time.monotonic()
+        )
+
+    def add(self, tech_class: int, entry: CachedAnswer):
+        """새로 저장한 답변을 색인에 반영 (같은 id 는 교체)
+
+        이미 만든 색인에는 기존 IDF 로 행만 덧붙이고, IDF 는 ttl 이 지나 다시 읽을 때 갱신한다.
+        """
+        index = self.classes.get(tech_class)
+        if index is None:
+            # 아직 DB 에서 읽지 않은 tech_class 는 첫 검색 때 통째로 읽는다
+            return
+        if any(item.id == entry.id for item in index.entries):
+            index.entries = [item for item in index.entries if item.id != entry.id]
+            index.dirty = True
+        index.entries.append(entry)
+        if index.dirty:
+            return
+
+        row = len(index.entries) - 1
+        index.terms.append(key_terms(entry.question))
+        for gram, weight in self._vectorize(index, char_ngrams(entry.question, self.ngram_range), extend=True).items():
+            positions, weights = index.postings.get(gram, (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)))
+            index.postings[gram] = (np.append(positions, np.int32(row)), np.append(weights, np.float32(weight)))
+
+    def search(self, tech_class: int, question: str, exclude_id: Optional[int] = None) -> Tuple[Optional[CachedAnswer], float]:
+        """영문/숫자 토큰이 같은 질문 중 가장 비슷한 답변과 코사인 유사도 (없으면 (None, 0.0))"""
+        index = self.classes.get(tech_class)
+        if index is None or not index.entries:
+            return None, 0.0
+        if index.dirty:
+            self._build(index)
+
+        query = self._vectorize(index, char_ngrams(question, self.ngram_range))
+        if not query:
+            return None, 0.0
+        scores = np.zeros(len(index.entries), dtype=np.float32)
+        for gram, weight in query.items():
+            rows, weights = index.postings[gram]
+            scores[rows] += weights * weight
+        terms = key_terms(question)
+        for position, entry in enumerate(index.entries):
+            if entry.id == exclude_id or index.terms[position] != terms:
+                scores[position] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] <= 0:
+            return None, 0.0
+        return index.entries[best], float(scores[best])
+
+    def _build(self, index: _ClassIndex):
+        counts = [char_ngrams(entry.question, self.ngram_range) for entry in index.entries]
+        rows: Dict[str, List[int]] = {}
+        for row, count in enumerate(counts):
+            for gram in count:
+                rows.setdefault(gram, []).append(row)
+
+        # sklearn 의 smooth_idf 와 같은 식
+        total = len(counts)
+        idf = {gram: math.log((1.0 + total) / (1.0 + len(grams))) + 1.0 for gram, grams in rows.items()}
+        norms = np.ones(total, dtype=np.float32)
+        for row, count in enumerate(counts):
+            square = sum(((1.0 + math.log(frequency)) * idf[gram]) ** 2 for gram, frequency in count.items())
+            norms[row] = math.sqrt(square) or 1.0
+
+        postings = {}
+        for gram, grams in rows.items():
+            positions = np.array(grams, dtype=np.int32)
+            weights = np.array(
+                [(1.0 + math.log(counts[row][gram])) * idf[gram] for row in grams], dtype=np.float32
+            ) / norms[positions]
+            postings[gram] = (positions, weights)
+
+        index.postings = postings
+        index.idf = idf
+        index.terms = [key_terms(entry.question) for entry in index.entries]
+        index.dirty = False
+
+    def _vectorize(self, index: _ClassIndex, count: Counter, extend: bool = False) -> Dict[str, float]:
+        """색인에 있는 n-gram 만의 정규화된 가중치 (extend=True 면 새 n-gram 도 포함)"""
+        # 색인에 없는 n-gram 도 노름에는 포함해야 유사도가 부풀지 않는다 (df=0 의 idf)
+        unseen_idf = math.log(1.0 + len(index.entries)) + 1.0
+        weights = {}
+        square = 0.0
+        for gram, frequency in count.items():
+            weight = (1.0 + math.log(frequency)) * index.idf.get(gram, unseen_idf)
+            square += weight ** 2
+            if extend or gram in index.postings:
+                weights[gram] = weight
+        norm = math.sqrt(square)
+        if norm == 0:
+            return {}
+        if extend:
+            for gram in weights:
+                index.idf.setdefault(gram, unseen_idf)
+        return {gram: weight / norm for gram, weight in weights.items()}
+
+answer_index = AnswerIndex()
@@ -0,0 +1,70 @@
+from typing import Dict, Iterable, List
+import threading
+import time
+import redis
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.config.redis_config import REDIS_CONFIG
+
+class InMemoryAnswerFailureStore:
+    """단일 프로세스용 질문별 답안 생성 실패 횟수 저장소"""
+    def __init__(self, ttl: int = INTERVIEW_CONFIG['PRECOMPUTE_FAILURE_TTL_SECONDS']):
+        self.ttl = ttl
+        self.attempts: Dict[int, int] = {}
+        self.expires_at = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, failed: Iterable[int], succeeded: Iterable[int] = ()) -> None:
+        """실패한 질문은 횟수를 늘리고, 성공한 질문은 기록을 지움"""
+        failed = list(failed)
+        with self.lock:
+            self._expire()
+            for question_id in failed:
+                self.attempts[question_id] = self.attempts.get(question_id, 0) + 1
+            for question_id in succeeded:
+                self.attempts.pop(question_id, None)
+            if failed:
+                self.expires_at = time.monotonic() + self.ttl
+
+    def exhausted_ids(self, max_attempts: int) -> List[int]:
+        """max_attempts 번 이상 실패한 질문 ID"""
+        with self.lock:
+            self._expire()
+            return [question_id for question_id, count in self.attempts.items() if count >= max_attempts]
+
+    def _expire(self):
+        if self.attempts and self.expires_at < time.monotonic():
+            self.attempts.clear()
+
+class RedisAnswerFailureStore:
+    """모든 워커가 공유하는 실패 횟수 저장소 (해시 하나, 마지막 실패 후 ttl 이 지나면 통째로 만료)"""
+    key = "answer_precompute:failures"
+
+    def __init__(self, client: redis.Redis, ttl: int = INTERVIEW_CONFIG['PRECOMPUTE_FAILURE_TTL_SECONDS']):
+        self.client = client
+        self.ttl = ttl
+
+    def record(self, failed: Iterable[int], succeeded: Iterable[int] = ()) -> None:
+        failed, succeeded = list(failed), list(succeeded)
+        if not failed and not succeeded:
+            return
+        pipe = self.client.pipeline()
+        for question_id in failed:
+            pipe.hincrby(self.key, question_id, 1)
+        if succeeded:
+            pipe.hdel(self.key, *succeeded)
+        if failed:
+            pipe.expire(self.key, self.ttl)
+        pipe.execute()
+
+    def exhausted_ids(self, max_attempts: int) -> List[int]:
+        return [
+            int(question_id) for question_id, count in self.client.hgetall(self.key).items()
+            if int(count) >= max_attempts
+        ]
+
+def create_answer_failure_store():
+    if REDIS_CONFIG['ANSWER_FAILURE_BACKEND'] == 'redis':
+        return RedisAnswerFailureStore(redis.Redis.from_url(REDIS_CONFIG['URL']))
+    return InMemoryAnswerFailureStore()
+
+answer_failure_store = create_answer_failure_store()
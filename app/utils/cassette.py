@@ -0,0 +1,141 @@
+from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from langchain_core.messages import AIMessageChunk, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from app.config.llm_config import LLM_CASSETTE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class CassetteMissError(Exception):
+    """재생 모드에서 녹화에 없는 LLM 호출이 들어옴"""
+    pass
+
+class CassetteStore:
+    """LLM 호출 녹화/재생 저장소 (gzip JSON Lines, 호출 1건당 1줄)
+
+    키는 모델/파라미터/프롬프트 메시지의 해시이며, 같은 프롬프트가 여러 번 녹화되면
+    재생 시 녹화된 순서대로 돌아가며 응답한다.
+    파서는 재생된 원문 응답에 그대로 다시 적용되므로 파싱/DB 반영/진행률까지 실제와 같은 경로를 탄다.
+    """
+    def __init__(self, path: str, mode: str, latency_scale: float = 0.0, on_miss: str = "error"):
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.on_miss = on_miss
+        self.entries: Dict[str, deque] = defaultdict(deque)
+        self.lock = threading.Lock()
+        if mode == "replay":
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"녹화 파일이 없습니다: {self.path}")
+            return
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries[entry["key"]].append(entry)
+                    count += 1
+        logger.info(f"LLM 녹화 {count}건 로드: {self.path}")
+
+    @staticmethod
+    def key(model: str, messages: List[BaseMessage], params: Dict[str, Any]) -> str:
+        payload = json.dumps({
+            "model": model,
+            "params": params,
+            "messages": [[message.type, message.content] for message in messages]
+        }, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """녹화된 응답 조회 (ON_MISS=live 이면 없을 때 None)"""
+        with self.lock:
+            recorded = self.entries.get(key)
+            if recorded:
+                entry = recorded.popleft()
+                recorded.append(entry)
+                return entry
+        if self.on_miss == "live":
+            logger.warning(f"녹화에 없는 LLM 호출, 실제 호출로 대체: {key[:12]}")
+            return None
+        raise CassetteMissError(f"녹화에 없는 LLM 호출입니다: {key[:12]} ({self.path})")
+
+    def replay_delay(self, entry: Dict[str, Any]) -> float:
+        return entry.get("latency", 0.0) * self.latency_scale
+
+    @staticmethod
+    def to_result(entry: Dict[str, Any]) -> ChatResult:
+        message = messages_from_dict([entry["message"]])[0]
+        return ChatResult(
+            generations=[ChatGeneration(message=message, generation_info=entry.get("generation_info"))],
+            llm_output=entry.get("llm_output")
+        )
+
+    @staticmethod
+    def to_chunks(entry: Dict[str, Any], size: int = 32) -> List[ChatGenerationChunk]:
+        """녹화된 응답을 스트리밍 조각으로 나눔 (사용량은 마지막 조각에만 붙임)"""
+        message = messages_from_dict([entry["message"]])[0]
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        pieces = [content[start:start + size] for start in range(0, len(content), size)] or [""]
+        chunks = [ChatGenerationChunk(message=AIMessageChunk(content=piece)) for piece in pieces]
+        chunks[-1] = ChatGenerationChunk(
+            message=AIMessageChunk(content=pieces[-1], usage_metadata=getattr(message, "usage_metadata", None)),
+            generation_info=entry.get("generation_info")
+        )
+        return chunks
+
+    def record(self, key: str, model: str, messages: List[BaseMessage], result: ChatResult, latency: float):
+        generation = result.generations[0]
+        entry = {
+            "key": key,
+            "model": model,
+            "recorded_at": time.time(),
+            "latency": round(latency, 4),
+            "prompt": [[message.type, message.content] for message in messages],
+            "message": message_to_dict(generation.message),
+            "generation_info": generation.generation_info,
+            "llm_output": result.llm_output
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self.lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # gzip 멤버를 이어 붙이는 방식이라 추가 기록도 하나의 파일로 읽힌다
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+_cassette: Optional[CassetteStore] = None
+_cassette_lock = threading.Lock()
+
+def get_cassette() -> Optional[CassetteStore]:
+    """LLM_CASSETTE_MODE 가 record/replay 일 때만 저장소 반환"""
+    global _cassette
+    if LLM_CASSETTE_CONFIG['MODE'] not in ("record", "replay"):
+        return None
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = CassetteStore(
+                path=LLM_CASSETTE_CONFIG['PATH'],
+                mode=LLM_CASSETTE_CONFIG['MODE'],
+                latency_scale=LLM_CASSETTE_CONFIG['REPLAY_LATENCY_SCALE'],
+                on_miss=LLM_CASSETTE_CONFIG['ON_MISS']
+            )
+        return _cassette
@@ -1,58 +1,82 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Union
 from sqlalchemy.orm import Session
-from app.db.mysql.models import Answer
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.repositories.mysql.answer_repository import AnswerRepository
+from app.db.repositories.mysql.async_answer_repository import AsyncAnswerRepository
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
 class BatchProcessor:
-    def __init__(self, db: Session, batch_size: int):
+    def __init__(self, db: Union[Session, AsyncSession], batch_size: int):
         self.db = db
+        self.is_async = isinstance(db, AsyncSession)
+        self.repository = AsyncAnswerRepository(db) if self.is_async else AnswerRepository(db)
         self.batch_size = batch_size
         self.batch = []
         self.lock = asyncio.Lock()
+        # 호출한 작업이 취소되어도 끝까지 진행 중인 추가/반영 작업
+        self.pending: Set[asyncio.Task] = set()
 
     async def add_to_batch(self, item: Dict[str, Any]):
+        """평가 결과를 배치에 추가하고 가득 차면 반영
+
+        스트림이 끊겨 호출한 평가 작업이 취소되어도 이미 나온 결과는 버리지 않도록, 추가와 반영은
+        별도 작업으로 끝까지 진행한다 (진행 중인 DB 쓰기를 중간에 끊지 않음).
+        """
+        task = asyncio.ensure_future(self._add(item))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+        await asyncio.shield(task)
+
+    async def process_batch(self):
+        """남은 배치 반영 (진행 중인 추가/반영이 끝난 뒤 같은 락 안에서 실행)"""
+        if self.pending:
+            await asyncio.gather(*self.pending, return_exceptions=True)
+        async with self.lock:
+            await self._flush()
+
+    async def _add(self, item: Dict[str, Any]):
         async with self.lock:
             self.batch.append(item)
             if len(self.batch) >= self.batch_size:
-                await self.process_batch()
+                await self._flush()
 
-    async def process_batch(self):
+    async def _flush(self):
+        """lock 을 잡은 상태에서 호출"""
         if not self.batch:
             return
 
-        batch_to_process = self.batch.copy()
+        batch_to_process = self.batch
         self.batch = []
 
         try:
-            for item in batch_to_process:
-                answer = self.db.query(Answer).filter(
-                    Answer.problem_id == item['problem_id'],
-                    Answer.participant_id == item['participant_id']
-                ).first()
-                
-                if answer:
-                    answer.rank_score = item['score']
-                    answer.feedback = item['feedback']
-            
-            self.db.commit()
-            logger.info(f"배치 업데이트 성공 - {len(batch_to_process)}개 항목")
+            # answer_id 기준 단일 UPDATE 문으로 반영
+            updated = await self._call(self.repository.bulk_update_evaluations, batch_to_process)
+            logger.info(f"배치 업데이트 성공 - {updated}/{len(batch_to_process)}개 항목")
+        except asyncio.CancelledError:
+            # 반영이 중단되면 다음 process_batch 에서 다시 쓰도록 되돌림
+            self.batch = batch_to_process + self.batch
+            raise
         except Exception as e:
-            self.db.rollback()
             logger.error(f"배치 업데이트 실패: {str(e)}")
             await self._handle_failed_batch(batch_to_process)
 
+    async def _call(self, method, *args):
+        """AsyncSession 이면 그대로 await, 동기 Session 이면 이벤트 루프를 막지 않도록 스레드에서 실행"""
+        if self.is_async:
+            return await method(*args)
+        return await asyncio.to_thread(method, *args)
+
     async def _handle_failed_batch(self, failed_batch: List[Dict[str, Any]]):
         for item in failed_batch:
             try:
-                await update_evaluation(
-                    db=self.db,
-                    problem_id=item['problem_id'],
-                    participant_id=item['participant_id'],
-                    score=item['score'],
-                    feedback=item['feedback']
+                await self._call(
+                    self.repository.update_evaluation,
+                    item['answer_id'],
+                    item['score'],
+                    item['feedback']
                 )
             except Exception as e:
-                logger.error(f"개별 업데이트 실패: 문제 ID {item['problem_id']}, 참가자 ID {item['participant_id']}, 오류: {str(e)}")
\ No newline at end of file
+                logger.error(f"개별 업데이트 실패: 답변 ID {item['answer_id']}, 문제 ID {item['problem_id']}, 참가자 ID {item['participant_id']}, 오류: {str(e)}")
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional, Tuple
+import json
+import threading
+import time
+import redis
+from app.config.coding_test_config import CODING_TEST_CONFIG
+from app.config.redis_config import REDIS_CONFIG
+
+class InMemoryGeneratorStore:
+    """단일 프로세스용 생성 스크립트 저장소"""
+    def __init__(self, ttl: int = CODING_TEST_CONFIG['GENERATOR_TTL_SECONDS']):
+        self.ttl = ttl
+        self.items: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.lock = threading.Lock()
+
+    def save(self, generator_set_id: str, data: Dict[str, Any]) -> None:
+        with self.lock:
+            now = time.monotonic()
+            for key in [key for key, (_, expires_at) in self.items.items() if expires_at < now]:
+                del self.items[key]
+            self.items[generator_set_id] = (json.loads(json.dumps(data)), now + self.ttl)
+
+    def get(self, generator_set_id: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            item = self.items.get(generator_set_id)
+            if item is None or item[1] < time.monotonic():
+                return None
+            return json.loads(json.dumps(item[0]))
+
+class RedisGeneratorStore:
+    """모든 API 컨테이너가 공유하는 생성 스크립트 저장소 (generate-testcases 와 save-testcases 가 다른 컨테이너여도 됨)"""
+    def __init__(self, client: redis.Redis, ttl: int = CODING_TEST_CONFIG['GENERATOR_TTL_SECONDS']):
+        self.client = client
+        self.ttl = ttl
+
+    def _key(self, generator_set_id: str) -> str:
+        return f"testcase_generators:{generator_set_id}"
+
+    def save(self, generator_set_id: str, data: Dict[str, Any]) -> None:
+        self.client.set(self._key(generator_set_id), json.dumps(data, ensure_ascii=False), ex=self.ttl)
+
+    def get(self, generator_set_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self._key(generator_set_id))
+        return json.loads(raw) if raw else None
+
+def create_generator_store():
+    if REDIS_CONFIG['GENERATOR_BACKEND'] == 'redis':
+        return RedisGeneratorStore(redis.Redis.from_url(REDIS_CONFIG['URL']))
+    return InMemoryGeneratorStore()
+
+generator_store = create_generator_store()
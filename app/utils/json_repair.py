@@ -0,0 +1,229 @@
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
+import json
+import re
+from pydantic import BaseModel
+
+# 로컬 복구에서 고친 결함 종류 (메트릭 라벨로 사용)
+DEFECTS = ("code_fence", "surrounding_text", "trailing_comma", "python_literal", "single_quote", "unclosed", "coerced")
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA_PATTERN = re.compile(r",(\s*[}\]])")
+_NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+_FRACTION_PATTERN = re.compile(r"(-?\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)")
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+class JSONRepairError(ValueError):
+    """로컬 복구로도 JSON 을 얻지 못함"""
+    pass
+
+def _extract_block(text: str, defects: List[str]) -> str:
+    """코드 펜스와 앞뒤 설명 문장을 걷어내고 첫 JSON 객체/배열만 남김"""
+    fenced = _FENCE_PATTERN.search(text)
+    if fenced:
+        defects.append("code_fence")
+        text = fenced.group(1)
+    else:
+        # 닫는 펜스 없이 잘린 응답
+        stripped = text.lstrip()
+        if stripped.startswith("```"):
+            defects.append("code_fence")
+            text = stripped.split("\n", 1)[1] if "\n" in stripped else ""
+
+    starts = [index for index in (text.find("{"), text.find("[")) if index >= 0]
+    if not starts:
+        raise JSONRepairError("응답에 JSON 객체/배열이 없습니다")
+    start = min(starts)
+
+    # 문자열 안의 괄호는 건너뛰며 짝이 맞는 위치까지 자름
+    depth = 0
+    in_string: Optional[str] = None
+    escaped = False
+    end = None
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == in_string:
+                in_string = None
+        elif char in "\"'":
+            in_string = char
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                end = index + 1
+                break
+
+    block = text[start:end] if end else text[start:]
+    if text[:start].strip() or (end and text[end:].strip()):
+        defects.append("surrounding_text")
+    return block
+
+def _normalize_tokens(block: str, defects: List[str]) -> str:
+    """문자열 밖의 작은따옴표/파이썬 리터럴을 JSON 으로 바꾸고, 닫히지 않은 괄호를 닫음
+
+    Raises:
+        JSONRepairError: 문자열이 닫히지 않은 채 끝난 경우 (잘린 응답)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string: Optional[str] = None
+    escaped = False
+    index = 0
+    while index < len(block):
+        char = block[index]
+        if in_string:
+            if escaped:
+                escaped = False
+                out.append(char)
+            elif char == "\\":
+                escaped = True
+                out.append(char)
+            elif char == in_string:
+                in_string = None
+                out.append('"')
+            elif char == '"' and in_string == "'":
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+        elif char in "\"'":
+            if char == "'":
+                defects.append("single_quote")
+            in_string = char
+            out.append('"')
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+            out.append(char)
+        elif char in "}]":
+            if stack:
+                stack.pop()
+            out.append(char)
+        else:
+            word = re.match(r"True|False|None", block[index:])
+            if word and not (index and block[index - 1].isalnum()):
+                defects.append("python_literal")
+                out.append(_PYTHON_LITERALS[word.group(0)])
+                index += len(word.group(0))
+                continue
+            out.append(char)
+        index += 1
+
+    if in_string:
+        # 문자열 중간에서 끊긴 응답(토큰 한도 등)은 닫아 주면 잘린 피드백/답변이 성공으로 저장되므로 재요청
+        raise JSONRepairError("응답이 문자열 중간에서 끊겼습니다")
+    if stack:
+        defects.append("unclosed")
+        repaired = "".join(out).rstrip()
+        # 값 없이 끝난 키("key":)나 쉼표는 버리고 괄호를 닫음
+        repaired = re.sub(r',?\s*"[^"]*"\s*:\s*$', "", repaired)
+        repaired = repaired.rstrip().rstrip(",")
+        return repaired + "".join(reversed(stack))
+    return "".join(out)
+
+def repair_json(text: str) -> Tuple[Any, List[str]]:
+    """LLM 응답에서 흔한 JSON 결함을 고쳐 파싱
+
+    Returns:
+        (파싱 결과, 고친 결함 종류 목록). 결함이 없으면 목록이 비어 있다.
+
+    Raises:
+        JSONRepairError: 고쳐도 JSON 으로 읽을 수 없는 경우
+    """
+    defects: List[str] = []
+    block = _extract_block(text, defects)
+    try:
+        return json.loads(block), defects
+    except json.JSONDecodeError:
+        pass
+
+    repaired = _normalize_tokens(block, defects)
+    if _TRAILING_COMMA_PATTERN.search(repaired):
+        defects.append("trailing_comma")
+        repaired = _TRAILING_COMMA_PATTERN.sub(r"\1", repaired)
+    try:
+        return json.loads(repaired, strict=False), list(dict.fromkeys(defects))
+    except json.JSONDecodeError as e:
+        raise JSONRepairError(f"JSON 복구 실패: {str(e)}") from e
+
+def _normalize_key(key: str) -> str:
+    return re.sub(r"[_\-\s]", "", str(key)).lower()
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+def _parse_number(value: str) -> Optional[float]:
+    """"85점", "85/100" 같은 문자열의 숫자 (그 밖의 분수는 척도를 알 수 없으므로 None)"""
+    fraction = _FRACTION_PATTERN.search(value)
+    if fraction:
+        # "8.5/10" 을 8 로 읽으면 0-100 점수에서 엉뚱한 값이 되므로 검증 실패로 두어 재요청
+        return float(fraction.group(1)) if float(fraction.group(2)) == 100 else None
+    number = _NUMBER_PATTERN.search(value)
+    return float(number.group(0)) if number else None
+
+def _coerce_value(value: Any, annotation: Any) -> Any:
+    annotation = _unwrap_optional(annotation)
+    origin = get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return coerce_to_model(value, annotation) if isinstance(value, dict) else value
+    if origin in (list, List):
+        (item_type,) = get_args(annotation) or (Any,)
+        if isinstance(value, (str, dict)) and not isinstance(value, list):
+            value = [value] if value != "" else []
+        return [_coerce_value(item, item_type) for item in value] if isinstance(value, list) else value
+    if annotation is int and not isinstance(value, bool):
+        if isinstance(value, float):
+            return round(value)
+        if isinstance(value, str):
+            number = _parse_number(value)
+            return round(number) if number is not None else value
+    if annotation is float and isinstance(value, str):
+        number = _parse_number(value)
+        return number if number is not None else value
+    if annotation is str:
+        if isinstance(value, list):
+            return "\n".join(str(item) for item in value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+    return value
+
+def coerce_to_model(data: Any, model: Type[BaseModel]) -> Any:
+    """스키마에 맞게 키 이름(대소문자/스네이크·카멜 표기)과 값 타입을 맞춤
+
+    - 필드가 하나뿐인 모델에 배열이 오면 그 필드로 감싼다 ({"evaluations": [...]})
+    - 모델 필드가 하나도 없고 값이 객체 하나뿐이면 한 겹 벗긴다 ({"evaluation": {...}})
+    """
+    fields = model.model_fields
+    if isinstance(data, list) and len(fields) == 1:
+        data = {next(iter(fields)): data}
+    if not isinstance(data, dict):
+        return data
+
+    aliases = {
+        _normalize_key(alias): name
+        for name, field in fields.items()
+        for alias in (name, field.alias)
+        if alias
+    }
+    if not any(_normalize_key(key) in aliases for key in data) and len(data) == 1:
+        inner = next(iter(data.values()))
+        if isinstance(inner, dict):
+            data = inner
+
+    coerced: Dict[str, Any] = {}
+    for key, value in data.items():
+        name = aliases.get(_normalize_key(key))
+        if name is None:
+            coerced[key] = value
+            continue
+        coerced[fields[name].alias or name] = _coerce_value(value, fields[name].annotation)
+    return coerced
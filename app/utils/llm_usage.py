@@ -0,0 +1,255 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import json
+import logging
+import queue
+import threading
+import time
+import redis
+from fastapi import Request
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from app.config.llm_config import LLM_PRICING
+from app.config.redis_config import REDIS_CONFIG
+from app.metrics import LLM_CALL_COUNTER, LLM_TOKEN_COUNTER, LLM_COST_COUNTER, LLM_CALL_DURATION, LLM_PROMPT_CACHE_RATIO
+
+logger = logging.getLogger(__name__)
+
+# 집계 차원과 항목
+DIMENSIONS = ("chain", "model", "space_id", "user_id")
+USAGE_FIELDS = ("calls", "errors", "prompt_tokens", "completion_tokens", "cached_tokens", "cost_usd", "latency_seconds")
+
+# 호출을 일으킨 요청의 space_id / user_id (라우터 의존성이나 워커 작업에서 지정)
+_usage_scope: ContextVar[Dict[str, Optional[str]]] = ContextVar("llm_usage_scope", default={})
+
+def bind_usage_scope(space_id: Any = None, user_id: Any = None):
+    """현재 컨텍스트(요청 태스크)의 LLM 사용량 귀속 대상 지정"""
+    scope = dict(_usage_scope.get())
+    if space_id is not None:
+        scope["space_id"] = str(space_id)
+    if user_id is not None:
+        scope["user_id"] = str(user_id)
+    _usage_scope.set(scope)
+
+@contextmanager
+def usage_scope(space_id: Any = None, user_id: Any = None) -> Iterator[None]:
+    """with 블록 안의 LLM 호출을 space_id / user_id 로 집계"""
+    token = _usage_scope.set(dict(_usage_scope.get()))
+    try:
+        bind_usage_scope(space_id, user_id)
+        yield
+    finally:
+        _usage_scope.reset(token)
+
+async def bind_request_usage_scope(request: Request):
+    """라우터 의존성: 경로의 space_id / user_id 를 사용량 귀속 대상으로 지정
+
+    백그라운드 작업과 스트리밍 응답도 같은 요청 컨텍스트에서 실행되므로 함께 집계된다.
+    """
+    bind_usage_scope(request.path_params.get("space_id"), request.path_params.get("user_id"))
+
+def model_pricing(model: str) -> Optional[Dict[str, float]]:
+    if model in LLM_PRICING:
+        return LLM_PRICING[model]
+    matches = [name for name in LLM_PRICING if model.startswith(name)]
+    return LLM_PRICING[max(matches, key=len)] if matches else None
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    """USD 기준 예상 비용 (가격표에 없는 모델은 0)"""
+    pricing = model_pricing(model)
+    if pricing is None:
+        return 0.0
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (
+        uncached * pricing["input"]
+        + cached_tokens * pricing.get("cached_input", pricing["input"])
+        + completion_tokens * pricing["output"]
+    ) / 1_000_000
+
+def _day(offset: int = 0) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+def summarize(rows: Dict[Tuple[str, ...], Dict[str, float]], group_by: Sequence[str]) -> Dict[str, Any]:
+    """차원별 원시 집계를 group_by 기준으로 다시 묶어 비용 순으로 정렬"""
+    groups: Dict[Tuple[str, ...], Dict[str, float]] = {}
+    totals = {field: 0.0 for field in USAGE_FIELDS}
+    for dims, values in rows.items():
+        labels = dict(zip(DIMENSIONS, dims))
+        group = groups.setdefault(tuple(labels[name] for name in group_by), {field: 0.0 for field in USAGE_FIELDS})
+        for field in USAGE_FIELDS:
+            group[field] += values.get(field, 0.0)
+            totals[field] += values.get(field, 0.0)
+
+    def to_row(values: Dict[str, float]) -> Dict[str, Any]:
+        row = {field: int(values[field]) for field in USAGE_FIELDS if field not in ("cost_usd", "latency_seconds")}
+        row["cost_usd"] = round(values["cost_usd"], 6)
+        row["cached_token_ratio"] = round(values["cached_tokens"] / values["prompt_tokens"], 3) if values["prompt_tokens"] else None
+        row["avg_latency_seconds"] = round(values["latency_seconds"] / values["calls"], 3) if values["calls"] else None
+        return row
+
+    items = [
+        {**dict(zip(group_by, key)), **to_row(values)}
+        for key, values in sorted(groups.items(), key=lambda item: item[1]["cost_usd"], reverse=True)
+    ]
+    return {"group_by": list(group_by), "items": items, "total": to_row(totals)}
+
+class InMemoryUsageStore:
+    """단일 프로세스용 일별 사용량 집계"""
+    def __init__(self, retention_days: int = REDIS_CONFIG['USAGE_RETENTION_DAYS']):
+        self.retention_days = retention_days
+        self.days: Dict[str, Dict[Tuple[str, ...], Dict[str, float]]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, dims: Tuple[str, ...], values: Dict[str, float]):
+        day = _day()
+        with self.lock:
+            row = self.days.setdefault(day, {}).setdefault(dims, {})
+            for field, value in values.items():
+                row[field] = row.get(field, 0.0) + value
+            oldest = _day(self.retention_days)
+            for stale in [d for d in self.days if d < oldest]:
+                del self.days[stale]
+
+    def rows(self, days: int) -> Dict[Tuple[str, ...], Dict[str, float]]:
+        merged: Dict[Tuple[str, ...], Dict[str, float]] = {}
+        with self.lock:
+            for offset in range(days):
+                for dims, values in self.days.get(_day(offset), {}).items():
+                    row = merged.setdefault(dims, {})
+                    for field, value in values.items():
+                        row[field] = row.get(field, 0.0) + value
+        return merged
+
+class RedisUsageStore:
+    """모든 워커/컨테이너의 사용량을 일별 Redis 해시에 합산
+
+    LLM 호출 경로를 막지 않도록 기록은 큐에 넣고, 백그라운드 스레드가 모아서 한 번의 파이프라인으로 반영한다.
+    """
+    def __init__(self, client: redis.Redis, retention_days: int = REDIS_CONFIG['USAGE_RETENTION_DAYS']):
+        self.client = client
+        self.retention_days = retention_days
+        self.pending: queue.SimpleQueue = queue.SimpleQueue()
+        self.writer = threading.Thread(target=self._write_loop, name="llm-usage-writer", daemon=True)
+        self.writer.start()
+
+    def _key(self, day: str) -> str:
+        return f"llm_usage:{day}"
+
+    def record(self, dims: Tuple[str, ...], values: Dict[str, float]):
+        self.pending.put((_day(), dims, values))
+
+    def _write_loop(self):
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.flush(batch)
+            except redis.RedisError as e:
+                logger.warning(f"LLM 사용량 기록 실패 ({len(batch)}건): {str(e)}")
+
+    def flush(self, batch: List[Tuple[str, Tuple[str, ...], Dict[str, float]]]):
+        pipe = self.client.pipeline(transaction=False)
+        for day, dims, values in batch:
+            for field, value in values.items():
+                if value:
+                    pipe.hincrbyfloat(self._key(day), json.dumps([*dims, field], ensure_ascii=False), value)
+        for day in {day for day, _, _ in batch}:
+            pipe.expire(self._key(day), self.retention_days * 24 * 60 * 60)
+        pipe.execute()
+
+    def rows(self, days: int) -> Dict[Tuple[str, ...], Dict[str, float]]:
+        merged: Dict[Tuple[str, ...], Dict[str, float]] = {}
+        pipe = self.client.pipeline(transaction=False)
+        for offset in range(days):
+            pipe.hgetall(self._key(_day(offset)))
+        for raw in pipe.execute():
+            for name, value in raw.items():
+                *dims, field = json.loads(name)
+                row = merged.setdefault(tuple(dims), {})
+                row[field] = row.get(field, 0.0) + float(value)
+        return merged
+
+def create_usage_store():
+    if REDIS_CONFIG['USAGE_BACKEND'] == 'redis':
+        return RedisUsageStore(redis.Redis.from_url(REDIS_CONFIG['URL'], socket_timeout=1.0))
+    return InMemoryUsageStore()
+
+usage_store = create_usage_store()
+
+class LLMUsageCallback(BaseCallbackHandler):
+    """체인 LLM 에 붙여 호출마다 토큰/캐시 토큰/지연/예상 비용을 기록하는 콜백
+
+    chain 이름과 호출 시점의 space_id / user_id 로 집계하며, Prometheus 에는 chain/model 만 라벨로 남긴다.
+    """
+    # 호출한 코루틴 안에서 바로 실행해야 contextvars(사용량 귀속 대상)를 읽을 수 있음
+    run_inline = True
+
+    def __init__(self, chain: str, store=None):
+        self.chain = chain
+        self.store = store
+        self.runs: Dict[UUID, Tuple[float, str, Dict[str, Optional[str]]]] = {}
+
+    def _start(self, run_id: UUID, kwargs: Dict[str, Any]):
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model_name") or params.get("model") or "unknown"
+        self.runs[run_id] = (time.monotonic(), model, _usage_scope.get())
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any):
+        self._start(run_id, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs: Any):
+        self._start(run_id, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        started, model, scope = self.runs.pop(run_id, (time.monotonic(), "unknown", _usage_scope.get()))
+        prompt_tokens = completion_tokens = cached_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+                cached_tokens += (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+        if model == "unknown":
+            model = (response.llm_output or {}).get("model_name", model)
+        self._record(model, scope, time.monotonic() - started, {
+            "calls": 1,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "cost_usd": estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
+        }, status="success")
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        started, model, scope = self.runs.pop(run_id, (time.monotonic(), "unknown", _usage_scope.get()))
+        self._record(model, scope, time.monotonic() - started, {"calls": 1, "errors": 1}, status="error")
+
+    def _record(self, model: str, scope: Dict[str, Optional[str]], latency: float, values: Dict[str, float], status: str):
+        LLM_CALL_COUNTER.labels(chain=self.chain, model=model, status=status).inc()
+        LLM_CALL_DURATION.labels(chain=self.chain, model=model).observe(latency)
+        for kind in ("prompt", "completion", "cached"):
+            if values.get(f"{kind}_tokens"):
+                LLM_TOKEN_COUNTER.labels(chain=self.chain, model=model, kind=kind).inc(values[f"{kind}_tokens"])
+        if values.get("prompt_tokens"):
+            LLM_PROMPT_CACHE_RATIO.labels(chain=self.chain, model=model).observe(
+                values.get("cached_tokens", 0) / values["prompt_tokens"]
+            )
+        if values.get("cost_usd"):
+            LLM_COST_COUNTER.labels(chain=self.chain, model=model).inc(values["cost_usd"])
+
+        dims = (self.chain, model, scope.get("space_id") or "-", scope.get("user_id") or "-")
+        try:
+            (self.store or usage_store).record(dims, {**values, "latency_seconds": latency})
+        except Exception as e:
+            # 사용량 기록 실패가 체인 호출을 실패시키지 않도록 함
+            logger.warning(f"[{self.chain}] LLM 사용량 기록 실패: {str(e)}")
+
+def usage_callbacks(chain: str) -> List[BaseCallbackHandler]:
+    """체인 LLM 생성 시 callbacks 인자로 넘길 사용량 콜백"""
+    return [LLMUsageCallback(chain)]
@@ -0,0 +1,200 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
+import threading
+import time
+import redis
+import redis.asyncio as aioredis
+from fastapi.encoders import jsonable_encoder
+from app.config.redis_config import REDIS_CONFIG
+
+# 상태별로 증감하는 카운터 필드 (나머지 필드는 메타데이터로 덮어씀)
+COUNTER_FIELDS = ("total", "completed", "success", "failed", "skipped", "in_progress")
+
+def initial_progress(total: int, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    progress = {field: 0 for field in COUNTER_FIELDS}
+    progress["total"] = total
+    if metadata:
+        progress.update(metadata)
+    return progress
+
+def apply_status(progress: Dict[str, Any], status: Optional[str], metadata: Optional[Dict[str, Any]] = None):
+    """ProgressTracker 규칙대로 진행 상황 갱신 (IN_PROGRESS 는 진행중만 증가, 나머지는 완료 처리)"""
+    if status == "in_progress":
+        progress["in_progress"] += 1
+    elif status:
+        if progress["in_progress"] > 0:
+            progress["in_progress"] -= 1
+        progress["completed"] += 1
+        progress[status] += 1
+    if metadata:
+        progress.update(metadata)
+
+# 카운터 증감 + 메타데이터 병합 + TTL 갱신 + 변경 알림을 한 번에 원자적으로 실행
+APPLY_SCRIPT = """
+local key = KEYS[1]
+local status = ARGV[1]
+if status == 'in_progress' then
+    redis.call('HINCRBY', key, 'in_progress', 1)
+elseif status ~= '' then
+    if tonumber(redis.call('HGET', key, 'in_progress') or '0') > 0 then
+        redis.call('HINCRBY', key, 'in_progress', -1)
+    end
+    redis.call('HINCRBY', key, 'completed', 1)
+    redis.call('HINCRBY', key, status, 1)
+end
+for i = 4, #ARGV, 2 do
+    redis.call('HSET', key, ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', key, tonumber(ARGV[2]))
+local snapshot = redis.call('HGETALL', key)
+redis.call('PUBLISH', ARGV[3], cjson.encode(snapshot))
+return snapshot
+"""
+
+class InMemoryProgressStore:
+    """단일 프로세스용 진행 상황 저장소"""
+    # 네트워크 왕복이 없으므로 이벤트 루프에서 바로 호출
+    blocking = False
+
+    def __init__(self, ttl: int = REDIS_CONFIG['PROGRESS_TTL_SECONDS']):
+        self.ttl = ttl
+        self.items: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self.lock = threading.Lock()
+
+    def create(self, key: str, progress: Dict[str, Any]) -> None:
+        with self.lock:
+            self._prune()
+            self.items[key] = (dict(progress), time.monotonic() + self.ttl)
+            self._publish(key, progress)
+
+    def apply(self, key: str, status: Optional[str], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self.lock:
+            progress = self.items.get(key, (initial_progress(0), 0))[0]
+            apply_status(progress, status, metadata)
+            self.items[key] = (progress, time.monotonic() + self.ttl)
+            self._publish(key, progress)
+            return dict(progress)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            item = self.items.get(key)
+            if item is None or item[1] < time.monotonic():
+                return None
+            return dict(item[0])
+
+    async def subscribe(self, key: str, heartbeat: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """갱신될 때마다 진행 상황 스냅샷을 내보냄 (heartbeat 초 동안 갱신이 없으면 None)"""
+        queue: asyncio.Queue = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self.lock:
+            self.subscribers.setdefault(key, []).append(subscriber)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self.lock:
+                self.subscribers[key].remove(subscriber)
+                if not self.subscribers[key]:
+                    del self.subscribers[key]
+
+    def _publish(self, key: str, progress: Dict[str, Any]):
+        for loop, queue in self.subscribers.get(key, []):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, dict(progress))
+            except RuntimeError:
+                # 구독자의 이벤트 루프가 이미 종료됨
+                pass
+
+    def _prune(self):
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self.items.items() if expires_at < now]:
+            del self.items[key]
+
+class RedisProgressStore:
+    """모든 워커/컨테이너가 공유하는 진행 상황 저장소
+
+    카운터는 HINCRBY 로 원자적으로 증가시키고, 갱신될 때마다 전체 스냅샷을 채널로 발행한다.
+    필드 값은 JSON 으로 저장한다 (정수 카운터도 그대로 HINCRBY 가능).
+    """
+    blocking = True
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        async_client: Optional[aioredis.Redis] = None,
+        ttl: int = REDIS_CONFIG['PROGRESS_TTL_SECONDS']
+    ):
+        self.client = client
+        self.async_client = async_client
+        self.ttl = ttl
+        self.apply_script = client.register_script(APPLY_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        return f"progress:{key}"
+
+    def _channel(self, key: str) -> str:
+        return f"progress_updates:{key}"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> List[str]:
+        # 결과 메타데이터에 pydantic 모델/datetime 등이 섞여 있어 JSON 으로 바꿀 수 있는 값으로 먼저 변환
+        return [
+            value for name, raw in fields.items()
+            for value in (name, json.dumps(jsonable_encoder(raw), ensure_ascii=False))
+        ]
+
+    @staticmethod
+    def _decode(flat: List[Any]) -> Dict[str, Any]:
+        values = [item.decode() if isinstance(item, bytes) else item for item in flat]
+        return {values[i]: json.loads(values[i + 1]) for i in range(0, len(values), 2)}
+
+    def create(self, key: str, progress: Dict[str, Any]) -> None:
+        self.client.delete(self._key(key))
+        self.apply_script(keys=[self._key(key)], args=["", self.ttl, self._channel(key), *self._encode(progress)])
+
+    def apply(self, key: str, status: Optional[str], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        snapshot = self.apply_script(
+            keys=[self._key(key)],
+            args=[status or "", self.ttl, self._channel(key), *self._encode(metadata or {})]
+        )
+        return self._decode(snapshot)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.hgetall(self._key(key))
+        if not raw:
+            return None
+        return {
+            (name.decode() if isinstance(name, bytes) else name): json.loads(value)
+            for name, value in raw.items()
+        }
+
+    async def subscribe(self, key: str, heartbeat: Optional[float] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """갱신될 때마다 진행 상황 스냅샷을 내보냄 (heartbeat 초 동안 갱신이 없으면 None)"""
+        if self.async_client is None:
+            self.async_client = aioredis.Redis.from_url(REDIS_CONFIG['URL'])
+        pubsub = self.async_client.pubsub()
+        await pubsub.subscribe(self._channel(key))
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat)
+                if message is None:
+                    if heartbeat is not None:
+                        yield None
+                    continue
+                if message["type"] == "message":
+                    yield self._decode(json.loads(message["data"]))
+        finally:
+            await pubsub.unsubscribe(self._channel(key))
+            await pubsub.aclose()
+
+def create_progress_store():
+    if REDIS_CONFIG['PROGRESS_BACKEND'] == 'redis':
+        return RedisProgressStore(redis.Redis.from_url(REDIS_CONFIG['URL']))
+    return InMemoryProgressStore()
+
+progress_store = create_progress_store()
@@ -1,7 +1,9 @@
-from typing import Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable
 import asyncio
 import logging
 from enum import Enum
+import redis
+from app.utils.progress_store import progress_store, initial_progress, apply_status
 
 logger = logging.getLogger(__name__)
 
@@ -12,25 +14,38 @@ class ProgressStatus(Enum):
     IN_PROGRESS = "in_progress"
 
 class ProgressTracker:
+    """진행 상황 카운터
+
+    key 를 주면 모든 갱신을 공용 진행 상황 저장소(progress_store)에도 반영해,
+    다른 워커/컨테이너의 상태 조회나 스트리밍 엔드포인트가 같은 진행 상황을 읽을 수 있다.
+    저장소 반영(연결 오류, 직렬화할 수 없는 메타데이터)에 실패해도 이 프로세스의 카운터는 계속 갱신된다.
+    key 가 있으면 저장소에 초기 상태를 등록하도록 `await ProgressTracker.create(...)` 로 만든다.
+    """
     def __init__(
         self, 
         total: int, 
         log_interval: int = 10,
         status_callback: Optional[Callable[[Dict], None]] = None,
-        log_prefix: str = "Progress"
+        log_prefix: str = "Progress",
+        key: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        store=None
     ):
-        self.progress = {
-            "total": total,
-            "completed": 0,
-            "success": 0,
-            "failed": 0,
-            "skipped": 0,
-            "in_progress": 0
-        }
+        self.progress = initial_progress(total, metadata)
         self.log_interval = log_interval
         self.lock = asyncio.Lock()
         self.status_callback = status_callback
         self.log_prefix = log_prefix
+        self.key = key
+        self.store = store or progress_store
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "ProgressTracker":
+        """트래커를 만들고 key 가 있으면 저장소에 초기 상태 등록 (Redis 호출은 스레드에서)"""
+        tracker = cls(*args, **kwargs)
+        if tracker.key is not None:
+            await tracker._apply(tracker.store.create, tracker.key, tracker.get_progress())
+        return tracker
 
     async def update(self, status: ProgressStatus, metadata: Optional[Dict] = None):
         """진행 상황 업데이트
@@ -40,19 +55,9 @@ class ProgressTracker:
             metadata: 추가 메타데이터 (선택사항)
         """
         async with self.lock:
-            if status == ProgressStatus.IN_PROGRESS:
-                # IN_PROGRESS 상태일 때는 completed를 증가시키지 않고 in_progress만 증가
-                self.progress["in_progress"] += 1
-            else:
-                # 다른 상태일 때는 completed를 증가시키고, 이전에 IN_PROGRESS였다면 감소
-                if self.progress["in_progress"] > 0:
-                    self.progress["in_progress"] -= 1
-                self.progress["completed"] += 1
-                self.progress[status.value] += 1
-            
-            # metadata를 progress 딕셔너리에 저장
-            if metadata:
-                self.progress.update(metadata)
+            # IN_PROGRESS 상태일 때는 in_progress만 증가, 다른 상태일 때는 completed를 증가시키고
+            # 이전에 IN_PROGRESS였다면 감소. metadata는 progress 딕셔너리에 저장
+            apply_status(self.progress, status.value, metadata)
             
             percent = (self.progress["completed"] / self.progress["total"]) * 100
             if percent % self.log_interval < 0.5 and percent > 0:
@@ -61,6 +66,10 @@ class ProgressTracker:
             if self.status_callback:
                 self.status_callback(self.progress)
 
+        if self.key is not None:
+            # 저장소에서는 원자적으로 증가시키므로 락 밖에서 반영해도 안전 (여러 프로세스가 같은 key를 갱신해도 됨)
+            await self._apply(self.store.apply, self.key, status.value, metadata)
+
     def _log_progress(self, metadata: Optional[Dict] = None):
         """진행 상황 로깅"""
         log_message = (
@@ -77,17 +86,25 @@ class ProgressTracker:
             
         logger.info(log_message)
 
+    async def _apply(self, operation, *args):
+        """저장소 반영 (blocking 저장소는 이벤트 루프를 막지 않도록 스레드에서 호출)"""
+        try:
+            if self.store.blocking:
+                await asyncio.to_thread(operation, *args)
+            else:
+                operation(*args)
+        except redis.RedisError as e:
+            logger.warning(f"{self.log_prefix}: 진행 상황 저장소 반영 실패 - {str(e)}")
+        except (TypeError, ValueError) as e:
+            # JSON 으로 바꿀 수 없는 메타데이터: 이 갱신만 저장소 반영을 건너뜀
+            logger.error(f"{self.log_prefix}: 진행 상황 메타데이터 직렬화 실패 - {str(e)}")
+
     def get_progress(self) -> Dict:
         """현재 진행 상황 반환"""
         return self.progress.copy()
 
-    def reset(self):
+    async def reset(self):
         """진행 상황 초기화"""
-        self.progress = {
-            "total": self.progress["total"],
-            "completed": 0,
-            "success": 0,
-            "failed": 0,
-            "skipped": 0,
-            "in_progress": 0
-        }
\ No newline at end of file
+        self.progress = initial_progress(self.progress["total"])
+        if self.key is not None:
+            await self._apply(self.store.create, self.key, self.get_progress())
\ No newline at end of file
@@ -0,0 +1,193 @@
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import threading
+import time
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+from app.config.llm_config import LLM_RATE_LIMIT_CONFIG
+from app.config.redis_config import REDIS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# (버킷 키, 분당 용량, 이번 호출 비용)
+BucketRequest = Tuple[str, float, float]
+
+# 한 번에 기다리는 최대 시간 (다른 프로세스가 정산한 토큰을 다시 확인하기 위해 나눠서 대기)
+MAX_WAIT_STEP = 1.0
+
+# 모든 버킷이 비용을 감당할 수 있을 때만 한꺼번에 차감 (원자적으로 실행)
+ACQUIRE_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local wait = 0
+local levels = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local cost = tonumber(ARGV[i * 2])
+    local rate = capacity / 60
+    local state = redis.call('HMGET', key, 'level', 'updated')
+    local level = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    level = math.min(capacity, level + math.max(0, now - updated) * rate)
+    levels[i] = level
+    if level < cost then
+        wait = math.max(wait, (cost - level) / rate)
+    end
+end
+for i, key in ipairs(KEYS) do
+    local level = levels[i]
+    if wait == 0 then
+        level = level - tonumber(ARGV[i * 2])
+    end
+    redis.call('HSET', key, 'level', tostring(level), 'updated', tostring(now))
+    redis.call('EXPIRE', key, 120)
+end
+return tostring(wait)
+"""
+
+# 예약한 토큰과 실제 사용량의 차이를 정산 (음수면 추가 차감)
+ADJUST_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local capacity = tonumber(ARGV[1])
+local rate = capacity / 60
+local state = redis.call('HMGET', KEYS[1], 'level', 'updated')
+local level = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+level = math.min(capacity, level + math.max(0, now - updated) * rate + tonumber(ARGV[2]))
+redis.call('HSET', KEYS[1], 'level', tostring(level), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], 120)
+return tostring(level)
+"""
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 대략적인 토큰 수 추정 (ASCII 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+class LocalTokenBucket:
+    """프로세스 내 토큰 버킷 (Redis 가 없거나 장애일 때 사용)"""
+    def __init__(self):
+        self.levels: Dict[str, Tuple[float, float]] = {}
+        self.lock = threading.Lock()
+
+    def _refill(self, key: str, capacity: float, now: float) -> float:
+        level, updated = self.levels.get(key, (capacity, now))
+        return min(capacity, level + max(0.0, now - updated) * capacity / 60)
+
+    def try_acquire(self, buckets: List[BucketRequest]) -> float:
+        with self.lock:
+            now = time.monotonic()
+            levels = [self._refill(key, capacity, now) for key, capacity, _ in buckets]
+            wait = max(
+                [(cost - level) / (capacity / 60) for (_, capacity, cost), level in zip(buckets, levels) if level < cost],
+                default=0.0
+            )
+            for (key, _, cost), level in zip(buckets, levels):
+                self.levels[key] = (level - cost if wait == 0 else level, now)
+            return wait
+
+    def adjust(self, key: str, capacity: float, delta: float):
+        with self.lock:
+            now = time.monotonic()
+            self.levels[key] = (min(capacity, self._refill(key, capacity, now) + delta), now)
+
+class RedisTokenBucket:
+    """Redis 공유 토큰 버킷 (모든 컨테이너/워커가 같은 한도를 나눠 씀)"""
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self.acquire_script = client.register_script(ACQUIRE_SCRIPT)
+        self.adjust_script = client.register_script(ADJUST_SCRIPT)
+
+    def try_acquire(self, buckets: List[BucketRequest]) -> float:
+        keys = [key for key, _, _ in buckets]
+        args = [value for _, capacity, cost in buckets for value in (capacity, cost)]
+        return float(self.acquire_script(keys=keys, args=args))
+
+    def adjust(self, key: str, capacity: float, delta: float):
+        self.adjust_script(keys=[key], args=[capacity, delta])
+
+class LLMRateLimiter:
+    """모델별 분당 요청 수(RPM)와 토큰 수(TPM)를 함께 제한
+
+    호출 전 프롬프트 추정 토큰 + 예상 완성 토큰을 예약하고, 응답 후 실제 사용량과의 차이를 정산한다.
+    Redis 오류가 나면 FALLBACK_SECONDS 동안 프로세스 내 버킷으로 대신 제한한다.
+    """
+    def __init__(self, backend: Optional[RedisTokenBucket] = None, key_prefix: str = "llm_rate"):
+        self.backend = backend
+        self.local = LocalTokenBucket()
+        self.key_prefix = key_prefix
+        self.fallback_until = 0.0
+
+    def limits(self, model: str) -> Tuple[int, int]:
+        limits = LLM_RATE_LIMIT_CONFIG['MODEL_LIMITS'].get(model, {})
+        return (
+            int(limits.get('rpm', LLM_RATE_LIMIT_CONFIG['DEFAULT_RPM'])),
+            int(limits.get('tpm', LLM_RATE_LIMIT_CONFIG['DEFAULT_TPM']))
+        )
+
+    def _buckets(self, model: str, tokens: int) -> List[BucketRequest]:
+        rpm, tpm = self.limits(model)
+        return [
+            (f"{self.key_prefix}:{model}:requests", rpm, 1),
+            # 한도보다 큰 요청도 언젠가는 통과하도록 비용은 용량으로 자름
+            (f"{self.key_prefix}:{model}:tokens", tpm, min(tokens, tpm))
+        ]
+
+    def _call(self, method: str, *args):
+        if self.backend is not None and time.monotonic() >= self.fallback_until:
+            try:
+                return getattr(self.backend, method)(*args)
+            except redis.RedisError as e:
+                self.fallback_until = time.monotonic() + LLM_RATE_LIMIT_CONFIG['FALLBACK_SECONDS']
+                logger.warning(f"Redis 속도 제한 사용 불가, 로컬 버킷으로 전환: {str(e)}")
+        return getattr(self.local, method)(*args)
+
+    def acquire(self, model: str, tokens: int):
+        buckets = self._buckets(model, tokens)
+        while True:
+            wait = self._call("try_acquire", buckets)
+            if wait <= 0:
+                return
+            time.sleep(min(wait, MAX_WAIT_STEP))
+
+    async def aacquire(self, model: str, tokens: int):
+        buckets = self._buckets(model, tokens)
+        while True:
+            # Redis 왕복은 스레드에서 실행해 이벤트 루프를 막지 않음
+            wait = await asyncio.to_thread(self._call, "try_acquire", buckets)
+            if wait <= 0:
+                return
+            await asyncio.sleep(min(wait, MAX_WAIT_STEP))
+
+    def settle(self, model: str, reserved: int, used: int):
+        """예약 토큰과 실제 사용량 차이 정산"""
+        _, tpm = self.limits(model)
+        delta = min(reserved, tpm) - used
+        if delta:
+            self._call("adjust", f"{self.key_prefix}:{model}:tokens", tpm, delta)
+
+    async def asettle(self, model: str, reserved: int, used: int):
+        await asyncio.to_thread(self.settle, model, reserved, used)
+
+_rate_limiter: Optional[LLMRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> LLMRateLimiter:
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            backend = None
+            if LLM_RATE_LIMIT_CONFIG['BACKEND'] == 'redis':
+                client = redis.Redis.from_url(
+                    REDIS_CONFIG['URL'],
+                    socket_connect_timeout=0.5,
+                    socket_timeout=0.5,
+                    # 장애 시 재시도로 LLM 호출을 지연시키지 않고 바로 로컬 버킷으로 전환
+                    retry=Retry(NoBackoff(), 0)
+                )
+                backend = RedisTokenBucket(client)
+            _rate_limiter = LLMRateLimiter(backend)
+        return _rate_limiter
@@ -0,0 +1,10 @@
+# benchmarks/__init__.py
+# 실제 OpenAI/MySQL 없이 실행할 수 있도록 앱 모듈 import 전에 더미 환경 변수를 채운다.
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("MYSQL_USER", "benchmark")
+os.environ.setdefault("MYSQL_PASSWORD", "benchmark")
+os.environ.setdefault("MYSQL_HOST", "localhost")
+os.environ.setdefault("MYSQL_PORT", "3306")
+os.environ.setdefault("MYSQL_DB_NAME", "benchmark")
@@ -0,0 +1,78 @@
+# benchmarks/adaptive_concurrency.py
+"""적응형 동시성 제한기(AIMD) 벤치마크
+
+동시 호출이 --capacity 를 넘으면 429 를 내는 가짜 LLM 으로 parallel 엔진을 실행해
+고정 limit(너무 낮음 / 너무 높음)와 적응형 limit 의 처리 시간과 429 발생 수를 비교한다.
+
+실행: python -m benchmarks.adaptive_concurrency --answers 200 --capacity 15 --latency 0.1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import time
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.evaluation_concurrency import install_fake_llm
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.config.llm_config import LLM_CONCURRENCY_CONFIG
+from app.services.interview.evaluate import evaluate_contest_answers_parallel
+from app.utils import adaptive_limiter
+
+
+async def run(mode: str, args) -> dict:
+    if mode == "fixed_low":
+        LLM_CONCURRENCY_CONFIG.update(INITIAL_LIMIT=2, MIN_LIMIT=2, MAX_LIMIT=2)
+    elif mode == "fixed_high":
+        LLM_CONCURRENCY_CONFIG.update(INITIAL_LIMIT=args.high, MIN_LIMIT=args.high, MAX_LIMIT=args.high)
+    else:
+        LLM_CONCURRENCY_CONFIG.update(INITIAL_LIMIT=2, MIN_LIMIT=1, MAX_LIMIT=args.high)
+    adaptive_limiter._limiters.clear()
+
+    fake_llm = install_fake_llm(args.latency)
+    fake_llm.capacity = args.capacity
+
+    _, db = create_sqlite_session()
+    problems = max(1, args.answers // 10)
+    contest_id = seed_contest(db, problems=problems, participants=math.ceil(args.answers / problems))
+
+    start_time = time.perf_counter()
+    results = await evaluate_contest_answers_parallel(db, contest_id)
+    duration = time.perf_counter() - start_time
+    db.close()
+
+    limiter = adaptive_limiter.get_limiter("evaluation")
+    return {
+        "mode": mode,
+        "capacity": args.capacity,
+        "evaluated": len(results),
+        "duration": round(duration, 2),
+        "llm_calls": fake_llm.calls,
+        "rate_limited": fake_llm.rate_limited,
+        "peak_in_flight": fake_llm.peak_in_flight,
+        "final_limit": limiter.limit,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="적응형 동시성 제한기 벤치마크")
+    parser.add_argument("--answers", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=15, help="가짜 provider 의 동시 호출 한도")
+    parser.add_argument("--high", type=int, default=40, help="고정 limit(너무 높음) 및 적응형 최대값")
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--modes", default="fixed_low,fixed_high,adaptive")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    # 재시도 대기를 짧게 해 429 가 처리 시간에 미치는 영향만 비교
+    EVALUATION_CONFIG['RETRY_BASE_DELAY'] = 1.5
+
+    for mode in args.modes.split(","):
+        print(json.dumps(asyncio.run(run(mode, args)), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/answer_cache.py
+"""유사 질문 답변 재사용 색인 벤치마크
+
+답변된 질문 색인에 표현만 다른 같은 질문(재사용해야 함)과 비슷해 보이는 다른 질문
+(재사용하면 안 됨)을 조회해 임계값별 hit 비율/오탐 수와, 색인 크기별 조회 지연을 잰다.
+
+실행: python -m benchmarks.answer_cache --index-sizes 100,1000,5000
+"""
+import argparse
+import json
+import random
+import time
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+
+from app.utils.answer_cache import AnswerIndex, CachedAnswer
+
+STORED = [
+    "MongoDB의 인덱싱에 대해 설명해주세요.",
+    "REST API란 무엇인가요?",
+    "TCP와 UDP의 차이점을 설명해주세요.",
+    "프로세스와 스레드의 차이는?",
+    "데이터베이스 트랜잭션의 ACID 속성을 설명해주세요.",
+    "React의 가상 DOM에 대해 설명해주세요.",
+    "HTTP와 HTTPS의 차이점은 무엇인가요?",
+    "JavaScript의 클로저란 무엇인가요?",
+    "RDBMS의 정규화에 대해 설명해주세요.",
+    "가비지 컬렉션의 동작 방식을 설명해주세요.",
+]
+
+# (질문, 재사용해야 할 STORED 인덱스 또는 None)
+QUERIES = [
+    ("MongoDB 인덱싱", 0),
+    ("MongoDB 인덱싱에 대해 설명해 주세요", 0),
+    ("몽고DB 인덱스 설명", 0),
+    ("REST API 란?", 1),
+    ("TCP 와 UDP 의 차이점을 설명해 주세요!", 2),
+    ("UDP와 TCP의 차이", 2),
+    ("프로세스와 스레드 차이점을 설명해주세요", 3),
+    ("트랜잭션 ACID 속성 설명", 4),
+    ("React 가상 DOM", 5),
+    ("HTTPS와 HTTP 차이점", 6),
+    ("자바스크립트 클로저", 7),
+    ("RDBMS 정규화란?", 8),
+    ("가비지 컬렉션 동작 방식", 9),
+    ("Vue의 반응성 시스템을 설명해주세요.", None),
+    ("HTTP/2와 HTTP/1.1의 차이점은 무엇인가요?", None),
+    ("JavaScript의 호이스팅이란 무엇인가요?", None),
+    ("MongoDB의 샤딩에 대해 설명해주세요.", None),
+    ("데이터베이스 인덱스의 동작 원리를 설명해주세요.", None),
+    ("React의 상태 관리 방법을 설명해주세요.", None),
+    ("프로세스 스케줄링 알고리즘을 설명해주세요.", None),
+]
+
+WORDS = ["캐시", "큐", "스택", "해시", "트리", "그래프", "락", "세마포어", "메모리", "소켓", "쿠키", "세션",
+         "토큰", "인덱스", "조인", "뷰", "컴포넌트", "훅", "이벤트", "프로미스", "제네릭", "인터페이스"]
+
+
+def synthetic_questions(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(WORDS)}와 {rng.choice(WORDS)}의 {rng.choice(['차이', '동작 원리', '장단점', '사용 사례'])}를 설명해주세요. ({i})"
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 질문 답변 재사용 색인 벤치마크")
+    parser.add_argument("--thresholds", default="0.7,0.75,0.8,0.85,0.9")
+    parser.add_argument("--index-sizes", default="100,1000,5000")
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    index = AnswerIndex()
+    index.load(0, [CachedAnswer(i, question, "{}") for i, question in enumerate(STORED)])
+    scored = []
+    for question, expected in QUERIES:
+        entry, similarity = index.search(0, question)
+        scored.append((expected, entry.id if entry else None, similarity))
+
+    positives = sum(1 for expected, _, _ in scored if expected is not None)
+    for threshold in [float(value) for value in args.thresholds.split(",")]:
+        hits = sum(1 for expected, found, similarity in scored if similarity >= threshold and found == expected)
+        false_hits = sum(1 for expected, found, similarity in scored if similarity >= threshold and found != expected)
+        print(json.dumps({
+            "threshold": threshold,
+            "hit_rate": round(hits / positives, 3),
+            "false_hits": false_hits,
+            "queries": len(scored)
+        }))
+
+    for size in [int(value) for value in args.index_sizes.split(",")]:
+        questions = synthetic_questions(size)
+        index = AnswerIndex()
+        index.load(0, [CachedAnswer(i, question, "{}") for i, question in enumerate(questions)])
+        start_time = time.perf_counter()
+        index.search(0, questions[0])
+        build_ms = (time.perf_counter() - start_time) * 1000
+        start_time = time.perf_counter()
+        for i in range(args.lookups):
+            index.search(0, questions[i % size])
+        lookup_ms = (time.perf_counter() - start_time) * 1000 / args.lookups
+        print(json.dumps({"index_size": size, "build_ms": round(build_ms, 1), "lookup_ms": round(lookup_ms, 3)}))
+
+
+if __name__ == "__main__":
+    main()
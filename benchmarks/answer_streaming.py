@@ -0,0 +1,84 @@
+# benchmarks/answer_streaming.py
+"""AI 모범 답안 스트리밍 벤치마크
+
+가짜 LLM 으로 일반 생성(generate_interview_answer)과 SSE 스트리밍(stream_interview_answer)의
+첫 바이트까지의 시간(TTFB)과 전체 시간을 비교한다. 두 경로 모두 SQLite 에 답안을 저장한다.
+
+실행: python -m benchmarks.answer_streaming --latency 3 --requests 5
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import time
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.seed import create_sqlite_session, seed_contest
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.db.mysql.models import TechInterview
+from app.services.interview import interview as interview_service
+
+ANSWER = {
+    "question": "MongoDB의 인덱싱에 대해 설명해주세요.",
+    "answer": "MongoDB의 인덱스는 B-Tree 기반으로 컬렉션 스캔 없이 조건에 맞는 문서를 찾게 해 줍니다. " * 8,
+    "tips": "복합 인덱스의 필드 순서(ESR 규칙)와 explain() 으로 확인한 경험을 말하면 좋습니다.",
+    "related_topics": "복합 인덱스, 커버드 쿼리, TTL 인덱스, 샤딩 키"
+}
+
+
+async def run(args):
+    engine, db = create_sqlite_session()
+    seed_contest(db, problems=args.requests * 2, participants=1)
+    db.commit()
+    ids = [row.id for row in db.query(TechInterview).order_by(TechInterview.id)]
+
+    fake = FakeChatModel(responder=lambda prompt: json.dumps(ANSWER, ensure_ascii=False), latency=args.latency)
+    interview_service.chain = interview_service.prompt | fake | interview_service.parser
+    interview_service.stream_chain = interview_service.prompt | fake
+
+    @contextlib.asynccontextmanager
+    async def session_factory():
+        yield db
+
+    blocking = []
+    for i in range(args.requests):
+        start_time = time.perf_counter()
+        await interview_service.generate_interview_answer("JAVASCRIPT", f"벤치마크 질문 {i}", ids[i], db)
+        blocking.append(time.perf_counter() - start_time)
+
+    ttfb, totals, deltas = [], [], 0
+    for i in range(args.requests):
+        start_time = time.perf_counter()
+        first = None
+        events = interview_service.stream_interview_answer(
+            "JAVASCRIPT", f"스트리밍 질문 {i}", ids[args.requests + i], session_factory
+        )
+        async for event, data in events:
+            if first is None:
+                first = time.perf_counter() - start_time
+            deltas += event == "delta"
+        ttfb.append(first)
+        totals.append(time.perf_counter() - start_time)
+
+    print(json.dumps({"mode": "blocking", "ttfb_s": round(statistics.median(blocking), 3),
+                      "total_s": round(statistics.median(blocking), 3)}))
+    print(json.dumps({"mode": "stream", "ttfb_s": round(statistics.median(ttfb), 3),
+                      "total_s": round(statistics.median(totals), 3),
+                      "deltas_per_answer": deltas // args.requests}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 모범 답안 스트리밍 벤치마크")
+    parser.add_argument("--latency", type=float, default=3.0, help="가짜 LLM 응답 시간(초)")
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+    # 서로 비슷한 질문이라 재사용 색인이 생성을 건너뛰지 않도록 끔
+    INTERVIEW_CONFIG['ANSWER_CACHE'] = False
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/batched_evaluation.py
+"""답변 단건 평가(parallel)와 문제별 묶음 평가(batched)의 토큰/처리량 비교
+
+가짜 LLM 이 프롬프트/응답 길이로 토큰 수를 추정해 usage_metadata 로 돌려주므로,
+같은 문제/모범답안/포맷 안내문을 반복해서 보내는 비용을 비교할 수 있다.
+
+실행: python -m benchmarks.batched_evaluation --problems 5 --participants 40 --batch-sizes 1,5,10
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.evaluation_concurrency import pin_concurrency
+from benchmarks.fake_llm import FakeChatModel, batch_evaluation_response
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.services.interview import evaluation_core
+from app.services.interview.evaluate import (
+    evaluate_contest_answers_parallel,
+    evaluate_contest_answers_batched
+)
+
+evaluate_chain_module = importlib.import_module("app.chain.evaluate_chain")
+batch_chain_module = importlib.import_module("app.chain.batch_evaluate_chain")
+
+
+class TokenCounter(BaseCallbackHandler):
+    """LLM 응답의 usage_metadata 를 합산"""
+
+    def __init__(self):
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def on_llm_end(self, response, **kwargs):
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(generation.message, "usage_metadata", None) or {}
+                self.input_tokens += usage.get("input_tokens", 0)
+                self.output_tokens += usage.get("output_tokens", 0)
+
+
+async def run(engine_name: str, batch_size: int, args) -> dict:
+    pin_concurrency(args.limit)
+    EVALUATION_CONFIG['BATCH_EVAL_SIZE'] = batch_size
+    counter = TokenCounter()
+    fake_llm = FakeChatModel(latency=args.latency, callbacks=[counter])
+    batch_llm = FakeChatModel(latency=args.latency, responder=batch_evaluation_response, callbacks=[counter])
+    evaluation_core.chain = evaluate_chain_module.prompt | fake_llm | evaluate_chain_module.parser
+    evaluation_core.batch_chain = batch_chain_module.prompt | batch_llm
+
+    _, db = create_sqlite_session()
+    contest_id = seed_contest(db, problems=args.problems, participants=args.participants,
+                              answer_length=args.answer_length)
+
+    start_time = time.perf_counter()
+    if engine_name == "parallel":
+        results = await evaluate_contest_answers_parallel(db, contest_id)
+    else:
+        results = await evaluate_contest_answers_batched(db, contest_id)
+    duration = time.perf_counter() - start_time
+    db.close()
+
+    total_tokens = counter.input_tokens + counter.output_tokens
+    return {
+        "engine": engine_name,
+        "answers_per_call": batch_size if engine_name == "batched" else 1,
+        "evaluated": len(results),
+        "llm_calls": fake_llm.calls + batch_llm.calls,
+        "input_tokens": counter.input_tokens,
+        "output_tokens": counter.output_tokens,
+        "tokens_per_answer": round(total_tokens / len(results), 1) if results else 0,
+        "answers_per_sec": round(len(results) / duration, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="묶음 평가 토큰/처리량 벤치마크")
+    parser.add_argument("--problems", type=int, default=5)
+    parser.add_argument("--participants", type=int, default=40)
+    parser.add_argument("--answer-length", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--batch-sizes", default="1,5,10")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(json.dumps(asyncio.run(run("parallel", 1, args)), ensure_ascii=False))
+    for batch_size in [int(size) for size in args.batch_sizes.split(",")]:
+        print(json.dumps(asyncio.run(run("batched", batch_size, args)), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bulk_writer.py
+"""평가 결과 쓰기 경로 처리량 벤치마크
+
+배치 크기별로 기존 방식(답변마다 (problem_id, participant_id) 재조회 후 수정)과
+AnswerRepository.bulk_update_evaluations(answer_id 기준 단일 UPDATE)의 rows/sec 를 비교한다.
+
+실행: python -m benchmarks.bulk_writer --rows 2000 --rtt-ms 0.5
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.db_stats import QueryCounter
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.db.mysql.models import Answer
+from app.db.repositories.mysql.answer_repository import AnswerRepository
+
+BATCH_SIZES = [1, 10, 50, 100, 250, 500]
+
+
+def legacy_write(db, batch):
+    """개선 전 BatchProcessor.process_batch 의 쓰기 패턴"""
+    for item in batch:
+        answer = db.query(Answer).filter(
+            Answer.problem_id == item['problem_id'],
+            Answer.participant_id == item['participant_id']
+        ).first()
+        if answer:
+            answer.rank_score = item['score']
+            answer.feedback = item['feedback']
+    db.commit()
+
+
+def bulk_write(db, batch):
+    AnswerRepository(db).bulk_update_evaluations(batch)
+
+
+WRITERS = {
+    "legacy": legacy_write,
+    "bulk": bulk_write,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="평가 결과 벌크 쓰기 벤치마크")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="쿼리당 흉내낼 왕복 지연(ms)")
+    parser.add_argument("--batch-sizes", default=",".join(str(size) for size in BATCH_SIZES))
+    args = parser.parse_args()
+
+    engine, db = create_sqlite_session()
+    contest_id = seed_contest(db, problems=10, participants=max(1, args.rows // 10))
+    rows = db.execute(select(Answer.id, Answer.problem_id, Answer.participant_id)).all()[:args.rows]
+    db.close()
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    counter = QueryCounter(engine, rtt=args.rtt_ms / 1000)
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(",")]:
+        for writer_name, writer in WRITERS.items():
+            items = [
+                {
+                    'answer_id': answer_id,
+                    'problem_id': problem_id,
+                    'participant_id': participant_id,
+                    'score': (answer_id * 7) % 101,
+                    'feedback': f"{writer_name}-{batch_size} 피드백 {answer_id}"
+                }
+                for answer_id, problem_id, participant_id in rows
+            ]
+            db = session_factory()
+            counter.reset()
+            start_time = time.perf_counter()
+            for offset in range(0, len(items), batch_size):
+                writer(db, items[offset:offset + batch_size])
+            duration = time.perf_counter() - start_time
+            statements = counter.count
+
+            # 기록된 값 검증
+            stored = dict(db.execute(select(Answer.id, Answer.rank_score)).all())
+            if any(stored[item['answer_id']] != item['score'] for item in items):
+                raise SystemExit(f"{writer_name} 쓰기 결과가 올바르지 않습니다.")
+            db.close()
+
+            print(json.dumps({
+                "writer": writer_name,
+                "batch_size": batch_size,
+                "rows": len(items),
+                "statements": statements,
+                "rows_per_sec": round(len(items) / duration, 1),
+            }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
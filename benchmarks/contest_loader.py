@@ -0,0 +1,103 @@
+# benchmarks/contest_loader.py
+"""콘테스트 로더 쿼리 수/지연 시간 벤치마크
+
+기존 ORM lazy load 방식(문제별 tech_interview/Answer 조회, 답변별 participant 조회)과
+ContestRepository.get_snapshot 의 조인 쿼리 방식을 같은 SQLite 데이터에서 비교한다.
+
+실행: python -m benchmarks.contest_loader --problems 10 --participants 200 --rtt-ms 0.5
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.db_stats import QueryCounter
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.db.mysql.models import Problem, Answer
+from app.services.interview.evaluate import _load_problems_data
+
+
+def legacy_get_problems_data(db, contest_id):
+    """개선 전 get_problems_data 의 N+1 조회 패턴"""
+    problems_data = []
+    for problem in db.query(Problem).filter(Problem.contest_id == contest_id).all():
+        tech_interview = problem.tech_interview
+        answers = db.query(Answer).filter(Answer.problem_id == problem.id).all()
+        problem_data = {
+            'id': problem.id,
+            'question': tech_interview.question,
+            'ai_answer': tech_interview.ai_answer,
+            'tech_class': tech_interview.tech_class_enum.name if tech_interview.tech_class_enum else None,
+            'answers': []
+        }
+        for answer in answers:
+            participant = answer.participant
+            problem_data['answers'].append({
+                'answer_id': answer.id,
+                'participant_id': participant.id,
+                'nickname': participant.nickname,
+                'answer': answer.answer,
+                'feedback': answer.feedback,
+                'rank_score': answer.rank_score
+            })
+        problems_data.append(problem_data)
+    return problems_data
+
+
+LOADERS = {
+    "legacy": legacy_get_problems_data,
+    "snapshot": _load_problems_data,
+}
+
+
+def measure(engine, session_factory, contest_id, loader_name, rtt, repeat):
+    counter = QueryCounter(engine, rtt=rtt)
+    durations = []
+    queries = 0
+    result = None
+    for _ in range(repeat):
+        db = session_factory()
+        counter.reset()
+        start_time = time.perf_counter()
+        result = LOADERS[loader_name](db, contest_id)
+        durations.append(time.perf_counter() - start_time)
+        queries = counter.count
+        db.close()
+    counter.close()
+    durations.sort()
+    return result, {
+        "loader": loader_name,
+        "queries": queries,
+        "median_ms": round(durations[len(durations) // 2] * 1000, 2),
+        "answers": sum(len(p['answers']) for p in result),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콘테스트 로더 벤치마크")
+    parser.add_argument("--problems", type=int, default=10)
+    parser.add_argument("--participants", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="쿼리당 흉내낼 왕복 지연(ms)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine, db = create_sqlite_session()
+    contest_id = seed_contest(db, problems=args.problems, participants=args.participants)
+    db.close()
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    results = {}
+    for loader_name in LOADERS:
+        data, report = measure(engine, session_factory, contest_id, loader_name, args.rtt_ms / 1000, args.repeat)
+        results[loader_name] = data
+        print(json.dumps(report, ensure_ascii=False))
+
+    if results["legacy"] != results["snapshot"]:
+        raise SystemExit("로더 결과가 일치하지 않습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# benchmarks/db_stats.py
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수를 세고, 필요하면 왕복 지연을 흉내낸다.
+
+    SQLite 는 네트워크 왕복이 없으므로 rtt 를 주면 실행마다 그만큼 sleep 하여
+    MySQL 원격 서버에서의 round-trip 비용을 근사한다.
+    """
+
+    def __init__(self, engine: Engine, rtt: float = 0.0):
+        self.engine = engine
+        self.rtt = rtt
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def reset(self):
+        self.count = 0
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
@@ -0,0 +1,106 @@
+# benchmarks/evaluation_concurrency.py
+"""평가 엔진 동시성 회귀 벤치마크
+
+고정 지연 시간의 가짜 LLM 으로 N개의 답변을 채점했을 때 병렬 엔진이
+대략 ceil(N / limit) 번의 왕복 시간 안에 끝나는지 확인한다.
+적응형 제한기는 --limit 값으로 고정해 예전 고정 세마포어 기준과 같은 조건에서 측정한다.
+
+실행: python -m benchmarks.evaluation_concurrency --answers 40 --limit 10 --latency 0.2
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import math
+import time
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.llm_config import LLM_CONCURRENCY_CONFIG
+from app.utils import adaptive_limiter
+from app.services.interview import evaluation_core
+from app.services.interview import evaluate
+
+# app.chain 패키지가 같은 이름의 체인 객체를 re-export 하므로 모듈은 직접 가져온다.
+evaluate_chain_module = importlib.import_module("app.chain.evaluate_chain")
+
+ENGINES = {
+    "sequential": evaluate.evaluate_contest_answers_sequential,
+    "parallel": evaluate.evaluate_contest_answers_parallel,
+    "parallel_1": evaluate.evaluate_contest_answers_parallel_1,
+}
+
+
+def install_fake_llm(latency: float) -> FakeChatModel:
+    """평가 체인의 LLM 을 가짜 모델로 교체 (프롬프트/파서는 그대로 사용)"""
+    fake_llm = FakeChatModel(latency=latency)
+    evaluation_core.chain = evaluate_chain_module.prompt | fake_llm | evaluate_chain_module.parser
+    return fake_llm
+
+
+def pin_concurrency(limit: int):
+    """적응형 제한기를 고정 limit 로 설정 (이미 만들어진 제한기는 폐기)"""
+    LLM_CONCURRENCY_CONFIG.update(INITIAL_LIMIT=limit, MIN_LIMIT=limit, MAX_LIMIT=limit)
+    adaptive_limiter._limiters.clear()
+
+
+async def run(engine_name: str, answers: int, limit: int, latency: float) -> dict:
+    pin_concurrency(limit)
+    fake_llm = install_fake_llm(latency)
+
+    _, db = create_sqlite_session()
+    problems = max(1, answers // 10)
+    contest_id = seed_contest(db, problems=problems, participants=math.ceil(answers / problems))
+    total = problems * math.ceil(answers / problems)
+
+    start_time = time.perf_counter()
+    results = await ENGINES[engine_name](db, contest_id)
+    duration = time.perf_counter() - start_time
+    db.close()
+
+    round_trips = duration / latency
+    expected = total if engine_name == "sequential" else math.ceil(total / limit)
+    return {
+        "engine": engine_name,
+        "answers": total,
+        "concurrent_limit": limit,
+        "latency": latency,
+        "llm_calls": fake_llm.calls,
+        "evaluated": len(results),
+        "duration": round(duration, 3),
+        "round_trips": round(round_trips, 2),
+        "expected_round_trips": expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="평가 엔진 동시성 벤치마크")
+    parser.add_argument("--answers", type=int, default=40)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--engines", default="parallel,parallel_1,sequential")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="병렬 엔진 왕복 횟수가 기대값의 몇 배를 넘으면 실패로 볼지")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    reports = []
+    for engine_name in args.engines.split(","):
+        report = asyncio.run(run(engine_name, args.answers, args.limit, args.latency))
+        reports.append(report)
+        print(json.dumps(report, ensure_ascii=False))
+
+    regressions = [
+        r for r in reports
+        if r["engine"] != "sequential" and r["round_trips"] > r["expected_round_trips"] * args.tolerance
+    ]
+    if regressions:
+        raise SystemExit(f"동시성 회귀 감지: {[r['engine'] for r in regressions]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/fair_scheduler.py
+"""콘테스트 간 공정 스케줄링 벤치마크
+
+큰 콘테스트(--large 답변)를 먼저 채점하기 시작한 직후 작은 콘테스트(--small 답변)를 요청했을 때
+작은 콘테스트가 끝나기까지 걸리는 시간을 비교한다.
+
+- fifo: 모든 콘테스트가 하나의 흐름으로 줄을 섬 (기존 동작: 큰 콘테스트 뒤에 갇힘)
+- fair: 콘테스트별 흐름으로 번갈아 슬롯을 받음
+
+실행: python -m benchmarks.fair_scheduler --large 400 --small 20 --limit 10 --latency 0.1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.evaluation_concurrency import install_fake_llm, pin_concurrency
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.services.interview import evaluate
+from app.tasks import evaluation_scheduler
+
+
+def fifo_slots(limiter_name, contest_id, space_id=None, priority=0):
+    """모든 콘테스트를 같은 흐름으로 묶어 선착순으로만 슬롯을 받게 함"""
+    slots = evaluation_scheduler.contest_slots(limiter_name, contest_id, space_id, priority)
+    slots.space_id = slots.contest_id = None
+    return slots
+
+
+async def timed(engine, db, contest_id, space_id, start_time) -> float:
+    await engine(db, contest_id, space_id=space_id)
+    return time.perf_counter() - start_time
+
+
+async def run(mode: str, args) -> dict:
+    pin_concurrency(args.limit)
+    install_fake_llm(args.latency)
+    # 문제별 워밍업은 큰 콘테스트의 대기열 순서를 바꾸므로 스케줄러만 비교하도록 끔
+    EVALUATION_CONFIG['PREFIX_WARMUP'] = "off"
+    evaluate.contest_slots = fifo_slots if mode == "fifo" else evaluation_scheduler.contest_slots
+
+    engine, db = create_sqlite_session()
+    large_id = seed_contest(db, contest_id=1, space_id=1, problems=10, participants=math.ceil(args.large / 10))
+    small_id = seed_contest(db, contest_id=2, space_id=2, problems=1, participants=args.small)
+    small_db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    engine_fn = evaluate.evaluate_contest_answers_parallel
+    start_time = time.perf_counter()
+    large_task = asyncio.create_task(timed(engine_fn, db, large_id, 1, start_time))
+    # 큰 콘테스트가 대기열을 먼저 채우도록 한 틱 양보
+    await asyncio.sleep(args.latency / 2)
+    small_duration = await timed(engine_fn, small_db, small_id, 2, start_time)
+    large_duration = await large_task
+    db.close()
+    small_db.close()
+
+    return {
+        "mode": mode,
+        "large_answers": args.large,
+        "small_answers": args.small,
+        "concurrent_limit": args.limit,
+        "small_finished_at": round(small_duration, 2),
+        "large_finished_at": round(large_duration, 2),
+        "small_ideal": round(math.ceil(args.small / args.limit) * args.latency, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콘테스트 간 공정 스케줄링 벤치마크")
+    parser.add_argument("--large", type=int, default=400)
+    parser.add_argument("--small", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--modes", default="fifo,fair")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    for mode in args.modes.split(","):
+        print(json.dumps(asyncio.run(run(mode, args)), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
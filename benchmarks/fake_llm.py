@@ -0,0 +1,266 @@
+# benchmarks/fake_llm.py
+import asyncio
+import json
+import random
+import re
+import time
+import zlib
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+# 파서가 거부하는 깨진 응답 (모델이 JSON 형식을 지키지 않은 경우 흉내)
+MALFORMED_RESPONSE = "죄송합니다. 요청하신 형식으로 평가를 작성하지 못했습니다."
+
+
+def damage_json(content: str, rng: random.Random) -> str:
+    """로컬 복구로 고칠 수 있는 흔한 형식 결함 하나를 JSON 응답에 입힘"""
+    defect = rng.choice(["fence", "trailing_comma", "single_quote", "score_text"])
+    if defect == "fence":
+        return f"평가 결과입니다.\n```json\n{content}\n```\n참고 부탁드립니다."
+    if defect == "trailing_comma":
+        return re.sub(r"}(\s*[\]}]?)\s*$", r",}\1", content.rstrip(), count=1).replace("}]", "},]")
+    if defect == "single_quote":
+        return content.replace("'", "").replace('"', "'")
+    return re.sub(r'"score": (\d+)', r'"score": "\1점"', content)
+
+
+def default_evaluation_response(prompt: str) -> str:
+    """평가 체인용 고정 응답"""
+    return json.dumps({"score": 80, "feedback": "핵심 개념을 잘 설명했습니다."}, ensure_ascii=False)
+
+
+def batch_evaluation_response(prompt: str) -> str:
+    """배치 평가 체인용 응답: 프롬프트에 포함된 answer_id 마다 결과 하나씩"""
+    answer_ids = [int(answer_id) for answer_id in re.findall(r"\[answer_id=(\d+)\]", prompt)]
+    return json.dumps({
+        "evaluations": [
+            {"answer_id": answer_id, "score": 80, "feedback": "핵심 개념을 잘 설명했습니다."}
+            for answer_id in answer_ids
+        ]
+    }, ensure_ascii=False)
+
+
+def cascade_evaluation_responder(clear_rate: float) -> Callable[[str], str]:
+    """2단계 평가의 1차(작은 모델) 응답
+
+    clear_rate 비율의 답변은 점수가 분명한(매우 높거나 낮은) 확신도 높은 결과를,
+    나머지는 경계 점수와 낮은 확신도를 돌려준다. 같은 프롬프트에는 항상 같은 결과를 낸다.
+    """
+    def respond(prompt: str) -> str:
+        bucket = zlib.crc32(prompt.encode("utf-8")) % 1000 / 1000
+        if bucket < clear_rate:
+            score = 95 if bucket < clear_rate / 2 else 5
+            result = {"score": score, "feedback": "점수가 분명한 답변입니다.", "confidence": 0.95}
+        else:
+            result = {"score": 60, "feedback": "일부 개념이 부정확합니다.", "confidence": 0.5}
+        return json.dumps(result, ensure_ascii=False)
+    return respond
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정 (ASCII 4자당 1토큰, 그 외 문자는 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+class PromptCache:
+    """provider 프롬프트 캐시 흉내
+
+    OpenAI 처럼 1024 토큰 이상인 접두사를 128 토큰 단위로 캐시하며, 요청이 처리된 뒤에야 캐시에 들어간다
+    (동시에 보낸 같은 접두사 요청은 모두 캐시를 놓친다).
+    """
+    MIN_TOKENS = 1024
+    BLOCK_TOKENS = 128
+
+    def __init__(self):
+        self.prefixes = set()
+
+    def _boundaries(self, prompt: str) -> List[tuple]:
+        boundaries = []
+        tokens = 0.0
+        next_boundary = self.MIN_TOKENS
+        for index, ch in enumerate(prompt):
+            tokens += 0.25 if ord(ch) < 128 else 1
+            if tokens >= next_boundary:
+                boundaries.append((next_boundary, index + 1))
+                next_boundary += self.BLOCK_TOKENS
+        return boundaries
+
+    def lookup(self, prompt: str) -> int:
+        """캐시에서 읽히는 접두사 토큰 수"""
+        cached = 0
+        for tokens, end in self._boundaries(prompt):
+            if hash(prompt[:end]) not in self.prefixes:
+                break
+            cached = tokens
+        return cached
+
+    def store(self, prompt: str):
+        for _, end in self._boundaries(prompt):
+            self.prefixes.add(hash(prompt[:end]))
+
+
+class FakeRateLimitError(Exception):
+    """openai.RateLimitError 처럼 status_code 429 를 가지는 오류"""
+    status_code = 429
+
+
+class FakeServerError(Exception):
+    """openai.InternalServerError 처럼 status_code 500 을 가지는 일시적 오류"""
+    status_code = 500
+
+
+class FakeChatModel(BaseChatModel):
+    """지연 시간/오류율을 조절할 수 있는 가짜 채팅 모델
+
+    동기 호출(`invoke`)은 time.sleep 으로, 비동기 호출(`ainvoke`)은 asyncio.sleep 으로 지연되므로
+    이벤트 루프 블로킹 여부를 그대로 재현한다.
+    capacity 를 지정하면 동시 호출이 그 수를 넘을 때 429 오류를 낸다 (provider 쿼터 흉내).
+
+    latency_distribution:
+        fixed: 항상 latency / uniform: latency 의 0.5~1.5배 /
+        exponential: 평균 latency / lognormal: 중앙값 latency, 긴 꼬리
+    error_rate 확률로 500 오류를, malformed_rate 확률로 JSON 이 아닌 응답을,
+    repairable_rate 확률로 로컬 복구가 가능한 결함(코드 펜스, 끝 쉼표 등)이 있는 JSON 을 돌려준다.
+    prompt_cache 를 켜면 provider 접두사 캐시를 흉내 내 usage_metadata 에 cache_read 토큰을 채운다.
+    model_name 을 주면 사용량 콜백이 그 모델의 가격으로 비용을 계산한다.
+    seed 를 주면 같은 순서의 호출에 같은 지연/오류가 재현된다.
+    스트리밍(`astream`)은 지연의 first_token_ratio 만큼 기다린 뒤 나머지 지연 동안 stream_chunks 조각으로 나눠 보낸다.
+    """
+    latency: float = 0.5
+    first_token_ratio: float = 0.1
+    stream_chunks: int = 20
+    latency_distribution: str = "fixed"
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    repairable_rate: float = 0.0
+    prompt_cache: bool = False
+    model_name: str = "fake-chat"
+    seed: Optional[int] = None
+    responder: Callable[[str], str] = default_evaluation_response
+    calls: int = 0
+    capacity: Optional[int] = None
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    malformed: int = 0
+    damaged: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    _random: Optional[random.Random] = PrivateAttr(default=None)
+    _cache: PromptCache = PrivateAttr(default_factory=PromptCache)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> dict:
+        # 사용량 콜백이 model_name 으로 가격표를 찾을 수 있게 함
+        return {"model_name": self.model_name}
+
+    @property
+    def rng(self) -> random.Random:
+        if self._random is None:
+            self._random = random.Random(self.seed)
+        return self._random
+
+    def sample_latency(self) -> float:
+        if self.latency_distribution == "uniform":
+            return self.latency * self.rng.uniform(0.5, 1.5)
+        if self.latency_distribution == "exponential":
+            return self.rng.expovariate(1 / self.latency) if self.latency > 0 else 0.0
+        if self.latency_distribution == "lognormal":
+            return self.latency * self.rng.lognormvariate(0, 0.6)
+        return self.latency
+
+    @staticmethod
+    def _prompt(messages: List[BaseMessage]) -> str:
+        return "\n".join(str(m.content) for m in messages)
+
+    def _cache_lookup(self, messages: List[BaseMessage]) -> int:
+        return self._cache.lookup(self._prompt(messages)) if self.prompt_cache else 0
+
+    def _respond(self, messages: List[BaseMessage], cached_tokens: int = 0) -> ChatResult:
+        self.calls += 1
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors += 1
+            raise FakeServerError("The server had an error while processing your request")
+
+        prompt = self._prompt(messages)
+        if self.prompt_cache:
+            self._cache.store(prompt)
+        if self.malformed_rate and self.rng.random() < self.malformed_rate:
+            self.malformed += 1
+            content = MALFORMED_RESPONSE
+        else:
+            content = self.responder(prompt)
+            if self.repairable_rate and self.rng.random() < self.repairable_rate:
+                self.damaged += 1
+                content = damage_json(content, self.rng)
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(content)
+        self.prompt_tokens += input_tokens
+        self.completion_tokens += output_tokens
+        self.cached_tokens += cached_tokens
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_token_details": {"cache_read": cached_tokens}
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        cached_tokens = self._cache_lookup(messages)
+        time.sleep(self.sample_latency())
+        return self._respond(messages, cached_tokens)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.capacity is not None and self.in_flight > self.capacity:
+                self.rate_limited += 1
+                await asyncio.sleep(self.latency / 10)
+                raise FakeRateLimitError("Rate limit reached for requests")
+            cached_tokens = self._cache_lookup(messages)
+            await asyncio.sleep(self.sample_latency())
+            return self._respond(messages, cached_tokens)
+        finally:
+            self.in_flight -= 1
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            cached_tokens = self._cache_lookup(messages)
+            latency = self.sample_latency()
+            await asyncio.sleep(latency * self.first_token_ratio)
+            message = self._respond(messages, cached_tokens).generations[0].message
+            content = message.content
+            size = max(1, -(-len(content) // self.stream_chunks))
+            pieces = [content[start:start + size] for start in range(0, len(content), size)] or [""]
+            for index, piece in enumerate(pieces):
+                if index:
+                    await asyncio.sleep(latency * (1 - self.first_token_ratio) / len(pieces))
+                last = index == len(pieces) - 1
+                chunk = ChatGenerationChunk(
+                    message=AIMessageChunk(content=piece, usage_metadata=message.usage_metadata if last else None)
+                )
+                if run_manager:
+                    await run_manager.on_llm_new_token(piece, chunk=chunk)
+                yield chunk
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,75 @@
+# benchmarks/generated_testcase.py
+"""대용량 테스트 케이스 생성 스크립트 모드 벤치마크
+
+N 별로 생성 스크립트 -> 예시 솔루션 -> ZIP 스트리밍에 걸리는 시간과 Python 쪽 추가 메모리 최대치
+(tracemalloc), 그리고 같은 입력을 LLM 이 직접 썼다면 필요한 출력 토큰 수(추정)를 비교한다.
+
+실행: python -m benchmarks.generated_testcase --sizes 100000,1000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+
+# 이 파일에 적힌 코드만 실행하므로 격리 없이 실행 허용 (TESTCASE_SANDBOX_JAIL=unshare 로 격리 비용도 잴 수 있음)
+os.environ.setdefault("TESTCASE_TRUSTED_SOLUTIONS", "true")
+
+from benchmarks.fake_llm import estimate_tokens
+from app.schemas.coding_test import GeneratedTestCase
+from app.services.coding_test.generator import generated_case_files
+from app.services.coding_test.testcase_zip import aiter_test_case_zip
+
+GENERATOR = """import sys, random
+random.seed(int(sys.argv[1]))
+n = {n}
+sys.stdout.write(str(n) + "\\n" + " ".join(str(random.randint(1, 10 ** 9)) for _ in range(n)) + "\\n")
+"""
+
+SOLUTION = """#include <stdio.h>
+int main() {
+    int n; long long x, s = 0;
+    scanf("%d", &n);
+    for (int i = 0; i < n; i++) { scanf("%lld", &x); s += x; }
+    printf("%lld\\n", s);
+}
+"""
+
+
+async def run(n: int):
+    code = GENERATOR.format(n=n)
+    case = GeneratedTestCase(code=code, seed=1, name="11")
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    zip_bytes = 0
+    async for chunk in aiter_test_case_zip([], generated_case_files([case], {"language": "C", "code": SOLUTION})):
+        zip_bytes += len(chunk)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # LLM 이 입력을 직접 쓰는 경우: 숫자 평균 10자리 + 공백 (대략 1토큰/4자)
+    inline_tokens = estimate_tokens("1000000000 " * n)
+    return {
+        "n": n,
+        "seconds": round(elapsed, 2),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "zip_mb": round(zip_bytes / 1024 / 1024, 2),
+        "generator_tokens": estimate_tokens(code),
+        "inline_tokens": inline_tokens
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 테스트 케이스 생성 스크립트 모드 벤치마크")
+    parser.add_argument("--sizes", default="100000,1000000")
+    args = parser.parse_args()
+    for n in [int(value) for value in args.sizes.split(",")]:
+        print(json.dumps(asyncio.run(run(n))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# benchmarks/harness.py
+"""평가 엔진 오프라인 비교 하네스
+
+OpenAI/MySQL 없이 SQLite 에 합성 콘테스트(문제 x 참가자 x 답변 길이)를 만들고,
+지연 분포/오류율/깨진 응답 비율을 조절할 수 있는 가짜 LLM 으로 각 엔진을 실행한다.
+엔진마다 새 프로세스에서 돌려 peak RSS 가 서로 섞이지 않게 하고, 결과는 JSON 리포트로 남긴다.
+
+리포트 항목 (엔진별):
+- answers_per_sec: 채점 완료 답변 수 / 전체 소요 시간
+- answer_latency_*: 실행 시작부터 각 답변 채점 완료까지 걸린 시간 (대기/재시도 포함)
+- llm_call_latency_*: LLM 호출 한 번의 소요 시간 (성공/실패 모두)
+- escalation_rate: 2단계 평가(엔진 이름:cascade)에서 큰 모델로 재평가한 비율
+- llm_cost_usd / cost_per_answer_usd: 사용량 콜백이 가격표로 계산한 예상 비용 (전체 / 채점 답변당)
+- cached_token_ratio: 프롬프트 토큰 중 provider 접두사 캐시에서 읽힌 비율 (--prompt-cache)
+- llm_retries_avoided: 깨진 응답을 로컬 JSON 복구로 고쳐 아낀 LLM 재호출 수
+- db_round_trips: 실행된 SQL 문 수
+- peak_rss_mb: 엔진 실행 프로세스의 최대 RSS
+
+--cassette 를 주면 가짜 LLM 대신 실제 체인을 녹화 파일로 재생(replay)하거나 실제 API 호출을 녹화(record)한다.
+
+실행: python -m benchmarks.harness --problems 10 --participants 50 --latency 0.05 \\
+          --latency-dist lognormal --error-rate 0.02 --malformed-rate 0.02 --repairable-rate 0.1 \\
+          --output report.json
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from sqlalchemy import func
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.db_stats import QueryCounter
+from benchmarks.evaluation_concurrency import pin_concurrency
+from benchmarks.fake_llm import FakeChatModel, batch_evaluation_response, cascade_evaluation_responder
+from benchmarks.health_latency import percentile
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.config.llm_config import LLM_CASSETTE_CONFIG
+from app.db.mysql.models import Answer, Problem
+from app.metrics import EVALUATION_CASCADE_COUNTER, LLM_RETRY_AVOIDED_COUNTER
+from app.services.interview import evaluate, evaluation_core
+from app.tasks import batch_evaluation_task, evaluation_task
+from app.utils.llm_usage import summarize as summarize_usage, usage_callbacks, usage_store
+
+evaluate_chain_module = importlib.import_module("app.chain.evaluate_chain")
+batch_chain_module = importlib.import_module("app.chain.batch_evaluate_chain")
+cascade_chain_module = importlib.import_module("app.chain.cascade_evaluate_chain")
+
+ENGINES = {
+    "sequential": evaluate.evaluate_contest_answers_sequential,
+    "parallel": evaluate.evaluate_contest_answers_parallel,
+    "parallel_1": evaluate.evaluate_contest_answers_parallel_1,
+    "batched": evaluate.evaluate_contest_answers_batched,
+}
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (Linux 는 KB, macOS 는 byte 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(prefix: str, samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {f"{prefix}_p50_ms": None, f"{prefix}_p95_ms": None, f"{prefix}_p99_ms": None}
+    return {
+        f"{prefix}_p50_ms": round(statistics.median(samples) * 1000, 2),
+        f"{prefix}_p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+        f"{prefix}_p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+    }
+
+
+def counter_totals(counter) -> Dict[tuple, float]:
+    """Prometheus Counter 의 라벨 조합별 누적값"""
+    return {
+        tuple(sample.labels.values()): sample.value
+        for metric in counter.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_total")
+    }
+
+
+def retries_avoided() -> int:
+    """로컬 JSON 복구로 아낀 LLM 재호출 수 (모든 체인 합계)"""
+    return int(sum(counter_totals(LLM_RETRY_AVOIDED_COUNTER).values()))
+
+
+def escalation_rate() -> float:
+    """2단계 평가에서 큰 모델로 재평가한 비율 (1차 평가가 없었으면 None)"""
+    outcomes = counter_totals(EVALUATION_CASCADE_COUNTER)
+    total = sum(outcomes.values())
+    if not total:
+        return None
+    return round(1 - outcomes.get(("accepted",), 0) / total, 3)
+
+
+class LatencyRecorder:
+    """엔진이 부르는 평가 함수를 감싸 호출 지연과 답변별 완료 시각을 기록"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.call_latencies: List[float] = []
+        self.answer_latencies: List[float] = []
+
+    def install(self):
+        single, batch = evaluation_core.evaluate_answer, evaluation_core.evaluate_answers_batch
+
+        async def timed_single(*args, **kwargs):
+            call_start = time.perf_counter()
+            try:
+                result = await single(*args, **kwargs)
+            finally:
+                self.call_latencies.append(time.perf_counter() - call_start)
+            self.answer_latencies.append(time.perf_counter() - self.started)
+            return result
+
+        async def timed_batch(*args, **kwargs):
+            call_start = time.perf_counter()
+            try:
+                results, usage = await batch(*args, **kwargs)
+            finally:
+                self.call_latencies.append(time.perf_counter() - call_start)
+            self.answer_latencies.extend([time.perf_counter() - self.started] * len(results))
+            return results, usage
+
+        # 각 모듈이 이름으로 import 했으므로 사용처의 참조를 바꾼다
+        evaluate.evaluate_answer = timed_single
+        evaluation_task.evaluate_answer = timed_single
+        batch_evaluation_task.evaluate_answers_batch = timed_batch
+
+
+def build_llm(args: dict, **overrides) -> FakeChatModel:
+    params = dict(
+        latency=args["latency"],
+        latency_distribution=args["latency_dist"],
+        error_rate=args["error_rate"],
+        malformed_rate=args["malformed_rate"],
+        repairable_rate=args["repairable_rate"],
+        prompt_cache=args["prompt_cache"],
+        seed=args["seed"],
+    )
+    params.update(overrides)
+    return FakeChatModel(**params)
+
+
+async def run_engine_async(engine_spec: str, args: dict) -> dict:
+    logging.getLogger().setLevel(logging.CRITICAL)
+    pin_concurrency(args["limit"])
+    EVALUATION_CONFIG['RETRY_BASE_DELAY'] = args["retry_delay"]
+    EVALUATION_CONFIG['BATCH_EVAL_SIZE'] = args["batch_size"]
+    EVALUATION_CONFIG['PREFIX_WARMUP'] = args["prefix_warmup"]
+
+    engine_name, _, variant = engine_spec.partition(":")
+    EVALUATION_CONFIG['CASCADE'] = variant == "cascade"
+
+    # 사용량 콜백을 붙여 실제 체인과 같은 방식으로 비용을 집계
+    fake_llm = build_llm(args, model_name="gpt-4.1", callbacks=usage_callbacks("evaluate"))
+    batch_llm = build_llm(
+        args,
+        responder=batch_evaluation_response,
+        model_name="gpt-4.1",
+        callbacks=usage_callbacks("batch_evaluate")
+    )
+    cascade_llm = build_llm(
+        args,
+        responder=cascade_evaluation_responder(args["cascade_clear_rate"]),
+        latency=args["cascade_latency"],
+        model_name=EVALUATION_CONFIG['CASCADE_MODEL'],
+        callbacks=usage_callbacks("evaluate_cascade")
+    )
+    if args["cassette"]:
+        # 체인은 그대로 두고 RateLimitedChatOpenAI 가 녹화 파일을 사용
+        LLM_CASSETTE_CONFIG.update(
+            MODE=args["cassette_mode"],
+            PATH=args["cassette"],
+            REPLAY_LATENCY_SCALE=args["replay_latency"]
+        )
+    else:
+        evaluation_core.chain = evaluate_chain_module.prompt | fake_llm | evaluate_chain_module.parser
+        evaluation_core.batch_chain = batch_chain_module.prompt | batch_llm
+        evaluation_core.cascade_chain = cascade_chain_module.prompt | cascade_llm | cascade_chain_module.parser
+
+    engine, db = create_sqlite_session()
+    contest_id = seed_contest(
+        db,
+        problems=args["problems"],
+        participants=args["participants"],
+        answer_length=args["answer_length"],
+        answer_length_max=args["answer_length_max"],
+        seed=args["seed"]
+    )
+    baseline_rss = peak_rss_mb()
+
+    counter = QueryCounter(engine, rtt=args["rtt_ms"] / 1000)
+    recorder = LatencyRecorder()
+    recorder.install()
+    await ENGINES[engine_name](db, contest_id)
+    duration = time.perf_counter() - recorder.started
+    counter.close()
+
+    evaluated = (
+        db.query(func.count(Answer.id))
+        .join(Problem, Answer.problem_id == Problem.id)
+        .filter(Problem.contest_id == contest_id, Answer.feedback.isnot(None))
+        .scalar()
+    )
+    total = args["problems"] * args["participants"]
+    db.close()
+
+    fakes = (fake_llm, batch_llm, cascade_llm)
+    llm_calls = sum(llm.calls for llm in fakes)
+    prompt_tokens = sum(llm.prompt_tokens for llm in fakes)
+    cached_tokens = sum(llm.cached_tokens for llm in fakes)
+    cost = summarize_usage(usage_store.rows(1), group_by=())["total"]["cost_usd"]
+    return {
+        "engine": engine_spec,
+        "answers": total,
+        "evaluated": evaluated,
+        "failed": total - evaluated,
+        "duration": round(duration, 3),
+        "answers_per_sec": round(evaluated / duration, 2) if duration else None,
+        **summarize("answer_latency", recorder.answer_latencies),
+        **summarize("llm_call_latency", recorder.call_latencies),
+        "llm_calls": llm_calls,
+        "llm_errors": sum(llm.errors for llm in fakes),
+        "llm_malformed": sum(llm.malformed for llm in fakes),
+        "llm_repairable": sum(llm.damaged for llm in fakes),
+        "llm_retries_avoided": retries_avoided(),
+        "escalation_rate": escalation_rate(),
+        "llm_cost_usd": round(cost, 6),
+        "cost_per_answer_usd": round(cost / evaluated, 6) if evaluated else None,
+        "cached_token_ratio": round(cached_tokens / prompt_tokens, 3) if prompt_tokens else None,
+        "db_round_trips": counter.count,
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_engine(engine_spec: str, args: dict) -> dict:
+    return asyncio.run(run_engine_async(engine_spec, args))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="평가 엔진 오프라인 비교 하네스")
+    parser.add_argument("--engines", default="sequential,parallel,parallel_1,batched",
+                        help="엔진 목록. 이름 뒤에 :cascade 를 붙이면 2단계 평가로 실행 (예: parallel,parallel:cascade)")
+    parser.add_argument("--problems", type=int, default=10)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--answer-length", type=int, default=300)
+    parser.add_argument("--answer-length-max", type=int, default=None,
+                        help="주면 답변 길이를 answer-length ~ answer-length-max 에서 무작위 선택")
+    parser.add_argument("--latency", type=float, default=0.05, help="LLM 지연 (분포의 평균/중앙값, 초)")
+    parser.add_argument("--latency-dist", default="fixed", choices=["fixed", "uniform", "exponential", "lognormal"])
+    parser.add_argument("--error-rate", type=float, default=0.0, help="LLM 호출이 500 오류로 끝날 확률")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="LLM 이 JSON 이 아닌 응답을 낼 확률")
+    parser.add_argument("--repairable-rate", type=float, default=0.0,
+                        help="LLM 이 로컬 복구 가능한 결함(코드 펜스, 끝 쉼표 등)이 있는 JSON 을 낼 확률")
+    parser.add_argument("--prompt-cache", action="store_true",
+                        help="가짜 LLM 이 provider 접두사 캐시를 흉내 내 cached_token_ratio 를 보고")
+    parser.add_argument("--prefix-warmup", default=EVALUATION_CONFIG['PREFIX_WARMUP'], choices=["auto", "on", "off"])
+    parser.add_argument("--cascade-latency", type=float, default=0.02, help="2단계 평가의 1차(작은 모델) 지연")
+    parser.add_argument("--cascade-clear-rate", type=float, default=0.7,
+                        help="1차 평가에서 점수가 분명해 그대로 채택될 답변 비율")
+    parser.add_argument("--limit", type=int, default=10, help="고정 동시성 limit")
+    parser.add_argument("--batch-size", type=int, default=EVALUATION_CONFIG['BATCH_EVAL_SIZE'])
+    parser.add_argument("--retry-delay", type=float, default=1.2, help="재시도 지수 백오프 밑 (초)")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="SQL 문마다 더할 DB 왕복 지연")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cassette", default=None, help="LLM 녹화 파일 경로 (주면 가짜 LLM 대신 사용)")
+    parser.add_argument("--cassette-mode", default="replay", choices=["record", "replay"])
+    parser.add_argument("--replay-latency", type=float, default=1.0, help="재생 시 녹화 지연에 곱할 값")
+    parser.add_argument("--output", default=None, help="JSON 리포트 저장 경로")
+    args = parser.parse_args()
+
+    config = {key: value for key, value in vars(args).items() if key not in ("engines", "output")}
+    results = []
+    for engine_name in args.engines.split(","):
+        # 엔진마다 새 프로세스를 띄워 peak RSS 와 전역 상태(제한기, 체인 교체)를 분리
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            result = pool.submit(run_engine, engine_name, config).result()
+        results.append(result)
+        print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "config": config,
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/health_latency.py
+"""대회 채점 중 /health 응답 지연 벤치마크
+
+가짜 LLM 으로 큰 콘테스트를 채점하는 동안 같은 이벤트 루프에서 /api/v1/health 를
+주기적으로 호출하여, 동기 Session(스레드 오프로딩)과 AsyncSession 두 경로 모두에서
+응답 지연이 유휴 상태와 비슷하게 유지되는지 확인한다.
+
+aiosqlite 가 필요하다: pip install aiosqlite
+실행: python -m benchmarks.health_latency --problems 10 --participants 100 --limit 20 --latency 0.05
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from benchmarks.evaluation_concurrency import install_fake_llm, pin_concurrency
+from benchmarks.seed import seed_contest
+
+from app.api.routes.metrics import router as metrics_router
+from app.db.mysql.models import Base, Answer
+from app.services.interview.evaluate import evaluate_contest_answers_parallel
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, interval: float):
+    samples = []
+    while not stop.is_set():
+        start_time = time.perf_counter()
+        response = await client.get("/api/v1/health")
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start_time) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def run(mode: str, db_path: str, contest_id: int, interval: float, idle_seconds: float) -> dict:
+    probe_app = FastAPI()
+    probe_app.include_router(metrics_router)
+    transport = httpx.ASGITransport(app=probe_app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_health(client, stop, interval))
+        start_time = time.perf_counter()
+        evaluated = 0
+
+        if mode == "idle":
+            await asyncio.sleep(idle_seconds)
+        elif mode == "sync":
+            engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+            db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+            # 모드마다 같은 DB 파일을 쓰므로 이전 모드의 채점 결과를 지우고 다시 채점
+            evaluated = len(await evaluate_contest_answers_parallel(db, contest_id, force=True))
+            db.close()
+            engine.dispose()
+        else:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+            async with async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as db:
+                evaluated = len(await evaluate_contest_answers_parallel(db, contest_id, force=True))
+            await engine.dispose()
+
+        duration = time.perf_counter() - start_time
+        stop.set()
+        samples = await probe
+
+    return {
+        "mode": mode,
+        "evaluated": evaluated,
+        "duration": round(duration, 2),
+        "health_requests": len(samples),
+        "health_p50_ms": round(statistics.median(samples), 2),
+        "health_p95_ms": round(percentile(samples, 0.95), 2),
+        "health_p99_ms": round(percentile(samples, 0.99), 2),
+        "health_max_ms": round(max(samples), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채점 중 /health 지연 벤치마크")
+    parser.add_argument("--problems", type=int, default=10)
+    parser.add_argument("--participants", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--interval", type=float, default=0.01, help="health 호출 간격(초)")
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    pin_concurrency(args.limit)
+    install_fake_llm(args.latency)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "benchmark.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        contest_id = seed_contest(db, problems=args.problems, participants=args.participants)
+
+        for mode in ["idle", "sync", "async"]:
+            # 이전 모드의 채점 결과 초기화
+            db.execute(update(Answer).values(feedback=None, rank_score=0))
+            db.commit()
+            print(json.dumps(asyncio.run(run(mode, db_path, contest_id, args.interval, args.idle_seconds)), ensure_ascii=False))
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
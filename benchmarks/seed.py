@@ -0,0 +1,73 @@
+# benchmarks/seed.py
+import random
+from typing import Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.mysql.models import Base, Contest, Problem, Participant, Answer, TechInterview
+
+
+def create_sqlite_session(url: str = "sqlite://") -> Tuple[Engine, Session]:
+    """MySQL 대용 SQLite 세션 생성 (스레드 간 공유 가능하도록 StaticPool 사용)"""
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def seed_contest(
+    db: Session,
+    contest_id: int = 1,
+    space_id: int = 1,
+    problems: int = 10,
+    participants: int = 20,
+    answer_length: int = 300,
+    answer_length_max: Optional[int] = None,
+    seed: int = 0
+) -> int:
+    """문제 x 참가자 수만큼 답변이 채워진 콘테스트 생성
+
+    answer_length_max 를 주면 답변 길이를 answer_length ~ answer_length_max 사이에서 고르게 뽑는다.
+    SQLite 는 BIGINT 기본키를 자동 증가시키지 않으므로 id 를 직접 지정한다.
+    """
+    base = contest_id * 1_000_000
+    db.add(Contest(id=contest_id, space_id=space_id, submit=1, title=f"benchmark-{contest_id}"))
+
+    for p in range(problems):
+        tech_interview_id = base + p + 1
+        db.add(TechInterview(
+            id=tech_interview_id,
+            question=f"질문 {p + 1}: 인덱스의 동작 원리를 설명해주세요.",
+            ai_answer="모범 답안 " * 200,
+            key_point="핵심 포인트",
+            additional_topics="관련 주제",
+            tech_class=p % 20
+        ))
+        db.add(Problem(id=base + p + 1, contest_id=contest_id, tech_interview_id=tech_interview_id))
+
+    for u in range(participants):
+        db.add(Participant(id=base + u + 1, member_id=u + 1, nickname=f"user{u + 1}", submit=1, contest_id=contest_id))
+
+    rng = random.Random(seed)
+    answer_id = base
+    for p in range(problems):
+        for u in range(participants):
+            answer_id += 1
+            db.add(Answer(
+                id=answer_id,
+                # 응시자마다 앞부분을 다르게 해 답변끼리 프롬프트 접두사를 공유하지 않게 함
+                answer=f"응시자 {u + 1}의 답변. " + "가" * (rng.randint(answer_length, answer_length_max) if answer_length_max else answer_length),
+                feedback=None,
+                rank_score=0,
+                participant_id=base + u + 1,
+                problem_id=base + p + 1
+            ))
+
+    db.commit()
+    return contest_id
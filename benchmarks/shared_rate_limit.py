@@ -0,0 +1,76 @@
+# benchmarks/shared_rate_limit.py
+"""클러스터 공용 LLM 속도 제한 벤치마크
+
+fakeredis 서버 하나를 공유하는 --workers 개의 LLMRateLimiter(컨테이너/uvicorn 워커 흉내)가
+동시에 요청할 때 합산 처리량이 모델의 RPM 한도를 넘지 않는지 확인한다.
+비교를 위해 워커마다 로컬 버킷만 쓰는 경우(기존 프로세스별 제한)도 함께 측정한다.
+
+실행: python -m benchmarks.shared_rate_limit --workers 4 --rpm 120 --requests 200
+"""
+import argparse
+import json
+import logging
+import threading
+import time
+
+import fakeredis
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+from app.config.llm_config import LLM_RATE_LIMIT_CONFIG
+from app.utils.rate_limiter import LLMRateLimiter, RedisTokenBucket
+
+
+def run(mode: str, args) -> dict:
+    server = fakeredis.FakeServer()
+    limiters = [
+        LLMRateLimiter(RedisTokenBucket(fakeredis.FakeRedis(server=server)) if mode == "redis" else None)
+        for _ in range(args.workers)
+    ]
+    per_worker = args.requests // args.workers
+    timestamps = []
+    lock = threading.Lock()
+
+    def worker(rate_limiter: LLMRateLimiter):
+        for _ in range(per_worker):
+            rate_limiter.acquire("benchmark-model", args.tokens)
+            with lock:
+                timestamps.append(time.perf_counter())
+
+    start_time = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(limiter,)) for limiter in limiters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start_time
+
+    # 처음 1분 동안 허용되는 최대치: 버킷 용량 + 1분간 채워지는 양
+    window = min(duration, 60.0)
+    allowed = args.rpm + args.rpm * window / 60
+    return {
+        "mode": mode,
+        "workers": args.workers,
+        "requests": per_worker * args.workers,
+        "duration": round(duration, 2),
+        "allowed_in_window": round(allowed),
+        "over_limit": per_worker * args.workers > allowed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클러스터 공용 속도 제한 벤치마크")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rpm", type=int, default=120)
+    parser.add_argument("--tokens", type=int, default=100, help="요청당 예약 토큰 수")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    LLM_RATE_LIMIT_CONFIG['MODEL_LIMITS'] = {"benchmark-model": {"rpm": args.rpm, "tpm": 10_000_000}}
+
+    for mode in ("local", "redis"):
+        print(json.dumps(run(mode, args), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
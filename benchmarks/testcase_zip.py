@@ -0,0 +1,103 @@
+# benchmarks/testcase_zip.py
+"""테스트 케이스 ZIP 생성 벤치마크
+
+payload 크기별로 ZIP 을 만드는 시간과 추가 메모리 최대치(tracemalloc, payload 자체 제외)를 잰다.
+  - disk: 예전 방식 (.in/.out 을 디렉토리에 쓴 뒤 ZIP 파일로 묶음, 임시 디렉토리에서 실행)
+  - buffer: 아카이브 전체를 BytesIO 에 만든 뒤 한 번에 응답
+  - stream: iter_test_case_zip 으로 조각씩 내보냄 (현재 방식)
+
+실행: python -m benchmarks.testcase_zip --sizes-mb 1,10,50
+"""
+import argparse
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+import benchmarks  # noqa: F401  (더미 환경 변수 설정)
+
+from app.services.coding_test.testcase_zip import iter_test_case_zip
+
+
+def make_testcases(size_mb: float, cases: int = 10, seed: int = 0):
+    """작은 케이스 cases-1 개 + 나머지 크기를 차지하는 큰(large) 입력 하나"""
+    rng = random.Random(seed)
+    testcases = [{f"{i}.in": f"5\n{' '.join(str(rng.randint(1, 100)) for _ in range(5))}\n", f"{i}.out": "ok\n"}
+                 for i in range(1, cases)]
+    numbers = []
+    length = 0
+    while length < size_mb * 1024 * 1024:
+        number = str(rng.randint(1, 10 ** 9))
+        numbers.append(number)
+        length += len(number) + 1
+    testcases.append({f"{cases}.in": f"{len(numbers)}\n{' '.join(numbers)}\n", f"{cases}.out": "ok\n"})
+    return testcases
+
+
+def disk_zip(testcases, workdir):
+    temp_dir = os.path.join(workdir, "case")
+    os.makedirs(temp_dir, exist_ok=True)
+    for test_case in testcases:
+        for file_name, content in test_case.items():
+            with open(os.path.join(temp_dir, file_name), "w", encoding="utf-8") as f:
+                f.write(content)
+    zip_path = os.path.join(workdir, "case.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        for test_case in testcases:
+            for file_name in test_case:
+                zip_file.write(os.path.join(temp_dir, file_name), arcname=file_name)
+    # 응답으로 보내려면 파일을 다시 읽는다 (FileResponse 처럼 조각씩)
+    size = 0
+    with open(zip_path, "rb") as f:
+        while chunk := f.read(64 * 1024):
+            size += len(chunk)
+    return size
+
+
+def buffer_zip(testcases):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        for test_case in testcases:
+            for file_name, content in test_case.items():
+                zip_file.writestr(file_name, content)
+    return len(buffer.getvalue())
+
+
+def stream_zip(testcases):
+    return sum(len(chunk) for chunk in iter_test_case_zip(testcases))
+
+
+def measure(name, run):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    size = run()
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"mode": name, "seconds": round(elapsed, 3), "peak_mb": round(peak / 1024 / 1024, 2),
+            "zip_mb": round(size / 1024 / 1024, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="테스트 케이스 ZIP 생성 벤치마크")
+    parser.add_argument("--sizes-mb", default="1,10,50")
+    args = parser.parse_args()
+
+    for size_mb in [float(value) for value in args.sizes_mb.split(",")]:
+        testcases = make_testcases(size_mb)
+        with tempfile.TemporaryDirectory() as workdir:
+            results = [
+                measure("disk", lambda: disk_zip(testcases, workdir)),
+                measure("buffer", lambda: buffer_zip(testcases)),
+                measure("stream", lambda: stream_zip(testcases)),
+            ]
+        for result in results:
+            print(json.dumps({"payload_mb": size_mb, **result}))
+
+
+if __name__ == "__main__":
+    main()
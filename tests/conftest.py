@@ -0,0 +1,15 @@
+# tests/conftest.py
+# 실제 OpenAI/MySQL/Redis 없이 실행할 수 있도록 앱 모듈 import 전에 더미 환경 변수를 채운다.
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("MYSQL_USER", "test")
+os.environ.setdefault("MYSQL_PASSWORD", "test")
+os.environ.setdefault("MYSQL_HOST", "localhost")
+os.environ.setdefault("MYSQL_PORT", "3306")
+os.environ.setdefault("MYSQL_DB_NAME", "test")
+os.environ.setdefault("DRAMATIQ_BROKER", "stub")
+os.environ.setdefault("PROGRESS_BACKEND", "memory")
+os.environ.setdefault("LLM_USAGE_BACKEND", "memory")
+# 테스트 워커가 뜰 때 모범 답안 사전 생성 반복 실행을 등록하지 않음
+os.environ.setdefault("INTERVIEW_PRECOMPUTE_INTERVAL", "0")
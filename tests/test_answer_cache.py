@@ -0,0 +1,68 @@
+import pytest
+
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.schemas.interview import InterviewAnswer
+from app.services.interview import interview
+from app.utils.answer_cache import AnswerIndex, CachedAnswer
+
+TECH_CLASS = 0
+STORED_QUESTIONS = [
+    "TCP 3-way handshake 과정을 설명하세요",
+    "HTTP/2 의 특징",
+    "TCP와 UDP의 차이",
+    "트랜잭션 격리 수준에 대해 설명해주세요",
+    "MongoDB 인덱싱",
+]
+
+
+def stored_answer(question: str) -> str:
+    return InterviewAnswer(
+        question=question, answer=f"{question} 답변", tips="팁", related_topics="주제"
+    ).model_dump_json()
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = AnswerIndex()
+    index.load(TECH_CLASS, [
+        CachedAnswer(question_id, question, stored_answer(question))
+        for question_id, question in enumerate(STORED_QUESTIONS, start=1)
+    ])
+    monkeypatch.setattr(interview, "answer_index", index)
+    monkeypatch.setitem(INTERVIEW_CONFIG, "ANSWER_CACHE", True)
+    return index
+
+
+def test_paraphrase_reuses_stored_answer(index):
+    response = interview.lookup_cached_answer(TECH_CLASS, "트랜잭션의 격리 수준이란?")
+    assert response is not None
+    assert response.answer == "트랜잭션 격리 수준에 대해 설명해주세요 답변"
+    assert response.question == "트랜잭션의 격리 수준이란?"
+
+    # 영문 토큰의 순서만 다른 질문도 같은 질문
+    entry, _ = index.search(TECH_CLASS, "UDP와 TCP의 차이")
+    assert entry.question == "TCP와 UDP의 차이"
+
+
+@pytest.mark.parametrize("question", [
+    "TCP 4-way handshake 과정을 설명하세요",
+    "HTTP/3 의 특징",
+    "TCP의 특징",
+])
+def test_different_numbers_or_ascii_terms_are_never_reused(index, question):
+    entry, similarity = index.search(TECH_CLASS, question)
+    assert entry is None or entry.question not in STORED_QUESTIONS[:3]
+    assert interview.lookup_cached_answer(TECH_CLASS, question) is None
+
+
+def test_transliterated_question_is_a_miss(index):
+    # "몽고DB" 와 "MongoDB" 는 문자 n-gram 으로 이어지지 않으므로 LLM 으로 새로 생성
+    assert interview.lookup_cached_answer(TECH_CLASS, "몽고DB 인덱스 설명") is None
+
+
+def test_reused_answer_added_under_new_wording_keeps_the_guard(index):
+    response = interview.lookup_cached_answer(TECH_CLASS, "TCP 3-way handshake 과정")
+    assert response is not None
+    interview.remember_answer(TECH_CLASS, 10, "TCP 3-way handshake 과정", response)
+    assert interview.lookup_cached_answer(TECH_CLASS, "TCP 4-way handshake 과정") is None
+
@@ -0,0 +1,106 @@
+import fakeredis
+import pytest
+from dramatiq import Message
+
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.tasks import answer_jobs
+from app.tasks.broker import broker
+from app.tasks.contest_jobs import JobStatus
+from app.tasks.job_store import RedisJobStore, job_store
+
+INTERVAL = 600
+
+
+@pytest.fixture(autouse=True)
+def schedule(monkeypatch):
+    broker.flush_all()
+    monkeypatch.setattr(job_store, "leases", {})
+    monkeypatch.setitem(INTERVIEW_CONFIG, "PRECOMPUTE_INTERVAL_SECONDS", INTERVAL)
+    yield
+    broker.flush_all()
+
+
+def queued_messages():
+    """바로 실행될 메시지와 지연 메시지 (stub 브로커는 지연 메시지를 .DQ 큐에 둠)"""
+    return [
+        Message.decode(message)
+        for queue_name in (answer_jobs.PRECOMPUTE_QUEUE, f"{answer_jobs.PRECOMPUTE_QUEUE}.DQ")
+        for message in broker.queues.get(queue_name, {}).queue
+    ]
+
+
+def run_job(monkeypatch, scheduled: bool, outcome):
+    async def fake_run(job_id, limit):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(answer_jobs, "_run_precompute", fake_run)
+    job = answer_jobs.submit_answer_precompute(scheduled=scheduled)
+    broker.flush_all()
+    try:
+        answer_jobs.precompute_answers_job.fn(job["job_id"], job["limit"], scheduled)
+    except RuntimeError:
+        pass
+    return job_store.get(job["job_id"])
+
+
+def test_worker_boot_starts_one_schedule_across_workers():
+    class FakeWorker:
+        consumer_whitelist = None
+
+    scheduler = answer_jobs.PrecomputeScheduler()
+    scheduler.after_worker_boot(broker, FakeWorker())
+    scheduler.after_worker_boot(broker, FakeWorker())
+
+    messages = queued_messages()
+    assert len(messages) == 1
+    assert messages[0].args[2] is True  # scheduled
+
+
+def test_worker_on_other_queues_does_not_start_schedule():
+    class ContestWorker:
+        consumer_whitelist = {"contest_evaluation"}
+
+    answer_jobs.PrecomputeScheduler().after_worker_boot(broker, ContestWorker())
+    assert queued_messages() == []
+
+
+@pytest.mark.parametrize("outcome", [
+    {"total": 0, "success": 0, "failed": 0, "has_more": False},
+    RuntimeError("DB 연결 실패"),
+])
+def test_scheduled_run_always_schedules_the_next_run(monkeypatch, outcome):
+    job = run_job(monkeypatch, scheduled=True, outcome=outcome)
+
+    assert job["status"] in (JobStatus.COMPLETED, JobStatus.FAILED)
+    (message,) = queued_messages()
+    assert message.args[0] == job["next_job_id"]
+    assert message.options["eta"] > 0  # INTERVAL 뒤 실행
+
+
+def test_requested_run_does_not_start_a_second_schedule(monkeypatch):
+    assert answer_jobs.ensure_precompute_schedule() is not None
+    broker.flush_all()
+
+    job = run_job(monkeypatch, scheduled=False, outcome={"has_more": False})
+
+    assert "next_job_id" not in job
+    assert queued_messages() == []
+
+
+def test_interval_zero_disables_rescheduling(monkeypatch):
+    monkeypatch.setitem(INTERVIEW_CONFIG, "PRECOMPUTE_INTERVAL_SECONDS", 0)
+    job = run_job(monkeypatch, scheduled=True, outcome={"has_more": True})
+
+    assert "next_job_id" not in job
+    assert answer_jobs.ensure_precompute_schedule() is None
+
+
+def test_redis_schedule_lease_is_held_by_one_worker():
+    store = RedisJobStore(fakeredis.FakeRedis())
+    assert store.claim(answer_jobs.PRECOMPUTE_SCHEDULE, 60) is True
+    assert store.claim(answer_jobs.PRECOMPUTE_SCHEDULE, 60) is False
+    # 반복 작업은 다음 실행을 예약하며 선점을 연장
+    assert store.claim(answer_jobs.PRECOMPUTE_SCHEDULE, 120, force=True) is True
+    assert store.client.ttl(f"job_lease:{answer_jobs.PRECOMPUTE_SCHEDULE}") > 60
@@ -0,0 +1,81 @@
+import asyncio
+
+import fakeredis
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from benchmarks.seed import create_sqlite_session
+
+from app.config.interview_config import INTERVIEW_CONFIG
+from app.db.mysql.models import TechInterview
+from app.schemas.interview import InterviewAnswer
+from app.services.interview import interview
+from app.utils.answer_failures import InMemoryAnswerFailureStore, RedisAnswerFailureStore
+
+FAILING_QUESTION = "항상 실패하는 질문"
+
+
+@pytest.fixture
+def db():
+    engine, db = create_sqlite_session()
+    for question_id, question in enumerate(["인덱스란?", FAILING_QUESTION, "트랜잭션이란?"], start=1):
+        db.add(TechInterview(id=question_id, question=question, tech_class=0))
+    db.commit()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = RedisAnswerFailureStore(fakeredis.FakeRedis())
+    monkeypatch.setattr(interview, "answer_failure_store", store)
+    monkeypatch.setitem(INTERVIEW_CONFIG, "PRECOMPUTE_MAX_ATTEMPTS", 2)
+    monkeypatch.setitem(INTERVIEW_CONFIG, "PRECOMPUTE_DAILY_BUDGET_USD", 0)
+    monkeypatch.setitem(INTERVIEW_CONFIG, "ANSWER_CACHE", False)
+    return store
+
+
+@pytest.fixture
+def chain_calls(monkeypatch):
+    calls = []
+
+    async def answer(inputs):
+        calls.append(inputs["question"])
+        if inputs["question"] == FAILING_QUESTION:
+            raise ValueError("structured output 파싱 실패")
+        return InterviewAnswer(question=inputs["question"], answer="답변", tips="팁", related_topics="주제")
+
+    monkeypatch.setattr(interview, "precompute_chain", RunnableLambda(answer))
+    return calls
+
+
+def test_repeatedly_failing_question_is_no_longer_selected(db, store, chain_calls):
+    first = asyncio.run(interview.precompute_missing_answers(db, limit=10))
+    assert (first["success"], first["failed"], first["excluded"]) == (2, 1, 0)
+
+    # 성공한 질문은 채워졌으므로 실패한 질문만 다시 뽑힘
+    second = asyncio.run(interview.precompute_missing_answers(db, limit=10))
+    assert (second["total"], second["failed"]) == (1, 1)
+
+    # PRECOMPUTE_MAX_ATTEMPTS(2) 번 실패했으므로 더 이상 LLM 을 호출하지 않음
+    third = asyncio.run(interview.precompute_missing_answers(db, limit=10))
+    assert (third["total"], third["excluded"], third["has_more"]) == (0, 1, False)
+    assert chain_calls.count(FAILING_QUESTION) == 2
+
+
+def test_success_clears_failure_record():
+    store = RedisAnswerFailureStore(fakeredis.FakeRedis(), ttl=60)
+    store.record([1, 2])
+    store.record([1], succeeded=[2])
+    assert store.exhausted_ids(2) == [1]
+    assert store.exhausted_ids(1) == [1]
+    assert store.client.ttl(store.key) > 0
+
+
+def test_in_memory_store_expires_after_last_failure():
+    store = InMemoryAnswerFailureStore(ttl=60)
+    store.record([1])
+    assert store.exhausted_ids(1) == [1]
+    store.expires_at = 0
+    assert store.exhausted_ids(1) == []
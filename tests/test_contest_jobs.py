@@ -0,0 +1,120 @@
+import importlib
+
+import pytest
+from dramatiq import Worker
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.fake_llm import FakeChatModel, default_evaluation_response
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.api.routes.interview import router
+from app.db.mysql import async_session
+from app.db.mysql.async_session import get_evaluation_db
+from app.db.mysql.connection import DB_CONFIG
+from app.db.mysql.models import Contest
+from app.services.interview import evaluation_core
+from app.tasks.broker import broker
+from app.tasks.contest_jobs import JobStatus
+from app.tasks.job_store import job_store
+
+# app.chain 패키지가 같은 이름의 체인 객체를 re-export 하므로 모듈은 직접 가져온다.
+evaluate_chain_module = importlib.import_module("app.chain.evaluate_chain")
+
+SPACE_ID = 1
+CONTEST_ID = 1
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """시드한 SQLite 파일을 워커(aiosqlite, 작업마다 새 엔진)와 라우트(동기 세션)가 함께 사용"""
+    path = tmp_path / "contest.db"
+    engine, db = create_sqlite_session(f"sqlite:///{path}")
+    seed_contest(db, contest_id=CONTEST_ID, space_id=SPACE_ID, problems=2, participants=3)
+    db.close()
+
+    monkeypatch.setitem(DB_CONFIG, "ASYNC_DB", True)
+    monkeypatch.setattr(async_session, "ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{path}")
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(database):
+    app = FastAPI()
+    app.include_router(router)
+
+    def override_db():
+        db = database()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_evaluation_db] = override_db
+    return TestClient(app)
+
+
+@pytest.fixture
+def worker():
+    broker.flush_all()
+    worker = Worker(broker, worker_threads=2)
+    worker.start()
+    yield worker
+    worker.stop()
+
+
+def install_fake_llm(monkeypatch, responder=default_evaluation_response):
+    fake_llm = FakeChatModel(latency=0, responder=responder)
+    monkeypatch.setattr(
+        evaluation_core, "chain", evaluate_chain_module.prompt | fake_llm | evaluate_chain_module.parser
+    )
+
+
+def run_evaluation(client, **params):
+    response = client.get(f"/api/v1/ai/{SPACE_ID}/contest/{CONTEST_ID}/evaluate", params=params)
+    assert response.status_code == 202
+    job = response.json()["data"]
+    assert job["status"] == JobStatus.QUEUED
+
+    broker.join("contest_evaluation", fail_fast=True)
+    return job_store.get(job["job_id"])
+
+
+def contest_submit(database) -> int:
+    with database() as db:
+        return db.get(Contest, CONTEST_ID).submit
+
+
+def test_get_evaluate_enqueues_job_and_worker_marks_contest_evaluated(client, worker, database, monkeypatch):
+    install_fake_llm(monkeypatch)
+
+    job = run_evaluation(client, method="both")
+
+    assert job["status"] == JobStatus.COMPLETED
+    assert job["result"]["evaluation_count"] == 6
+    assert job["result"]["failed_count"] == 0
+    assert set(job["result"]["methods"]) == {"sequential", "parallel"}
+    assert contest_submit(database) == 2  # EVALUATED
+
+
+def test_job_reports_answers_left_unevaluated_as_failed(client, worker, database, monkeypatch):
+    def responder(prompt: str) -> str:
+        if "응시자 1의 답변" in prompt:
+            return "not json"
+        return default_evaluation_response(prompt)
+
+    install_fake_llm(monkeypatch, responder)
+
+    job = run_evaluation(client, method="sequential")
+
+    assert job["status"] == JobStatus.COMPLETED
+    assert job["result"]["evaluation_count"] == 4
+    assert job["result"]["failed_count"] == 2
+    assert contest_submit(database) == 1  # 남은 답변이 있으므로 상태 유지
+
+
+def test_get_evaluate_rejects_unknown_method(client):
+    response = client.get(f"/api/v1/ai/{SPACE_ID}/contest/{CONTEST_ID}/evaluate", params={"method": "unknown"})
+    assert response.status_code == 400
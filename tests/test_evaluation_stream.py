@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.seed import create_sqlite_session, seed_contest
+
+from app.config.evaluation_config import EVALUATION_CONFIG
+from app.db.mysql.models import Answer
+from app.db.repositories.mysql.answer_repository import AnswerRepository
+from app.schemas.interview import Evaluation
+from app.services.interview import evaluate
+from app.tasks import evaluation_task
+
+CONTEST_ID = 1
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine, db = create_sqlite_session()
+    seed_contest(db, contest_id=CONTEST_ID, problems=2, participants=3)
+    monkeypatch.setitem(EVALUATION_CONFIG, "BATCH_SIZE", 2)
+    monkeypatch.setitem(EVALUATION_CONFIG, "PREFIX_WARMUP", "off")
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def finished(monkeypatch):
+    """LLM 평가가 끝난 답변 본문 (응시자 3 의 답변은 끝나지 않음)"""
+    finished = []
+
+    async def fake_evaluate_answer(problem, ai_answer, participant_answer):
+        if participant_answer.startswith("응시자 3"):
+            await asyncio.Event().wait()
+        await asyncio.sleep(0.01 if participant_answer.startswith("응시자 1") else 0.05)
+        finished.append(participant_answer)
+        return Evaluation(score=70, feedback="피드백")
+
+    monkeypatch.setattr(evaluation_task, "evaluate_answer", fake_evaluate_answer)
+    return finished
+
+
+@pytest.fixture
+def slow_writes(monkeypatch):
+    """스트림이 끊길 때 DB 쓰기가 진행 중이도록 UPDATE 를 느리게 함"""
+    bulk_update = AnswerRepository.bulk_update_evaluations
+
+    def slow_bulk_update(self, items):
+        time.sleep(0.2)
+        return bulk_update(self, items)
+
+    monkeypatch.setattr(AnswerRepository, "bulk_update_evaluations", slow_bulk_update)
+
+
+def test_disconnect_mid_stream_saves_every_finished_evaluation(db, finished, slow_writes):
+    async def consume_until_disconnect():
+        events = evaluate.iter_contest_evaluations_parallel(db, CONTEST_ID)
+        async for event in events:
+            if event['event'] == 'evaluation':
+                break
+        # 클라이언트 연결 종료. 정리가 끝나면 진행 중이던 쓰기까지 반영되어 있어야 함
+        await events.aclose()
+        return {answer.answer for answer in db.query(Answer).filter(Answer.feedback.isnot(None)).all()}
+
+    saved = asyncio.run(consume_until_disconnect())
+    assert len(finished) == 2  # 응시자 1 의 두 답변만 LLM 평가가 끝난 상태에서 연결 종료
+    assert saved == set(finished)
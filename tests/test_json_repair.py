@@ -0,0 +1,65 @@
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+from pydantic import ValidationError
+
+from app.chain.structured_output import RepairingOutputParser
+from app.schemas.interview import Evaluation, InterviewAnswer
+from app.utils.json_repair import JSONRepairError, coerce_to_model, repair_json
+
+
+def repair_to_evaluation(text: str) -> Evaluation:
+    data, _ = repair_json(text)
+    return Evaluation.model_validate(coerce_to_model(data, Evaluation))
+
+
+def test_code_fence_and_surrounding_text():
+    data, defects = repair_json('평가 결과입니다.\n```json\n{"score": 85, "feedback": "좋음"}\n```\n감사합니다.')
+    assert data == {"score": 85, "feedback": "좋음"}
+    assert "code_fence" in defects
+
+
+def test_trailing_comma_and_python_literals():
+    data, defects = repair_json("{'score': 70, 'passed': True, 'feedback': \"보통\",}")
+    assert data == {"score": 70, "passed": True, "feedback": "보통"}
+    assert {"trailing_comma", "single_quote", "python_literal"} <= set(defects)
+
+
+def test_missing_closing_brace_after_complete_value_is_closed():
+    data, defects = repair_json('{"score": 85, "feedback": "좋은 답변입니다."')
+    assert data == {"score": 85, "feedback": "좋은 답변입니다."}
+    assert "unclosed" in defects
+
+
+@pytest.mark.parametrize("text", [
+    '{"score": 85, "feedback": "좋은 답변입니다. 다만 TCP 의',
+    '```json\n{"question": "인덱스란?", "answer": "B-Tree 로',
+])
+def test_truncated_string_is_a_parse_failure(text):
+    with pytest.raises(JSONRepairError):
+        repair_json(text)
+
+
+@pytest.mark.parametrize("score, expected", [("85점", 85), ("85/100", 85), (84.6, 85)])
+def test_score_strings_are_coerced(score, expected):
+    assert coerce_to_model({"score": score, "feedback": "f"}, Evaluation)["score"] == expected
+
+
+@pytest.mark.parametrize("score", ["8.5/10", "4/5"])
+def test_fraction_on_another_scale_is_rejected(score):
+    with pytest.raises(ValidationError):
+        repair_to_evaluation(f'{{"score": "{score}", "feedback": "f"}}')
+
+
+def generation(text: str, finish_reason: str) -> ChatGeneration:
+    return ChatGeneration(message=AIMessage(content=text, response_metadata={"finish_reason": finish_reason}))
+
+
+def test_parser_does_not_repair_length_truncated_generation():
+    parser = RepairingOutputParser(pydantic_object=InterviewAnswer, chain_name="test")
+    # 문자열은 닫혀 있지만 토큰 한도로 끝난 응답: 나머지 필드가 빠져 있을 수 있으므로 재요청
+    text = '{"question": "인덱스란?", "answer": "B-Tree", "tips": "팁", "related_topics": "주제"'
+    with pytest.raises(OutputParserException):
+        parser.parse_result([generation(text, "length")])
+    assert parser.parse_result([generation(text, "stop")]).answer == "B-Tree"
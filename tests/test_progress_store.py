@@ -0,0 +1,57 @@
+import asyncio
+
+import fakeredis
+
+from app.chain.custom_resume_chain import CareerAnalysis, TotalCareerAnalysis, TotalPortfolioAnalysis
+from app.utils.progress_store import RedisProgressStore
+from app.utils.progress_tracker import ProgressStatus, ProgressTracker
+
+
+def redis_store() -> RedisProgressStore:
+    return RedisProgressStore(fakeredis.FakeRedis())
+
+
+def test_redis_store_serializes_pydantic_result():
+    """커스텀 이력서의 마지막 SUCCESS 갱신처럼 결과에 pydantic 모델이 있어도 저장된다"""
+    store = redis_store()
+
+    async def run():
+        tracker = await ProgressTracker.create(total=1, key="custom_resume:1", store=store)
+        career = TotalCareerAnalysis(careers=[CareerAnalysis(
+            company="A", position="백엔드", isCurrent=True, startDate="2024-01-01",
+            description="API 개발", achievement="응답 속도 개선"
+        )])
+        await tracker.update(ProgressStatus.SUCCESS, {
+            "status": "completed",
+            "result": {"portfolio": TotalPortfolioAnalysis(portfolios=[]), "career": career}
+        })
+
+    asyncio.run(run())
+    progress = store.get("custom_resume:1")
+    assert progress["status"] == "completed"
+    assert progress["success"] == 1 and progress["completed"] == 1
+    assert progress["result"]["portfolio"] == {"portfolios": []}
+    assert progress["result"]["career"]["careers"][0]["company"] == "A"
+
+
+def test_tracker_survives_unserializable_metadata():
+    """JSON 으로 바꿀 수 없는 메타데이터는 저장소 반영만 건너뛰고 카운터는 계속 갱신"""
+    store = redis_store()
+
+    async def run():
+        tracker = await ProgressTracker.create(total=2, key="job:1", store=store)
+        await tracker.update(ProgressStatus.SUCCESS, {"bad": object()})
+        await tracker.update(ProgressStatus.FAILED)
+        return tracker.get_progress()
+
+    progress = asyncio.run(run())
+    assert progress["completed"] == 2
+    assert store.get("job:1")["failed"] == 1
+
+
+def test_create_registers_initial_progress():
+    store = redis_store()
+    asyncio.run(ProgressTracker.create(total=3, key="job:2", store=store, metadata={"stage": "start"}))
+    assert store.get("job:2") == {
+        "total": 3, "completed": 0, "success": 0, "failed": 0, "skipped": 0, "in_progress": 0, "stage": "start"
+    }
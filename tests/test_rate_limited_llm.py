@@ -0,0 +1,96 @@
+import asyncio
+
+import fakeredis
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_openai import ChatOpenAI
+
+import app.chain.rate_limited_llm as rate_limited_llm
+from app.chain.rate_limited_llm import RateLimitedChatOpenAI
+from app.config.llm_config import LLM_RATE_LIMIT_CONFIG
+from app.utils.rate_limiter import LLMRateLimiter, RedisTokenBucket
+
+MODEL = "test-model"
+TPM = 6000
+TOKENS_KEY = f"llm_rate:{MODEL}:tokens"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = fakeredis.FakeRedis()
+    limiter = LLMRateLimiter(RedisTokenBucket(client))
+    monkeypatch.setitem(LLM_RATE_LIMIT_CONFIG, "ENABLED", True)
+    monkeypatch.setitem(LLM_RATE_LIMIT_CONFIG, "MODEL_LIMITS", {MODEL: {"rpm": 100, "tpm": TPM}})
+    monkeypatch.setattr(rate_limited_llm, "get_rate_limiter", lambda: limiter)
+    return client
+
+
+@pytest.fixture
+def llm():
+    return RateLimitedChatOpenAI(model_name=MODEL, api_key="test", max_retries=0)
+
+
+def token_level(client) -> float:
+    return float(client.hget(TOKENS_KEY, "level"))
+
+
+def result_with_usage(total_tokens: int) -> ChatResult:
+    message = AIMessage(content="ok", usage_metadata={
+        "input_tokens": total_tokens - 1, "output_tokens": 1, "total_tokens": total_tokens
+    })
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+MESSAGES = [HumanMessage(content="hello " * 40)]
+
+
+def test_generate_reserves_then_settles_actual_usage(client, llm, monkeypatch):
+    reserved = llm._reserved_tokens(MESSAGES)
+    levels = []
+
+    def fake_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        # 호출 중에는 예약한 만큼 빠져 있어야 함
+        levels.append(token_level(client))
+        return result_with_usage(50)
+
+    monkeypatch.setattr(ChatOpenAI, "_generate", fake_generate)
+    llm._generate(MESSAGES)
+
+    assert levels[0] == pytest.approx(TPM - reserved, abs=1)
+    # 예약분 중 쓰지 않은 만큼 환불 (초당 TPM/60 만큼 다시 차므로 약간의 오차 허용)
+    assert token_level(client) == pytest.approx(TPM - 50, abs=20)
+
+
+def test_generate_refunds_reservation_on_failure(client, llm, monkeypatch):
+    def failing_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        assert token_level(client) < TPM - 100
+        raise RuntimeError("provider error")
+
+    monkeypatch.setattr(ChatOpenAI, "_generate", failing_generate)
+    with pytest.raises(RuntimeError):
+        llm._generate(MESSAGES)
+
+    assert token_level(client) == pytest.approx(TPM, abs=1)
+
+
+def test_agenerate_settles_actual_usage(client, llm, monkeypatch):
+    async def fake_agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        return result_with_usage(80)
+
+    monkeypatch.setattr(ChatOpenAI, "_agenerate", fake_agenerate)
+    asyncio.run(llm._agenerate(MESSAGES))
+
+    assert token_level(client) == pytest.approx(TPM - 80, abs=20)
+
+
+def test_agenerate_refunds_reservation_on_failure(client, llm, monkeypatch):
+    async def failing_agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        assert token_level(client) < TPM - 100
+        raise RuntimeError("provider error")
+
+    monkeypatch.setattr(ChatOpenAI, "_agenerate", failing_agenerate)
+    with pytest.raises(RuntimeError):
+        asyncio.run(llm._agenerate(MESSAGES))
+
+    assert token_level(client) == pytest.approx(TPM, abs=1)
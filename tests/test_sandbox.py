@@ -0,0 +1,102 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from app.config.coding_test_config import CODING_TEST_CONFIG
+from app.schemas import coding_test as schemas
+from app.services.coding_test import sandbox
+from app.services.coding_test.sandbox import OK, SandboxError, SolutionSandbox, check_jail
+from app.services.coding_test.testcase import should_run_solution
+
+PROBE = r'''
+import os, socket
+print(os.getuid())
+print(os.path.exists("/etc/passwd"))
+try:
+    socket.create_connection(("1.1.1.1", 80), timeout=1)
+    print("network")
+except OSError:
+    print("no network")
+try:
+    open("/usr/probe", "w")
+    print("rw")
+except OSError:
+    print("ro")
+'''
+
+
+def jail_available() -> bool:
+    if os.geteuid() != 0 or shutil.which("unshare") is None or shutil.which("setpriv") is None:
+        return False
+    try:
+        asyncio.run(check_jail())
+    except SandboxError:
+        return False
+    return True
+
+
+@pytest.fixture
+def execution(monkeypatch):
+    """TRUSTED_SOLUTIONS / SANDBOX_JAIL 을 테스트마다 설정"""
+    def configure(trusted: bool = False, jail: str = ""):
+        monkeypatch.setitem(CODING_TEST_CONFIG, "TRUSTED_SOLUTIONS", trusted)
+        monkeypatch.setitem(CODING_TEST_CONFIG, "SANDBOX_JAIL", jail)
+    configure()
+    return configure
+
+
+def solution_input(**overrides) -> schemas.TestCaseInput:
+    return schemas.TestCaseInput(
+        problem_description="두 수의 합",
+        input_description="a b",
+        output_description="a+b",
+        sample_solution={"language": "Python", "code": "print(sum(map(int, input().split())))"},
+        selected_languages=["python"],
+        test_case_types=["basic"],
+        **overrides
+    )
+
+
+def test_client_code_is_not_executed_by_default(execution):
+    with pytest.raises(SandboxError):
+        SolutionSandbox("python", "print(1)")
+    # 요청에서 run_solution 을 켜도 LLM 이 출력까지 생성
+    assert should_run_solution(solution_input(run_solution=True)) is False
+
+
+def test_trusted_solutions_run_without_jail(execution):
+    execution(trusted=True)
+    assert should_run_solution(solution_input(run_solution=True)) is True
+
+    async def run():
+        async with SolutionSandbox("python", "print(sum(map(int, input().split())))") as box:
+            return await box.run("1 2\n")
+
+    result = asyncio.run(run())
+    assert (result.status, result.stdout) == (OK, "3\n")
+
+
+@pytest.mark.skipif(not jail_available(), reason="unshare 격리 실행 불가 (root 권한 필요)")
+def test_jailed_solution_runs_as_nobody_without_network_or_host_files(execution):
+    execution(jail="unshare")
+
+    async def run():
+        async with SolutionSandbox("python", PROBE) as box:
+            return await box.run("")
+
+    result = asyncio.run(run())
+    assert result.status == OK, result.stderr
+    assert result.stdout.split("\n")[:4] == [str(sandbox.JAIL_UID), "False", "no network", "ro"]
+
+
+@pytest.mark.skipif(not jail_available(), reason="unshare 격리 실행 불가 (root 권한 필요)")
+def test_jailed_limits_keep_their_status(execution):
+    execution(jail="unshare")
+
+    async def run():
+        async with SolutionSandbox("python", "while True: pass", cpu_seconds=1) as box:
+            return await box.run("")
+
+    assert asyncio.run(run()).status == sandbox.TIME_LIMIT
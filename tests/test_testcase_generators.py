@@ -0,0 +1,78 @@
+import io
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import coding_test
+from app.config.coding_test_config import CODING_TEST_CONFIG
+from app.utils.generator_store import InMemoryGeneratorStore
+
+GENERATOR = "import sys, random\nrandom.seed(int(sys.argv[1]))\nprint(3)\nprint(*(random.randint(1, 9) for _ in range(3)))\n"
+SOLUTION = "input()\nprint(sum(map(int, input().split())))\n"
+URL = "/api/v1/ai/1/problems/7/save-testcases"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = InMemoryGeneratorStore()
+    store.save("set-1", {
+        "sample_solution": {"language": "python", "code": SOLUTION},
+        "generators": [
+            {"code": GENERATOR, "seed": seed, "description": "", "name": name}
+            for seed, name in ((1, "11"), (2, "12"))
+        ]
+    })
+    monkeypatch.setattr(coding_test, "generator_store", store)
+    monkeypatch.setitem(CODING_TEST_CONFIG, "TRUSTED_SOLUTIONS", True)
+    monkeypatch.setitem(CODING_TEST_CONFIG, "SANDBOX_JAIL", "")
+    return store
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(coding_test.router)
+    return TestClient(app)
+
+
+def zip_names(response) -> list:
+    assert response.status_code == 200, response.text
+    return sorted(zipfile.ZipFile(io.BytesIO(response.content)).namelist())
+
+
+def test_save_runs_server_side_generators_by_id(client, store):
+    body = {"test_case_id": "7", "testcases": [{"1.in": "1\n5\n", "1.out": "5\n"}], "generator_set_id": "set-1"}
+    assert zip_names(client.post(URL, json=body)) == ["1.in", "1.out", "11.in", "11.out", "12.in", "12.out"]
+
+    body["generator_names"] = ["12"]
+    response = client.post(URL, json=body)
+    assert zip_names(response) == ["1.in", "1.out", "12.in", "12.out"]
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    numbers = archive.read("12.in").decode().split("\n")[1].split()
+    assert archive.read("12.out").decode() == f"{sum(map(int, numbers))}\n"
+
+
+def test_generator_code_in_request_is_ignored(client, store):
+    body = {
+        "test_case_id": "7",
+        "testcases": [{"1.in": "1\n5\n", "1.out": "5\n"}],
+        "generators": [{"code": "import os; os.system('id')", "seed": 1, "name": "2"}],
+        "sample_solution": {"language": "python", "code": "print(1)"}
+    }
+    assert zip_names(client.post(URL, json=body)) == ["1.in", "1.out"]
+
+
+def test_unknown_generator_set_or_name(client, store):
+    body = {"test_case_id": "7", "testcases": [], "generator_set_id": "missing"}
+    assert client.post(URL, json=body).status_code == 404
+
+    body.update(generator_set_id="set-1", generator_names=["99"])
+    assert client.post(URL, json=body).status_code == 400
+
+
+def test_generators_rejected_when_execution_disabled(client, store, monkeypatch):
+    monkeypatch.setitem(CODING_TEST_CONFIG, "TRUSTED_SOLUTIONS", False)
+    body = {"test_case_id": "7", "testcases": [], "generator_set_id": "set-1"}
+    assert client.post(URL, json=body).status_code == 403
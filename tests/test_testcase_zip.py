@@ -0,0 +1,88 @@
+import asyncio
+import io
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import coding_test
+# test_ 로 시작하는 함수(test_case_arcname)가 테스트로 수집되지 않도록 모듈로 가져온다.
+from app.services.coding_test import testcase_zip
+
+CHUNK_SIZE = 1024
+LARGE_INPUT = "".join(f"{number}\n" for number in range(20000))  # 여러 조각에 걸치는 파일
+TESTCASES = [
+    {"1.in": "1 2\n", "1.out": "3\n"},
+    {"2.in": LARGE_INPUT, "2.out": "합계\n".encode("utf-8")},
+]
+EXPECTED = {
+    "1.in": b"1 2\n",
+    "1.out": b"3\n",
+    "2.in": LARGE_INPUT.encode("utf-8"),
+    "2.out": "합계\n".encode("utf-8"),
+}
+
+
+def read_zip(data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+@pytest.mark.parametrize("compress_level", [0, 6])
+def test_iter_test_case_zip_streams_a_valid_archive(compress_level):
+    chunks = list(testcase_zip.iter_test_case_zip(TESTCASES, chunk_size=CHUNK_SIZE, compress_level=compress_level))
+
+    assert len(chunks) > 2
+    archive = read_zip(b"".join(chunks))
+    assert list(archive) == list(EXPECTED)
+    assert archive == EXPECTED
+
+
+def test_aiter_test_case_zip_appends_streamed_files():
+    async def pieces(data: bytes):
+        for start in range(0, len(data), 300):
+            yield data[start:start + 300]
+
+    async def streamed_files():
+        yield "3.in", pieces(LARGE_INPUT.encode("utf-8"))
+        yield "3.out", pieces(b"199990000\n")
+
+    async def collect():
+        return [
+            chunk async for chunk in
+            testcase_zip.aiter_test_case_zip(TESTCASES, streamed_files(), chunk_size=CHUNK_SIZE, compress_level=6)
+        ]
+
+    archive = read_zip(b"".join(asyncio.run(collect())))
+    assert archive == {**EXPECTED, "3.in": LARGE_INPUT.encode("utf-8"), "3.out": b"199990000\n"}
+
+
+@pytest.mark.parametrize("file_name", ["../x.in", "dir/1.in", "..\\x.in", "..", ""])
+def test_arcname_rejects_paths(file_name):
+    with pytest.raises(ValueError):
+        testcase_zip.test_case_arcname(file_name)
+
+
+def test_save_testcases_rejects_path_in_file_name():
+    app = FastAPI()
+    app.include_router(coding_test.router)
+    body = {"test_case_id": "7", "testcases": [{"../x.in": "1\n", "1.out": "1\n"}]}
+
+    response = TestClient(app).post("/api/v1/ai/1/problems/7/save-testcases", json=body)
+
+    assert response.status_code == 400
+    assert "../x.in" in response.json()["detail"]
+
+
+def test_save_testcases_streams_the_payload():
+    app = FastAPI()
+    app.include_router(coding_test.router)
+    body = {"test_case_id": "7", "testcases": [{"1.in": "1 2\n", "1.out": "3\n"}, {"2.in": LARGE_INPUT, "2.out": "합계\n"}]}
+
+    response = TestClient(app).post("/api/v1/ai/1/problems/7/save-testcases", json=body)
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="testcase_7.zip"'
+    assert read_zip(response.content) == EXPECTED